@@ -0,0 +1,541 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple, Union
+import uno
+from com.sun.star.awt.grid import GridDataEvent
+from com.sun.star.awt.grid import XMutableGridDataModel
+from com.sun.star.lang import DisposedException
+from com.sun.star.lang import EventObject
+from com.sun.star.lang import IndexOutOfBoundsException
+
+from ooodev.uno_helper.base_class.base import Base
+from ooodev.utils.cache.lru_cache import LRUCache
+from ooodev.utils.cache.cache_stats import CacheStats
+
+RowFetchT = Callable[[int, int], Sequence[Any]]
+HeadingsT = Union[Sequence[Any], Callable[[int], Any], None]
+
+
+class VirtualGridDataModel(Base, XMutableGridDataModel):
+    """
+    Python implementation of ``com.sun.star.awt.grid.XMutableGridDataModel`` that serves rows on demand.
+
+    Rows are not copied into office. The grid control asks for the rows it shows and they are read from
+    ``rows`` when needed. ``rows`` can be:
+
+    - A sequence such as a ``list`` or ``tuple`` of rows.
+    - An iterator or other iterable. Rows are read one page at a time as the grid scrolls to the end of the
+      rows read so far, ``RowCount`` grows as rows are read.
+    - A callable ``fetch(start, count)`` that returns ``count`` rows starting at ``start``, ``row_count`` is required.
+      Use this for paged sources such as database queries.
+
+    Pages of rows are kept in a LRU cache when rows are fetched or converted with ``row_converter``.
+
+    Cell and heading updates are kept as overrides, the source is not changed.
+    Adding, inserting or removing rows first reads all rows into the model.
+
+    Example:
+        .. code-block:: python
+
+            rows = [(i, f"Item {i}", i * 1.5) for i in range(100_000)]
+            model = VirtualGridDataModel(rows)
+            ctl_grid.set_virtual_data(model, column_titles=("Id", "Name", "Value"))
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(
+        self,
+        rows: Any = None,
+        *,
+        row_count: int = -1,
+        column_count: int = 0,
+        headings: HeadingsT = None,
+        row_converter: Callable[[Any], Sequence[Any]] | None = None,
+        page_size: int = 200,
+        cache_size: int = 20,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            rows (Any, optional): Sequence of rows, iterable of rows or ``fetch(start, count)`` callable.
+            row_count (int, optional): Number of rows. Required when ``rows`` is a callable.
+            column_count (int, optional): Number of columns. If omitted the length of the first row is used.
+            headings (Sequence, Callable[[int], Any], optional): Row headings or a callable that gets the heading
+                for a row index. Defaults to no heading.
+            row_converter (Callable[[Any], Sequence[Any]], optional): Converts a source row into a sequence of
+                cell values, such as a ``dict`` or ``dataclass`` into a tuple.
+            page_size (int, optional): Number of rows read at a time. Defaults to ``200``.
+            cache_size (int, optional): Number of pages kept in the row cache. Defaults to ``20``.
+
+        Raises:
+            ValueError: If ``rows`` is a callable and ``row_count`` is omitted.
+        """
+        super().__init__()
+        if page_size < 1:
+            raise ValueError("page_size must be greater than 0")
+        self._page_size = page_size
+        self._pages = LRUCache(max(cache_size, 1))
+        self._converter = row_converter
+        self._fetch: RowFetchT | None = None
+        self._iter: Iterator[Any] | None = None
+        self._count = 0
+        # True once rows are copied into a list owned by this model.
+        self._owns_rows = False
+        if rows is None:
+            self._seq: Any = []
+        elif callable(rows) and not hasattr(rows, "__len__"):
+            if row_count < 0:
+                raise ValueError("row_count is required when rows is a callable")
+            self._seq = None
+            self._fetch = rows
+            self._count = row_count
+        elif hasattr(rows, "__len__") and hasattr(rows, "__getitem__") and not isinstance(rows, str):
+            self._seq = rows
+        else:
+            self._seq = []
+            self._iter = iter(rows)
+            self._read_more()
+        self._column_count = column_count
+        self._headings = headings
+        self._overrides: Dict[int, List[Any]] = {}
+        self._heading_overrides: Dict[int, Any] = {}
+        self._tooltips: Dict[Tuple[int, int], Any] = {}
+        self._row_tooltips: Dict[int, Any] = {}
+        self._data_listeners: List[Any] = []
+        self._event_listeners: List[Any] = []
+        # row count last reported to listeners, a sequence source can change size without notice.
+        self._last_count = self.RowCount
+
+    # region internal
+    def _read_more(self) -> int:
+        # reads the next page from the iterator, returns the number of rows read.
+        if self._iter is None:
+            return 0
+        start = len(self._seq)
+        for _ in range(self._page_size):
+            try:
+                self._seq.append(next(self._iter))
+            except StopIteration:
+                self._iter = None
+                break
+        return len(self._seq) - start
+
+    def _check_row(self, row: int) -> None:
+        if row < 0 or row >= self.RowCount:
+            raise IndexOutOfBoundsException(f"Row index {row} is out of range", self)
+
+    def _load_page(self, page: int) -> Tuple[Tuple[Any, ...], ...]:
+        start = page * self._page_size
+        end = min(start + self._page_size, self.RowCount)
+        if self._fetch is not None:
+            raw = self._fetch(start, end - start)
+        else:
+            raw = [self._seq[i] for i in range(start, end)]
+        conv = self._converter
+        if conv is None:
+            return tuple(r if isinstance(r, tuple) else tuple(r) for r in raw)
+        return tuple(tuple(conv(r)) for r in raw)
+
+    def _get_row(self, row: int) -> Tuple[Any, ...]:
+        override = self._overrides.get(row)
+        if override is not None:
+            return tuple(override)
+        if self._fetch is None and self._converter is None:
+            # plain sequence, no need to cache
+            if self._iter is not None and row >= len(self._seq) - 1:
+                self._grow()
+            result = self._seq[row]
+            return result if isinstance(result, tuple) else tuple(result)
+        if self._iter is not None and row >= len(self._seq) - 1:
+            self._grow()
+        page = row // self._page_size
+        rows = self._pages.get(page)
+        if rows is None or row - page * self._page_size >= len(rows):
+            rows = self._load_page(page)
+            self._pages.put(page, rows)
+        return rows[row - page * self._page_size]
+
+    def _grow(self) -> None:
+        # grid reached the last row read from the iterator.
+        first = len(self._seq)
+        if self._read_more():
+            self._notify("rowsInserted", -1, -1, first, len(self._seq) - 1)
+
+    def _materialize(self) -> None:
+        # structural changes need a list of rows owned by this model.
+        if self._owns_rows:
+            return
+        count = self._count_all()
+        rows = [self._get_row(i) for i in range(count)]
+        headings = [self.getRowHeading(i) for i in range(count)]
+        self._seq = rows
+        self._headings = headings
+        self._fetch = None
+        self._iter = None
+        self._converter = None
+        self._overrides.clear()
+        self._heading_overrides.clear()
+        self._pages.clear()
+        self._owns_rows = True
+
+    def _shift_rows(self, index: int, delta: int) -> None:
+        # moves tooltips after rows are inserted (delta > 0) or removed (delta < 0) at index.
+        def new_row(row: int) -> int:
+            if row < index:
+                return row
+            if delta < 0 and row < index - delta:
+                return -1
+            return row + delta
+
+        tips = {}
+        for (col, row), value in self._tooltips.items():
+            row = new_row(row)
+            if row >= 0:
+                tips[(col, row)] = value
+        self._tooltips = tips
+        row_tips = {}
+        for row, value in self._row_tooltips.items():
+            row = new_row(row)
+            if row >= 0:
+                row_tips[row] = value
+        self._row_tooltips = row_tips
+
+    def _count_all(self) -> int:
+        while self._iter is not None:
+            self._read_more()
+        return self.RowCount
+
+    def _notify(self, method: str, first_col: int, last_col: int, first_row: int, last_row: int) -> None:
+        if method != "dataChanged":
+            self._last_count = self.RowCount
+        if not self._data_listeners:
+            return
+        event = GridDataEvent(self, first_col, last_col, first_row, last_row)
+        for listener in list(self._data_listeners):
+            try:
+                getattr(listener, method)(event)
+            except DisposedException:
+                self._data_listeners.remove(listener)
+
+    # endregion internal
+
+    # region XGridDataModel
+    @property
+    def RowCount(self) -> int:
+        """Gets the number of rows."""
+        if self._fetch is not None:
+            return self._count
+        return len(self._seq)
+
+    @property
+    def ColumnCount(self) -> int:
+        """Gets the number of columns."""
+        if self._column_count <= 0 and self.RowCount > 0:
+            self._column_count = len(self._get_row(0))
+        return self._column_count
+
+    def getCellData(self, Column: int, RowIndex: int) -> Any:
+        """
+        Retrieves the data for a given cell.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        if Column < 0 or Column >= self.ColumnCount:
+            raise IndexOutOfBoundsException(f"Column index {Column} is out of range", self)
+        row = self._get_row(RowIndex)
+        return row[Column] if Column < len(row) else None
+
+    def getCellToolTip(self, Column: int, RowIndex: int) -> Any:
+        """
+        Retrieves the tool tip to be displayed when the mouse hovers over a given cell.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        result = self._tooltips.get((Column, RowIndex))
+        if result is None:
+            result = self._row_tooltips.get(RowIndex)
+        return result
+
+    def getRowHeading(self, RowIndex: int) -> Any:
+        """
+        Retrieves the heading of a given row.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        if RowIndex in self._heading_overrides:
+            return self._heading_overrides[RowIndex]
+        headings = self._headings
+        if headings is None:
+            return ""
+        if callable(headings):
+            return headings(RowIndex)
+        return headings[RowIndex] if RowIndex < len(headings) else ""
+
+    def getRowData(self, RowIndex: int) -> Tuple[Any, ...]:
+        """
+        Retrieves the data for a complete row.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        row = self._get_row(RowIndex)
+        count = self.ColumnCount
+        if len(row) < count:
+            return row + (None,) * (count - len(row))
+        return row[:count] if len(row) > count else row
+
+    # endregion XGridDataModel
+
+    # region XCloneable
+    def createClone(self) -> VirtualGridDataModel:
+        """Creates a clone of the model that shares the same source."""
+        if self._fetch is not None:
+            rows: Any = self._fetch
+        elif self._iter is not None:
+            self._count_all()
+            rows = self._seq
+        else:
+            rows = list(self._seq) if self._owns_rows else self._seq
+        clone = VirtualGridDataModel(
+            rows,
+            row_count=self._count,
+            column_count=self._column_count,
+            headings=list(self._headings) if isinstance(self._headings, list) else self._headings,
+            row_converter=self._converter,
+            page_size=self._page_size,
+            cache_size=self._pages.capacity,
+        )
+        clone._overrides.update({k: list(v) for k, v in self._overrides.items()})
+        clone._heading_overrides.update(self._heading_overrides)
+        clone._tooltips.update(self._tooltips)
+        clone._row_tooltips.update(self._row_tooltips)
+        return clone
+
+    # endregion XCloneable
+
+    # region XMutableGridDataModel
+    def addRow(self, Heading: Any, Data: Tuple[Any, ...]) -> None:
+        """Appends a row to the model."""
+        self.insertRows(self.RowCount, (Heading,), (Data,))
+
+    def addRows(self, Headings: Tuple[Any, ...], Data: Tuple[Tuple[Any, ...], ...]) -> None:
+        """
+        Appends several rows to the model.
+
+        Raises:
+            com.sun.star.lang.IllegalArgumentException: ``IllegalArgumentException``
+        """
+        self.insertRows(self.RowCount, Headings, Data)
+
+    def insertRow(self, Index: int, Heading: Any, Data: Tuple[Any, ...]) -> None:
+        """
+        Inserts a row into the set of data rows.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self.insertRows(Index, (Heading,), (Data,))
+
+    def insertRows(self, Index: int, Headings: Tuple[Any, ...], Data: Tuple[Tuple[Any, ...], ...]) -> None:
+        """
+        Inserts several rows into the set of data rows.
+
+        Raises:
+            com.sun.star.lang.IllegalArgumentException: ``IllegalArgumentException``
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        if not Data:
+            return
+        self._materialize()
+        if Index < 0 or Index > len(self._seq):
+            raise IndexOutOfBoundsException(f"Row index {Index} is out of range", self)
+        headings = list(Headings) + [""] * (len(Data) - len(Headings))
+        self._seq[Index:Index] = [tuple(r) for r in Data]
+        self._headings[Index:Index] = headings[: len(Data)]  # type: ignore
+        self._shift_rows(Index, len(Data))
+        if self._column_count <= 0:
+            self._column_count = max(len(r) for r in Data)
+        self._notify("rowsInserted", -1, -1, Index, Index + len(Data) - 1)
+
+    def removeRow(self, RowIndex: int) -> None:
+        """
+        Removes a row of data from the model.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        self._materialize()
+        del self._seq[RowIndex]
+        del self._headings[RowIndex]  # type: ignore
+        self._shift_rows(RowIndex, -1)
+        self._notify("rowsRemoved", -1, -1, RowIndex, RowIndex)
+
+    def removeAllRows(self) -> None:
+        """Removes all rows from the model."""
+        self._seq = []
+        self._headings = []
+        self._owns_rows = True
+        self._fetch = None
+        self._iter = None
+        self._converter = None
+        self._count = 0
+        self._overrides.clear()
+        self._heading_overrides.clear()
+        self._tooltips.clear()
+        self._row_tooltips.clear()
+        self._pages.clear()
+        self._notify("rowsRemoved", -1, -1, -1, -1)
+
+    def updateCellData(self, ColumnIndex: int, RowIndex: int, Value: Any) -> None:
+        """
+        Updates the content of a given cell.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self.updateRowData((ColumnIndex,), RowIndex, (Value,))
+
+    def updateRowData(self, ColumnIndexes: Tuple[int, ...], RowIndex: int, Values: Tuple[Any, ...]) -> None:
+        """
+        Updates the content of a given row.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+            com.sun.star.lang.IllegalArgumentException: ``IllegalArgumentException``
+        """
+        self._check_row(RowIndex)
+        if not ColumnIndexes:
+            return
+        row = list(self._get_row(RowIndex))
+        for col, value in zip(ColumnIndexes, Values):
+            if col < 0 or col >= self.ColumnCount:
+                raise IndexOutOfBoundsException(f"Column index {col} is out of range", self)
+            if col >= len(row):
+                row.extend([None] * (col + 1 - len(row)))
+            row[col] = value
+        self._overrides[RowIndex] = row
+        self._notify("dataChanged", min(ColumnIndexes), max(ColumnIndexes), RowIndex, RowIndex)
+
+    def updateRowHeading(self, RowIndex: int, Heading: Any) -> None:
+        """
+        Sets a new title for a given row.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        self._heading_overrides[RowIndex] = Heading
+        self._notify("rowHeadingChanged", -1, -1, RowIndex, RowIndex)
+
+    def updateCellToolTip(self, ColumnIndex: int, RowIndex: int, Value: Any) -> None:
+        """
+        Updates the tooltip to be displayed for a given cell.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        self._tooltips[(ColumnIndex, RowIndex)] = Value
+
+    def updateRowToolTip(self, RowIndex: int, Value: Any) -> None:
+        """
+        Updates the tooltip for all cells of a given row.
+
+        Raises:
+            com.sun.star.lang.IndexOutOfBoundsException: ``IndexOutOfBoundsException``
+        """
+        self._check_row(RowIndex)
+        self._row_tooltips[RowIndex] = Value
+
+    def addGridDataListener(self, Listener: Any) -> None:
+        """Registers listener to be notified of data changes in the model."""
+        if Listener not in self._data_listeners:
+            self._data_listeners.append(Listener)
+
+    def removeGridDataListener(self, Listener: Any) -> None:
+        """Revokes a listener which was previously registered via ``addGridDataListener()``."""
+        if Listener in self._data_listeners:
+            self._data_listeners.remove(Listener)
+
+    # endregion XMutableGridDataModel
+
+    # region XComponent
+    def dispose(self) -> None:
+        """Notifies listeners that the model is disposed and releases the source."""
+        event = EventObject(self)
+        for listener in list(self._data_listeners) + list(self._event_listeners):
+            try:
+                listener.disposing(event)
+            except Exception:
+                pass
+        self._data_listeners.clear()
+        self._event_listeners.clear()
+        self.removeAllRows()
+
+    def addEventListener(self, xListener: Any) -> None:
+        """Adds an event listener to the object."""
+        if xListener not in self._event_listeners:
+            self._event_listeners.append(xListener)
+
+    def removeEventListener(self, aListener: Any) -> None:
+        """Removes an event listener from the listener list."""
+        if aListener in self._event_listeners:
+            self._event_listeners.remove(aListener)
+
+    # endregion XComponent
+
+    # region Methods
+    def refresh(self, row_count: int = -1) -> None:
+        """
+        Reloads rows from the source and notifies the grid.
+
+        Call after the source rows have changed. Cell and heading overrides are discarded.
+
+        Args:
+            row_count (int, optional): New row count for a ``fetch`` callable source.
+        """
+        old_count = self._last_count
+        if row_count >= 0 and self._fetch is not None:
+            self._count = row_count
+        self._pages.clear()
+        self._overrides.clear()
+        self._heading_overrides.clear()
+        new_count = self.RowCount
+        if new_count < old_count:
+            self._notify("rowsRemoved", -1, -1, new_count, old_count - 1)
+        elif new_count > old_count:
+            self._notify("rowsInserted", -1, -1, old_count, new_count - 1)
+        if min(old_count, new_count) > 0:
+            self._notify("dataChanged", -1, -1, 0, min(old_count, new_count) - 1)
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def is_virtual(self) -> bool:
+        """Gets if rows are still read on demand from the source."""
+        return not self._owns_rows
+
+    @property
+    def page_size(self) -> int:
+        """Gets the number of rows read at a time."""
+        return self._page_size
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Gets row cache statistics."""
+        return self._pages.stats
+
+    # endregion Properties
+
+
+__all__ = ("VirtualGridDataModel",)
@@ -1,28 +1,62 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 import uno
-from ooo.dyn.sheet.general_function import GeneralFunction as GeneralFunction
-from ooo.dyn.sheet.solver_constraint_operator import SolverConstraintOperator as SolverConstraintOperator
-from ooo.dyn.sheet.cell_flags import CellFlagsEnum as CellFlagsEnum
 
-from ooodev.utils.data_type.cell_obj import CellObj as CellObj
-from ooodev.utils.data_type.range_obj import RangeObj as RangeObj
-from ooodev.utils.data_type.range_values import RangeValues as RangeValues
-from ooodev.utils.kind.zoom_kind import ZoomKind as ZoomKind
-from ooodev.events.calc_named_event import CalcNamedEvent as CalcNamedEvent
+from ooodev.lazy.lazy_exports import lazy_exports
 
-from ooodev.office.calc import Calc as Calc
-from ooodev.calc.calc_cell import CalcCell as CalcCell
-from ooodev.calc.calc_cell_cursor import CalcCellCursor as CalcCellCursor
-from ooodev.calc.calc_cell_range import CalcCellRange as CalcCellRange
-from ooodev.calc.calc_cell_text_cursor import CalcCellTextCursor as CalcCellTextCursor
-from ooodev.calc.calc_doc import CalcDoc as CalcDoc
-from ooodev.calc.calc_form import CalcForm as CalcForm
-from ooodev.calc.calc_forms import CalcForms as CalcForms
-from ooodev.calc.calc_charts import CalcCharts as CalcCharts
-from ooodev.calc.calc_sheet import CalcSheet as CalcSheet
-from ooodev.calc.calc_sheet_view import CalcSheetView as CalcSheetView
-from ooodev.calc.calc_sheets import CalcSheets as CalcSheets
-from ooodev.calc.spreadsheet_draw_page import SpreadsheetDrawPage as SpreadsheetDrawPage
-from ooodev.calc.spreadsheet_draw_pages import SpreadsheetDrawPages as SpreadsheetDrawPages
+if TYPE_CHECKING:
+    from ooo.dyn.sheet.general_function import GeneralFunction as GeneralFunction
+    from ooo.dyn.sheet.solver_constraint_operator import SolverConstraintOperator as SolverConstraintOperator
+    from ooo.dyn.sheet.cell_flags import CellFlagsEnum as CellFlagsEnum
+
+    from ooodev.utils.data_type.cell_obj import CellObj as CellObj
+    from ooodev.utils.data_type.range_obj import RangeObj as RangeObj
+    from ooodev.utils.data_type.range_values import RangeValues as RangeValues
+    from ooodev.utils.kind.zoom_kind import ZoomKind as ZoomKind
+    from ooodev.events.calc_named_event import CalcNamedEvent as CalcNamedEvent
+
+    from ooodev.office.calc import Calc as Calc
+    from ooodev.calc.calc_cell import CalcCell as CalcCell
+    from ooodev.calc.calc_cell_cursor import CalcCellCursor as CalcCellCursor
+    from ooodev.calc.calc_cell_range import CalcCellRange as CalcCellRange
+    from ooodev.calc.calc_cell_text_cursor import CalcCellTextCursor as CalcCellTextCursor
+    from ooodev.calc.calc_doc import CalcDoc as CalcDoc
+    from ooodev.calc.calc_form import CalcForm as CalcForm
+    from ooodev.calc.calc_forms import CalcForms as CalcForms
+    from ooodev.calc.calc_charts import CalcCharts as CalcCharts
+    from ooodev.calc.calc_sheet import CalcSheet as CalcSheet
+    from ooodev.calc.calc_sheet_view import CalcSheetView as CalcSheetView
+    from ooodev.calc.calc_sheets import CalcSheets as CalcSheets
+    from ooodev.calc.spreadsheet_draw_page import SpreadsheetDrawPage as SpreadsheetDrawPage
+    from ooodev.calc.spreadsheet_draw_pages import SpreadsheetDrawPages as SpreadsheetDrawPages
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "GeneralFunction": "ooo.dyn.sheet.general_function",
+        "SolverConstraintOperator": "ooo.dyn.sheet.solver_constraint_operator",
+        "CellFlagsEnum": "ooo.dyn.sheet.cell_flags",
+        "CellObj": "ooodev.utils.data_type.cell_obj",
+        "RangeObj": "ooodev.utils.data_type.range_obj",
+        "RangeValues": "ooodev.utils.data_type.range_values",
+        "ZoomKind": "ooodev.utils.kind.zoom_kind",
+        "CalcNamedEvent": "ooodev.events.calc_named_event",
+        "Calc": "ooodev.office.calc",
+        "CalcCell": "ooodev.calc.calc_cell",
+        "CalcCellCursor": "ooodev.calc.calc_cell_cursor",
+        "CalcCellRange": "ooodev.calc.calc_cell_range",
+        "CalcCellTextCursor": "ooodev.calc.calc_cell_text_cursor",
+        "CalcDoc": "ooodev.calc.calc_doc",
+        "CalcForm": "ooodev.calc.calc_form",
+        "CalcForms": "ooodev.calc.calc_forms",
+        "CalcCharts": "ooodev.calc.calc_charts",
+        "CalcSheet": "ooodev.calc.calc_sheet",
+        "CalcSheetView": "ooodev.calc.calc_sheet_view",
+        "CalcSheets": "ooodev.calc.calc_sheets",
+        "SpreadsheetDrawPage": "ooodev.calc.spreadsheet_draw_page",
+        "SpreadsheetDrawPages": "ooodev.calc.spreadsheet_draw_pages",
+    },
+)
 
 __all__ = [
     "CalcCell",
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, cast, List, overload, Sequence, TYPE_CHECKING
+from typing import Any, cast, Dict, List, Mapping, overload, Sequence, TYPE_CHECKING
 import uno
 
 from com.sun.star.sheet import XCellSeries
@@ -33,6 +33,7 @@ from ooodev.utils.data_type.generic_unit_size import GenericUnitSize
 from ooodev.utils.data_type.cell_obj import CellObj
 from ooodev.utils.data_type.range_obj import RangeObj
 from ooodev.utils.data_type.range_values import RangeValues
+from ooodev.utils.helper.np_table_helper import NpTableHelper
 from ooodev.utils.partial.lo_inst_props_partial import LoInstPropsPartial
 from ooodev.utils.partial.prop_partial import PropPartial
 from ooodev.utils.partial.qi_partial import QiPartial
@@ -47,6 +48,7 @@ from ooodev.adapter.table.cell_properties2_partial_props import CellProperties2P
 
 
 if TYPE_CHECKING:
+    import numpy as np
     from com.sun.star.sheet import SheetCell
     from com.sun.star.sheet import SheetCellRange
     from com.sun.star.table import CellAddress
@@ -64,6 +66,7 @@ if TYPE_CHECKING:
     from ooodev.calc.calc_sheet import CalcSheet
     from ooodev.calc.chart2.table_chart import TableChart
     from ooodev.calc.controls.cell_range_control import CellRangeControl
+    from ooodev.utils.helper.dot_dict import DotDict
 else:
     CellRangeAddress = Any
     ImgExportT = Any
@@ -689,6 +692,104 @@ class CalcCellRange(
         """
         return self.calc_sheet.get_float_array(range_obj=self._range_obj)
 
+    def get_array_np(self, dtype: Any = None, mask_empty: bool = False, formula: bool = False) -> np.ndarray:
+        """
+        Gets a 2-Dimensional NumPy array of values from a range of cells.
+
+        Data is read in a single call to office and converted by NumPy.
+
+        Args:
+            dtype (Any, optional): NumPy dtype of the result.
+                A floating point dtype reads pure doubles; non-numeric cells are ``NaN``.
+                If omitted then dtype is ``float64`` when all non-empty cells are numeric; Otherwise, ``object``.
+            mask_empty (bool, optional): If ``True`` a ``numpy.ma.MaskedArray`` is returned with empty cells masked;
+                Otherwise, empty cells are ``NaN``. Default ``False``.
+            formula (bool, optional): If ``True`` cell formulas are returned instead of values. Default ``False``.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Returns:
+            numpy.ndarray: 2-Dimensional array.
+
+        .. versionadded:: 0.48.0
+        """
+        return NpTableHelper.get_array(
+            cell_range=self.component, dtype=dtype, mask_empty=mask_empty, formula=formula  # type: ignore
+        )
+
+    def set_array_np(self, values: np.ndarray, formula: bool = False) -> None:
+        """
+        Sets the values of the range from a 2-Dimensional NumPy array.
+
+        Data is written in a single call to office.
+
+        Args:
+            values (numpy.ndarray): 2-Dimensional array. Must be the same size as the range.
+                ``NaN``, ``None`` and masked values result in empty cells.
+            formula (bool, optional): If ``True`` values are written as formulas. Default ``False``.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``values`` is not 2-Dimensional or does not match the size of the range.
+
+        Returns:
+            None:
+
+        .. versionadded:: 0.48.0
+        """
+        shape = getattr(values, "shape", None)
+        if shape is not None and tuple(shape) != (self._range_obj.row_count, self._range_obj.col_count):
+            raise ValueError(
+                f"Array shape {tuple(shape)} does not match range size "
+                f"({self._range_obj.row_count}, {self._range_obj.col_count})."
+            )
+        NpTableHelper.set_array(cell_range=self.component, values=values, formula=formula)  # type: ignore
+
+    def get_custom_properties_bulk(self) -> Dict[CellObj, DotDict]:
+        """
+        Gets the custom properties of all cells in the range that have custom properties.
+
+        All cell shapes and hidden controls are resolved in a single pass over the sheet draw page.
+
+        Returns:
+            Dict[CellObj, DotDict]: Custom properties keyed by cell.
+
+        See Also:
+            :py:meth:`CalcCell.get_custom_properties() <ooodev.calc.calc_cell.CalcCell.get_custom_properties>`
+
+        .. versionadded:: 0.48.0
+        """
+        return self.calc_sheet.custom_cell_properties.get_custom_properties_bulk(self.range_obj)
+
+    def set_custom_properties_bulk(self, values: Mapping[CellObj | str, DotDict]) -> None:
+        """
+        Sets the custom properties of many cells in the range.
+
+        All cell shapes and hidden controls are resolved in a single pass over the sheet draw page.
+        Missing shapes and hidden controls are created in one batch while the document controllers are locked.
+
+        Args:
+            values (Mapping[CellObj | str, DotDict]): Custom properties keyed by cell or cell name such as ``A1``.
+
+        Raises:
+            IndexError: If a cell is not in the range.
+            AttributeError: If a property is a forbidden key.
+
+        Returns:
+            None:
+
+        See Also:
+            :py:meth:`CalcCell.set_custom_properties() <ooodev.calc.calc_cell.CalcCell.set_custom_properties>`
+
+        .. versionadded:: 0.48.0
+        """
+        rng = self.range_obj
+        for cell in values.keys():
+            if not rng.contains(cell):  # type: ignore
+                raise IndexError(f"Cell '{cell}' is not in range '{rng}'")
+        self.calc_sheet.custom_cell_properties.set_custom_properties_bulk(values)
+
     def get_val(self) -> Any:
         """
         Get the value of the very first cell in the range.
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, cast, List, Tuple, overload, Sequence, TYPE_CHECKING
+from typing import Any, cast, Iterable, List, Tuple, overload, Sequence, TYPE_CHECKING
 
 # pylint: wrong-import-position
 import uno
@@ -190,6 +190,54 @@ class CalcDoc(
             result = mCalc.Calc.call_fun(func_name, *args)
         return result
 
+    def call_fun_many(
+        self,
+        func_name: str,
+        args: Iterable[Any],
+        *,
+        vectorize: bool = False,
+        chunk_size: int = 1000,
+        as_numpy: bool = False,
+        return_exceptions: bool = False,
+    ) -> Any:
+        """
+        Execute a Calc function for many sets of arguments.
+
+        When ``vectorize`` is ``True`` and all arguments are numbers or strings, each chunk of rows is sent to office
+        in a single call by passing the arguments that vary as column arrays.
+
+        Args:
+            func_name (str): the English name of the function to execute such as ``NORM.DIST``.
+            args (Iterable[Any]): Arguments for each call. Each item is a tuple of arguments
+                or a single value for functions that take one argument.
+            vectorize (bool, optional): Pack arguments into arrays. Only set to ``True`` for functions that return
+                one value per element of an array argument, such as ``NORM.DIST`` or ``SQRT``. Array functions such as
+                ``SORT`` or ``TREND`` also return one value per row but the values depend on all rows, so the results
+                would be wrong. Defaults to ``False``.
+            chunk_size (int, optional): Max number of rows per call when vectorized. Defaults to ``1000``.
+            as_numpy (bool, optional): Return a NumPy array. Defaults to ``False``.
+            return_exceptions (bool, optional): If ``True`` the exception of a failed row is returned in place of
+                its result; Otherwise, ``None`` is returned for failed rows. Defaults to ``False``.
+
+        Returns:
+            List[Any] | numpy.ndarray: One result per item of ``args``.
+
+        See Also:
+            :py:meth:`Calc.call_fun_many() <ooodev.office.calc.Calc.call_fun_many>`
+
+        .. versionadded:: 0.48.0
+        """
+        with LoContext(self.lo_inst):
+            result = mCalc.Calc.call_fun_many(
+                func_name,
+                args,
+                vectorize=vectorize,
+                chunk_size=chunk_size,
+                as_numpy=as_numpy,
+                return_exceptions=return_exceptions,
+            )
+        return result
+
     def compute_function(self, fn: GeneralFunction | str, cell_range: XCellRange) -> float:
         """
         Computes a Calc Function
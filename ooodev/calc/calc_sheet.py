@@ -1,8 +1,13 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Set, Tuple, cast, overload, Sequence, TYPE_CHECKING
+import itertools
+import operator
+from typing import Any, Dict, Generator, Iterable, List, Set, Tuple, cast, overload, Sequence, TYPE_CHECKING
 import uno
 
 from com.sun.star.drawing import XDrawPageSupplier
+from com.sun.star.frame import XModel
+from com.sun.star.sheet import XCalculatable
+from com.sun.star.sheet import XCellRangeData
 from com.sun.star.sheet import XSheetCellRange
 from com.sun.star.sheet import XSpreadsheet
 from com.sun.star.table import XCell
@@ -24,9 +29,11 @@ from ooodev.loader.inst.lo_inst import LoInst
 from ooodev.office import calc as mCalc
 from ooodev.utils import info as mInfo
 from ooodev.utils import props as mProps
+from ooodev.utils import table_helper as mTb
 from ooodev.utils.context.lo_context import LoContext
 from ooodev.utils.data_type import cell_obj as mCellObj
 from ooodev.utils.data_type import range_obj as mRngObj
+from ooodev.utils.helper.np_table_helper import NpTableHelper
 from ooodev.utils.partial.lo_inst_props_partial import LoInstPropsPartial
 from ooodev.utils.partial.prop_partial import PropPartial
 from ooodev.utils.partial.qi_partial import QiPartial
@@ -44,6 +51,7 @@ from ooodev.calc.partial.calc_sheet_prop_partial import CalcSheetPropPartial
 from ooodev.calc.partial.popup_rng_sel_partial import PopupRngSelPartial
 
 if TYPE_CHECKING:
+    import numpy as np
     from com.sun.star.sheet import SolverConstraint  # struct
     from com.sun.star.sheet import XDataPilotTables
     from com.sun.star.sheet import XGoalSeek
@@ -588,6 +596,114 @@ class CalcSheet(
 
     # endregion get_float_array()
 
+    # region get_array_np()
+    def _get_np_cell_range(self, kwargs: Dict[str, Any]) -> XCellRange:
+        if "cell_range" in kwargs:
+            return kwargs["cell_range"]
+        return mCalc.Calc.get_cell_range(sheet=self.component, **kwargs)
+
+    @overload
+    def get_array_np(
+        self, *, cell_range: XCellRange, dtype: Any = ..., mask_empty: bool = ..., formula: bool = ...
+    ) -> np.ndarray: ...
+
+    @overload
+    def get_array_np(
+        self, *, range_name: str, dtype: Any = ..., mask_empty: bool = ..., formula: bool = ...
+    ) -> np.ndarray: ...
+
+    @overload
+    def get_array_np(
+        self, *, range_obj: mRngObj.RangeObj, dtype: Any = ..., mask_empty: bool = ..., formula: bool = ...
+    ) -> np.ndarray: ...
+
+    def get_array_np(
+        self, *, dtype: Any = None, mask_empty: bool = False, formula: bool = False, **kwargs
+    ) -> np.ndarray:
+        """
+        Gets a 2-Dimensional NumPy array of values from a range of cells.
+
+        Data is read in a single call to office and converted by NumPy.
+
+        Args:
+            cell_range (XCellRange): Cell range to get data from.
+            range_name (str): Range of data to get such as ``A1:E16``.
+            range_obj (RangeObj): Range object.
+            dtype (Any, optional): NumPy dtype of the result.
+                A floating point dtype reads pure doubles; non-numeric cells are ``NaN``.
+                If omitted then dtype is ``float64`` when all non-empty cells are numeric; Otherwise, ``object``.
+            mask_empty (bool, optional): If ``True`` a ``numpy.ma.MaskedArray`` is returned with empty cells masked;
+                Otherwise, empty cells are ``NaN``. Default ``False``.
+            formula (bool, optional): If ``True`` cell formulas are returned instead of values. Default ``False``.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Returns:
+            numpy.ndarray: 2-Dimensional array.
+
+        .. versionadded:: 0.48.0
+        """
+        cell_range = self._get_np_cell_range(kwargs)
+        return NpTableHelper.get_array(cell_range=cell_range, dtype=dtype, mask_empty=mask_empty, formula=formula)
+
+    # endregion get_array_np()
+
+    # region set_array_np()
+    @overload
+    def set_array_np(self, *, values: np.ndarray, cell_range: XCellRange, formula: bool = ...) -> None: ...
+
+    @overload
+    def set_array_np(self, *, values: np.ndarray, range_name: str, formula: bool = ...) -> None: ...
+
+    @overload
+    def set_array_np(self, *, values: np.ndarray, range_obj: mRngObj.RangeObj, formula: bool = ...) -> None: ...
+
+    @overload
+    def set_array_np(self, *, values: np.ndarray, cell_obj: mCellObj.CellObj, formula: bool = ...) -> None: ...
+
+    def set_array_np(self, *, values: np.ndarray, formula: bool = False, **kwargs) -> None:
+        """
+        Sets the values of a range of cells from a 2-Dimensional NumPy array.
+
+        Data is written in a single call to office.
+
+        Args:
+            values (numpy.ndarray): 2-Dimensional array.
+                ``NaN``, ``None`` and masked values result in empty cells.
+            cell_range (XCellRange): Cell range to write to. Must be the same size as ``values``.
+            range_name (str): Range to write to such as ``A1:E16``. Must be the same size as ``values``.
+            range_obj (RangeObj): Range object. Must be the same size as ``values``.
+            cell_obj (CellObj): Top left cell to write to. The range size is taken from ``values``.
+            formula (bool, optional): If ``True`` values are written as formulas. Default ``False``.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``values`` is not 2-Dimensional.
+
+        Returns:
+            None:
+
+        .. versionadded:: 0.48.0
+        """
+        if "cell_obj" in kwargs:
+            cell_obj = cast(mCellObj.CellObj, kwargs["cell_obj"])
+            rows, cols = values.shape
+            col_start = cell_obj.col_obj.index
+            row_start = cell_obj.row - 1
+            cell_range = mCalc.Calc.get_cell_range(
+                sheet=self.component,
+                col_start=col_start,
+                row_start=row_start,
+                col_end=col_start + cols - 1,
+                row_end=row_start + rows - 1,
+            )
+        else:
+            cell_range = self._get_np_cell_range(kwargs)
+        NpTableHelper.set_array(cell_range=cell_range, values=values, formula=formula)
+
+    # endregion set_array_np()
+
     def get_pilot_tables(self) -> XDataPilotTables:
         """
         Gets pivot tables (formerly known as DataPilot) for a sheet.
@@ -3104,6 +3220,182 @@ class CalcSheet(
 
     # endregion find_used_range_obj()
 
+    def iter_rows(
+        self,
+        chunk_rows: int = 1000,
+        columns: Sequence[int | str] | None = None,
+        range_obj: mRngObj.RangeObj | None = None,
+    ) -> Generator[Tuple[Any, ...], None, None]:
+        """
+        Iterates the rows of a range in blocks of rows.
+
+        Each block is read with a single ``getDataArray()`` call and its rows are yielded one at a time.
+        Only one block is held in memory at a time so memory stays bounded regardless of sheet size.
+
+        Args:
+            chunk_rows (int, optional): Number of rows to read per call to office. Default ``1000``.
+            columns (Sequence[int | str], optional): Columns to include in each row, in the order given.
+                Columns can be zero-based sheet column indexes or column names such as ``A``.
+                If omitted then all columns of the range are included.
+            range_obj (RangeObj, optional): Range to iterate. If omitted then the used range of the sheet is iterated.
+
+        Raises:
+            ValueError: If ``chunk_rows`` is less than ``1``.
+
+        Yields:
+            Tuple[Any, ...]: Row values.
+
+        Note:
+            When ``columns`` is passed then the block read from office spans from the lowest to the highest column
+            and the requested columns are picked from it.
+
+        Example:
+            .. code-block:: python
+
+                for row in sheet.iter_rows(chunk_rows=5000, columns=["A", "C"]):
+                    print(row)
+
+        .. versionadded:: 0.48.0
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be 1 or greater. Got {chunk_rows}")
+        rng = self.find_used_range_obj() if range_obj is None else range_obj
+        col_start = rng.start_col_index
+        col_end = rng.end_col_index
+        getter = None
+        if columns:
+            col_indexes = [
+                mTb.TableHelper.col_name_to_int(name=col, zero_index=True) if isinstance(col, str) else int(col)
+                for col in columns
+            ]
+            col_start = min(col_indexes)
+            col_end = max(col_indexes)
+            positions = [idx - col_start for idx in col_indexes]
+            if positions != list(range(col_end - col_start + 1)):
+                # positions always has more than one item here, so itemgetter returns a tuple.
+                getter = operator.itemgetter(*positions)
+
+        sheet = self.component
+        row_end = rng.end_row_index
+        row = rng.start_row_index
+        while row <= row_end:
+            block_end = min(row + chunk_rows - 1, row_end)
+            cell_range = sheet.getCellRangeByPosition(col_start, row, col_end, block_end)
+            cr_data = self.lo_inst.qi(XCellRangeData, cell_range, True)
+            block = cr_data.getDataArray()
+            if getter is None:
+                yield from block
+            else:
+                for values in block:
+                    yield getter(values)
+            row = block_end + 1
+
+    def write_table(
+        self,
+        values: Iterable[Sequence[Any]],
+        start_cell: str | mCellObj.CellObj = "A1",
+        chunk_rows: int | None = None,
+        lock_controllers: bool = True,
+        disable_auto_calc: bool = False,
+        chunk_cells: int = 50_000,
+    ) -> mRngObj.RangeObj | None:
+        """
+        Writes a table of values to the sheet in blocks of rows.
+
+        Each block is written with a single ``setDataArray()`` call.
+        ``values`` can be any iterable of rows, including a generator,
+        so the whole table never needs to be held in memory.
+
+        Args:
+            values (Iterable[Sequence[Any]]): Rows of values to write.
+            start_cell (str | CellObj, optional): Top left cell of the table. Default ``A1``.
+            chunk_rows (int, optional): Number of rows written per call to office.
+                If omitted then the number of rows is computed from ``chunk_cells`` and the width of the first row.
+            lock_controllers (bool, optional): If ``True`` the document controllers are locked while writing
+                so the UI is not updated for each block. Default ``True``.
+            disable_auto_calc (bool, optional): If ``True`` automatic calculation is turned off while writing
+                and restored when done. Default ``False``.
+            chunk_cells (int, optional): Approximate number of cells written per call to office
+                when ``chunk_rows`` is omitted. Default ``50_000``.
+
+        Raises:
+            ValueError: If ``chunk_rows`` or ``chunk_cells`` is less than ``1``.
+
+        Returns:
+            RangeObj | None: Range that was written to or ``None`` if ``values`` has no rows.
+
+        Note:
+            Rows in a block that are shorter than the longest row of that block are padded with empty values.
+
+        Example:
+            .. code-block:: python
+
+                def gen_rows():
+                    for i in range(1_000_000):
+                        yield (i, i * 2, f"row {i}")
+
+                rng = sheet.write_table(gen_rows(), "A1", disable_auto_calc=True)
+
+        .. versionadded:: 0.48.0
+        """
+        if chunk_rows is not None and chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be 1 or greater. Got {chunk_rows}")
+        if chunk_cells < 1:
+            raise ValueError(f"chunk_cells must be 1 or greater. Got {chunk_cells}")
+        cell_obj = mCellObj.CellObj.from_cell(start_cell)
+        col_start = cell_obj.col_obj.index
+        row_start = cell_obj.row - 1
+
+        rows_iter = iter(values)
+        first = next(rows_iter, None)
+        if first is None:
+            return None
+        if chunk_rows is None:
+            chunk_rows = max(1, chunk_cells // max(1, len(first)))
+        rows_iter = itertools.chain((first,), rows_iter)
+
+        model = self.lo_inst.qi(XModel, self.calc_doc.component, True) if lock_controllers else None
+        calculatable = self.lo_inst.qi(XCalculatable, self.calc_doc.component, True) if disable_auto_calc else None
+        auto_calc = False
+        sheet = self.component
+        row = row_start
+        max_cols = 0
+        try:
+            if model is not None:
+                model.lockControllers()
+            if calculatable is not None:
+                auto_calc = calculatable.isAutomaticCalculationEnabled()
+                calculatable.enableAutomaticCalculation(False)
+            while True:
+                block = [tuple(r) for r in itertools.islice(rows_iter, chunk_rows)]
+                if not block:
+                    break
+                width = max(len(r) for r in block)
+                if width == 0:
+                    row += len(block)
+                    continue
+                block = [r if len(r) == width else r + ("",) * (width - len(r)) for r in block]
+                max_cols = max(max_cols, width)
+                cell_range = sheet.getCellRangeByPosition(col_start, row, col_start + width - 1, row + len(block) - 1)
+                cr_data = self.lo_inst.qi(XCellRangeData, cell_range, True)
+                cr_data.setDataArray(tuple(block))
+                row += len(block)
+        finally:
+            if calculatable is not None and auto_calc:
+                calculatable.enableAutomaticCalculation(True)
+            if model is not None:
+                model.unlockControllers()
+
+        if row == row_start or max_cols == 0:
+            return None
+        return mRngObj.RangeObj(
+            col_start=mTb.TableHelper.make_column_name(col_start, zero_index=True),
+            col_end=mTb.TableHelper.make_column_name(col_start + max_cols - 1, zero_index=True),
+            row_start=row_start + 1,
+            row_end=row,
+            sheet_idx=self.sheet_index,
+        )
+
     # region find_used_range()
     @overload
     def find_used_range(self) -> mCalcCellRange.CalcCellRange:
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, cast, Dict, List, TYPE_CHECKING, Tuple
+from typing import Any, cast, TYPE_CHECKING, Tuple
 import contextlib
 import uno
 import unohelper
@@ -8,14 +8,11 @@ from com.sun.star.drawing import XControlShape
 from com.sun.star.form import XForm
 from com.sun.star.lang import XComponent
 
-from ooo.dyn.drawing.text_vertical_adjust import TextVerticalAdjust
 from ooo.dyn.beans.property_attribute import PropertyAttributeEnum
-from ooo.dyn.awt.size import Size
 
 from ooodev.calc.calc_cell import CalcCell
 from ooodev.calc.cell.custom_prop_base import CustomPropBase
 from ooodev.form.controls.form_ctl_hidden import FormCtlHidden
-from ooodev.utils import gen_util as gUtil
 from ooodev.utils import props as mProps
 from ooodev.utils.gen_util import NULL_OBJ
 from ooodev.utils.helper.dot_dict import DotDict
@@ -23,7 +20,6 @@ from ooodev.utils.helper.dot_dict import DotDict
 if TYPE_CHECKING:
     from com.sun.star.container import ContainerEvent
     from com.sun.star.container import XContainer
-    from com.sun.star.drawing import ControlShape
     from com.sun.star.lang import EventObject
     from ooodev.loader.inst.lo_inst import LoInst
 
@@ -51,7 +47,7 @@ class CustomProp(CustomPropBase):
     class ContainerListener(unohelper.Base, XContainerListener):
 
         def __init__(
-            self, form_name: str, cp: CustomProp, lo_inst: LoInst, subscriber: XContainer | None = None
+            self, form_name: str, cp: CustomPropBase, lo_inst: LoInst, subscriber: XContainer | None = None
         ) -> None:
             super().__init__()
             self._form_name = form_name
@@ -77,6 +73,8 @@ class CustomProp(CustomPropBase):
             # replaced element should be a form
             if self.is_element_monitored_form(event.Element):
                 self.reset()
+            else:
+                self._cp._on_element_inserted(event)
 
         def elementRemoved(self, event: ContainerEvent) -> None:
             """
@@ -84,6 +82,8 @@ class CustomProp(CustomPropBase):
             """
             if self.is_element_monitored_form(event.Element):
                 self.reset()
+            else:
+                self._cp._on_element_removed(event)
 
         def elementReplaced(self, event: ContainerEvent) -> None:
             """
@@ -112,7 +112,6 @@ class CustomProp(CustomPropBase):
     def __init__(self, cell: CalcCell) -> None:
         CustomPropBase.__init__(self, cell.calc_sheet)
         self._cell = cell
-        self._forbidden_keys = set(("HiddenValue", "Name", "ClassId", "Tag"))
         self._attribute_name = "CustomPropertiesId"
         self._ctl_name = None
         self._row = self._cell.cell_obj.row - 1
@@ -137,120 +136,19 @@ class CustomProp(CustomPropBase):
         self.cache[key] = shape, s
         return shape, s
 
-    def _get_shapes_dict(self) -> Dict[str, List[XControlShape]]:
-
-        comp = self.draw_page.component
-        shapes = {}
-        # find all shapes on the draw page that start with prefix and end with suffix
-        for shape in comp:  # type: ignore
-            if not hasattr(shape, "supportsService"):
-                continue
-            if not shape.supportsService("com.sun.star.drawing.ControlShape"):
-                continue
-            try:
-                name = cast(str, shape.Name)
-            except AttributeError:
-                continue
-            if name.startswith(self.shape_prefix) and name.endswith(self.shape_suffix):
-                if name in shapes:
-                    shapes[name].append(shape)
-                else:
-                    shapes[name] = [shape]
-        return shapes
-
     def _find_shape_by_cell_row_col(self, row: int, col: int) -> XControlShape | None:
-        # When a cell has been copied and pasted there will be a duplicate shape in the dest cell.
-        # For this reason a small cleanup is done if needed to remove any duplicate shapes.
-        # The duplicate shapes will have a higher z-order then the original shape. The higher z-order shapes are removed.
-        # Depending on environment there may not be duplicates with the exact shape name. It may be an artifact such as '_cprop_idhdkuy07hizr3eh_id 1'
-        # In this case the artifact is removed when the cell custom properties that contains the artifact is accessed.
+        # Shapes are looked up in the (row, col) index of the sheet custom properties.
+        # The index also takes care of removing duplicate shapes and artifacts such as '_cprop_idhdkuy07hizr3eh_id 1'
+        # that are in the cell. See SheetCellCustomProperties._index_find_shape().
 
         key = f"shape_{row}_{col}"
         if key in self.cache:
             return self.cache[key]
-        comp = self.draw_page.component
-
-        found_shape = None
-        cleanup = []
-
-        for shape in comp:  # type: ignore
-            if not shape.supportsService("com.sun.star.drawing.ControlShape"):
-                continue
-
-            anchor = shape.Anchor
-            if anchor is None:
-                continue
-            if anchor.getImplementationName() != "ScCellObj":
-                continue
-
-            if not shape.Name.startswith(self.shape_prefix):
-                continue
-
-            cell_address = anchor.CellAddress
-            if cell_address.Row == row and cell_address.Column == col:
-                if shape.Name.endswith(self.shape_suffix):
-                    if found_shape is None:
-                        found_shape = shape
-                else:
-                    cleanup.append(shape)
-
-        if found_shape is None:
-            if cleanup:
-                for shape in cleanup:
-                    with contextlib.suppress(Exception):
-                        self._draw_page.remove(shape)
-            cleanup.clear()
-            return None
-
-        def get_result(shp: Any) -> Any:
-            nonlocal row, col
-            anchor = shp.Anchor
-            if anchor is None:
-                return None
-            if anchor.getImplementationName() != "ScCellObj":
-                return None
-            cell_address = anchor.CellAddress
-            if cell_address.Row == row and cell_address.Column == col:
-                # the current shape may be the original shape in another cell.
-                # That means this cell is a copy.
-                return shp
-            return None
-
-        result = None
-
-        shapes_dict = self._get_shapes_dict()
-        shapes = shapes_dict[found_shape.Name]
-        if len(shapes) == 1:
-            result = found_shape
-        else:
-            # sort shapes by zorder
-            found_shape = None
-            result = None
-            shapes.sort(key=lambda x: x.ZOrder)  # type: ignore
-            # if there is more then one shape then the first shape is the original
-            # if cleanup is not empty at this point then it will contain artifacts such as '_cprop_idhdkuy07hizr3eh_id 1' that need to be removed.
-            cleanup.extend(shapes[1:])
-            result = get_result(shapes[0])
-
-        if cleanup:
-            for shape in cleanup:
-                with contextlib.suppress(Exception):
-                    self.draw_page.remove(shape)
+        result = self.sheet.custom_cell_properties._index_find_shape(row, col)
         if result:
             self.cache[key] = result
         return result
 
-    def _create_shape(self) -> XControlShape:
-        shape = cast(
-            "ControlShape",
-            self.sheet.lo_inst.create_instance_msf(XControlShape, "com.sun.star.drawing.ControlShape", raise_err=True),
-        )
-        # Setting shape.Visible does not work here. It does work after shape has been added to the draw page.
-        # shape.setPropertyValue("Visible", False)
-        # shape.Visible = False
-
-        return shape
-
     def _add_shape_to_cell(self) -> Tuple[XControlShape, str]:
         # There is a strange issue, maybe a bug, when the shape is added the the cell the sheet must be activated.
         # If the sheet is not active when the shape is added then everything seems to work fine until you try to save the document.
@@ -263,30 +161,9 @@ class CustomProp(CustomPropBase):
         if active_sheet.name != self.sheet.name:
             activated = True
             self.sheet.calc_sheet.set_active()
-        shape = cast("ControlShape", self._create_shape())
-
-        str_id = "id" + gUtil.Util.generate_random_alpha_numeric(14).lower()
-        shape.Name = f"{self.shape_prefix}{str_id}{self.shape_suffix}"  # type: ignore
-
-        self.draw_page.add(shape)
-
-        # note setting visible to true here cause the document to hang when be saved. This is a critical failure.
-        shape.Anchor = self._cell.component  # type: ignore
-        shape_key_val = {
-            "Decorative": False,
-            "TextVerticalAdjust": TextVerticalAdjust.CENTER,
-            "HoriOrient": 0,
-            "MoveProtect": False,
-            "Printable": False,
-            "ResizeWithCell": True,
-            "SizeProtect": False,
-            "Visible": True,
-        }
-        for key, val in shape_key_val.items():
-            if hasattr(shape, key):
-                setattr(shape, key, val)
-
-        shape.setSize(Size(1, 1))
+
+        shape, str_id = self._add_shape_to_cell_component(self._cell.component)
+        self.sheet.custom_cell_properties._index_add_shape(self._row, self._col, shape)
 
         if activated:
             active_sheet.set_active()
@@ -493,6 +370,7 @@ class CustomProp(CustomPropBase):
         shape = self._find_shape_by_cell_row_col(self._row, self._col)
         if shape:
             self._draw_page.remove(shape)
+            self.sheet.custom_cell_properties._index_remove_shape(self._row, self._col)
             shape = None
 
     # endregion Property Access
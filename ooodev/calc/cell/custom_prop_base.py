@@ -1,11 +1,18 @@
 from __future__ import annotations
-from typing import cast, TYPE_CHECKING
+from typing import Any, cast, TYPE_CHECKING, Tuple
 import uno
 from com.sun.star.drawing import XControlShape
 from com.sun.star.form import XForm
+
+from ooo.dyn.awt.size import Size
+from ooo.dyn.drawing.text_vertical_adjust import TextVerticalAdjust
+
+from ooodev.utils import gen_util as gUtil
 from ooodev.utils.partial.the_dictionary_partial import TheDictionaryPartial
 
 if TYPE_CHECKING:
+    from com.sun.star.container import ContainerEvent
+    from com.sun.star.drawing import ControlShape
     from com.sun.star.form.component import Form
     from com.sun.star.form.component import HiddenControl
     from ooodev.calc.calc_sheet import CalcSheet
@@ -19,6 +26,7 @@ class CustomPropBase(TheDictionaryPartial):
         self._shape_suffix = "_id"  # suffix is important for ensure shape duplicates are removed.
         self._sheet = sheet
         self._form_name = "CellCustomProperties"
+        self._forbidden_keys = set(("HiddenValue", "Name", "ClassId", "Tag"))
         self._cache = {}
         self._draw_page = self._sheet.draw_page
 
@@ -37,6 +45,45 @@ class CustomPropBase(TheDictionaryPartial):
         name = name[:-suffix_len]
         return name
 
+    def _create_shape(self) -> XControlShape:
+        shape = cast(
+            "ControlShape",
+            self.sheet.lo_inst.create_instance_msf(XControlShape, "com.sun.star.drawing.ControlShape", raise_err=True),
+        )
+        # Setting shape.Visible does not work here. It does work after shape has been added to the draw page.
+        # shape.setPropertyValue("Visible", False)
+        # shape.Visible = False
+
+        return shape
+
+    def _add_shape_to_cell_component(self, cell: Any) -> Tuple[XControlShape, str]:
+        # The sheet should be active when the shape is added. See CustomProp._add_shape_to_cell()
+        shape = cast("ControlShape", self._create_shape())
+
+        str_id = "id" + gUtil.Util.generate_random_alpha_numeric(14).lower()
+        shape.Name = f"{self.shape_prefix}{str_id}{self.shape_suffix}"  # type: ignore
+
+        self.draw_page.add(shape)
+
+        # note setting visible to true here cause the document to hang when be saved. This is a critical failure.
+        shape.Anchor = cell  # type: ignore
+        shape_key_val = {
+            "Decorative": False,
+            "TextVerticalAdjust": TextVerticalAdjust.CENTER,
+            "HoriOrient": 0,
+            "MoveProtect": False,
+            "Printable": False,
+            "ResizeWithCell": True,
+            "SizeProtect": False,
+            "Visible": True,
+        }
+        for key, val in shape_key_val.items():
+            if hasattr(shape, key):
+                setattr(shape, key, val)
+
+        shape.setSize(Size(1, 1))
+        return shape, str_id
+
     def _get_form(self) -> Form:
 
         key = self._form_name
@@ -72,6 +119,14 @@ class CustomPropBase(TheDictionaryPartial):
     def _reset(self) -> None:
         self._cache.clear()
 
+    def _on_element_inserted(self, event: ContainerEvent) -> None:
+        # called by container listener for elements that are not the monitored form.
+        pass
+
+    def _on_element_removed(self, event: ContainerEvent) -> None:
+        # called by container listener for elements that are not the monitored form.
+        pass
+
     def __del__(self) -> None:
         pass
 
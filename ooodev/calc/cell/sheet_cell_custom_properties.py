@@ -1,19 +1,226 @@
 from __future__ import annotations
-from typing import Dict, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Set, Tuple, TYPE_CHECKING
+import contextlib
 
 import uno
+from com.sun.star.frame import XModel
+from com.sun.star.lang import XComponent
 
+from ooo.dyn.beans.property_attribute import PropertyAttributeEnum
+
+from ooodev.events.calc_named_event import CalcNamedEvent
+from ooodev.events.event_singleton import _Events
 from ooodev.io.log import logging as logger
+from ooodev.calc.cell.custom_prop import CustomProp
 from ooodev.calc.cell.custom_prop_clean import CustomPropClean
+from ooodev.utils import props as mProps
 from ooodev.utils.data_type.cell_obj import CellObj
+from ooodev.utils.helper.dot_dict import DotDict
 
 if TYPE_CHECKING:
+    from com.sun.star.container import ContainerEvent
+    from com.sun.star.drawing import XControlShape
     from ooodev.calc.calc_sheet import CalcSheet
+    from ooodev.events.args.calc.sheet_args import SheetArgs
+    from ooodev.utils.data_type.range_obj import RangeObj
 
 
 class SheetCellCustomProperties(CustomPropClean):
+    """
+    Custom properties for all cells of a sheet.
+
+    Keeps a ``(row, col)`` index of the shapes that hold cell custom properties.
+    The index is built in a single pass over the draw page the first time it is needed.
+    It is kept current when custom properties are added or removed and it is invalidated when the custom properties form
+    changes or when rows, columns or cells are inserted or deleted using |odev|.
+
+    .. versionchanged:: 0.48.0
+        Added shape index.
+    """
+
     def __init__(self, sheet: CalcSheet):
         CustomPropClean.__init__(self, sheet)
+        self._shape_index: Dict[Tuple[int, int], XControlShape] | None = None
+        self._shape_index_names: Dict[str, Tuple[int, int]] = {}
+        self._shape_index_artifacts: Dict[Tuple[int, int], List[XControlShape]] = {}
+        self._listened_form: Any = None
+        self._container_listener = CustomProp.ContainerListener(
+            form_name=self._form_name, cp=self, lo_inst=sheet.lo_inst, subscriber=self._draw_page.forms.component
+        )
+        self._fn_on_sheet_changed = self._on_sheet_changed
+        for event_name in (
+            CalcNamedEvent.SHEET_ROW_INSERTED,
+            CalcNamedEvent.SHEET_ROW_DELETED,
+            CalcNamedEvent.SHEET_COL_INSERTED,
+            CalcNamedEvent.SHEET_COL_DELETED,
+            CalcNamedEvent.CELLS_INSERTED,
+            CalcNamedEvent.CELLS_DELETED,
+        ):
+            _Events().on(event_name, self._fn_on_sheet_changed)
+
+    # region Shape Index
+    def _get_shape_index(self) -> Dict[Tuple[int, int], XControlShape]:
+        if self._shape_index is None:
+            self._build_shape_index()
+        return self._shape_index  # type: ignore
+
+    def _build_shape_index(self) -> None:
+        # One pass over the draw page.
+        # When a cell has been copied and pasted there will be a duplicate shape in the dest cell.
+        # The duplicate shapes will have a higher z-order then the original shape.
+        # Duplicates and artifacts such as '_cprop_idhdkuy07hizr3eh_id 1' are kept by cell so they can be removed when
+        # the cell is accessed.
+        index: Dict[Tuple[int, int], XControlShape] = {}
+        names: Dict[str, Tuple[int, int]] = {}
+        artifacts: Dict[Tuple[int, int], List[XControlShape]] = {}
+        groups: Dict[str, List[Tuple[Tuple[int, int], XControlShape]]] = {}
+
+        for shape in self.draw_page.component:  # type: ignore
+            if not shape.supportsService("com.sun.star.drawing.ControlShape"):
+                continue
+            name = shape.Name
+            if not name.startswith(self._shape_prefix):
+                continue
+            anchor = shape.Anchor
+            if anchor is None:
+                continue
+            if anchor.getImplementationName() != "ScCellObj":
+                continue
+            cell_address = anchor.CellAddress
+            key = (cell_address.Row, cell_address.Column)
+            if name.endswith(self._shape_suffix):
+                if name in groups:
+                    groups[name].append((key, shape))
+                else:
+                    groups[name] = [(key, shape)]
+            elif key in artifacts:
+                artifacts[key].append(shape)
+            else:
+                artifacts[key] = [shape]
+
+        for name, items in groups.items():
+            if len(items) > 1:
+                items.sort(key=lambda x: x[1].ZOrder)  # type: ignore
+                for key, shape in items[1:]:
+                    if key in artifacts:
+                        artifacts[key].append(shape)
+                    else:
+                        artifacts[key] = [shape]
+            key, shape = items[0]
+            if key not in index:
+                index[key] = shape
+                names[name] = key
+
+        self._shape_index = index
+        self._shape_index_names = names
+        self._shape_index_artifacts = artifacts
+        self._listen_form()
+
+    def _listen_form(self) -> None:
+        # listen to the custom properties form for hidden controls being inserted or removed.
+        with contextlib.suppress(Exception):
+            forms = self.draw_page.forms
+            if not forms.has_by_name(self._form_name):
+                return
+            frm = forms.component.getByName(self._form_name)
+            if frm == self._listened_form:
+                return
+            frm.addContainerListener(self._container_listener)
+            self._listened_form = frm
+
+    def _is_shape_at(self, shape: XControlShape, row: int, col: int) -> bool:
+        try:
+            anchor = shape.Anchor  # type: ignore
+            if anchor is None:
+                return False
+            cell_address = anchor.CellAddress
+            return cell_address.Row == row and cell_address.Column == col
+        except Exception:
+            return False
+
+    def _index_find_shape(self, row: int, col: int) -> XControlShape | None:
+        key = (row, col)
+        for _ in range(2):
+            index = self._get_shape_index()
+            cleanup = self._shape_index_artifacts.pop(key, None)
+            if cleanup:
+                for shape in cleanup:
+                    with contextlib.suppress(Exception):
+                        logger.debug(f"Removing artifact shape {shape.Name}")  # type: ignore
+                        self.draw_page.remove(shape)
+            shape = index.get(key, None)
+            if shape is None:
+                return None
+            if self._is_shape_at(shape, row, col):
+                return shape
+            # The shape has moved. Rows or columns may have been changed without using OooDev.
+            self.invalidate_index()
+        return None
+
+    def _index_add_shape(self, row: int, col: int, shape: XControlShape, name: str = "") -> None:
+        if self._shape_index is None:
+            return
+        self._shape_index[(row, col)] = shape
+        self._shape_index_names[name or shape.Name] = (row, col)  # type: ignore
+
+    def _index_remove_shape(self, row: int, col: int) -> None:
+        if self._shape_index is None:
+            return
+        shape = self._shape_index.pop((row, col), None)
+        if shape is not None:
+            self._shape_index_names = {k: v for k, v in self._shape_index_names.items() if v != (row, col)}
+
+    def invalidate_index(self) -> None:
+        """
+        Invalidates the shape index. The index is rebuilt the next time it is needed.
+
+        The index is invalidated automatically when rows, columns or cells are inserted or deleted using |odev|.
+        Call this method after rows or columns have been inserted or deleted by other means.
+
+        .. versionadded:: 0.48.0
+        """
+        self._shape_index = None
+        self._shape_index_names = {}
+        self._shape_index_artifacts = {}
+
+    def _reset(self) -> None:
+        super()._reset()
+        self.invalidate_index()
+        self._listened_form = None
+
+    def _get_event_element_shape_name(self, event: ContainerEvent) -> str | None:
+        with contextlib.suppress(Exception):
+            return f"{self._shape_prefix}{event.Element.Name}{self._shape_suffix}"  # type: ignore
+        return None
+
+    def _on_element_inserted(self, event: ContainerEvent) -> None:
+        # hidden control inserted into the custom properties form.
+        if self._shape_index is None:
+            return
+        name = self._get_event_element_shape_name(event)
+        if name is None or name not in self._shape_index_names:
+            # inserted by another instance.
+            self.invalidate_index()
+
+    def _on_element_removed(self, event: ContainerEvent) -> None:
+        # hidden control removed from the custom properties form.
+        if self._shape_index is None:
+            return
+        self.invalidate_index()
+
+    def _on_sheet_changed(self, source: Any, event_args: SheetArgs) -> None:
+        if self._shape_index is None:
+            return
+        with contextlib.suppress(Exception):
+            if event_args.sheet is not None and event_args.sheet != self._sheet.component:
+                return
+        self.invalidate_index()
+
+    # endregion Shape Index
+
+    def clean(self):
+        super().clean()
+        self.invalidate_index()
 
     def get_cell_properties(self, *filter: str) -> Dict[CellObj, Set[str]]:
         """
@@ -31,20 +238,16 @@ class SheetCellCustomProperties(CustomPropClean):
         # Get all cell that have custom properties and their property names
 
         self.clean()
-        all_shapes = self._get_shapes_artifact_dict()
-        prop_shapes = all_shapes["prop_shapes"]
+        index = self._get_shape_index()
+        sheet_idx = self._sheet.sheet_index
         result = {}
         if filter:
             filter_set = set(filter)
         else:
             filter_set = None
-        for _, shapes in prop_shapes.items():
-            shape = shapes[0]
-            anchor = shape.Anchor  # type: ignore
-            # self.clean() would have removed the shape if the anchor is None or if cell has been deleted
-            assert anchor is not None
-
-            cell_obj = CellObj.from_cell(anchor.CellAddress)
+        # self.clean() would have removed the shape if the anchor is None or if cell has been deleted
+        for row, col in list(index.keys()):
+            cell_obj = CellObj.from_idx(col_idx=col, row_idx=row, sheet_idx=sheet_idx)
 
             current_set = set()
             cell = self._sheet[cell_obj]
@@ -58,6 +261,126 @@ class SheetCellCustomProperties(CustomPropClean):
 
         return dict(sorted(result.items()))
 
+    # region Bulk Access
+    def _get_ctl_name_from_shape_name(self, name: str) -> str:
+        return name[len(self._shape_prefix) : -len(self._shape_suffix)]
+
+    def get_custom_properties_bulk(self, range_obj: RangeObj | None = None) -> Dict[CellObj, DotDict]:
+        """
+        Gets the custom properties of many cells at once.
+
+        Shapes are found with the shape index, which is built in a single pass over the draw page when needed.
+
+        Args:
+            range_obj (RangeObj, optional): Range to get cells from. If omitted all cells of the sheet are included.
+
+        Returns:
+            Dict[CellObj, DotDict]: Custom properties keyed by cell, sorted in the cell order of across and then down.
+            Cells without custom properties are not included.
+
+        .. versionadded:: 0.48.0
+        """
+        result: Dict[CellObj, DotDict] = {}
+        if not self.draw_page.forms.has_by_name(self._form_name):
+            return result
+        form = self._get_form()
+        self._get_shape_index()
+        self._listen_form()
+        ctl_names = set(form.getElementNames())
+        sheet_idx = self._sheet.sheet_index
+        for shape_name, (row, col) in self._shape_index_names.items():
+            if range_obj is not None and not (
+                range_obj.start_row_index <= row <= range_obj.end_row_index
+                and range_obj.start_col_index <= col <= range_obj.end_col_index
+            ):
+                continue
+            ctl_name = self._get_ctl_name_from_shape_name(shape_name)
+            if ctl_name not in ctl_names:
+                continue
+            ctl = form.getByName(ctl_name)
+            # getPropertyValues() on a hidden control is an error. See PropertyAccessPartial.get_property_values()
+            props = [prop for prop in ctl.PropertyValues if prop.Name not in self._forbidden_keys]
+            if props:
+                cell_obj = CellObj.from_idx(col_idx=col, row_idx=row, sheet_idx=sheet_idx)
+                result[cell_obj] = mProps.Props.props_to_dot_dict(props)
+        return dict(sorted(result.items()))
+
+    def set_custom_properties_bulk(self, values: Mapping[CellObj | str, DotDict]) -> None:
+        """
+        Sets the custom properties of many cells at once.
+
+        Shapes are found with the shape index, which is built in a single pass over the draw page when needed.
+        Missing shapes and hidden controls are created in one batch while the document controllers are locked.
+
+        Args:
+            values (Mapping[CellObj | str, DotDict]): Custom properties keyed by cell or cell name such as ``A1``.
+
+        Raises:
+            AttributeError: If a property is a forbidden key.
+
+        Returns:
+            None:
+
+        .. versionadded:: 0.48.0
+        """
+        if not values:
+            return
+        cells: Dict[Tuple[int, int], DotDict] = {}
+        for cell, props in values.items():
+            for name in props.keys():
+                if name in self._forbidden_keys:
+                    raise AttributeError(f"Property '{name}' is forbidden. Forbidden keys: {self._forbidden_keys}")
+            cell_obj = CellObj.from_cell(cell)
+            cells[(cell_obj.row - 1, cell_obj.col_obj.index)] = props
+
+        lo_inst = self._sheet.lo_inst
+        model = lo_inst.qi(XModel, self._sheet.calc_doc.component, True)
+        # The sheet must be active when shapes are added. See CustomProp._add_shape_to_cell()
+        active_sheet = self._sheet.calc_doc.get_active_sheet()
+        activated = active_sheet.name != self._sheet.name
+        if activated:
+            self._sheet.set_active()
+        model.lockControllers()
+        try:
+            form = self._get_form()
+            index = self._get_shape_index()
+            # the form may have been created after the index was built.
+            self._listen_form()
+            key_names = {key: name for name, key in self._shape_index_names.items()}
+            ctl_names = set(form.getElementNames())
+            sheet = self._sheet.component
+            attrib = PropertyAttributeEnum.REMOVABLE.value
+            for key, props in cells.items():
+                if key in index:
+                    ctl_name = self._get_ctl_name_from_shape_name(key_names[key])
+                else:
+                    row, col = key
+                    shape, ctl_name = self._add_shape_to_cell_component(sheet.getCellByPosition(col, row))
+                    self._index_add_shape(row, col, shape, f"{self._shape_prefix}{ctl_name}{self._shape_suffix}")
+
+                if ctl_name in ctl_names:
+                    ctl = form.getByName(ctl_name)
+                    info = ctl.getPropertySetInfo()
+                    for name, value in props.items():
+                        if info.hasPropertyByName(name):
+                            ctl.removeProperty(name)
+                        ctl.addProperty(name, attrib, value)
+                else:
+                    ctl = lo_inst.create_instance_mcf(
+                        XComponent, "com.sun.star.form.component.HiddenControl", raise_err=True
+                    )
+                    ctl.HiddenValue = ""  # type: ignore
+                    form.insertByName(ctl_name, ctl)
+                    ctl_names.add(ctl_name)
+                    for name, value in props.items():
+                        ctl.addProperty(name, attrib, value)  # type: ignore
+        finally:
+            model.unlockControllers()
+            if activated:
+                active_sheet.set_active()
+
+    # endregion Bulk Access
+
     def remove_all_custom_properties(self) -> None:
         """
         Remove all custom properties from all cells.
@@ -79,3 +402,16 @@ class SheetCellCustomProperties(CustomPropClean):
         if draw_page.forms.has_by_name(self.form_name):
             logger.debug(f"Removing form {self.form_name}")
             draw_page.forms.remove_by_name(self.form_name)
+        self.invalidate_index()
+
+    def __del__(self) -> None:
+        with contextlib.suppress(Exception):
+            if self._container_listener:
+                comp = self._draw_page.forms.component
+                if comp:
+                    comp.removeContainerListener(self._container_listener)
+                if self._listened_form is not None:
+                    self._listened_form.removeContainerListener(self._container_listener)
+            self._container_listener = None  # type: ignore
+            self._listened_form = None
+        super().__del__()
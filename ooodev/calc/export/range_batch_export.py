@@ -0,0 +1,143 @@
+"""
+Batch export of cell ranges as images.
+
+.. versionadded:: 0.48.0
+"""
+
+from __future__ import annotations
+import time
+from typing import Any, Iterable, List, TYPE_CHECKING
+import uno
+from com.sun.star.frame import XModel
+from com.sun.star.frame import XStorable
+from com.sun.star.sheet import XCellRangesQuery
+from com.sun.star.view import XSelectionSupplier
+
+from ooodev.calc.export.export_base import ExportBase
+from ooodev.loader import lo as mLo
+from ooodev.utils.helper.image_export_helper import BatchExportResult
+from ooodev.utils.helper.image_export_helper import ImageExportHelper
+from ooodev.utils.partial.lo_inst_props_partial import LoInstPropsPartial
+
+if TYPE_CHECKING:
+    from ooodev.calc.calc_cell_range import CalcCellRange
+    from ooodev.loader.inst.lo_inst import LoInst
+    from ooodev.utils.type_var import PathOrStr
+
+
+class RangeBatchExport(LoInstPropsPartial, ExportBase):
+    """
+    Exports many cell ranges of a Calc document as images.
+
+    The media descriptor is built once for all ranges. Each range is selected once with a single call to the
+    controller and stored. The selection is cleared once when the batch is done.
+
+    Example:
+        .. code-block:: python
+
+            from ooodev.calc.export.range_batch_export import RangeBatchExport
+
+            exporter = RangeBatchExport(doc, image_type="png")
+            results = exporter.export_ranges([sheet.rng("A1:C10"), sheet.rng("E1:H20")], out_dir="/tmp/ranges")
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(
+        self,
+        doc: Any,
+        image_type: str = "png",
+        resolution: int = 96,
+        translucent: bool = True,
+        lo_inst: LoInst | None = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            doc (Any): ``CalcDoc`` or UNO spreadsheet document.
+            image_type (str, optional): Image type. ``png`` or ``jpg``. Defaults to ``png``.
+            resolution (int, optional): Resolution in dpi. Defaults to ``96``.
+            translucent (bool, optional): ``png`` only. Transparent background. Defaults to ``True``.
+            lo_inst (LoInst, optional): Lo Instance. Defaults to the instance of ``doc`` or ``Lo.current_lo``.
+
+        Raises:
+            ValueError: If ``image_type`` is not ``png`` or ``jpg``.
+        """
+        if lo_inst is None:
+            lo_inst = doc.lo_inst if isinstance(doc, LoInstPropsPartial) else mLo.Lo.current_lo
+        LoInstPropsPartial.__init__(self, lo_inst=lo_inst)
+        ExportBase.__init__(self)
+        self._doc = getattr(doc, "component", doc)
+        self._resolution = resolution
+        image_type = image_type.lower()
+        self._helper = ImageExportHelper(
+            filter_name="calc_jpg_Export" if image_type in ("jpg", "jpeg") else "calc_png_Export",
+            image_type=image_type,
+            lo_inst=self.lo_inst,
+            translucent=translucent,
+            selection_only=True,
+        )
+
+    def export_ranges(
+        self,
+        ranges: Iterable[CalcCellRange | Any],
+        out_dir: PathOrStr | None = None,
+        name_template: str = "range_{index:04d}.{ext}",
+    ) -> List[BatchExportResult]:
+        """
+        Exports cell ranges as images.
+
+        Args:
+            ranges (Iterable[CalcCellRange | Any]): Ranges to export. Each item can be a ``CalcCellRange`` or a UNO
+                ``SheetCellRange``. Ranges may be on different sheets.
+            out_dir (PathOrStr, optional): Directory to write the images to.
+                If omitted then images are exported into memory and returned in ``BatchExportResult.data``.
+            name_template (str, optional): File name template. ``{index}`` is replaced with the position in
+                ``ranges`` and ``{ext}`` is replaced with the image type. Defaults to ``range_{index:04d}.{ext}``.
+
+        Returns:
+            List[BatchExportResult]: Result for each range in the order of ``ranges``.
+
+        Note:
+            Calc exports the current selection, so the document must have a controller. The selection is cleared
+            when the batch is done. No export events are raised for each range.
+        """
+        helper = self._helper
+        storable = mLo.Lo.qi(XStorable, self._doc, True)
+        controller = mLo.Lo.qi(XModel, self._doc, True).getCurrentController()
+        selector = mLo.Lo.qi(XSelectionSupplier, controller, True)
+        results: List[BatchExportResult] = []
+        try:
+            for i, rng in enumerate(ranges):
+                start = time.perf_counter()
+                comp = getattr(rng, "component", rng)
+                sz = comp.Size
+                dpi_x, dpi_y = self._get_dpi_width_height(sz.Width, sz.Height, self._resolution)
+                filter_data = helper.get_filter_data(dpi_x, dpi_y)
+                # selecting a range replaces the current selection, there is no need to deselect first.
+                selector.select(comp)
+                if out_dir is None:
+                    stream = helper.create_output_stream()
+                    storable.storeToURL("private:stream", helper.get_args(filter_data, stream))
+                    url = ""
+                    data = helper.get_stream_bytes(stream)
+                else:
+                    url = helper.get_url(out_dir, name_template, i)
+                    storable.storeToURL(url, helper.get_args(filter_data, url))
+                    data = None
+                results.append(
+                    BatchExportResult(index=i, source=rng, url=url, data=data, seconds=time.perf_counter() - start)
+                )
+        finally:
+            if results:
+                # deselect all cells, the same as CalcSheet.deselect_cells()
+                empty = self.lo_inst.create_instance_msf(XCellRangesQuery, "com.sun.star.sheet.SheetCellRanges")
+                if empty is not None:
+                    selector.select(empty)
+        return results
+
+    @property
+    def image_type(self) -> str:
+        """Gets image type. ``png`` or ``jpg``."""
+        return self._helper.image_type
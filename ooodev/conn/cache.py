@@ -1,15 +1,36 @@
 # coding: utf-8
 from __future__ import annotations
+import contextlib
+import hashlib
+import json
 import os
 from pathlib import Path
 from shutil import copytree
+import shlex
 import shutil
+import subprocess
 import tempfile
-from typing import Tuple
+import time
+import uuid
+from typing import Any, Dict, Generator, Tuple
+from ooodev import get_version
 from ooodev.utils.type_var import PathOrStr
 from ooodev.utils import sys_info
 from ooodev.cfg import config
 
+# ioctl request for cloning a file on Linux file systems that support reflinks such as btrfs and xfs.
+_FICLONE = 0x40049409
+
+# Only files office reads but never rewrites may be hard linked, all other files are copied.
+# Office rewrites many profile files in place (registry, Basic libraries, palettes, ...) and a rewrite of a hard
+# linked file would change the warm profile for every instance.
+_LINK_SUFFIXES = frozenset((".png", ".jpg", ".jpeg", ".gif", ".bmp", ".svg", ".ttf", ".otf"))
+# Dirs whose files are always copied, extensions may rewrite any file they contain.
+_COPY_DIRS = frozenset(("extensions",))
+
+_STAMP_NAME = "ooodev_stamp.json"
+_STAMP_FORMAT = 2
+
 
 class Cache:
     """Office Profile Cache Manager"""
@@ -24,10 +45,28 @@ class Cache:
                 Default is searched for in known locations.
             working_dir (PathOrStr, optional): sets the working dir to use.
                 This is the dir that LO profile will be copied to. Defaults to a newly generated temp dir.
+            warm_profile (bool, optional): Determines if a warm profile is used. Default is False.
+                See :py:attr:`~.Cache.warm_profile`.
+            warm_profile_path (PathOrStr, optional): Set the path warm profiles are stored in.
+                Default is ``ooodev/warm_profile`` in the system temp dir.
+            link_files (bool, optional): Determines if read only files of a warm profile such as images may be hard
+                linked when the file system does not support reflinks. Default is True.
+            warm_timeout (float, optional): Max number of seconds to wait for office to initialize a warm profile.
+                Default is ``120``.
+
+        .. versionchanged:: 0.48.0
+            Added ``warm_profile``, ``warm_profile_path``, ``link_files`` and ``warm_timeout`` keyword args.
         """
         self._use_cache = bool(kwargs.get("use_cache", True))
         self._profile_dir_name = "profile"
         self._profile_cached = False
+        self._warm_profile = bool(kwargs.get("warm_profile", False))
+        self._link_files = bool(kwargs.get("link_files", True))
+        self._warm_timeout = float(kwargs.get("warm_timeout", 120.0))
+        self._timings: Dict[str, float] = {}
+        warm_profile_path = kwargs.get("warm_profile_path", None)
+        if warm_profile_path is not None:
+            self.warm_profile_path = warm_profile_path
         cache_path = kwargs.get("cache_path", None)
         if cache_path is not None:
             self.cache_path = cache_path
@@ -75,30 +114,246 @@ class Cache:
         if self.cache_path is None:
             return
         if self._profile_cached is False:
-            copytree(self.user_profile, self.cache_path)
+            with self.time_phase("profile_cache"):
+                copytree(self.user_profile, self.cache_path)
         return
 
-    def copy_cache_to_profile(self) -> None:
+    def copy_cache_to_profile(self, soffice: PathOrStr | None = None) -> None:
         """
         Copies cached profile to profile dir set in
         :py:attr:`~.Cache.user_profile`
 
         Ignored if :py:attr:`~Cache.use_cache` is ``False``
+
+        Args:
+            soffice (PathOrStr, optional): Path to soffice. Only used when :py:attr:`~.Cache.warm_profile` is ``True``.
+
+        .. versionchanged:: 0.48.0
+            Added ``soffice`` arg.
         """
         # this method is called before cache_profile.
         if self.use_cache is False:
             return
+        if self._warm_profile and soffice:
+            self._copy_warm_to_profile(soffice)
+            return
         if self.cache_path is None:
             return
-        if self.cache_path.exists() and self.cache_path.is_dir():
-            copytree(self.cache_path, self.user_profile)
-            self._profile_cached = True
-        else:
-            # create the dir.
-            # when when cache_profile is called it will cache
-            # the profile into this dir.
-            os.mkdir(self.user_profile)
-            self._profile_cached = False
+        with self.time_phase("profile_copy"):
+            if self.cache_path.exists() and self.cache_path.is_dir():
+                copytree(self.cache_path, self.user_profile)
+                self._profile_cached = True
+            else:
+                # create the dir.
+                # when when cache_profile is called it will cache
+                # the profile into this dir.
+                os.mkdir(self.user_profile)
+                self._profile_cached = False
+
+    # region warm profile
+    def _copy_warm_to_profile(self, soffice: PathOrStr) -> None:
+        warm = self.get_warm_profile(soffice)
+        with self.time_phase("profile_copy"):
+            copytree(warm, self.user_profile, copy_function=self._clone_file)
+        # a warm profile is never written back to cache.
+        self._profile_cached = True
+
+    def get_warm_profile(self, soffice: PathOrStr) -> Path:
+        """
+        Gets the path of the warm profile for ``soffice``.
+
+        The profile is prepared if there is no warm profile yet or if its stamp does not match.
+
+        Args:
+            soffice (PathOrStr): Path to soffice.
+
+        Raises:
+            TimeoutError: If office does not finish initializing the profile in time.
+            RuntimeError: If office fails to initialize the profile.
+
+        Returns:
+            Path: Path to warm profile dir.
+
+        .. versionadded:: 0.48.0
+        """
+        version = self._get_office_version_key(soffice)
+        root = Path(self.warm_profile_path, version)
+        profile = root / self._profile_dir_name
+        with self.time_phase("warm_check"):
+            valid = self._is_stamp_valid(root, version)
+        if valid:
+            return profile
+        with self.time_phase("warm_prepare"):
+            self._prepare_warm_profile(soffice, root, version)
+        return profile
+
+    def _prepare_warm_profile(self, soffice: PathOrStr, root: Path, version: str) -> None:
+        root.parent.mkdir(parents=True, exist_ok=True)
+        # office initializes the profile in a staging dir that is renamed into place when done.
+        # this way other processes never see a partial profile.
+        staging = root.parent / f".{root.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+        profile = staging / self._profile_dir_name
+        profile.mkdir(parents=True)
+        try:
+            soffice_str = str(soffice)
+            args = shlex.split(soffice_str) if soffice_str.startswith("flatpak ") else [soffice_str]
+            args.extend(
+                [
+                    "--headless",
+                    "--invisible",
+                    "--nologo",
+                    "--norestore",
+                    "--nodefault",
+                    "--terminate_after_init",
+                    f"-env:UserInstallation={profile.as_uri()}",
+                ]
+            )
+            try:
+                result = subprocess.run(
+                    args, timeout=self._warm_timeout, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            except subprocess.TimeoutExpired as e:
+                raise TimeoutError(f"Office did not initialize profile within {self._warm_timeout} seconds") from e
+            if result.returncode != 0:
+                raise RuntimeError(f"Office failed to initialize profile. Exit code: {result.returncode}")
+            with contextlib.suppress(OSError):
+                (profile / ".lock").unlink()
+            self._write_stamp(staging, version)
+            if root.exists():
+                # stale or invalid profile.
+                shutil.rmtree(root, ignore_errors=True)
+            try:
+                os.rename(staging, root)
+            except OSError:
+                # another process finished first.
+                if not self._is_stamp_valid(root, version):
+                    raise
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def _get_office_version_key(self, soffice: PathOrStr) -> str:
+        # office is not running yet so the version key is based on the soffice install and the ooodev version.
+        soffice_str = str(soffice)
+        parts = [get_version(), soffice_str]
+        if not soffice_str.startswith("flatpak "):
+            with contextlib.suppress(OSError):
+                st = Path(soffice_str).resolve().stat()
+                parts.extend((str(st.st_size), str(int(st.st_mtime))))
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+    def _get_profile_hash(self, profile: Path) -> str:
+        # hash of file names, sizes and modification times. Only stat is needed which keeps the check fast.
+        # A file that is changed through a hard link changes the hash and the warm profile is prepared again.
+        digest = hashlib.sha256()
+        for dir_path, dir_names, file_names in os.walk(profile):
+            dir_names.sort()
+            rel = os.path.relpath(dir_path, profile)
+            for name in sorted(file_names):
+                if name == ".lock":
+                    continue
+                st = os.stat(os.path.join(dir_path, name))
+                digest.update(f"{rel}/{name}:{st.st_size}:{st.st_mtime_ns}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _write_stamp(self, root: Path, version: str) -> None:
+        stamp = {
+            "format": _STAMP_FORMAT,
+            "version": version,
+            "ooodev": get_version(),
+            "hash": self._get_profile_hash(root / self._profile_dir_name),
+            "created": time.time(),
+        }
+        with open(root / _STAMP_NAME, "w", encoding="utf-8") as f:
+            json.dump(stamp, f)
+
+    def _read_stamp(self, root: Path) -> Dict[str, Any] | None:
+        try:
+            with open(root / _STAMP_NAME, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _is_stamp_valid(self, root: Path, version: str) -> bool:
+        stamp = self._read_stamp(root)
+        if not stamp:
+            return False
+        if stamp.get("format") != _STAMP_FORMAT or stamp.get("version") != version:
+            return False
+        profile = root / self._profile_dir_name
+        if not profile.is_dir():
+            return False
+        return stamp.get("hash") == self._get_profile_hash(profile)
+
+    def _clone_file(self, src: str, dst: str) -> str:
+        # copy on write clone when supported, then hard link for files office does not rewrite, else a copy.
+        if self._reflink(src, dst):
+            return dst
+        if self._link_files and self._is_linkable(src):
+            try:
+                os.link(src, dst)
+                return dst
+            except OSError:
+                pass
+        return shutil.copy2(src, dst)
+
+    def _is_linkable(self, src: str) -> bool:
+        if os.path.splitext(src)[1].lower() not in _LINK_SUFFIXES:
+            return False
+        try:
+            rel = Path(src).relative_to(self.warm_profile_path)
+        except ValueError:
+            return False
+        return _COPY_DIRS.isdisjoint(rel.parts)
+
+    @staticmethod
+    def _reflink(src: str, dst: str) -> bool:
+        try:
+            import fcntl  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            return False
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(dst)
+            return False
+        shutil.copystat(src, dst)
+        return True
+
+    # endregion warm profile
+
+    # region timings
+    @contextlib.contextmanager
+    def time_phase(self, name: str) -> Generator[None, None, None]:
+        """
+        Context manager that adds the time spent in its block to :py:attr:`~.Cache.timings`.
+
+        Args:
+            name (str): Phase name.
+
+        .. versionadded:: 0.48.0
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._timings[name] = self._timings.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """
+        Gets the number of seconds spent in each start up phase.
+
+        Phases are ``warm_check``, ``warm_prepare``, ``profile_copy``, ``office_start``, ``connect`` and ``profile_cache``.
+        Phases that did not run are not included.
+
+        .. versionadded:: 0.48.0
+        """
+        return dict(self._timings)
+
+    # endregion timings
 
     def del_working_dir(self):
         """
@@ -162,3 +417,45 @@ class Cache:
     @use_cache.setter
     def use_cache(self, value: bool) -> None:
         self._use_cache = value
+
+    @property
+    def warm_profile(self) -> bool:
+        """
+        Gets/Sets if a warm profile is used. Default is ``False``
+
+        When ``True`` office initializes a profile once using ``--terminate_after_init``.
+        The profile is stored in :py:attr:`~.Cache.warm_profile_path` together with a stamp of the office install,
+        the ooodev version and a hash of the profile.
+        Each new instance gets a copy on write clone of the warm profile. Reflinks are used when the file system
+        supports them, otherwise read only files such as images are hard linked and the rest are copied.
+        The profile of an instance is never written back to the warm profile.
+
+        When ``True`` and office is started by ooodev :py:attr:`~.Cache.cache_path` is not used.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._warm_profile
+
+    @warm_profile.setter
+    def warm_profile(self, value: bool) -> None:
+        self._warm_profile = value
+
+    @property
+    def warm_profile_path(self) -> Path:
+        """
+        Gets/Sets the path warm profiles are stored in.
+
+        Default is ``ooodev/warm_profile`` in the system temp dir.
+        For hard links to work this path must be on the same file system as :py:attr:`~.Cache.working_dir`.
+
+        .. versionadded:: 0.48.0
+        """
+        try:
+            return self._warm_profile_path
+        except AttributeError:
+            self._warm_profile_path = Path(tempfile.gettempdir(), "ooodev", "warm_profile")
+        return self._warm_profile_path
+
+    @warm_profile_path.setter
+    def warm_profile_path(self, value: PathOrStr) -> None:
+        self._warm_profile_path = Path(value)
@@ -15,7 +15,6 @@ from ooodev.conn import connectors
 from ooodev.conn import cache
 from ooodev.utils.sys_info import SysInfo
 
-
 if TYPE_CHECKING:
     from com.sun.star.connection import XConnector
     from com.sun.star.beans import XPropertySet
@@ -136,6 +135,12 @@ class LoBridgeCommon(ConnectBase):
         if connector.env_vars:
             self._environment.update(connector.env_vars)
 
+    def _copy_cache_to_profile(self) -> None:
+        soffice = None
+        if self._cache.use_cache and self._cache.warm_profile and self._connector.start_office:
+            soffice = self._connector.soffice
+        self._cache.copy_cache_to_profile(soffice=soffice)
+
     @abstractmethod
     def _get_connection_str(self) -> str:
         """
@@ -501,13 +506,15 @@ class LoPipeStart(LoBridgeCommon):
         Raises:
             NoConnectException: If unable to connect
         """
-        self._cache.copy_cache_to_profile()
+        self._copy_cache_to_profile()
         if self._connector.start_office:
-            self._popen()
+            with self._cache.time_phase("office_start"):
+                self._popen()
             # now that office is started toggle start office to False to prevent sub processes from starting office.
             self._connector.start_office = False
         try:
-            self._connect()
+            with self._cache.time_phase("connect"):
+                self._connect()
         except NoConnectException as e:  # pylint: disable=invalid-name
             if self._opened_office:
                 self.kill_soffice()
@@ -607,13 +614,15 @@ class LoSocketStart(LoBridgeCommon):
         Raises:
             NoConnectException: If unable to connect
         """
-        self._cache.copy_cache_to_profile()
+        self._copy_cache_to_profile()
         if self._connector.start_office:
-            self._popen()
+            with self._cache.time_phase("office_start"):
+                self._popen()
             # now that office is started toggle start office to False to prevent sub processes from starting office.
             self._connector.start_office = False
         try:
-            self._connect()
+            with self._cache.time_phase("connect"):
+                self._connect()
         except NoConnectException as e:  # pylint: disable=invalid-name
             if self._opened_office:
                 self.kill_soffice()
@@ -11,6 +11,7 @@ from com.sun.star.awt.grid import XMutableGridDataModel
 
 from ooodev.mock import mock_g
 from ooodev.adapter.awt.grid.grid_selection_events import GridSelectionEvents
+from ooodev.adapter.awt.grid.virtual_grid_data_model import VirtualGridDataModel
 from ooodev.events.args.listener_event_args import ListenerEventArgs
 from ooodev.loader import lo as mLo
 from ooodev.utils.kind.dialog_control_kind import DialogControlKind
@@ -20,15 +21,19 @@ from ooodev.utils.type_var import Table
 from ooodev.adapter.awt.grid.uno_control_grid_model_partial import UnoControlGridModelPartial
 from ooodev.dialog.dl_control.ctl_base import DialogControlBase, _create_control
 
-
 if TYPE_CHECKING:
     from com.sun.star.awt.grid import UnoControlGrid  # service
     from com.sun.star.awt.grid import UnoControlGridModel  # service
     from com.sun.star.awt import XWindowPeer
     from ooodev.dialog.dl_control.model.model_grid import ModelGrid
+    from ooodev.adapter.awt.grid.virtual_grid_data_model import HeadingsT
 # endregion imports
 
 
+def _row_number(row: int) -> str:
+    return str(row + 1)
+
+
 class CtlGrid(DialogControlBase, UnoControlGridModelPartial, GridSelectionEvents):
     """Class for Grid Control"""
 
@@ -49,6 +54,7 @@ class CtlGrid(DialogControlBase, UnoControlGridModelPartial, GridSelectionEvents
         # EventArgs.event_data will contain the ActionEvent
         GridSelectionEvents.__init__(self, trigger_args=generic_args, cb=self._on_grid_listener_add_remove)
         self._model_ex = None
+        self._virtual_model: VirtualGridDataModel | None = None
 
     # endregion init
 
@@ -165,20 +171,20 @@ class CtlGrid(DialogControlBase, UnoControlGridModelPartial, GridSelectionEvents
         # widths are applied by using a scale factor to the table width
         table = self.view
 
-        tbl_size = table.getSize()
-
         model = cast("UnoControlGridModel", table.getModel())
+        if self._virtual_model is not None:
+            # back to a data model that holds its rows inside office.
+            self._virtual_model = None
+            model.GridDataModel = self.lo_inst.create_instance_mcf(
+                XMutableGridDataModel, "com.sun.star.awt.grid.DefaultGridDataModel", raise_err=True
+            )
         data_model = model.GridDataModel
         if not data_model:
             raise ValueError("No data model")
         data_model = mLo.Lo.qi(XMutableGridDataModel, data_model, True)
 
-        # Erase any pre-existing data and columns
+        # Erase any pre-existing data
         data_model.removeAllRows()
-        if data_model.ColumnCount > 0:
-            # reverse indexes to start removing from the end
-            for i in range(data_model.ColumnCount - 1, -1, -1):
-                model.ColumnModel.removeColumn(i)
 
         # Get the headers from data
         use_col_headers = False
@@ -197,6 +203,155 @@ class CtlGrid(DialogControlBase, UnoControlGridModelPartial, GridSelectionEvents
 
         col_headers = data[0][1:] if has_row_headers else data[0]
 
+        # Manage row headers width
+        if has_row_headers and model.ShowRowHeader:
+            header_width_row = row_header_width
+            model.RowHeaderWidth = header_width_row
+        else:
+            header_width_row = 0
+
+        self._set_columns(
+            model=model,
+            col_headers=col_headers,
+            use_col_headers=use_col_headers,
+            widths=widths,
+            align=align,
+            header_width_row=header_width_row,
+        )
+
+        # Feed the table with data
+        # skip column headers row
+        if use_col_headers is False:
+            rng_start = 0
+        else:
+            rng_start = 1
+        show_row_header = model.ShowRowHeader
+        headings = []
+        rows = []
+        for i in range(rng_start, len(data)):
+            row = data[i][1:] if use_row_headers else data[i]
+            if not isinstance(row, tuple):
+                row = tuple(row)
+            row_header_text = ""
+            if use_row_headers and show_row_header:
+                row_header_text = str(data[i][0])
+            elif show_row_header:
+                if rng_start == 0:
+                    row_header_text = str(i + 1)
+                else:
+                    row_header_text = str(i)
+            headings.append(row_header_text)
+            rows.append(row)
+        # one call to office for all rows
+        if rows:
+            data_model.addRows(tuple(headings), tuple(rows))
+
+    def set_virtual_data(
+        self,
+        data: Any,
+        *,
+        column_titles: Sequence[Any] | None = None,
+        widths: Sequence[int] | None = None,
+        align: Iterable[HorizontalAlignment] | str | None = None,
+        row_header_width: int = 10,
+        row_headings: HeadingsT = None,
+        **kwargs: Any,
+    ) -> VirtualGridDataModel:
+        """
+        Binds the grid to a data model that reads rows on demand. Preexisting data is cleared.
+
+        Unlike :py:meth:`~.CtlGrid.set_table_data`, rows are not copied into office.
+        The grid asks for the rows it shows as it is scrolled. Use this for large data sets.
+
+        Args:
+            data (Any): A ``VirtualGridDataModel`` or the rows to pass to a new ``VirtualGridDataModel``,
+                sequence of rows, iterable of rows or a ``fetch(start, count)`` callable.
+            column_titles (Sequence[Any], optional): Column titles. If omitted and the table shows column headers
+                then the default column names such as (A, B, C, D) are used.
+            widths (Sequence[int] | None, optional): Specifies Column Widths. Same as ``set_table_data()``.
+            align (Iterable[HorizontalAlignment] | str | None, optional): Specifies column alignments.
+                Same as ``set_table_data()``.
+            row_header_width (int, optional): Specifies the width of the row header. Defaults to ``10``.
+            row_headings (Sequence, Callable[[int], Any], optional): Row headings or a callable that gets the
+                heading of a row index. If omitted and the table shows row headers then rows are numbered.
+
+        Keyword Args:
+            row_count (int, optional): Number of rows. Required when ``data`` is a callable.
+            column_count (int, optional): Number of columns. If omitted the length of ``column_titles`` is used.
+            row_converter (Callable[[Any], Sequence[Any]], optional): Converts a source row into cell values.
+            page_size (int, optional): Number of rows read at a time.
+            cache_size (int, optional): Number of pages kept in the row cache.
+
+        Raises:
+            ValueError: if not a valid UnoControlGrid.
+
+        Returns:
+            VirtualGridDataModel: Data model bound to the grid.
+
+        Example:
+            .. code-block:: python
+
+                rows = [(i, f"Item {i}", i * 1.5) for i in range(100_000)]
+                ctl_grid.set_virtual_data(rows, column_titles=("Id", "Name", "Value"), align="RLR")
+
+        .. versionadded:: 0.48.0
+        """
+        table = self.view
+        model = cast("UnoControlGridModel", table.getModel())
+        show_row_header = model.ShowRowHeader
+        if isinstance(data, VirtualGridDataModel):
+            data_model = data
+        else:
+            if column_titles and "column_count" not in kwargs:
+                kwargs["column_count"] = len(column_titles)
+            if row_headings is None and show_row_header:
+                row_headings = _row_number
+            data_model = VirtualGridDataModel(data, headings=row_headings, **kwargs)
+
+        if column_titles:
+            col_headers = column_titles
+            use_col_headers = True
+        else:
+            col_headers = [""] * data_model.ColumnCount
+            use_col_headers = False
+
+        if show_row_header:
+            header_width_row = row_header_width
+            model.RowHeaderWidth = header_width_row
+        else:
+            header_width_row = 0
+
+        self._set_columns(
+            model=model,
+            col_headers=col_headers,
+            use_col_headers=use_col_headers,
+            widths=widths,
+            align=align,
+            header_width_row=header_width_row,
+        )
+        model.GridDataModel = data_model
+        # keep a reference, office only holds the UNO proxy.
+        self._virtual_model = data_model
+        return data_model
+
+    def _set_columns(
+        self,
+        model: UnoControlGridModel,
+        col_headers: Sequence[Any],
+        use_col_headers: bool,
+        widths: Sequence[int] | None,
+        align: Iterable[HorizontalAlignment] | str | None,
+        header_width_row: int,
+    ) -> None:
+        # removes the existing columns then creates, sizes and aligns new columns.
+        tbl_size = self.view.getSize()
+        col_model = model.ColumnModel
+        col_count = col_model.getColumnCount()
+        if col_count > 0:
+            # reverse indexes to start removing from the end
+            for i in range(col_count - 1, -1, -1):
+                col_model.removeColumn(i)
+
         # Create the columns
         for i, header in enumerate(col_headers):
             column = model.ColumnModel.createColumn()
@@ -206,13 +361,6 @@ class CtlGrid(DialogControlBase, UnoControlGridModelPartial, GridSelectionEvents
                 column.Title = TableHelper.make_column_name(i, zero_index=True)
             model.ColumnModel.addColumn(column)
 
-        # Manage row headers width
-        if has_row_headers and model.ShowRowHeader:
-            header_width_row = row_header_width
-            model.RowHeaderWidth = header_width_row
-        else:
-            header_width_row = 0
-
         # Size the columns. Column sizing cannot be done before all the columns are added
         len_col_headers = len(col_headers)
         len_widths = 0
@@ -250,7 +398,7 @@ class CtlGrid(DialogControlBase, UnoControlGridModelPartial, GridSelectionEvents
                     model.ColumnModel.getColumn(i).ColumnWidth = int(last_width * width_factor)
         else:
             # Size header and columns evenly
-            width = (tbl_size.Width - header_width_row) // len_col_headers
+            width = (tbl_size.Width - header_width_row) // max(len_col_headers, 1)
             for i in range(len_col_headers):
                 model.ColumnModel.getColumn(i).ColumnWidth = width
 
@@ -280,26 +428,6 @@ class CtlGrid(DialogControlBase, UnoControlGridModelPartial, GridSelectionEvents
         while len(align) < len_col_headers:
             align.append(HorizontalAlignment.LEFT)
 
-        # Feed the table with data
-        # skip column headers row
-        if use_col_headers is False:
-            rng_start = 0
-        else:
-            rng_start = 1
-        for i in range(rng_start, len(data)):
-            row = data[i][1:] if use_row_headers else data[i]
-            if not isinstance(row, tuple):
-                row = tuple(row)
-            row_header_text = ""
-            if use_row_headers and model.ShowRowHeader:
-                row_header_text = str(data[i][0])
-            elif model.ShowRowHeader:
-                if rng_start == 0:
-                    row_header_text = str(i + 1)
-                else:
-                    row_header_text = str(i)
-            data_model.addRow(row_header_text, row)
-
         for i, alignment in enumerate(align):
             model.ColumnModel.getColumn(i).HorizontalAlign = alignment  # type: ignore
 
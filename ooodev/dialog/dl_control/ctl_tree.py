@@ -23,16 +23,18 @@ from ooodev.dialog.search.tree_search.rule_data_compare import RuleDataCompare
 from ooodev.dialog.search.tree_search.rule_data_insensitive import RuleDataInsensitive
 from ooodev.dialog.search.tree_search.rule_text_sensitive import RuleTextSensitive
 from ooodev.dialog.search.tree_search.rule_text_insensitive import RuleTextInsensitive
+from ooodev.dialog.search.tree_search.tree_index import DATA_VALUE_KEY, TreeIndex, TreeIndexNode
 from ooodev.dialog.dl_control.ctl_base import DialogControlBase, _create_control
 
-
 if TYPE_CHECKING:
     from com.sun.star.awt.tree import MutableTreeNode  # service
     from com.sun.star.awt.tree import TreeControl  # service
     from com.sun.star.awt.tree import TreeControlModel  # service
     from com.sun.star.awt.tree import XMutableTreeNode
     from com.sun.star.awt.tree import XTreeNode
+    from com.sun.star.awt.tree import TreeExpansionEvent
     from com.sun.star.awt import XWindowPeer
+    from ooodev.events.args.event_args import EventArgs
     from ooodev.dialog.dl_control.model.model_tree import ModelTree
 # endregion imports
 
@@ -40,7 +42,7 @@ if TYPE_CHECKING:
 class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents, TreeEditEvents, TreeExpansionEvents):
     """Class for Tree Control"""
 
-    DATA_VALUE_KEY = "___data_value___"
+    DATA_VALUE_KEY = DATA_VALUE_KEY
 
     # The API docs does not show it but the Tree Control does support the standard UNO events in CtlListenerBase.
 
@@ -67,6 +69,10 @@ class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents,
             self, trigger_args=generic_args, cb=self._on_tree_expansion_events_listener_add_remove
         )
         self._model_ex = None
+        self._index = TreeIndex()
+        self._lazy_registered = False
+        # keep a reference, event callbacks are held weakly.
+        self._fn_on_request_child_nodes = self._on_request_child_nodes
 
     # endregion init
 
@@ -91,6 +97,13 @@ class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents,
         self.view.addTreeExpansionListener(self.events_listener_tree_expansion)
         event.remove_callback = True
 
+    def _on_request_child_nodes(self, source: Any, event: EventArgs) -> None:
+        # creates the UNO nodes of a node added with add_sub_tree(lazy=True) when it is expanded.
+        tree_event = cast("TreeExpansionEvent", event.event_data)
+        mirror = self._index_node_from_uno(tree_event.Node)
+        if mirror is not None and not mirror.populated:
+            self._populate(mirror, self._get_tree_data_model())
+
     # endregion Lazy Listeners
 
     # region Overrides
@@ -129,10 +142,17 @@ class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents,
 
         Returns:
             XMutableTreeNode: Returns a new root node of the tree control.
+
+        .. versionchanged:: 0.48.0
+            The root node replaces the nodes of :py:attr:`~.CtlTree.index`.
         """
-        if not self.model.DataModel:
-            raise ValueError("DataModel is not set")
-        dm = mLo.Lo.qi(XMutableTreeDataModel, self.model.DataModel, True)
+        root = self._create_root_node(display_value, data_value)
+        mirror = self._index.set_root(display_value, data_value, root)
+        mirror.populated = True
+        return root
+
+    def _create_root_node(self, display_value: str, data_value: Any) -> XMutableTreeNode:
+        dm = self._get_tree_data_model()
         root = dm.createNode(display_value, True)
         if data_value is not None:
             root.DataValue = data_value
@@ -160,32 +180,159 @@ class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents,
         Returns:
             XMutableTreeNode: MutableTreeNode
         """
-        if not self.model.DataModel:
-            raise ValueError("DataModel is not set")
-        dm = mLo.Lo.qi(XMutableTreeDataModel, self.model.DataModel, True)
+        dm = self._get_tree_data_model()
+        parent = self._index_node_of(parent_node)
+        if parent is not None and not parent.populated:
+            # keep the order of nodes added with add_sub_tree(lazy=True)
+            self._populate(parent, dm)
         node = dm.createNode(display_value, True)
         if data_value is not None:
             node.DataValue = data_value
 
         parent_node.appendChild(node)
+        if parent is not None:
+            self._index.add_child(parent, display_value, data_value, node)
         return node
 
-    def add_sub_tree(self, flat_tree: Sequence[Any], parent_node: XMutableTreeNode | None = None) -> None:
+    def add_sub_tree(
+        self, flat_tree: Sequence[Any], parent_node: XMutableTreeNode | None = None, lazy: bool = False
+    ) -> None:
         """
         Adds a sub tree to the parent node
 
         Args:
             parent_node (XMutableTreeNode): Parent node.
             flat_tree (Sequence[Sequence[str]]): FlatTree: a 2D sequence of strings, sorted on the columns containing the DisplayValues
-            width_data (bool, optional): _description_. Defaults to False.
+            lazy (bool, optional): If ``True`` only the first level of nodes is created in the control.
+                Nodes below are created when their parent is expanded or found by :py:meth:`~.CtlTree.find_node`.
+                Defaults to ``False``.
 
         Note:
             The same data structure for ``tree_data`` can be used to add sub-nodes as shown in :py:meth:`~.CtlTree.convert_to_tree`.
+
+        .. versionchanged:: 0.48.0
+            Nodes are added to :py:attr:`~.CtlTree.index` and created in the control level by level.
+            Added ``lazy`` parameter.
         """
         if not flat_tree:
             return
         tree_data = self.convert_to_tree(flat_tree)
-        self._add_nodes_from_tree_data(tree_data, parent_node)
+        dm = self._get_tree_data_model()
+        if parent_node is None:
+            top = self._index.add_tree_data(tree_data)
+            if not top:
+                return
+            root = top[0]
+            self._index.set_node(root, self._create_root_node(root.display_value, root.data_value))
+            self._populate(root, dm)
+            level = root.children
+        else:
+            parent = self._index_node_of(parent_node)
+            if parent is None:
+                # parent_node is not in the index
+                self._add_nodes_from_tree_data(tree_data, parent_node)
+                return
+            if not parent.populated:
+                self._populate(parent, dm)
+            start = len(parent.children)
+            self._index.add_tree_data(tree_data, parent)
+            self._populate(parent, dm, start)
+            level = parent.children[start:]
+
+        if lazy:
+            if not self._lazy_registered:
+                self.add_event_request_child_nodes(self._fn_on_request_child_nodes)
+                self._lazy_registered = True
+            return
+        while level:
+            next_level: List[TreeIndexNode] = []
+            for mirror in level:
+                self._populate(mirror, dm)
+                next_level.extend(mirror.children)
+            level = next_level
+
+    def _get_tree_data_model(self) -> XMutableTreeDataModel:
+        if not self.model.DataModel:
+            raise ValueError("DataModel is not set")
+        return mLo.Lo.qi(XMutableTreeDataModel, self.model.DataModel, True)
+
+    def _populate(self, mirror: TreeIndexNode, dm: XMutableTreeDataModel, start: int = 0) -> None:
+        # creates the UNO nodes for the children of mirror.
+        parent_node = cast("XMutableTreeNode", mirror.node)
+        for child in mirror.children[start:]:
+            if child.node is not None:
+                continue
+            node = dm.createNode(child.display_value, True)
+            if child.data_value is not None:
+                node.DataValue = child.data_value
+            parent_node.appendChild(node)
+            self._index.set_node(child, node)
+        mirror.populated = True
+
+    def _resolve(self, mirror: TreeIndexNode) -> XTreeNode | None:
+        # gets the UNO node for mirror, creating lazy ancestors as needed.
+        if mirror.node is not None:
+            return mirror.node
+        pending: List[TreeIndexNode] = []
+        current = mirror.parent
+        while current is not None and current.node is None:
+            pending.append(current)
+            current = current.parent
+        if current is None:
+            return None
+        dm = self._get_tree_data_model()
+        self._populate(current, dm)
+        for node in reversed(pending):
+            self._populate(node, dm)
+        return mirror.node
+
+    def _index_node_of(self, node: Any) -> TreeIndexNode | None:
+        """
+        Gets the index node for a UNO node returned by this class. No calls to office are made.
+
+        Returns:
+            TreeIndexNode | None: Index node or ``None`` if the node is not in the index.
+        """
+        if isinstance(node, TreeIndexNode):
+            return node
+        if node is None:
+            return None
+        return self._index.find_node(node)
+
+    def _index_node_from_uno(self, node: Any) -> TreeIndexNode | None:
+        """
+        Gets the index node for any UNO node of the control, such as a node of an event.
+
+        Uses the child indexes from the node up to the root when the node was not returned by this class,
+        so the cost is one round trip per level.
+
+        Returns:
+            TreeIndexNode | None: Index node or ``None`` if the node is not in the index.
+        """
+        mirror = self._index_node_of(node)
+        if mirror is not None:
+            return mirror
+        root = self._index.root
+        if node is None or root is None or root.node is None:
+            return None
+        indexes: List[int] = []
+        with contextlib.suppress(Exception):
+            current = node
+            while True:
+                parent = current.getParent()
+                if parent is None:
+                    break
+                indexes.append(parent.getIndex(current))
+                current = parent
+            if current != root.node:
+                return None
+            indexes.reverse()
+            mirror = self._index.from_index_path(indexes)
+            if mirror is None or mirror.display_value != node.getDisplayValue():
+                # tree was changed outside of this class
+                return None
+            return mirror
+        return None
 
     def _add_nodes_from_tree_data(self, tree_data: dict, parent_node: XMutableTreeNode | None = None) -> None:
         """
@@ -379,10 +526,20 @@ class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents,
 
             Custom rules can be created if the exiting rules do no cover you search needs.
 
+            The search runs on :py:attr:`~.CtlTree.index`. Only the found node is read from the control.
+            If the tree was changed without the methods of this class call :py:meth:`~.CtlTree.rebuild_index` first.
+
         See Also:
             :ref:`ns_dialog_search_tree_search`
+
+        .. versionchanged:: 0.48.0
+            Search runs on :py:attr:`~.CtlTree.index` when ``node`` is in the index.
         """
-        # Check the current node
+        start = self._index_node_from_uno(node)
+        if start is not None and isinstance(value, str) and value:
+            found = self._find_in_index(start, value, case_sensitive, search_data_value)
+            return None if found is None else self._resolve(found)
+
         search = SearchTree(match_value=value, match_all=False)
         if case_sensitive:
             search.register_rule(RuleTextSensitive())
@@ -393,8 +550,52 @@ class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents,
             if search_data_value:
                 search.register_rule(RuleDataInsensitive())
 
+        if start is not None:
+            found = search.find_node(start)  # type: ignore
+            return None if found is None else self._resolve(found)  # type: ignore
         return search.find_node(node)
 
+    def _find_in_index(
+        self, start: TreeIndexNode, value: str, case_sensitive: bool, search_data_value: bool
+    ) -> TreeIndexNode | None:
+        # same result as SearchTree, the first match in depth first order at or below start.
+        candidates = self._index.find_text(value, case_sensitive)
+        if search_data_value:
+            candidates.extend(self._index.find_data(value, case_sensitive))
+        prefix = start.index_path
+        size = len(prefix)
+        result = None
+        result_path = None
+        for candidate in candidates:
+            path = candidate.index_path
+            if path[:size] != prefix:
+                continue
+            if result_path is None or path < result_path:
+                result = candidate
+                result_path = path
+        return result
+
+    def rebuild_index(self) -> None:
+        """
+        Rebuilds :py:attr:`~.CtlTree.index` from the nodes of the control.
+
+        Only needed when nodes are added or removed without the methods of this class.
+
+        .. versionadded:: 0.48.0
+        """
+        root = self.root_node
+        if root is None:
+            self._index.clear()
+            return
+        mirror = self._index.set_root(root.getDisplayValue(), root.DataValue, root)
+        stack = [(mirror, cast("XTreeNode", root))]
+        while stack:
+            parent, node = stack.pop()
+            for i in range(node.getChildCount()):
+                child = node.getChildAt(i)
+                stack.append((self._index.add_child(parent, child.getDisplayValue(), child.DataValue, child), child))
+            parent.populated = True
+
     # endregion Tree Nodes
 
     # region Static Methods
@@ -455,6 +656,17 @@ class CtlTree(DialogControlBase, TreeControlModelPartial, SelectionChangeEvents,
         return None
 
     # endregion TreeControlModelPartial overrides
+    @property
+    def index(self) -> TreeIndex:
+        """
+        Gets the index of the nodes added with this class.
+
+        The index is a Python side copy of the tree that is searched without calls to office.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._index
+
     @property
     def model(self) -> TreeControlModel:
         # pylint: disable=no-member
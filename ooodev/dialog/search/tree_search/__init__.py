@@ -8,6 +8,8 @@ from .rule_text_insensitive import RuleTextInsensitive as RuleTextInsensitive
 from .rule_text_regex import RuleTextRegex as RuleTextRegex
 from .rule_text_sensitive import RuleTextSensitive as RuleTextSensitive
 from .search_tree import SearchTree as SearchTree
+from .tree_index import TreeIndex as TreeIndex
+from .tree_index import TreeIndexNode as TreeIndexNode
 
 __all__ = [
     "RuleDataCompare",
@@ -20,4 +22,6 @@ __all__ = [
     "RuleTextRegex",
     "RuleTextSensitive",
     "SearchTree",
+    "TreeIndex",
+    "TreeIndexNode",
 ]
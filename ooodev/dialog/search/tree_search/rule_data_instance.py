@@ -1,10 +1,7 @@
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
 import contextlib
-import uno
-from com.sun.star.awt.tree import XMutableTreeNode
-
-from ooodev.loader import lo as mLo
+from ooodev.dialog.search.tree_search.tree_index import get_data_value
 
 if TYPE_CHECKING:
     from com.sun.star.awt.tree import XTreeNode
@@ -24,10 +21,9 @@ class RuleDataInstance:
         Returns:
             bool: True if the node's data value matches the match value; Otherwise, False.
         """
-        tree_node = mLo.Lo.qi(XMutableTreeNode, node)
-        if not tree_node:
+        found, data_value = get_data_value(node)
+        if not found:
             return False
-        data_value = tree_node.DataValue
         if data_value is None:
             return False
         with contextlib.suppress(Exception):
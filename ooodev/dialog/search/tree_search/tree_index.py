@@ -0,0 +1,403 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+import uno
+from com.sun.star.awt.tree import XMutableTreeNode
+
+from ooodev.loader import lo as mLo
+
+DATA_VALUE_KEY = "___data_value___"
+
+
+class TreeIndexNode:
+    """
+    Python side mirror of a tree node.
+
+    Has the same ``getDisplayValue()``, ``DataValue``, ``getChildCount()`` and ``getChildAt()`` members as a UNO
+    tree node so search rules and :py:class:`~.SearchTree` can run against it without calls to office.
+
+    .. versionadded:: 0.48.0
+    """
+
+    __slots__ = ("display_value", "data_value", "parent", "children", "node", "populated", "position")
+
+    def __init__(
+        self,
+        display_value: str,
+        data_value: Any = None,
+        parent: TreeIndexNode | None = None,
+        node: XMutableTreeNode | None = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            display_value (str): Display value.
+            data_value (Any, optional): Data value.
+            parent (TreeIndexNode, optional): Parent node.
+            node (XMutableTreeNode, optional): UNO node, if already created.
+        """
+        self.display_value = display_value
+        self.data_value = data_value
+        self.parent = parent
+        self.children: List[TreeIndexNode] = []
+        self.node = node
+        """UNO node or ``None`` if the node has not been created in the control yet."""
+        self.populated = False
+        """``True`` when UNO nodes exist for all children."""
+        self.position = 0
+        """Index of this node in the children of its parent."""
+
+    def __repr__(self) -> str:
+        return f"TreeIndexNode({self.display_value!r})"
+
+    # region XTreeNode like
+    def getDisplayValue(self) -> str:
+        """Gets the display value."""
+        return self.display_value
+
+    @property
+    def DataValue(self) -> Any:
+        """Gets the data value."""
+        return self.data_value
+
+    def getChildCount(self) -> int:
+        """Gets the number of children."""
+        return len(self.children)
+
+    def getChildAt(self, index: int) -> TreeIndexNode:
+        """Gets the child at index."""
+        return self.children[index]
+
+    # endregion XTreeNode like
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        """Gets the display values from the root to this node."""
+        result = []
+        node: TreeIndexNode | None = self
+        while node is not None:
+            result.append(node.display_value)
+            node = node.parent
+        return tuple(reversed(result))
+
+    @property
+    def index_path(self) -> Tuple[int, ...]:
+        """
+        Gets the child indexes from the root to this node.
+
+        Sorting nodes on ``index_path`` gives the depth first order of the tree.
+        """
+        result = []
+        node = self
+        while node.parent is not None:
+            result.append(node.position)
+            node = node.parent
+        return tuple(reversed(result))
+
+
+class TreeIndex:
+    """
+    Python side mirror of a tree control, indexed by display value, data value and path.
+
+    Lookups do not make any calls to office.
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(self) -> None:
+        self._root: TreeIndexNode | None = None
+        self._by_text: Dict[str, List[TreeIndexNode]] = {}
+        self._by_text_fold: Dict[str, List[TreeIndexNode]] = {}
+        self._by_data: Dict[Any, List[TreeIndexNode]] = {}
+        self._by_data_fold: Dict[str, List[TreeIndexNode]] = {}
+        self._by_path: Dict[Tuple[str, ...], TreeIndexNode] = {}
+        # id of UNO node proxy -> index node. The index node holds the proxy so the id is not reused.
+        self._by_node: Dict[int, TreeIndexNode] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    # region build
+    def clear(self) -> None:
+        """Removes all nodes."""
+        self._root = None
+        self._by_text.clear()
+        self._by_text_fold.clear()
+        self._by_data.clear()
+        self._by_data_fold.clear()
+        self._by_path.clear()
+        self._by_node.clear()
+        self._count = 0
+
+    def set_root(self, display_value: str, data_value: Any = None, node: Any = None) -> TreeIndexNode:
+        """
+        Clears the index and sets the root node.
+
+        Args:
+            display_value (str): Display value.
+            data_value (Any, optional): Data value.
+            node (XMutableTreeNode, optional): UNO node.
+
+        Returns:
+            TreeIndexNode: Root node.
+        """
+        self.clear()
+        root = TreeIndexNode(display_value, data_value, None, None)
+        self._root = root
+        self._add_keys(root, (display_value,))
+        if node is not None:
+            self.set_node(root, node)
+        return root
+
+    def add_child(
+        self, parent: TreeIndexNode, display_value: str, data_value: Any = None, node: Any = None
+    ) -> TreeIndexNode:
+        """
+        Adds a child node.
+
+        Args:
+            parent (TreeIndexNode): Parent node.
+            display_value (str): Display value.
+            data_value (Any, optional): Data value.
+            node (XMutableTreeNode, optional): UNO node.
+
+        Returns:
+            TreeIndexNode: New node.
+        """
+        child = TreeIndexNode(display_value, data_value, parent, None)
+        child.position = len(parent.children)
+        parent.children.append(child)
+        self._add_keys(child, parent.path + (display_value,))
+        if node is not None:
+            self.set_node(child, node)
+        return child
+
+    def set_node(self, mirror: TreeIndexNode, node: Any) -> None:
+        """
+        Sets the UNO node of an index node.
+
+        Args:
+            mirror (TreeIndexNode): Index node.
+            node (XMutableTreeNode): UNO node.
+        """
+        if mirror.node is not None:
+            self._by_node.pop(id(mirror.node), None)
+        mirror.node = node
+        self._by_node[id(node)] = mirror
+
+    def add_tree_data(self, tree_data: dict, parent: TreeIndexNode | None = None) -> List[TreeIndexNode]:
+        """
+        Adds nodes from a tree data structure as returned by ``CtlTree.convert_to_tree()``.
+
+        Nodes are added level by level. No UNO nodes are created.
+
+        Args:
+            tree_data (dict): Tree data.
+            parent (TreeIndexNode, optional): Node to add to. If omitted the last key of ``tree_data`` becomes
+                the root and the index is cleared.
+
+        Returns:
+            List[TreeIndexNode]: Nodes added directly below ``parent`` or a list with the root node.
+        """
+        top: List[TreeIndexNode] = []
+        if parent is None:
+            # each top level key replaces the root, as CtlTree.create_root() does. Only the last one is kept.
+            keys = [k for k in tree_data if k != DATA_VALUE_KEY]
+            if not keys:
+                return top
+            tree_data = {keys[-1]: tree_data[keys[-1]]}
+        # (parent, parent path, tree data) queue
+        level: List[Tuple[TreeIndexNode | None, Tuple[str, ...], Any]] = [
+            (parent, parent.path if parent is not None else (), tree_data)
+        ]
+        while level:
+            next_level: List[Tuple[TreeIndexNode | None, Tuple[str, ...], Any]] = []
+            for par, par_path, data in level:
+                if not isinstance(data, dict):
+                    # leaf value that is not a dict becomes a child node without data
+                    child = self._new_node(par, str(data), None, par_path)
+                    if par is parent:
+                        top.append(child)
+                    continue
+                for key, value in data.items():
+                    if key == DATA_VALUE_KEY:
+                        continue
+                    data_value = value.get(DATA_VALUE_KEY, None) if isinstance(value, dict) else None
+                    child = self._new_node(par, key, data_value, par_path)
+                    if par is parent:
+                        top.append(child)
+                    if isinstance(value, dict):
+                        if len(value) > (1 if DATA_VALUE_KEY in value else 0):
+                            next_level.append((child, par_path + (key,), value))
+                    else:
+                        next_level.append((child, par_path + (key,), value))
+            level = next_level
+        return top
+
+    def _new_node(
+        self, parent: TreeIndexNode | None, display_value: str, data_value: Any, parent_path: Tuple[str, ...]
+    ) -> TreeIndexNode:
+        if parent is None:
+            self.clear()
+            node = TreeIndexNode(display_value, data_value)
+            self._root = node
+        else:
+            node = TreeIndexNode(display_value, data_value, parent)
+            node.position = len(parent.children)
+            parent.children.append(node)
+        self._add_keys(node, parent_path + (display_value,))
+        return node
+
+    def _add_keys(self, node: TreeIndexNode, path: Tuple[str, ...]) -> None:
+        self._count += 1
+        text = node.display_value
+        self._by_text.setdefault(text, []).append(node)
+        if isinstance(text, str):
+            self._by_text_fold.setdefault(text.casefold(), []).append(node)
+        self._by_path.setdefault(path, node)
+        data = node.data_value
+        if data is not None:
+            try:
+                self._by_data.setdefault(data, []).append(node)
+            except TypeError:
+                # unhashable data value, only found by scanning
+                pass
+            if isinstance(data, str):
+                self._by_data_fold.setdefault(data.casefold(), []).append(node)
+
+    # endregion build
+
+    # region lookups
+    def find_path(self, path: Sequence[str]) -> TreeIndexNode | None:
+        """
+        Gets a node by path of display values from the root, such as ``("Root", "A1", "B1")``.
+
+        Args:
+            path (Sequence[str]): Display values.
+
+        Returns:
+            TreeIndexNode | None: First node with the path if found; Otherwise, ``None``.
+        """
+        return self._by_path.get(tuple(path), None)
+
+    def find_text(self, value: str, case_sensitive: bool = True) -> List[TreeIndexNode]:
+        """
+        Gets nodes by display value.
+
+        Args:
+            value (str): Display value.
+            case_sensitive (bool, optional): Case sensitive match. Defaults to ``True``.
+
+        Returns:
+            List[TreeIndexNode]: Matching nodes in the order they were added.
+        """
+        if case_sensitive:
+            return list(self._by_text.get(value, ()))
+        if not isinstance(value, str):
+            return []
+        return list(self._by_text_fold.get(value.casefold(), ()))
+
+    def find_data(self, value: Any, case_sensitive: bool = True) -> List[TreeIndexNode]:
+        """
+        Gets nodes by data value.
+
+        Args:
+            value (Any): Data value.
+            case_sensitive (bool, optional): Case sensitive match, only applies to string values. Defaults to ``True``.
+
+        Returns:
+            List[TreeIndexNode]: Matching nodes in the order they were added.
+        """
+        if not case_sensitive:
+            if not isinstance(value, str):
+                return []
+            return list(self._by_data_fold.get(value.casefold(), ()))
+        try:
+            return list(self._by_data.get(value, ()))
+        except TypeError:
+            return [n for n in self.walk() if n.data_value == value]
+
+    def find_node(self, node: Any) -> TreeIndexNode | None:
+        """
+        Gets the index node of a UNO node.
+
+        Only the node objects set on this index are found, another proxy of the same UNO node is not.
+
+        Args:
+            node (XMutableTreeNode): UNO node.
+
+        Returns:
+            TreeIndexNode | None: Index node if found; Otherwise, ``None``.
+        """
+        mirror = self._by_node.get(id(node), None)
+        if mirror is None or mirror.node is not node:
+            return None
+        return mirror
+
+    def from_index_path(self, index_path: Sequence[int]) -> TreeIndexNode | None:
+        """
+        Gets a node from child indexes starting at the root.
+
+        Args:
+            index_path (Sequence[int]): Child indexes.
+
+        Returns:
+            TreeIndexNode | None: Node if found; Otherwise, ``None``.
+        """
+        node = self._root
+        for i in index_path:
+            if node is None or i < 0 or i >= len(node.children):
+                return None
+            node = node.children[i]
+        return node
+
+    def walk(self, start: TreeIndexNode | None = None) -> Iterator[TreeIndexNode]:
+        """
+        Iterates nodes depth first.
+
+        Args:
+            start (TreeIndexNode, optional): Node to start from. Defaults to root.
+
+        Returns:
+            Iterator[TreeIndexNode]: Nodes.
+        """
+        if start is None:
+            start = self._root
+        if start is None:
+            return
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    # endregion lookups
+
+    @property
+    def root(self) -> TreeIndexNode | None:
+        """Gets the root node."""
+        return self._root
+
+
+def get_data_value(node: Any) -> Tuple[bool, Any]:
+    """
+    Gets the data value of a UNO tree node or a :py:class:`TreeIndexNode`.
+
+    Args:
+        node (Any): Tree node.
+
+    Returns:
+        Tuple[bool, Any]: ``(False, None)`` if node has no data value; Otherwise, ``(True, data_value)``.
+
+    .. versionadded:: 0.48.0
+    """
+    if isinstance(node, TreeIndexNode):
+        return True, node.data_value
+    tree_node = mLo.Lo.qi(XMutableTreeNode, node)
+    if not tree_node:
+        return False, None
+    return True, tree_node.DataValue
+
+
+__all__ = ("TreeIndex", "TreeIndexNode", "get_data_value")
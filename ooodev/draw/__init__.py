@@ -1,44 +1,95 @@
-from ooo.dyn.awt.point import Point as Point
-from ooo.dyn.drawing.line_style import LineStyle as LineStyle
-from ooo.dyn.drawing.polygon_flags import PolygonFlags as PolygonFlags
-from ooo.dyn.presentation.animation_speed import AnimationSpeed as AnimationSpeed
-from ooo.dyn.presentation.fade_effect import FadeEffect as FadeEffect
+from __future__ import annotations
+from typing import TYPE_CHECKING
 
-from ooodev.events.draw_named_event import DrawNamedEvent as DrawNamedEvent
-from ooodev.office.draw import Draw as Draw
-from ooodev.units.angle import Angle as Angle
-from ooodev.utils.data_type.image_offset import ImageOffset as ImageOffset
-from ooodev.utils.data_type.intensity import Intensity as Intensity
-from ooodev.utils.data_type.poly_sides import PolySides as PolySides
-from ooodev.utils.dispatch.shape_dispatch_kind import ShapeDispatchKind as ShapeDispatchKind
-from ooodev.utils.kind.drawing_bitmap_kind import DrawingBitmapKind as DrawingBitmapKind
-from ooodev.utils.kind.drawing_gradient_kind import DrawingGradientKind as DrawingGradientKind
-from ooodev.utils.kind.drawing_hatching_kind import DrawingHatchingKind as DrawingHatchingKind
-from ooodev.utils.kind.drawing_layer_kind import DrawingLayerKind as DrawingLayerKind
-from ooodev.utils.kind.drawing_name_space_kind import DrawingNameSpaceKind as DrawingNameSpaceKind
-from ooodev.utils.kind.drawing_shape_kind import DrawingShapeKind as DrawingShapeKind
-from ooodev.utils.kind.drawing_slide_show_kind import DrawingSlideShowKind as DrawingSlideShowKind
-from ooodev.utils.kind.glue_points_kind import GluePointsKind as GluePointsKind
-from ooodev.utils.kind.graphic_style_kind import GraphicStyleKind as GraphicStyleKind
-from ooodev.utils.kind.presentation_kind import PresentationKind as PresentationKind
-from ooodev.utils.kind.shape_comb_kind import ShapeCombKind as ShapeCombKind
-from ooodev.utils.kind.zoom_kind import ZoomKind as ZoomKind
+from ooodev.lazy.lazy_exports import lazy_exports
 
-from .draw_doc import DrawDoc as DrawDoc
-from .draw_doc_view import DrawDocView as DrawDocView
-from .draw_form import DrawForm as DrawForm
-from .draw_forms import DrawForms as DrawForms
-from .draw_page import DrawPage as DrawPage
-from .draw_pages import DrawPages as DrawPages
-from .draw_text import DrawText as DrawText
-from .draw_text_cursor import DrawTextCursor as DrawTextCursor
-from .generic_draw_page import GenericDrawPage as GenericDrawPage
-from .generic_draw_pages import GenericDrawPages as GenericDrawPages
-from .impress_doc import ImpressDoc as ImpressDoc
-from .impress_page import ImpressPage as ImpressPage
-from .impress_pages import ImpressPages as ImpressPages
-from .master_draw_page import MasterDrawPage as MasterDrawPage
-from .shape_collection import ShapeCollection as ShapeCollection
+if TYPE_CHECKING:
+    from ooo.dyn.awt.point import Point as Point
+    from ooo.dyn.drawing.line_style import LineStyle as LineStyle
+    from ooo.dyn.drawing.polygon_flags import PolygonFlags as PolygonFlags
+    from ooo.dyn.presentation.animation_speed import AnimationSpeed as AnimationSpeed
+    from ooo.dyn.presentation.fade_effect import FadeEffect as FadeEffect
+
+    from ooodev.events.draw_named_event import DrawNamedEvent as DrawNamedEvent
+    from ooodev.office.draw import Draw as Draw
+    from ooodev.units.angle import Angle as Angle
+    from ooodev.utils.data_type.image_offset import ImageOffset as ImageOffset
+    from ooodev.utils.data_type.intensity import Intensity as Intensity
+    from ooodev.utils.data_type.poly_sides import PolySides as PolySides
+    from ooodev.utils.dispatch.shape_dispatch_kind import ShapeDispatchKind as ShapeDispatchKind
+    from ooodev.utils.kind.drawing_bitmap_kind import DrawingBitmapKind as DrawingBitmapKind
+    from ooodev.utils.kind.drawing_gradient_kind import DrawingGradientKind as DrawingGradientKind
+    from ooodev.utils.kind.drawing_hatching_kind import DrawingHatchingKind as DrawingHatchingKind
+    from ooodev.utils.kind.drawing_layer_kind import DrawingLayerKind as DrawingLayerKind
+    from ooodev.utils.kind.drawing_name_space_kind import DrawingNameSpaceKind as DrawingNameSpaceKind
+    from ooodev.utils.kind.drawing_shape_kind import DrawingShapeKind as DrawingShapeKind
+    from ooodev.utils.kind.drawing_slide_show_kind import DrawingSlideShowKind as DrawingSlideShowKind
+    from ooodev.utils.kind.glue_points_kind import GluePointsKind as GluePointsKind
+    from ooodev.utils.kind.graphic_style_kind import GraphicStyleKind as GraphicStyleKind
+    from ooodev.utils.kind.presentation_kind import PresentationKind as PresentationKind
+    from ooodev.utils.kind.shape_comb_kind import ShapeCombKind as ShapeCombKind
+    from ooodev.utils.kind.zoom_kind import ZoomKind as ZoomKind
+
+    from .draw_doc import DrawDoc as DrawDoc
+    from .draw_doc_view import DrawDocView as DrawDocView
+    from .draw_form import DrawForm as DrawForm
+    from .draw_forms import DrawForms as DrawForms
+    from .draw_page import DrawPage as DrawPage
+    from .draw_pages import DrawPages as DrawPages
+    from .draw_text import DrawText as DrawText
+    from .draw_text_cursor import DrawTextCursor as DrawTextCursor
+    from .generic_draw_page import GenericDrawPage as GenericDrawPage
+    from .generic_draw_pages import GenericDrawPages as GenericDrawPages
+    from .impress_doc import ImpressDoc as ImpressDoc
+    from .impress_page import ImpressPage as ImpressPage
+    from .impress_pages import ImpressPages as ImpressPages
+    from .master_draw_page import MasterDrawPage as MasterDrawPage
+    from .shape_collection import ShapeCollection as ShapeCollection
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Point": "ooo.dyn.awt.point",
+        "LineStyle": "ooo.dyn.drawing.line_style",
+        "PolygonFlags": "ooo.dyn.drawing.polygon_flags",
+        "AnimationSpeed": "ooo.dyn.presentation.animation_speed",
+        "FadeEffect": "ooo.dyn.presentation.fade_effect",
+        "DrawNamedEvent": "ooodev.events.draw_named_event",
+        "Draw": "ooodev.office.draw",
+        "Angle": "ooodev.units.angle",
+        "ImageOffset": "ooodev.utils.data_type.image_offset",
+        "Intensity": "ooodev.utils.data_type.intensity",
+        "PolySides": "ooodev.utils.data_type.poly_sides",
+        "ShapeDispatchKind": "ooodev.utils.dispatch.shape_dispatch_kind",
+        "DrawingBitmapKind": "ooodev.utils.kind.drawing_bitmap_kind",
+        "DrawingGradientKind": "ooodev.utils.kind.drawing_gradient_kind",
+        "DrawingHatchingKind": "ooodev.utils.kind.drawing_hatching_kind",
+        "DrawingLayerKind": "ooodev.utils.kind.drawing_layer_kind",
+        "DrawingNameSpaceKind": "ooodev.utils.kind.drawing_name_space_kind",
+        "DrawingShapeKind": "ooodev.utils.kind.drawing_shape_kind",
+        "DrawingSlideShowKind": "ooodev.utils.kind.drawing_slide_show_kind",
+        "GluePointsKind": "ooodev.utils.kind.glue_points_kind",
+        "GraphicStyleKind": "ooodev.utils.kind.graphic_style_kind",
+        "PresentationKind": "ooodev.utils.kind.presentation_kind",
+        "ShapeCombKind": "ooodev.utils.kind.shape_comb_kind",
+        "ZoomKind": "ooodev.utils.kind.zoom_kind",
+        "DrawDoc": ".draw_doc",
+        "DrawDocView": ".draw_doc_view",
+        "DrawForm": ".draw_form",
+        "DrawForms": ".draw_forms",
+        "DrawPage": ".draw_page",
+        "DrawPages": ".draw_pages",
+        "DrawText": ".draw_text",
+        "DrawTextCursor": ".draw_text_cursor",
+        "GenericDrawPage": ".generic_draw_page",
+        "GenericDrawPages": ".generic_draw_pages",
+        "ImpressDoc": ".impress_doc",
+        "ImpressPage": ".impress_page",
+        "ImpressPages": ".impress_pages",
+        "MasterDrawPage": ".master_draw_page",
+        "ShapeCollection": ".shape_collection",
+    },
+)
 
 __all__ = [
     "DrawDoc",
@@ -0,0 +1,262 @@
+"""
+Batch export of draw pages and shapes as images.
+
+.. versionadded:: 0.48.0
+"""
+
+from __future__ import annotations
+import time
+from typing import Any, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+import uno
+from com.sun.star.drawing import XDrawPagesSupplier
+
+from ooodev.adapter.drawing.graphic_export_filter_implement import GraphicExportFilterImplement
+from ooodev.draw.export.export_base import ExportBase
+from ooodev.loader import lo as mLo
+from ooodev.utils import props as mProps
+from ooodev.utils.helper.image_export_helper import BatchExportResult
+from ooodev.utils.helper.image_export_helper import ImageExportHelper
+from ooodev.utils.partial.lo_inst_props_partial import LoInstPropsPartial
+
+if TYPE_CHECKING:
+    from ooodev.loader.inst.lo_inst import LoInst
+    from ooodev.loader.lo_pool import LoPool
+    from ooodev.utils.type_var import PathOrStr
+
+
+class PageBatchExport(LoInstPropsPartial, ExportBase):
+    """
+    Exports many pages or shapes of a Draw or Impress document as images.
+
+    A single ``GraphicExportFilter`` and media descriptor are reused for all items.
+    Images are written to files in a directory or into memory.
+
+    Example:
+        .. code-block:: python
+
+            from ooodev.draw.export.page_batch_export import PageBatchExport
+
+            exporter = PageBatchExport(doc, image_type="png", resolution=72)
+            results = exporter.export_pages(out_dir="/tmp/thumbs")
+            for result in results:
+                print(result.url, result.seconds)
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(
+        self,
+        doc: Any,
+        image_type: str = "png",
+        resolution: int = 96,
+        translucent: bool = False,
+        lo_inst: LoInst | None = None,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            doc (Any): ``DrawDoc``, ``ImpressDoc`` or UNO document that supports ``XDrawPagesSupplier``.
+            image_type (str, optional): Image type. ``png`` or ``jpg``. Defaults to ``png``.
+            resolution (int, optional): Resolution in dpi. Defaults to ``96``.
+            translucent (bool, optional): ``png`` only. Transparent background. Defaults to ``False``.
+            lo_inst (LoInst, optional): Lo Instance. Defaults to the instance of ``doc`` or ``Lo.current_lo``.
+
+        Raises:
+            ValueError: If ``image_type`` is not ``png`` or ``jpg``.
+        """
+        if lo_inst is None:
+            lo_inst = doc.lo_inst if isinstance(doc, LoInstPropsPartial) else mLo.Lo.current_lo
+        LoInstPropsPartial.__init__(self, lo_inst=lo_inst)
+        ExportBase.__init__(self)
+        self._doc = getattr(doc, "component", doc)
+        self._resolution = resolution
+        image_type = image_type.lower()
+        self._helper = ImageExportHelper(
+            filter_name="draw_jpg_Export" if image_type in ("jpg", "jpeg") else "draw_png_Export",
+            image_type=image_type,
+            lo_inst=self.lo_inst,
+            translucent=translucent,
+        )
+        self._filter: GraphicExportFilterImplement | None = None
+
+    def _get_filter(self) -> GraphicExportFilterImplement:
+        if self._filter is None:
+            self._filter = GraphicExportFilterImplement(lo_inst=self.lo_inst)
+        return self._filter
+
+    def _get_pages(self, pages: Iterable[Any] | None) -> List[Tuple[Any, Any]]:
+        draw_pages = mLo.Lo.qi(XDrawPagesSupplier, self._doc, True).getDrawPages()
+        if pages is None:
+            return [(i, draw_pages.getByIndex(i)) for i in range(draw_pages.getCount())]
+        result = []
+        for page in pages:
+            if isinstance(page, int):
+                result.append((page, draw_pages.getByIndex(page)))
+            else:
+                result.append((page, getattr(page, "component", page)))
+        return result
+
+    def _export(
+        self, items: List[Tuple[Any, Any, int, int]], out_dir: PathOrStr | None, name_template: str
+    ) -> List[BatchExportResult]:
+        graphic_filter = self._get_filter()
+        helper = self._helper
+        results: List[BatchExportResult] = []
+        for i, (source, comp, width, height) in enumerate(items):
+            start = time.perf_counter()
+            dpi_x, dpi_y = self._get_dpi_width_height(width, height, self._resolution)
+            filter_data = helper.get_filter_data(dpi_x, dpi_y)
+            index = source if isinstance(source, int) else i
+            graphic_filter.set_source_document(comp)
+            if out_dir is None:
+                stream = helper.create_output_stream()
+                graphic_filter.filter(*helper.get_args(filter_data, stream))
+                url = ""
+                data = helper.get_stream_bytes(stream)
+            else:
+                url = helper.get_url(out_dir, name_template, index)
+                graphic_filter.filter(*helper.get_args(filter_data, url))
+                data = None
+            results.append(
+                BatchExportResult(index=index, source=source, url=url, data=data, seconds=time.perf_counter() - start)
+            )
+        return results
+
+    def export_pages(
+        self,
+        pages: Iterable[Any] | None = None,
+        out_dir: PathOrStr | None = None,
+        name_template: str = "page_{index:04d}.{ext}",
+    ) -> List[BatchExportResult]:
+        """
+        Exports pages as images.
+
+        Args:
+            pages (Iterable[Any], optional): Pages to export. Each item can be a page index,
+                a ``DrawPage`` or an ``XDrawPage``. Defaults to all pages.
+            out_dir (PathOrStr, optional): Directory to write the images to.
+                If omitted then images are exported into memory and returned in ``BatchExportResult.data``.
+            name_template (str, optional): File name template. ``{index}`` is replaced with the page index when
+                pages are passed as indexes; Otherwise, the position in ``pages``. ``{ext}`` is replaced with the
+                image type. Defaults to ``page_{index:04d}.{ext}``.
+
+        Returns:
+            List[BatchExportResult]: Result for each page in the order of ``pages``.
+
+        Note:
+            Unlike ``DrawPage.export_page_png()`` no export events are raised for each page.
+        """
+        items = []
+        for source, comp in self._get_pages(pages):
+            height, width = comp.getPropertyValues(("Height", "Width"))
+            items.append((source, comp, width, height))
+        return self._export(items, out_dir, name_template)
+
+    def export_shapes(
+        self,
+        shapes: Iterable[Any],
+        out_dir: PathOrStr | None = None,
+        name_template: str = "shape_{index:04d}.{ext}",
+    ) -> List[BatchExportResult]:
+        """
+        Exports shapes as images.
+
+        Args:
+            shapes (Iterable[Any]): Shapes to export. Each item can be a shape such as ``DrawShape`` or an ``XShape``.
+            out_dir (PathOrStr, optional): Directory to write the images to.
+                If omitted then images are exported into memory and returned in ``BatchExportResult.data``.
+            name_template (str, optional): File name template. ``{index}`` is replaced with the position in
+                ``shapes`` and ``{ext}`` is replaced with the image type. Defaults to ``shape_{index:04d}.{ext}``.
+
+        Returns:
+            List[BatchExportResult]: Result for each shape in the order of ``shapes``.
+        """
+        items = []
+        for shape in shapes:
+            comp = getattr(shape, "component", shape)
+            sz = comp.getSize()
+            items.append((shape, comp, sz.Width, sz.Height))
+        return self._export(items, out_dir, name_template)
+
+    # region pool
+    @staticmethod
+    def _pool_task(
+        lo_inst: LoInst,
+        fnm: PathOrStr,
+        pages: Sequence[int] | None,
+        stride: Tuple[int, int],
+        out_dir: PathOrStr | None,
+        image_type: str,
+        resolution: int,
+        translucent: bool,
+        name_template: str,
+    ) -> List[BatchExportResult]:
+        doc = lo_inst.open_doc(fnm=fnm, props=mProps.Props.make_props(Hidden=True, ReadOnly=True))
+        try:
+            exporter = PageBatchExport(
+                doc, image_type=image_type, resolution=resolution, translucent=translucent, lo_inst=lo_inst
+            )
+            if pages is None:
+                start, step = stride
+                count = mLo.Lo.qi(XDrawPagesSupplier, doc, True).getDrawPages().getCount()
+                pages = range(start, count, step)
+            return exporter.export_pages(pages=pages, out_dir=out_dir, name_template=name_template)
+        finally:
+            lo_inst.close_doc(doc)
+
+    @classmethod
+    def export_pages_pool(
+        cls,
+        pool: LoPool,
+        fnm: PathOrStr,
+        pages: Sequence[int] | None = None,
+        out_dir: PathOrStr | None = None,
+        image_type: str = "png",
+        resolution: int = 96,
+        translucent: bool = False,
+        name_template: str = "page_{index:04d}.{ext}",
+    ) -> List[BatchExportResult]:
+        """
+        Exports pages of a document file as images using a pool of office processes.
+
+        Pages are split between the workers of the pool. Each worker opens the document hidden and read only
+        and exports its share of pages.
+
+        Args:
+            pool (LoPool): Pool of office processes.
+            fnm (PathOrStr): Document file.
+            pages (Sequence[int], optional): Indexes of pages to export. Defaults to all pages.
+            out_dir (PathOrStr, optional): Directory to write the images to.
+                If omitted then images are exported into memory and returned in ``BatchExportResult.data``.
+            image_type (str, optional): Image type. ``png`` or ``jpg``. Defaults to ``png``.
+            resolution (int, optional): Resolution in dpi. Defaults to ``96``.
+            translucent (bool, optional): ``png`` only. Transparent background. Defaults to ``False``.
+            name_template (str, optional): File name template. ``{index}`` is replaced with the page index and
+                ``{ext}`` is replaced with the image type. Defaults to ``page_{index:04d}.{ext}``.
+
+        Returns:
+            List[BatchExportResult]: Result for each page ordered by page index. ``source`` is the page index.
+        """
+        size = pool.size
+        args = (out_dir, image_type, resolution, translucent, name_template)
+        if pages is None:
+            futures = [pool.submit(cls._pool_task, fnm, None, (i, size), *args) for i in range(size)]
+        else:
+            chunk = max(1, -(-len(pages) // size))
+            futures = [
+                pool.submit(cls._pool_task, fnm, list(pages[i : i + chunk]), (0, 1), *args)
+                for i in range(0, len(pages), chunk)
+            ]
+        results: List[BatchExportResult] = []
+        for future in futures:
+            results.extend(future.result())
+        results.sort(key=lambda r: r.index)
+        return results
+
+    # endregion pool
+
+    @property
+    def image_type(self) -> str:
+        """Gets image type. ``png`` or ``jpg``."""
+        return self._helper.image_type
@@ -9,6 +9,7 @@ from ooo.dyn.awt.point import Point
 from ooo.dyn.drawing.polygon_flags import PolygonFlags
 from ooodev.mock import mock_g
 from ooodev.adapter.container.index_container_comp import IndexContainerComp
+from ooodev.draw.shape_index import ShapeIndex
 from ooodev.exceptions import ex as mEx
 from ooodev.office import draw as mDraw
 from ooodev.utils import color as mColor
@@ -53,6 +54,7 @@ class DrawPagePartial(Generic[_T]):
         self.__owner = owner
         self.__component = component
         self.__lo_inst = mLo.Lo.current_lo if lo_inst is None else lo_inst
+        self.__shape_index: ShapeIndex | None = None
 
     def add_bullet(self, bulls_txt: XText, level: int, text: str) -> None:
         """
@@ -810,6 +812,10 @@ class DrawPagePartial(Generic[_T]):
         Returns:
             int: Z-Order
         """
+        if self.__shape_index is not None:
+            if len(self.__shape_index) == 0:
+                raise mEx.DrawError("Error finding biggest z-order")
+            return self.__shape_index.get_biggest_zorder()
         return mDraw.Draw.find_biggest_zorder(self.__component)  # type: ignore
 
     def find_shape_by_name(self, shape_name: str) -> DrawShape[_T]:
@@ -826,7 +832,12 @@ class DrawPagePartial(Generic[_T]):
         Returns:
             DrawShape: Shape.
         """
-        shape = mDraw.Draw.find_shape_by_name(self.__component, shape_name)  # type: ignore
+        if self.__shape_index is not None:
+            shape = self.__shape_index.find_by_name(shape_name)
+            if shape is None:
+                raise mEx.ShapeMissingError(f'No shape named "{shape_name}"')
+        else:
+            shape = mDraw.Draw.find_shape_by_name(self.__component, shape_name)  # type: ignore
         return DrawShape(owner=self.__owner, component=shape, lo_inst=self.__lo_inst)
 
     def find_shape_by_type(self, shape_type: DrawingNameSpaceKind | str) -> DrawShape[_T]:
@@ -843,7 +854,13 @@ class DrawPagePartial(Generic[_T]):
         Returns:
             DrawShape: Shape
         """
-        shape = mDraw.Draw.find_shape_by_type(self.__component, shape_type)  # type: ignore
+        if self.__shape_index is not None:
+            shapes = self.__shape_index.find_by_type(shape_type)
+            if not shapes:
+                raise mEx.ShapeMissingError(f'No shape found for "{shape_type}"')
+            shape = shapes[0]
+        else:
+            shape = mDraw.Draw.find_shape_by_type(self.__component, shape_type)  # type: ignore
         return DrawShape(owner=self.__owner, component=shape, lo_inst=self.__lo_inst)
 
     def find_top_shape(self) -> DrawShape[_T]:
@@ -857,7 +874,12 @@ class DrawPagePartial(Generic[_T]):
         Returns:
             DrawShape: Top most shape.
         """
-        shape = mDraw.Draw.find_top_shape(self.__component)  # type: ignore
+        if self.__shape_index is not None:
+            shape = self.__shape_index.get_top_shape()
+            if shape is None:
+                raise mEx.ShapeMissingError("No shapes found")
+        else:
+            shape = mDraw.Draw.find_top_shape(self.__component)  # type: ignore
         return DrawShape(owner=self.__owner, component=shape, lo_inst=self.__lo_inst)
 
     def get_animation_node(self) -> XAnimationNode:
@@ -1005,7 +1027,10 @@ class DrawPagePartial(Generic[_T]):
         See Also:
             :py:meth:`~.draw.Draw.get_shapes`
         """
-        shapes = mDraw.Draw.get_ordered_shapes(slide=self.__component)  # type: ignore
+        if self.__shape_index is not None:
+            shapes = self.__shape_index.get_ordered_shapes()
+        else:
+            shapes = mDraw.Draw.get_ordered_shapes(slide=self.__component)  # type: ignore
         # pylint: disable=not-an-iterable
         return [DrawShape(owner=self.__owner, component=shape, lo_inst=self.__lo_inst) for shape in shapes]  # type: ignore
 
@@ -1211,6 +1236,76 @@ class DrawPagePartial(Generic[_T]):
             slide=self.__component, fade_effect=fade_effect, speed=speed, change=change, duration=duration  # type: ignore
         )
 
+    # region Shape Index
+    def enable_shape_index(self) -> ShapeIndex:
+        """
+        Enables the shape index of this draw page.
+
+        When enabled :py:meth:`find_shape_by_name`, :py:meth:`find_shape_by_type`, :py:meth:`find_top_shape`,
+        :py:meth:`find_biggest_zorder`, :py:meth:`get_ordered_shapes` and :py:meth:`find_shapes_at`
+        use the index instead of reading every shape from office on each call.
+
+        The index is built in a single pass and is rebuilt on the next lookup after the document is modified.
+
+        Returns:
+            ShapeIndex: Shape index.
+
+        .. versionadded:: 0.48.0
+        """
+        if self.__shape_index is None:
+            doc = None
+            office_doc = getattr(self.__owner, "office_doc", None)
+            if office_doc is not None:
+                doc = office_doc.component
+            self.__shape_index = ShapeIndex(draw_page=self.__component, doc=doc)
+        return self.__shape_index
+
+    def disable_shape_index(self) -> None:
+        """
+        Disables the shape index of this draw page.
+
+        .. versionadded:: 0.48.0
+        """
+        if self.__shape_index is not None:
+            self.__shape_index.dispose()
+            self.__shape_index = None
+
+    def find_shapes_at(self, x: int, y: int) -> List[ShapeBase[Any]]:
+        """
+        Finds shapes whose bounding box contains a point.
+
+        Enables the shape index if it is not already enabled.
+
+        Args:
+            x (int): X in ``1/100th mm`` units.
+            y (int): Y in ``1/100th mm`` units.
+
+        Returns:
+            List[ShapeBase[Any]]: Shapes with the top most shape first.
+
+        .. versionadded:: 0.48.0
+        """
+        # pylint: disable=import-outside-toplevel
+        from ooodev.draw.shapes.shape_factory import ShapeFactory
+
+        shapes = self.enable_shape_index().find_at(x, y)
+        factory = ShapeFactory(owner=self.__owner, lo_inst=self.__lo_inst)
+        return [factory.shape_factory(shape) for shape in shapes]
+
+    @property
+    def shape_index(self) -> ShapeIndex | None:
+        """
+        Gets the shape index of this draw page.
+
+        Returns:
+            ShapeIndex | None: Shape index if enabled; Otherwise, ``None``.
+
+        .. versionadded:: 0.48.0
+        """
+        return self.__shape_index
+
+    # endregion Shape Index
+
     def find_shape_at_position(self, x: int, y: int) -> ShapeBase[Any] | None:
         """
         Finds a shape at a given position.
@@ -0,0 +1,347 @@
+"""
+Index of the shapes of a draw page.
+
+.. versionadded:: 0.48.0
+"""
+
+from __future__ import annotations
+import contextlib
+from typing import Any, Dict, List, NamedTuple, TYPE_CHECKING
+
+import uno
+from com.sun.star.util import XModifyBroadcaster
+
+from ooodev.adapter.util.modify_listener import ModifyListener
+from ooodev.loader import lo as mLo
+
+if TYPE_CHECKING:
+    from com.sun.star.drawing import XDrawPage
+    from com.sun.star.drawing import XShape
+    from ooodev.utils.kind.drawing_name_space_kind import DrawingNameSpaceKind
+
+# getPropertyValues() needs the names in sorted order.
+_PROPS = ("BoundRect", "Name", "ZOrder")
+
+
+class ShapeIndexEntry(NamedTuple):
+    """
+    Entry of a :py:class:`ShapeIndex`.
+
+    .. versionadded:: 0.48.0
+    """
+
+    shape: Any
+    """UNO shape. Supports ``XShape``."""
+    name: str
+    """Shape name."""
+    shape_type: str
+    """Shape type such as ``com.sun.star.drawing.RectangleShape``."""
+    z_order: int
+    """Z-Order of the shape."""
+    x: int
+    """Left of bounding box in ``1/100th mm`` units."""
+    y: int
+    """Top of bounding box in ``1/100th mm`` units."""
+    width: int
+    """Width of bounding box in ``1/100th mm`` units."""
+    height: int
+    """Height of bounding box in ``1/100th mm`` units."""
+
+    def contains(self, x: int, y: int) -> bool:
+        """
+        Gets if a point is inside the bounding box of the shape.
+
+        Args:
+            x (int): X in ``1/100th mm`` units.
+            y (int): Y in ``1/100th mm`` units.
+
+        Returns:
+            bool: ``True`` if point is inside bounding box; Otherwise, ``False``.
+        """
+        return self.x <= x <= self.x + self.width and self.y <= y <= self.y + self.height
+
+    def intersects(self, x: int, y: int, width: int, height: int) -> bool:
+        """
+        Gets if a rectangle overlaps the bounding box of the shape.
+
+        Args:
+            x (int): Left of rectangle in ``1/100th mm`` units.
+            y (int): Top of rectangle in ``1/100th mm`` units.
+            width (int): Width of rectangle in ``1/100th mm`` units.
+            height (int): Height of rectangle in ``1/100th mm`` units.
+
+        Returns:
+            bool: ``True`` if rectangle overlaps bounding box; Otherwise, ``False``.
+        """
+        return not (x > self.x + self.width or x + width < self.x or y > self.y + self.height or y + height < self.y)
+
+    def inside(self, x: int, y: int, width: int, height: int) -> bool:
+        """
+        Gets if the bounding box of the shape is inside a rectangle.
+
+        Args:
+            x (int): Left of rectangle in ``1/100th mm`` units.
+            y (int): Top of rectangle in ``1/100th mm`` units.
+            width (int): Width of rectangle in ``1/100th mm`` units.
+            height (int): Height of rectangle in ``1/100th mm`` units.
+
+        Returns:
+            bool: ``True`` if bounding box is inside rectangle; Otherwise, ``False``.
+        """
+        return self.x >= x and self.y >= y and self.x + self.width <= x + width and self.y + self.height <= y + height
+
+
+class ShapeIndex:
+    """
+    Index of the shapes of a draw page.
+
+    The index maps name, type, z-order and bounding box to the shapes of a draw page.
+    It is built in a single pass over the draw page. After that lookups, type filtering and hit testing
+    are done locally without any calls to office.
+
+    When a document is passed the index listens for modifications of the document and is rebuilt on the next
+    lookup after a shape has been added, removed, moved or renamed.
+
+    Example:
+        .. code-block:: python
+
+            idx = doc.slides[0].enable_shape_index()
+            shape = idx.find_by_name("Logo")
+            hits = idx.find_at(2_000, 3_000)
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(self, draw_page: XDrawPage, doc: Any = None) -> None:
+        """
+        Constructor
+
+        Args:
+            draw_page (XDrawPage): Draw page to index.
+            doc (Any, optional): Document of the draw page. Must support ``XModifyBroadcaster``.
+                If omitted then the index is not kept fresh automatically and :py:meth:`invalidate`
+                must be called after shapes change.
+        """
+        self._draw_page = draw_page
+        self._entries: List[ShapeIndexEntry] = []
+        self._by_name: Dict[str, ShapeIndexEntry] = {}
+        self._by_type: Dict[str, List[ShapeIndexEntry]] = {}
+        self._dirty = True
+        self._listener: ModifyListener | None = None
+        self._broadcaster: XModifyBroadcaster | None = None
+        if doc is not None:
+            self._broadcaster = mLo.Lo.qi(XModifyBroadcaster, doc)
+        if self._broadcaster is not None:
+            self._fn_on_modified = self._on_modified
+            self._fn_on_disposing = self._on_disposing
+            self._listener = ModifyListener()
+            self._listener.on("modified", self._fn_on_modified)
+            self._listener.on("disposing", self._fn_on_disposing)
+            self._broadcaster.addModifyListener(self._listener)
+
+    def __del__(self) -> None:
+        with contextlib.suppress(Exception):
+            self.dispose()
+
+    def __len__(self) -> int:
+        return len(self._get_entries())
+
+    # region Events
+    def _on_modified(self, source: Any, event: Any) -> None:
+        self._dirty = True
+
+    def _on_disposing(self, source: Any, event: Any) -> None:
+        self._broadcaster = None
+        self.clear()
+
+    # endregion Events
+
+    # region build
+    def _read_entry(self, shape: Any) -> ShapeIndexEntry:
+        try:
+            rect, name, z_order = shape.getPropertyValues(_PROPS)
+        except Exception:
+            # shape does not support XMultiPropertySet or one of the properties.
+            name = getattr(shape, "Name", "")
+            z_order = getattr(shape, "ZOrder", -1)
+            rect = getattr(shape, "BoundRect", None)
+        if rect is None:
+            pos = shape.getPosition()
+            sz = shape.getSize()
+            x, y, width, height = pos.X, pos.Y, sz.Width, sz.Height
+        else:
+            x, y, width, height = rect.X, rect.Y, rect.Width, rect.Height
+        return ShapeIndexEntry(
+            shape=shape,
+            name=str(name or ""),
+            shape_type=shape.getShapeType(),
+            z_order=int(z_order),
+            x=x,
+            y=y,
+            width=width,
+            height=height,
+        )
+
+    def build(self) -> None:
+        """
+        Builds the index in a single pass over the draw page.
+
+        Called automatically by lookups when the index is not current.
+        """
+        entries: List[ShapeIndexEntry] = []
+        page = self._draw_page
+        for i in range(page.getCount()):
+            entries.append(self._read_entry(page.getByIndex(i)))
+        entries.sort(key=lambda e: e.z_order)
+
+        by_name: Dict[str, ShapeIndexEntry] = {}
+        by_type: Dict[str, List[ShapeIndexEntry]] = {}
+        for entry in entries:
+            if entry.name:
+                # first match in z-order wins, the same as Draw.find_shape_by_name()
+                by_name.setdefault(entry.name.casefold(), entry)
+            by_type.setdefault(entry.shape_type, []).append(entry)
+
+        self._entries = entries
+        self._by_name = by_name
+        self._by_type = by_type
+        self._dirty = False
+
+    def _get_entries(self) -> List[ShapeIndexEntry]:
+        if self._dirty:
+            self.build()
+        return self._entries
+
+    def invalidate(self) -> None:
+        """Marks the index as out of date. The index is rebuilt on the next lookup."""
+        self._dirty = True
+
+    def clear(self) -> None:
+        """Clears the index. The index is rebuilt on the next lookup."""
+        self._entries = []
+        self._by_name = {}
+        self._by_type = {}
+        self._dirty = True
+
+    def dispose(self) -> None:
+        """Stops listening for document modifications and clears the index."""
+        if self._broadcaster is not None and self._listener is not None:
+            with contextlib.suppress(Exception):
+                self._broadcaster.removeModifyListener(self._listener)
+        self._broadcaster = None
+        self._listener = None
+        self.clear()
+
+    # endregion build
+
+    # region lookups
+    def find_by_name(self, name: str) -> XShape | None:
+        """
+        Finds a shape by its name. Case is ignored.
+
+        Args:
+            name (str): Shape name.
+
+        Returns:
+            XShape | None: Shape if found; Otherwise, ``None``.
+        """
+        self._get_entries()
+        entry = self._by_name.get(name.casefold(), None)
+        return None if entry is None else entry.shape
+
+    def find_by_type(self, shape_type: DrawingNameSpaceKind | str) -> List[XShape]:
+        """
+        Finds shapes by type.
+
+        Args:
+            shape_type (DrawingNameSpaceKind | str): Shape type such as ``com.sun.star.drawing.RectangleShape``.
+
+        Returns:
+            List[XShape]: Shapes of the type ordered by z-order.
+        """
+        self._get_entries()
+        return [e.shape for e in self._by_type.get(str(shape_type), [])]
+
+    def find_at(self, x: int, y: int) -> List[XShape]:
+        """
+        Finds shapes whose bounding box contains a point.
+
+        Args:
+            x (int): X in ``1/100th mm`` units.
+            y (int): Y in ``1/100th mm`` units.
+
+        Returns:
+            List[XShape]: Shapes with the top most shape first.
+        """
+        return [e.shape for e in reversed(self._get_entries()) if e.contains(x, y)]
+
+    def find_in_rect(self, x: int, y: int, width: int, height: int, inside: bool = False) -> List[XShape]:
+        """
+        Finds shapes whose bounding box overlaps a rectangle.
+
+        Args:
+            x (int): Left of rectangle in ``1/100th mm`` units.
+            y (int): Top of rectangle in ``1/100th mm`` units.
+            width (int): Width of rectangle in ``1/100th mm`` units.
+            height (int): Height of rectangle in ``1/100th mm`` units.
+            inside (bool, optional): If ``True`` only shapes whose bounding box is completely inside the rectangle
+                are returned. Default ``False``.
+
+        Returns:
+            List[XShape]: Shapes with the top most shape first.
+        """
+        if inside:
+            return [e.shape for e in reversed(self._get_entries()) if e.inside(x, y, width, height)]
+        return [e.shape for e in reversed(self._get_entries()) if e.intersects(x, y, width, height)]
+
+    def get_ordered_shapes(self) -> List[XShape]:
+        """
+        Gets shapes ordered by z-order.
+
+        Returns:
+            List[XShape]: Shapes with the bottom most shape first.
+        """
+        return [e.shape for e in self._get_entries()]
+
+    def get_top_shape(self) -> XShape | None:
+        """
+        Gets the top most shape.
+
+        Returns:
+            XShape | None: Top most shape if the draw page has shapes; Otherwise, ``None``.
+        """
+        entries = self._get_entries()
+        return entries[-1].shape if entries else None
+
+    def get_biggest_zorder(self) -> int:
+        """
+        Gets the largest z-order.
+
+        Returns:
+            int: Largest z-order or ``-1`` if the draw page has no shapes.
+        """
+        entries = self._get_entries()
+        return entries[-1].z_order if entries else -1
+
+    # endregion lookups
+
+    # region Properties
+    @property
+    def entries(self) -> List[ShapeIndexEntry]:
+        """Gets the index entries ordered by z-order."""
+        return list(self._get_entries())
+
+    @property
+    def is_dirty(self) -> bool:
+        """Gets if the index is out of date and is rebuilt on the next lookup."""
+        return self._dirty
+
+    @property
+    def auto_update(self) -> bool:
+        """Gets if the index listens for document modifications."""
+        return self._listener is not None
+
+    # endregion Properties
+
+
+__all__ = ("ShapeIndex", "ShapeIndexEntry")
@@ -1,18 +1,44 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 import uno
-from ooo.dyn.awt.image_scale_mode import ImageScaleModeEnum as ImageScaleModeEnum
-from ooo.dyn.awt.line_end_format import LineEndFormatEnum as LineEndFormatEnum
-from ooo.dyn.awt.mouse_wheel_behavior import MouseWheelBehaviorEnum as MouseWheelBehaviorEnum
-from ooo.dyn.form.form_component_type import FormComponentType as FormComponentType
-from ooo.dyn.form.list_source_type import ListSourceType as ListSourceType
 
-from .forms import Forms as Forms
-from ooodev.utils.kind.border_kind import BorderKind as BorderKind
-from ooodev.utils.kind.date_format_kind import DateFormatKind as DateFormatKind
-from ooodev.utils.kind.form_component_kind import FormComponentKind as FormComponentKind
-from ooodev.utils.kind.language_kind import LanguageKind as LanguageKind
-from ooodev.utils.kind.orientation_kind import OrientationKind as OrientationKind
-from ooodev.utils.kind.state_kind import StateKind as StateKind
-from ooodev.utils.kind.time_format_kind import TimeFormatKind as TimeFormatKind
-from ooodev.utils.kind.tri_state_kind import TriStateKind as TriStateKind
+from ooodev.lazy.lazy_exports import lazy_exports
+
+if TYPE_CHECKING:
+    from ooo.dyn.awt.image_scale_mode import ImageScaleModeEnum as ImageScaleModeEnum
+    from ooo.dyn.awt.line_end_format import LineEndFormatEnum as LineEndFormatEnum
+    from ooo.dyn.awt.mouse_wheel_behavior import MouseWheelBehaviorEnum as MouseWheelBehaviorEnum
+    from ooo.dyn.form.form_component_type import FormComponentType as FormComponentType
+    from ooo.dyn.form.list_source_type import ListSourceType as ListSourceType
+
+    from .forms import Forms as Forms
+    from ooodev.utils.kind.border_kind import BorderKind as BorderKind
+    from ooodev.utils.kind.date_format_kind import DateFormatKind as DateFormatKind
+    from ooodev.utils.kind.form_component_kind import FormComponentKind as FormComponentKind
+    from ooodev.utils.kind.language_kind import LanguageKind as LanguageKind
+    from ooodev.utils.kind.orientation_kind import OrientationKind as OrientationKind
+    from ooodev.utils.kind.state_kind import StateKind as StateKind
+    from ooodev.utils.kind.time_format_kind import TimeFormatKind as TimeFormatKind
+    from ooodev.utils.kind.tri_state_kind import TriStateKind as TriStateKind
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ImageScaleModeEnum": "ooo.dyn.awt.image_scale_mode",
+        "LineEndFormatEnum": "ooo.dyn.awt.line_end_format",
+        "MouseWheelBehaviorEnum": "ooo.dyn.awt.mouse_wheel_behavior",
+        "FormComponentType": "ooo.dyn.form.form_component_type",
+        "ListSourceType": "ooo.dyn.form.list_source_type",
+        "Forms": ".forms",
+        "BorderKind": "ooodev.utils.kind.border_kind",
+        "DateFormatKind": "ooodev.utils.kind.date_format_kind",
+        "FormComponentKind": "ooodev.utils.kind.form_component_kind",
+        "LanguageKind": "ooodev.utils.kind.language_kind",
+        "OrientationKind": "ooodev.utils.kind.orientation_kind",
+        "StateKind": "ooodev.utils.kind.state_kind",
+        "TimeFormatKind": "ooodev.utils.kind.time_format_kind",
+        "TriStateKind": "ooodev.utils.kind.tri_state_kind",
+    },
+)
 
 __all__ = ["Forms"]
@@ -474,8 +474,9 @@ class StyleBase(metaclass=MetaStyle):
         """Lo Safe Method."""
         # set properties. Can be overridden in child classes
         # may be useful to wrap in try statements in child classes
+        # properties are set in a single batch to reduce the number of calls to LibreOffice.
         try:
-            mProps.Props.set(obj, **kwargs)
+            mProps.Props.set_batch(obj, **kwargs)
         except mEx.MultiError as multi_err:
             mLo.Lo.print(f"{self.__class__.__name__}.apply(): Unable to set Property")
             for err in multi_err.errors:
@@ -1,4 +1,5 @@
+from .cmd_catalog import CmdCatalog as CmdCatalog
 from .cmd_data import CmdData as CmdData
 from .cmd_info import CmdInfo as CmdInfo
 
-__all__ = ["CmdData", "CmdInfo"]
+__all__ = ["CmdCatalog", "CmdData", "CmdInfo"]
@@ -0,0 +1,469 @@
+"""
+On disk catalogue of UNO commands.
+
+.. versionadded:: 0.48.0
+"""
+
+from __future__ import annotations
+import contextlib
+import json
+import mmap
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+
+from ooodev.adapter.frame.module_manager_comp import ModuleManagerComp
+from ooodev.adapter.frame.the_ui_command_description_comp import TheUICommandDescriptionComp
+from ooodev.adapter.ui.global_accelerator_configuration_comp import GlobalAcceleratorConfigurationComp
+from ooodev.adapter.ui.the_module_ui_configuration_manager_supplier_comp import (
+    TheModuleUIConfigurationManagerSupplierComp,
+)
+from ooodev.gui.commands.cmd_data import CmdData
+from ooodev.io.log.named_logger import NamedLogger
+from ooodev.loader import lo as mLo
+from ooodev.utils import props as mProps
+
+if TYPE_CHECKING:
+    from ooodev.loader.inst.lo_inst import LoInst
+    from ooodev.loader.lo_pool import LoPool
+    from ooodev.utils.type_var import PathOrStr
+
+_FORMAT = 1
+_NODE_PRODUCT = "/org.openoffice.Setup/Product"
+_NODE_L10N = "/org.openoffice.Setup/L10N"
+
+
+def _get_key_strings(accel: Any, commands: Sequence[str]) -> List[str]:
+    """Gets the preferred shortcut of each command with a single call. Empty string for no shortcut."""
+    # pylint: disable=import-outside-toplevel
+    from ooodev.gui.menu.shortcuts import Shortcuts
+
+    try:
+        keys = accel.getPreferredKeyEventsForCommandList(tuple(commands))
+    except Exception:
+        keys = []
+        for cmd in commands:
+            try:
+                keys.append(accel.getPreferredKeyEventsForCommandList((cmd,))[0])
+            except Exception:
+                keys.append(None)
+    return ["" if key is None else Shortcuts.from_key_event(key) for key in keys]
+
+
+def build_module_dict(
+    mod_name: str,
+    ui_cmd_desc: TheUICommandDescriptionComp,
+    cmf: TheModuleUIConfigurationManagerSupplierComp,
+    global_sc: GlobalAcceleratorConfigurationComp,
+) -> Dict[str, CmdData]:
+    """
+    Reads the command data of a module from office.
+
+    Shortcuts of all commands of the module are looked up with one call for the module and one call for global
+    shortcuts.
+
+    Args:
+        mod_name (str): Module name such as ``com.sun.star.sheet.SpreadsheetDocument``.
+        ui_cmd_desc (TheUICommandDescriptionComp): UI command description.
+        cmf (TheModuleUIConfigurationManagerSupplierComp): Module UI configuration manager supplier.
+        global_sc (GlobalAcceleratorConfigurationComp): Global shortcut manager.
+
+    Returns:
+        Dict[str, CmdData]: Command data keyed by command such as ``.uno:Copy``.
+    """
+    desc = ui_cmd_desc.get_by_name(mod_name)
+    commands = desc.get_element_names()
+    if not commands:
+        return {}
+    local_sc = cmf.get_ui_configuration_manager(mod_name).get_short_cut_manager()
+    module_keys = _get_key_strings(local_sc.component, commands)
+    global_keys = _get_key_strings(global_sc.component, commands)
+    result: Dict[str, CmdData] = {}
+    for cmd, module_hotkey, global_hotkey in zip(commands, module_keys, global_keys):
+        el_dict = mProps.Props.data_to_dict(desc.get_by_name(cmd))
+        result[cmd] = CmdData(
+            cmd,
+            el_dict.get("Label", ""),
+            el_dict.get("Name", ""),
+            el_dict.get("Popup", False),
+            el_dict.get("Properties", 0),
+            el_dict.get("PopupLabel", ""),
+            el_dict.get("TooltipLabel", ""),
+            el_dict.get("TargetURL", ""),
+            el_dict.get("IsExperimental", False),
+            module_hotkey,
+            global_hotkey,
+        )
+    return result
+
+
+class CmdCatalog:
+    """
+    Catalogue of the UNO commands of all modules.
+
+    The catalogue is a single file that is keyed by LibreOffice version and UI locale. It is loaded with one read
+    of a memory mapped file and indexed by command such as ``.uno:Copy`` and by label.
+    Files are written atomically so that many processes can share a catalogue.
+
+    Building a catalogue reads every command of every module from office and is an explicit step.
+    See :py:meth:`build` and :py:meth:`build_pool`.
+
+    Example:
+        .. code-block:: python
+
+            from ooodev.gui.commands.cmd_catalog import CmdCatalog
+
+            catalog = CmdCatalog.from_lo()
+            if catalog is None:
+                catalog = CmdCatalog.build()
+            print(catalog.find_command(".uno:Copy"))
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(
+        self, version: str, locale: str, rows: Dict[str, Dict[str, CmdData]], path: Path | None = None
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            version (str): LibreOffice version such as ``7.6.4.1``.
+            locale (str): UI locale such as ``en-US``.
+            rows (Dict[str, Dict[str, CmdData]]): Command data keyed by module name and then by command.
+            path (Path, optional): File of the catalogue.
+        """
+        self._version = version
+        self._locale = locale
+        self._modules = rows
+        self._path = path
+        self._by_command: Dict[str, List[Tuple[str, CmdData]]] = {}
+        self._by_label: Dict[str, List[Tuple[str, CmdData]]] = {}
+        for mod_name, cmds in rows.items():
+            for cmd, data in cmds.items():
+                self._by_command.setdefault(cmd, []).append((mod_name, data))
+                if data.label:
+                    self._by_label.setdefault(self._norm_label(data.label), []).append((mod_name, data))
+
+    # region static
+    @staticmethod
+    def _norm_label(label: str) -> str:
+        # labels contain mnemonic markers such as Cop~y
+        return label.replace("~", "").strip().casefold()
+
+    @staticmethod
+    def get_default_dir() -> Path:
+        """Gets the default directory of catalogue files."""
+        return Path(tempfile.gettempdir(), "ooodev", "cmd_catalog")
+
+    @classmethod
+    def get_file_name(cls, version: str, locale: str) -> str:
+        """
+        Gets the file name of a catalogue.
+
+        Args:
+            version (str): LibreOffice version such as ``7.6.4.1``.
+            locale (str): UI locale such as ``en-US``.
+
+        Returns:
+            str: File name such as ``cmds_7.6.4.1_en-US.json``.
+        """
+        safe = re.compile(r"[^0-9A-Za-z._-]")
+        return f"cmds_{safe.sub('_', version)}_{safe.sub('_', locale)}.json"
+
+    @staticmethod
+    def get_version_locale(lo_inst: LoInst | None = None) -> Tuple[str, str]:
+        """
+        Gets the version and UI locale of a running office.
+
+        Args:
+            lo_inst (LoInst, optional): Lo Instance. Defaults to ``Lo.current_lo``.
+
+        Returns:
+            Tuple[str, str]: Version such as ``7.6.4.1`` and locale such as ``en-US``.
+        """
+        if lo_inst is None:
+            lo_inst = mLo.Lo.current_lo
+        cache = lo_inst.config_cache
+        version = cache.get_value(_NODE_PRODUCT, "ooSetupVersionAboutBox")
+        locale, sys_locale = cache.get_values(_NODE_L10N, ("ooLocale", "ooSetupSystemLocale"), None)
+        return str(version), str(locale or sys_locale or "en-US")
+
+    # endregion static
+
+    # region load save
+    @classmethod
+    def load(cls, version: str, locale: str, cache_dir: PathOrStr | None = None) -> CmdCatalog | None:
+        """
+        Loads a catalogue from disk.
+
+        Args:
+            version (str): LibreOffice version such as ``7.6.4.1``.
+            locale (str): UI locale such as ``en-US``.
+            cache_dir (PathOrStr, optional): Directory of catalogue files. Defaults to :py:meth:`get_default_dir`.
+
+        Returns:
+            CmdCatalog | None: Catalogue or ``None`` if there is no valid catalogue file.
+        """
+        path = Path(cache_dir or cls.get_default_dir(), cls.get_file_name(version, locale))
+        return cls.load_file(path)
+
+    @classmethod
+    def load_file(cls, path: PathOrStr) -> CmdCatalog | None:
+        """
+        Loads a catalogue file.
+
+        Args:
+            path (PathOrStr): Catalogue file.
+
+        Returns:
+            CmdCatalog | None: Catalogue or ``None`` if the file does not exist or is not a valid catalogue.
+        """
+        path = Path(path)
+        try:
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = json.loads(mm[:])
+            if data.get("format") != _FORMAT:
+                return None
+            modules = data["modules"]
+            rows: Dict[str, Dict[str, CmdData]] = {name: {} for name in modules}
+            for row in data["rows"]:
+                cmd_data = CmdData(*row[1:])
+                rows[modules[row[0]]][cmd_data.command] = cmd_data
+        except (OSError, ValueError, KeyError, IndexError, TypeError) as e:
+            NamedLogger(cls.__name__).debug(f"Unable to load command catalogue {path}: {e}")
+            return None
+        return cls(version=data["version"], locale=data["locale"], rows=rows, path=path)
+
+    @classmethod
+    def from_lo(cls, lo_inst: LoInst | None = None, cache_dir: PathOrStr | None = None) -> CmdCatalog | None:
+        """
+        Loads the catalogue that matches the version and locale of a running office.
+
+        Args:
+            lo_inst (LoInst, optional): Lo Instance. Defaults to ``Lo.current_lo``.
+            cache_dir (PathOrStr, optional): Directory of catalogue files. Defaults to :py:meth:`get_default_dir`.
+
+        Returns:
+            CmdCatalog | None: Catalogue or ``None`` if the catalogue has not been built.
+        """
+        version, locale = cls.get_version_locale(lo_inst)
+        return cls.load(version, locale, cache_dir)
+
+    def save(self, cache_dir: PathOrStr | None = None) -> Path:
+        """
+        Writes the catalogue to disk.
+
+        The file is written to a temporary file first and then renamed so readers never see a partial file.
+
+        Args:
+            cache_dir (PathOrStr, optional): Directory of catalogue files. Defaults to :py:meth:`get_default_dir`.
+
+        Returns:
+            Path: Catalogue file.
+        """
+        out_dir = Path(cache_dir or self.get_default_dir())
+        out_dir.mkdir(parents=True, exist_ok=True)
+        modules = list(self._modules.keys())
+        rows = []
+        for i, name in enumerate(modules):
+            for data in self._modules[name].values():
+                rows.append([i, *data])
+        data = {
+            "format": _FORMAT,
+            "version": self._version,
+            "locale": self._locale,
+            "created": time.time(),
+            "modules": modules,
+            "rows": rows,
+        }
+        path = out_dir / self.get_file_name(self._version, self._locale)
+        fd, tmp = tempfile.mkstemp(prefix=".cmds_", suffix=".tmp", dir=out_dir)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+            raise
+        self._path = path
+        return path
+
+    # endregion load save
+
+    # region build
+    @staticmethod
+    def read_modules(lo_inst: LoInst, modules: Iterable[str] | None = None) -> Dict[str, Dict[str, CmdData]]:
+        """
+        Reads the command data of modules from office.
+
+        Args:
+            lo_inst (LoInst): Lo Instance.
+            modules (Iterable[str], optional): Module names. Defaults to all modules.
+
+        Returns:
+            Dict[str, Dict[str, CmdData]]: Command data keyed by module name and then by command.
+        """
+        if modules is None:
+            modules = ModuleManagerComp.from_lo(lo_inst=lo_inst).get_element_names()
+        ui_cmd_desc = TheUICommandDescriptionComp.from_lo(lo_inst=lo_inst)
+        cmf = TheModuleUIConfigurationManagerSupplierComp.from_lo(lo_inst=lo_inst)
+        global_sc = GlobalAcceleratorConfigurationComp.from_lo(lo_inst=lo_inst)
+        result: Dict[str, Dict[str, CmdData]] = {}
+        for name in modules:
+            try:
+                result[name] = build_module_dict(name, ui_cmd_desc, cmf, global_sc)
+            except Exception as e:
+                # some modules have no commands or no UI configuration.
+                NamedLogger(CmdCatalog.__name__).debug(f"Skipping module {name}: {e}")
+        return result
+
+    @classmethod
+    def build(cls, lo_inst: LoInst | None = None, cache_dir: PathOrStr | None = None, save: bool = True) -> CmdCatalog:
+        """
+        Builds the catalogue of all modules from a running office.
+
+        Args:
+            lo_inst (LoInst, optional): Lo Instance. Defaults to ``Lo.current_lo``.
+            cache_dir (PathOrStr, optional): Directory of catalogue files. Defaults to :py:meth:`get_default_dir`.
+            save (bool, optional): Write the catalogue to disk. Defaults to ``True``.
+
+        Returns:
+            CmdCatalog: Catalogue.
+        """
+        if lo_inst is None:
+            lo_inst = mLo.Lo.current_lo
+        version, locale = cls.get_version_locale(lo_inst)
+        catalog = cls(version=version, locale=locale, rows=cls.read_modules(lo_inst))
+        if save:
+            catalog.save(cache_dir)
+        return catalog
+
+    @staticmethod
+    def _pool_names_task(lo_inst: LoInst) -> Tuple[str, str, Tuple[str, ...]]:
+        version, locale = CmdCatalog.get_version_locale(lo_inst)
+        return version, locale, ModuleManagerComp.from_lo(lo_inst=lo_inst).get_element_names()
+
+    @staticmethod
+    def _pool_read_task(lo_inst: LoInst, modules: List[str]) -> Dict[str, Dict[str, CmdData]]:
+        return CmdCatalog.read_modules(lo_inst, modules)
+
+    @classmethod
+    def build_pool(cls, pool: LoPool, cache_dir: PathOrStr | None = None, save: bool = True) -> CmdCatalog:
+        """
+        Builds the catalogue of all modules using a pool of office processes.
+
+        Modules are split between the workers of the pool.
+
+        Args:
+            pool (LoPool): Pool of office processes. All offices must be the same version and locale.
+            cache_dir (PathOrStr, optional): Directory of catalogue files. Defaults to :py:meth:`get_default_dir`.
+            save (bool, optional): Write the catalogue to disk. Defaults to ``True``.
+
+        Returns:
+            CmdCatalog: Catalogue.
+        """
+        version, locale, names = pool.submit(cls._pool_names_task).result()
+        names = list(names)
+        # round robin, large modules such as Writer and Calc end up on different workers.
+        futures = [pool.submit(cls._pool_read_task, names[i :: pool.size]) for i in range(min(pool.size, len(names)))]
+        read: Dict[str, Dict[str, CmdData]] = {}
+        for future in futures:
+            read.update(future.result())
+        rows = {name: read[name] for name in names if name in read}
+        catalog = cls(version=version, locale=locale, rows=rows)
+        if save:
+            catalog.save(cache_dir)
+        return catalog
+
+    # endregion build
+
+    # region lookups
+    def get_cmd_data(self, mod_name: str, cmd: str) -> CmdData | None:
+        """
+        Gets the command data of a module.
+
+        Args:
+            mod_name (str): Module name such as ``com.sun.star.sheet.SpreadsheetDocument``.
+            cmd (str): Command such as ``.uno:Copy``.
+
+        Returns:
+            CmdData | None: Command data or ``None`` if not found.
+        """
+        return self._modules.get(str(mod_name), {}).get(cmd, None)
+
+    def get_dict(self, mod_name: str) -> Dict[str, CmdData]:
+        """
+        Gets the command data of a module keyed by command.
+
+        Args:
+            mod_name (str): Module name such as ``com.sun.star.sheet.SpreadsheetDocument``.
+
+        Returns:
+            Dict[str, CmdData]: Command data. Empty if the module is not in the catalogue.
+        """
+        return self._modules.get(str(mod_name), {})
+
+    def find_command(self, cmd: str) -> List[Tuple[str, CmdData]]:
+        """
+        Finds a command in all modules.
+
+        Args:
+            cmd (str): Command such as ``.uno:Copy``.
+
+        Returns:
+            List[Tuple[str, CmdData]]: Module name and command data for each module that has the command.
+        """
+        return list(self._by_command.get(cmd, []))
+
+    def find_label(self, label: str) -> List[Tuple[str, CmdData]]:
+        """
+        Finds commands by label in all modules. Case and mnemonic markers (``~``) are ignored.
+
+        Args:
+            label (str): Label such as ``Copy``.
+
+        Returns:
+            List[Tuple[str, CmdData]]: Module name and command data for each match.
+        """
+        return list(self._by_label.get(self._norm_label(label), []))
+
+    def has_module(self, mod_name: str) -> bool:
+        """Gets if the catalogue has a module."""
+        return str(mod_name) in self._modules
+
+    # endregion lookups
+
+    # region Properties
+    @property
+    def version(self) -> str:
+        """Gets the LibreOffice version of the catalogue."""
+        return self._version
+
+    @property
+    def locale(self) -> str:
+        """Gets the UI locale of the catalogue."""
+        return self._locale
+
+    @property
+    def module_names(self) -> Tuple[str, ...]:
+        """Gets the module names of the catalogue."""
+        return tuple(self._modules.keys())
+
+    @property
+    def path(self) -> Path | None:
+        """Gets the file of the catalogue if it has been loaded or saved."""
+        return self._path
+
+    # endregion Properties
+
+    def __len__(self) -> int:
+        return len(self._by_command)
+
+
+__all__ = ("CmdCatalog", "build_module_dict")
@@ -1,25 +1,21 @@
 from __future__ import annotations
 from datetime import timedelta
-from typing import Any, Callable, Dict, List, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Tuple
 
 from ooodev.adapter.frame.module_manager_comp import ModuleManagerComp
 from ooodev.adapter.frame.the_ui_command_description_comp import TheUICommandDescriptionComp
-from ooodev.adapter.ui.accelerator_configuration_comp import AcceleratorConfigurationComp
 from ooodev.adapter.ui.global_accelerator_configuration_comp import GlobalAcceleratorConfigurationComp
 from ooodev.adapter.ui.the_module_ui_configuration_manager_supplier_comp import (
     TheModuleUIConfigurationManagerSupplierComp,
 )
 from ooodev.events.args.cancel_event_args import CancelEventArgs
 from ooodev.events.partial.events_partial import EventsPartial
+from ooodev.gui.commands.cmd_catalog import CmdCatalog
+from ooodev.gui.commands.cmd_catalog import build_module_dict
 from ooodev.gui.commands.cmd_data import CmdData
-from ooodev.utils import props as mProps
 from ooodev.utils.cache.file_cache.pickle_cache import PickleCache
 from ooodev.utils.cache.time_cache import TimeCache
 from ooodev.utils.kind.module_names_kind import ModuleNamesKind
-from ooodev.utils.string.str_list import StrList
-
-if TYPE_CHECKING:
-    from ooodev.gui.menu.shortcuts import Shortcuts
 
 
 class CmdInfo(EventsPartial):
@@ -32,6 +28,9 @@ class CmdInfo(EventsPartial):
     The cache valid for 5 days (may be cleared sooner, depending on system).
     The ``clear_cache()`` method can be used to clear the cache sooner.
 
+    When a :py:class:`~ooodev.gui.commands.cmd_catalog.CmdCatalog` has been built for the running office
+    version and locale it is used instead and no commands are read from office.
+
     Example:
         .. code-block:: python
 
@@ -64,13 +63,8 @@ class CmdInfo(EventsPartial):
 
     def __new__(cls, *args, **kwargs):
         if not isinstance(cls._instance, cls):
-            # avoid circular import
-            # pylint: disable=import-outside-toplevel
-            from ooodev.gui.menu.shortcuts import Shortcuts
-
             cls._instance = super(CmdInfo, cls).__new__(cls, *args, **kwargs)
             cls._instance._initialized = False
-            cls._instance._global_shortcuts = Shortcuts()
         return cls._instance
 
     # see https://opengrok.libreoffice.org/xref/core/officecfg/registry/data/org/openoffice/Office/UI/
@@ -86,9 +80,32 @@ class CmdInfo(EventsPartial):
         # using mem cache is many times faster than using file cache alone.
         self._mem_cache = TimeCache(300, 300)
         self._file_prefix = "uurt54_cmds_"
-        self._global_shortcuts: Shortcuts
+        self._catalog: CmdCatalog | None = None
+        self._catalog_loaded = False
         self._initialized = True
 
+    def _get_catalog(self) -> CmdCatalog | None:
+        if not self._catalog_loaded:
+            self._catalog_loaded = True
+            try:
+                self._catalog = CmdCatalog.from_lo()
+            except Exception:
+                self._catalog = None
+        return self._catalog
+
+    def set_catalog(self, catalog: CmdCatalog | None) -> None:
+        """
+        Sets the command catalogue used for lookups.
+
+        Args:
+            catalog (CmdCatalog, None): Catalogue. If ``None`` then commands are read from office.
+
+        .. versionadded:: 0.48.0
+        """
+        self._mem_cache.clear()
+        self._catalog = catalog
+        self._catalog_loaded = True
+
     def get_module_names(self) -> Tuple[str, ...]:
         """
         Get a list of module names such as ``com.sun.star.presentation.PresentationDocument``.
@@ -102,8 +119,15 @@ class CmdInfo(EventsPartial):
         return names
 
     def clear_cache(self) -> None:
-        """Clear the cache."""
+        """
+        Clear the cache.
+
+        .. versionchanged:: 0.48.0
+            The command catalogue is loaded again on next use.
+        """
         self._mem_cache.clear()
+        self._catalog = None
+        self._catalog_loaded = False
         names = self.get_module_names()
         for name in names:
             key = f"{self._file_prefix}{name.replace('.', '_')}.pkl"
@@ -127,10 +151,21 @@ class CmdInfo(EventsPartial):
             The ``event_data`` has the following event data:
             - ``module_name``: The module name.
             - ``cmd_data``: Instance of :py:class:`~ooodev.gui.commands.CmdData` The command data.
+
+        .. versionchanged:: 0.48.0
+            Uses the command index of the catalogue when available.
         """
         results = {}
-        for name in self.get_module_names():
-            cmd_data = self.get_cmd_data(name, command)
+        catalog = self._get_catalog()
+        if catalog is None:
+            found: List[Tuple[str, CmdData]] = []
+            for name in self.get_module_names():
+                cmd_data = self.get_cmd_data(name, command)
+                if cmd_data:
+                    found.append((name, cmd_data))
+        else:
+            found = catalog.find_command(command)
+        for name, cmd_data in found:
             if cmd_data:
                 cargs = CancelEventArgs(self)
                 cargs.event_data = {"module_name": name, "cmd_data": cmd_data}
@@ -192,7 +227,6 @@ class CmdInfo(EventsPartial):
         Hint:
             - ``ModuleNamesKind`` is an enum and can be imported from ``ooodev.utils.kind.module_names_kind``.
         """
-        # names = self.get_module_names()
         mod_name = str(mod_name)
         key = f"{self._file_prefix}{mod_name.replace('.', '_')}.pkl"
         if key in self._mem_cache:
@@ -202,61 +236,15 @@ class CmdInfo(EventsPartial):
             self._mem_cache[key] = val
             return val
 
-        # config = self._cmf.get_ui_configuration_manager(mod_name)
-        def build_row(
-            cmd: str, el: Any, local_sc: AcceleratorConfigurationComp, global_sc: GlobalAcceleratorConfigurationComp
-        ) -> tuple:
-            el_dict = mProps.Props.data_to_dict(el)
-            label = el_dict.get("Label", "")
-            name = el_dict.get("Name", "")
-            popup = el_dict.get("Popup", False)
-            properties = el_dict.get("Properties", 0)
-            popup_label = el_dict.get("PopupLabel", "")
-            tooltip_label = el_dict.get("TooltipLabel", "")
-            target_url = el_dict.get("TargetURL", "")
-            is_experimental = el_dict.get("IsExperimental", False)
-            local_keys = local_sc.get_preferred_key_events_for_command_list(cmd)
-            global_keys = global_sc.get_preferred_key_events_for_command_list(cmd)
-            if local_keys:
-                sl = StrList()
-                for key in local_keys:
-                    sl.append(self._global_shortcuts.from_key_event(key))
-                module_hotkey = str(sl)
-            else:
-                module_hotkey = ""
-            if global_keys:
-                sl = StrList()
-                for key in global_keys:
-                    sl.append(self._global_shortcuts.from_key_event(key))
-                global_hotkey = str(sl)
-            else:
-                global_hotkey = ""
-
-            return CmdData(
-                cmd,
-                label,
-                name,
-                popup,
-                properties,
-                popup_label,
-                tooltip_label,
-                target_url,
-                is_experimental,
-                module_hotkey,
-                global_hotkey,
-            )
+        catalog = self._get_catalog()
+        if catalog is not None and catalog.has_module(mod_name):
+            result = catalog.get_dict(mod_name)
+            self._mem_cache[key] = result
+            return result
 
-        result = {}
-        desc = self._ui_cmd_desc.get_by_name(mod_name)
-        commands = desc.get_element_names()
-        mod_ui_config = self._cmf.get_ui_configuration_manager(mod_name)
-        local_short_cut_mgr = mod_ui_config.get_short_cut_manager()
-        global_short_cut_mgr = GlobalAcceleratorConfigurationComp.from_lo()
-
-        for name in commands:
-            el = desc.get_by_name(name)
-            row = build_row(name, el, local_short_cut_mgr, global_short_cut_mgr)
-            result[name] = row
+        result = build_module_dict(
+            mod_name, self._ui_cmd_desc, self._cmf, GlobalAcceleratorConfigurationComp.from_lo()
+        )
         self._file_cache[key] = result
         self._mem_cache[key] = result
         return result
@@ -0,0 +1,53 @@
+from __future__ import annotations
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(importer_name: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Gets module level ``__getattr__()`` and ``__dir__()`` functions (:pep:`562`) for lazy exports.
+
+    Each exported name is imported on first access and then set on the module.
+
+    Args:
+        importer_name (str): Name of the module doing the export, usually ``__name__``.
+        exports (Dict[str, str]): Exported name mapped to the module it is imported from.
+            Relative module names are resolved against ``importer_name``.
+            The exported name must be the name of the attribute in that module.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: ``__getattr__`` and ``__dir__`` functions.
+
+    Example:
+        .. code-block:: python
+
+            from typing import TYPE_CHECKING
+            from ooodev.lazy.lazy_exports import lazy_exports
+
+            if TYPE_CHECKING:
+                from .calc_doc import CalcDoc as CalcDoc
+
+            __getattr__, __dir__ = lazy_exports(__name__, {"CalcDoc": ".calc_doc"})
+
+    .. versionadded:: 0.48.0
+    """
+    module = sys.modules[importer_name]
+    package = module.__package__
+
+    def __getattr__(name: str) -> Any:
+        mod_name = exports.get(name, None)
+        if mod_name is None:
+            raise AttributeError(f"module {importer_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(mod_name, package), name)
+        # later access is a plain module attribute lookup
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module.__dict__).union(exports))
+
+    return __getattr__, __dir__
+
+
+__all__ = ("lazy_exports",)
@@ -0,0 +1,298 @@
+"""Configuration access cache for ``LoInst``."""
+
+from __future__ import annotations
+from collections import OrderedDict
+import contextlib
+import threading
+from typing import Any, Dict, Iterable, NamedTuple, Tuple, TYPE_CHECKING
+import uno
+from com.sun.star.beans import XMultiPropertySet
+from com.sun.star.beans import XPropertySet
+from com.sun.star.container import XNameAccess
+from com.sun.star.lang import XMultiServiceFactory
+from com.sun.star.util import XChangesNotifier
+
+from ooodev.exceptions import ex as mEx
+from ooodev.utils import props as mProps
+from ooodev.utils.gen_util import NULL_OBJ
+
+if TYPE_CHECKING:
+    from ooodev.adapter.util.changes_listener import ChangesListener
+    from ooodev.loader.inst.lo_inst import LoInst
+
+
+class ConfigCacheStats(NamedTuple):
+    """
+    Configuration access cache statistics.
+
+    .. versionadded:: 0.48.0
+    """
+
+    node_hits: int
+    """Number of node lookups that were found in cache."""
+    node_misses: int
+    """Number of node lookups that opened a new configuration access."""
+    value_hits: int
+    """Number of values that were found in cache."""
+    value_misses: int
+    """Number of values that were read from office."""
+    invalidations: int
+    """Number of times cached values of a node were dropped because the configuration changed."""
+
+    @property
+    def value_hit_rate(self) -> float:
+        """Gets the hit rate of value lookups. Value is between ``0.0`` and ``1.0``."""
+        total = self.value_hits + self.value_misses
+        return self.value_hits / total if total else 0.0
+
+
+class _Node:
+    __slots__ = ("path", "access", "names", "values", "listener", "notifier", "callback")
+
+    def __init__(self, path: str, access: XPropertySet, names: frozenset) -> None:
+        self.path = path
+        self.access = access
+        self.names = names
+        self.values: Dict[str, Any] = {}
+        self.listener: ChangesListener | None = None
+        self.notifier: XChangesNotifier | None = None
+        self.callback: Any = None
+
+
+class ConfigCache:
+    """
+    Configuration access cache.
+
+    Holds a single ``ConfigurationProvider`` and a least recently used set of opened ``ConfigurationAccess``
+    node views keyed by node path. Values read from a node are cached until the configuration of that node
+    changes. Each node view has a ``XChangesListener`` that drops the cached values of the node when a change
+    is committed.
+
+    An instance is owned by each :py:class:`~ooodev.loader.inst.lo_inst.LoInst` and is cleared when office is closed
+    or the bridge to office is disposed.
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(self, lo_inst: LoInst, capacity: int = 64) -> None:
+        """
+        Constructor
+
+        Args:
+            lo_inst (LoInst): Lo Instance used to create the configuration provider.
+            capacity (int, optional): Max number of node views to keep open.
+                ``0`` or less turns caching off. Default ``64``.
+        """
+        self._lo_inst = lo_inst
+        self._lock = threading.RLock()
+        self._provider: XMultiServiceFactory | None = None
+        self._nodes: OrderedDict[str, _Node] = OrderedDict()
+        self._capacity = max(capacity, 0)
+        self._node_hits = 0
+        self._node_misses = 0
+        self._value_hits = 0
+        self._value_misses = 0
+        self._invalidations = 0
+
+    # region internal
+    def _get_provider(self) -> XMultiServiceFactory:
+        if self._provider is None:
+            self._provider = self._lo_inst.create_instance_mcf(
+                XMultiServiceFactory, "com.sun.star.configuration.ConfigurationProvider", raise_err=True
+            )
+        return self._provider
+
+    def _open_node(self, node_path: str) -> _Node:
+        p = mProps.Props.make_props(nodepath=node_path)
+        ca = self._get_provider().createInstanceWithArguments("com.sun.star.configuration.ConfigurationAccess", p)
+        access = self._lo_inst.qi(XPropertySet, ca, True)
+        na = self._lo_inst.qi(XNameAccess, ca)
+        names = frozenset(na.getElementNames()) if na is not None else frozenset()
+        return _Node(node_path, access, names)
+
+    def _listen(self, node: _Node) -> None:
+        # pylint: disable=import-outside-toplevel
+        from ooodev.adapter.util.changes_listener import ChangesListener
+
+        notifier = self._lo_inst.qi(XChangesNotifier, node.access)
+        if notifier is None:
+            return
+        path = node.path
+
+        def on_changes(source: Any, event: Any) -> None:
+            self.invalidate(path)
+
+        listener = ChangesListener()
+        # listener keeps the callback as a weak reference, the node keeps it alive.
+        node.callback = on_changes
+        listener.on("changesOccurred", on_changes)
+        notifier.addChangesListener(listener)
+        node.listener = listener
+        node.notifier = notifier
+
+    @staticmethod
+    def _unlisten(node: _Node) -> None:
+        if node.notifier is not None and node.listener is not None:
+            with contextlib.suppress(Exception):
+                node.notifier.removeChangesListener(node.listener)
+        node.notifier = None
+        node.listener = None
+        node.callback = None
+
+    def _get_node(self, node_path: str) -> _Node:
+        with self._lock:
+            node = self._nodes.get(node_path, None)
+            if node is not None:
+                self._nodes.move_to_end(node_path)
+                self._node_hits += 1
+                return node
+            self._node_misses += 1
+            node = self._open_node(node_path)
+            if self._capacity <= 0:
+                return node
+            self._listen(node)
+            self._nodes[node_path] = node
+            while len(self._nodes) > self._capacity:
+                _, old = self._nodes.popitem(last=False)
+                self._unlisten(old)
+            return node
+
+    # endregion internal
+
+    def get_node(self, node_path: str) -> XPropertySet:
+        """
+        Gets a read only view of a configuration node.
+
+        Args:
+            node_path (str): Node path such as ``/org.openoffice.Setup/Product``.
+
+        Raises:
+            PropertyError: If unable to access the node.
+
+        Returns:
+            XPropertySet: Configuration access of the node.
+        """
+        try:
+            return self._get_node(node_path).access
+        except Exception as e:
+            raise mEx.PropertyError(node_path, f"Unable to access config properties for\n\n  '{node_path}'") from e
+
+    def get_value(self, node_path: str, name: str) -> Any:
+        """
+        Gets a configuration value.
+
+        Args:
+            node_path (str): Node path such as ``/org.openoffice.Setup/Product``.
+            name (str): Name of value such as ``ooName``.
+
+        Raises:
+            PropertyError: If unable to access the node.
+            PropertyNotFoundError: If the node has no value named ``name``.
+
+        Returns:
+            Any: Value.
+        """
+        return self.get_values(node_path, (name,))[0]
+
+    def get_values(self, node_path: str, names: Iterable[str], default: Any = NULL_OBJ) -> Tuple[Any, ...]:
+        """
+        Gets many configuration values of a node.
+
+        Values that are not already cached are read from office with a single ``getPropertyValues()`` call.
+
+        Args:
+            node_path (str): Node path such as ``/org.openoffice.Setup/Product``.
+            names (Iterable[str]): Names of values.
+            default (Any, optional): Value returned for names the node does not have.
+                If omitted then an error is raised for names the node does not have.
+
+        Raises:
+            PropertyError: If unable to access the node or read the values.
+            PropertyNotFoundError: If the node does not have a name and ``default`` is not set.
+
+        Returns:
+            Tuple[Any, ...]: Values in the order of ``names``.
+        """
+        names = tuple(names)
+        try:
+            node = self._get_node(node_path)
+        except Exception as e:
+            raise mEx.PropertyError(node_path, f"Unable to access config properties for\n\n  '{node_path}'") from e
+        with self._lock:
+            values = node.values
+            missing = [n for n in dict.fromkeys(names) if n not in values]
+            self._value_hits += len(names) - len(missing)
+        if missing:
+            unknown = [n for n in missing if n not in node.names]
+            if unknown and default is NULL_OBJ:
+                raise mEx.PropertyNotFoundError(unknown[0])
+            known = [n for n in missing if n in node.names]
+            if known:
+                try:
+                    mps = self._lo_inst.qi(XMultiPropertySet, node.access)
+                    if mps is None:
+                        read = [node.access.getPropertyValue(n) for n in known]
+                    else:
+                        read = mps.getPropertyValues(tuple(known))
+                except Exception as e:
+                    raise mEx.PropertyError(node_path, f"Unable to read config values for\n\n  '{node_path}'") from e
+                with self._lock:
+                    self._value_misses += len(known)
+                    for n, v in zip(known, read):
+                        values[n] = v
+        return tuple(values.get(n, default) for n in names)
+
+    def invalidate(self, node_path: str = "") -> None:
+        """
+        Drops cached values. Node views are kept open.
+
+        Args:
+            node_path (str, optional): Node path. If omitted then cached values of all nodes are dropped.
+        """
+        with self._lock:
+            self._invalidations += 1
+            if node_path:
+                node = self._nodes.get(node_path, None)
+                if node is not None:
+                    node.values.clear()
+                return
+            for node in self._nodes.values():
+                node.values.clear()
+
+    def clear(self) -> None:
+        """Closes all node views and releases the configuration provider. Statistics are not reset."""
+        with self._lock:
+            for node in self._nodes.values():
+                self._unlisten(node)
+            self._nodes.clear()
+            self._provider = None
+
+    def reset_stats(self) -> None:
+        """Resets statistics."""
+        self._node_hits = 0
+        self._node_misses = 0
+        self._value_hits = 0
+        self._value_misses = 0
+        self._invalidations = 0
+
+    @property
+    def stats(self) -> ConfigCacheStats:
+        """Gets cache statistics."""
+        return ConfigCacheStats(
+            node_hits=self._node_hits,
+            node_misses=self._node_misses,
+            value_hits=self._value_hits,
+            value_misses=self._value_misses,
+            invalidations=self._invalidations,
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Gets max number of node views kept open."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+__all__ = ("ConfigCache", "ConfigCacheStats")
@@ -30,6 +30,7 @@ from com.sun.star.io import IOException
 from com.sun.star.lang import XComponent
 from com.sun.star.lang import XMultiServiceFactory
 from com.sun.star.lang import XServiceInfo
+from com.sun.star.sheet import XFunctionAccess
 from com.sun.star.util import XCloseable
 from com.sun.star.util import XNumberFormatsSupplier
 
@@ -37,7 +38,6 @@ from ooo.dyn.document.macro_exec_mode import MacroExecMode  # const
 from ooo.dyn.lang.disposed_exception import DisposedException
 from ooo.dyn.util.close_veto_exception import CloseVetoException
 
-
 # if not mock_g.DOCS_BUILDING:
 # not importing for doc building just result in short import name for
 # args that use these.
@@ -68,6 +68,8 @@ from ooodev.loader.comp.the_desktop import TheDesktop
 from ooodev.loader.comp.the_global_event_broadcaster import TheGlobalEventBroadcaster
 from ooodev.loader.inst.doc_type import DocType as LoDocType, DocTypeStr as LoDocTypeStr
 from ooodev.loader.inst.options import Options as LoOptions
+from ooodev.loader.inst.qi_cache import QiCache
+from ooodev.loader.inst.config_cache import ConfigCache
 from ooodev.utils import file_io as mFileIO
 from ooodev.utils import info as mInfo
 from ooodev.utils import props as mProps
@@ -161,6 +163,9 @@ class LoInst(EventsPartial):
         self._sys_font_pixel_ratio = None
         self._cache = LRUCache(50)
         self._shared_cache = LRUCache(self._opt.lo_cache_size)
+        self._qi_cache = QiCache(self._opt.qi_cache_size)
+        self._config_cache = ConfigCache(self, self._opt.config_cache_size)
+        self._function_access: XFunctionAccess | None = None
 
         self._allow_print = self._opt.verbose
         self._set_lo_events()
@@ -222,6 +227,7 @@ class LoInst(EventsPartial):
         self._logger.debug("on_doc_closed() Triggering DOC_CLOSED")
         self.trigger_event(LoNamedEvent.DOC_CLOSED, event_args)
         self._current_doc = None
+        self._qi_cache.clear()
         self._logger.debug("on_doc_closed() Triggered DOC_CLOSED. Current Doc is None")
 
     def on_doc_saving(self, event_args: CancelEventArgs) -> None:
@@ -260,6 +266,9 @@ class LoInst(EventsPartial):
         if event_args.cancel:
             return
         self._clear_cache()
+        self._qi_cache.clear()
+        self._config_cache.clear()
+        self._function_access = None
         self._glb_event_broadcaster = None
         self._current_doc = None
         self._mc_factory = None
@@ -337,6 +346,10 @@ class LoInst(EventsPartial):
         for attr, val in zip(data_attrs, data_vals):
             setattr(self, attr, val)
         setattr(self, "_disposed", True)
+        # cached objects are proxies of the disposed bridge.
+        self._qi_cache.clear()
+        self._config_cache.clear()
+        self._function_access = None
 
     def on_lo_loaded(self, source: Any, event: EventObject) -> None:  # pylint: disable=unused-argument
         if self.bridge is not None:
@@ -356,6 +369,9 @@ class LoInst(EventsPartial):
             if name == "OnUnfocus":
                 self._clear_cache()
                 self._logger.debug("on_global_document_event() Cleared Cache")
+            elif name == "OnUnload":
+                # do not keep proxies of a closed document, it may have been closed outside of this instance.
+                self._qi_cache.clear()
 
     # endregion Events
 
@@ -392,16 +408,26 @@ class LoInst(EventsPartial):
         Note:
             When ``raise_err=True`` return value will never be ``None``.
         """
-        result = None
-        if uno.isInterface(atype) and hasattr(obj, "queryInterface"):
-            uno_t = uno.getTypeByName(atype.__pyunointerface__)  # type: ignore
-            result = obj.queryInterface(uno_t)
+        result = self._qi(atype, obj, True)
         if raise_err and result is None:
             raise mEx.MissingInterfaceError(atype)
         if result is not None:
             result = cast(T, result)
         return result
 
+    def _qi(self, atype: Any, obj: Any, lookup: bool) -> Any:
+        # lookup is False when the caller already looked in the cache.
+        if not (uno.isInterface(atype) and hasattr(obj, "queryInterface")):
+            return None
+        name = atype.__pyunointerface__  # type: ignore
+        supported = self._qi_cache.get_supported(obj, name) if lookup else None
+        if supported is not None:
+            # a PyUNO proxy exposes all interfaces of its object, there is nothing more to query.
+            return obj if supported else None
+        result = obj.queryInterface(self._qi_cache.get_type(name))
+        self._qi_cache.set_supported(obj, name, result is not None)
+        return result
+
     # endregion qi()
 
     # region    cache
@@ -1436,6 +1462,7 @@ class LoInst(EventsPartial):
         # sourcery skip: raise-specific-error
         cargs = CancelEventArgs(self.close.__qualname__)
         cargs.event_data = deliver_ownership
+        cargs.set("closeable", closeable)
         self.on_doc_closing(cargs)
         if cargs.cancel:
             return False
@@ -1911,9 +1938,12 @@ class LoInst(EventsPartial):
         result = True
         for arg in args:
             try:
-                t = uno.getClass(arg) if isinstance(arg, str) else arg
-                obj = self.qi(t, component)  # type: ignore
-                if obj is None:
+                name = arg if isinstance(arg, str) else getattr(arg, "__pyunointerface__", None)
+                supported = None if name is None else self._qi_cache.get_supported(component, name)
+                if supported is None:
+                    t = uno.getClass(arg) if isinstance(arg, str) else arg
+                    supported = self._qi(t, component, name is None) is not None
+                if not supported:
                     result = False
                     break
             except Exception:
@@ -2325,6 +2355,59 @@ class LoInst(EventsPartial):
         """
         return self._shared_cache
 
+    @property
+    def qi_cache(self) -> QiCache:
+        """
+        Gets the interface query cache for the current instance.
+
+        The cache is used by :py:meth:`~.LoInst.qi` and :py:meth:`~.LoInst.is_uno_interfaces`.
+        Use ``qi_cache.stats`` to get the cache hit rate.
+
+        Returns:
+            QiCache: Cache instance.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._qi_cache
+
+    @property
+    def config_cache(self) -> ConfigCache:
+        """
+        Gets the configuration access cache for the current instance.
+
+        The cache is used by :py:meth:`Info.get_config() <ooodev.utils.info.Info.get_config>`
+        and :py:meth:`Info.get_config_many() <ooodev.utils.info.Info.get_config_many>`.
+
+        Returns:
+            ConfigCache: Cache instance.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._config_cache
+
+    @property
+    def function_access(self) -> XFunctionAccess:
+        """
+        Gets a ``com.sun.star.sheet.FunctionAccess`` service that is created once per instance.
+
+        The service is used by :py:meth:`Calc.call_fun() <ooodev.office.calc.Calc.call_fun>`
+        and :py:meth:`Calc.call_fun_many() <ooodev.office.calc.Calc.call_fun_many>`.
+        Property changes made on the service, such as ``NullDate``, apply to all later calls.
+
+        Raises:
+            CreateInstanceMcfError: If unable to create the service.
+
+        Returns:
+            XFunctionAccess: Function access service.
+
+        .. versionadded:: 0.48.0
+        """
+        fa = self._function_access
+        if fa is None:
+            fa = self.create_instance_mcf(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", raise_err=True)
+            self._function_access = fa
+        return fa
+
     @property
     def tmp_dir(self) -> Path:
         """
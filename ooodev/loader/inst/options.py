@@ -35,6 +35,20 @@ class Options:
     lo_cache_size: int = 200
     """Lo Instance cache size. Default ``200``, ``0`` or less means no caching. Normally you should not need to change this value. If you do, it should be a power of 2."""
 
+    qi_cache_size: int = 1000
+    """
+    Max number of ``(object, interface)`` results kept by the interface query cache. Default ``1000``, ``0`` or less means no caching.
+
+    .. versionadded:: 0.48.0
+    """
+
+    config_cache_size: int = 64
+    """
+    Max number of configuration node views kept open by the configuration access cache. Default ``64``, ``0`` or less means no caching.
+
+    .. versionadded:: 0.48.0
+    """
+
     def serialize(self) -> str:
         """
         Serialize the options to a json string.
@@ -0,0 +1,197 @@
+"""Interface query cache for ``LoInst``."""
+
+from __future__ import annotations
+from collections import OrderedDict, deque
+import threading
+import weakref
+from typing import Any, Deque, Dict, NamedTuple, Tuple
+import uno
+
+
+class QiCacheStats(NamedTuple):
+    """
+    Interface query cache statistics.
+
+    .. versionadded:: 0.48.0
+    """
+
+    type_hits: int
+    """Number of interface type lookups that were found in cache."""
+    type_misses: int
+    """Number of interface type lookups that were not found in cache."""
+    supported_hits: int
+    """Number of interface support lookups that were found in cache."""
+    supported_misses: int
+    """Number of interface support lookups that were not found in cache."""
+
+    @property
+    def type_hit_rate(self) -> float:
+        """Gets the hit rate of interface type lookups. Value is between ``0.0`` and ``1.0``."""
+        total = self.type_hits + self.type_misses
+        return self.type_hits / total if total else 0.0
+
+    @property
+    def supported_hit_rate(self) -> float:
+        """Gets the hit rate of interface support lookups. Value is between ``0.0`` and ``1.0``."""
+        total = self.supported_hits + self.supported_misses
+        return self.supported_hits / total if total else 0.0
+
+
+class QiCache:
+    """
+    Interface query cache.
+
+    Caches interface name to UNO type and ``(object, interface name)`` to supported.
+
+    An instance is owned by each :py:class:`~ooodev.loader.inst.lo_inst.LoInst` and is cleared when the bridge
+    to office is disposed.
+
+    Note:
+        Objects are keyed by the identity of the PyUNO proxy which is computed locally and does not require a call
+        to office. Looking up the implementation name of an object would itself be a call to office.
+
+        Objects that support weak references are held weakly and their entries are dropped when they are collected.
+        PyUNO proxies do not support weak references, they are held until they are pushed out by newer entries
+        or the cache is cleared. ``LoInst`` clears the cache when a document is closed.
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """
+        Constructor
+
+        Args:
+            capacity (int, optional): Max number of ``(object, interface)`` entries to keep.
+                ``0`` or less turns support caching off. Default ``1000``.
+        """
+        self._lock = threading.Lock()
+        self._types: Dict[str, Any] = {}
+        # (id of object, interface name) -> (object or weak reference to object, supported)
+        self._supported: OrderedDict[Tuple[int, str], Tuple[Any, bool]] = OrderedDict()
+        # ids of collected objects, appended from weak reference callbacks and removed on next use.
+        self._collected: Deque[int] = deque()
+        self._capacity = max(capacity, 0)
+        self._type_hits = 0
+        self._type_misses = 0
+        self._supported_hits = 0
+        self._supported_misses = 0
+
+    def get_type(self, name: str) -> Any:
+        """
+        Gets a UNO type by interface name.
+
+        Args:
+            name (str): Interface name such as ``com.sun.star.beans.XPropertySet``.
+
+        Raises:
+            RuntimeError: If ``name`` is not a valid UNO type name.
+
+        Returns:
+            Any: UNO type.
+        """
+        result = self._types.get(name, None)
+        if result is not None:
+            self._type_hits += 1
+            return result
+        self._type_misses += 1
+        result = uno.getTypeByName(name)
+        self._types[name] = result
+        return result
+
+    def get_supported(self, obj: Any, name: str) -> bool | None:
+        """
+        Gets if ``obj`` is known to support interface ``name``.
+
+        Args:
+            obj (Any): UNO Object.
+            name (str): Interface name.
+
+        Returns:
+            bool | None: ``True`` or ``False`` if cached; Otherwise, ``None``.
+        """
+        if self._capacity <= 0:
+            return None
+        key = (id(obj), name)
+        with self._lock:
+            self._remove_collected()
+            entry = self._supported.get(key, None)
+            if entry is None or self._get_obj(entry[0]) is not obj:
+                self._supported_misses += 1
+                return None
+            self._supported.move_to_end(key)
+            self._supported_hits += 1
+            return entry[1]
+
+    def set_supported(self, obj: Any, name: str, value: bool) -> None:
+        """
+        Sets if ``obj`` supports interface ``name``.
+
+        Args:
+            obj (Any): UNO Object.
+            name (str): Interface name.
+            value (bool): ``True`` if supported; Otherwise, ``False``.
+        """
+        if self._capacity <= 0:
+            return
+        oid = id(obj)
+        try:
+            holder = weakref.ref(obj, lambda _: self._collected.append(oid))
+        except TypeError:
+            # PyUNO proxies do not support weak references.
+            holder = obj
+        key = (oid, name)
+        with self._lock:
+            self._remove_collected()
+            self._supported[key] = (holder, value)
+            self._supported.move_to_end(key)
+            if len(self._supported) > self._capacity:
+                self._supported.popitem(last=False)
+
+    def _get_obj(self, holder: Any) -> Any:
+        return holder() if isinstance(holder, weakref.ref) else holder
+
+    def _remove_collected(self) -> None:
+        # called with the lock held.
+        if not self._collected:
+            return
+        ids = set()
+        while self._collected:
+            ids.add(self._collected.popleft())
+        for key in [k for k, v in self._supported.items() if k[0] in ids and self._get_obj(v[0]) is None]:
+            del self._supported[key]
+
+    def clear(self) -> None:
+        """Clears cache. Statistics are not reset."""
+        with self._lock:
+            self._types.clear()
+            self._supported.clear()
+            self._collected.clear()
+
+    def reset_stats(self) -> None:
+        """Resets statistics."""
+        self._type_hits = 0
+        self._type_misses = 0
+        self._supported_hits = 0
+        self._supported_misses = 0
+
+    @property
+    def stats(self) -> QiCacheStats:
+        """Gets cache statistics."""
+        return QiCacheStats(
+            type_hits=self._type_hits,
+            type_misses=self._type_misses,
+            supported_hits=self._supported_hits,
+            supported_misses=self._supported_misses,
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Gets max number of ``(object, interface)`` entries kept in cache."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        return len(self._supported)
+
+
+__all__ = ("QiCache", "QiCacheStats")
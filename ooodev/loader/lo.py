@@ -44,7 +44,6 @@ from ooodev.formatters.formatter_table import FormatterTable
 from ooodev.meta.static_meta import StaticProperty, classproperty
 from ooodev.mock import mock_g
 
-
 if TYPE_CHECKING:
     try:
         from typing import Literal  # Py >= 3.8
@@ -70,6 +69,8 @@ if TYPE_CHECKING:
     from ooodev.utils.type_var import Table
     from ooodev.utils.data_type.generic_size_pos import GenericSizePos
     from ooodev.utils.cache.lru_cache import LRUCache
+    from ooodev.loader.inst.qi_cache import QiCache
+    from ooodev.loader.inst.config_cache import ConfigCache
 else:
     PathOrStr = Any
     UnoInterface = Any
@@ -2407,6 +2408,36 @@ class Lo(metaclass=StaticProperty):
         """
         return cls._lo_inst._shared_cache
 
+    @classproperty
+    def qi_cache(cls) -> QiCache:
+        """
+        Gets the interface query cache for the current instance.
+
+        The cache is used by :py:meth:`~.Lo.qi` and :py:meth:`~.Lo.is_uno_interfaces`.
+        Use ``qi_cache.stats`` to get the cache hit rate.
+
+        Returns:
+            QiCache: Cache instance.
+
+        .. versionadded:: 0.48.0
+        """
+        return cls._lo_inst.qi_cache
+
+    @classproperty
+    def config_cache(cls) -> ConfigCache:
+        """
+        Gets the configuration access cache for the current instance.
+
+        The cache is used by :py:meth:`Info.get_config() <ooodev.utils.info.Info.get_config>`
+        and :py:meth:`Info.get_config_many() <ooodev.utils.info.Info.get_config_many>`.
+
+        Returns:
+            ConfigCache: Cache instance.
+
+        .. versionadded:: 0.48.0
+        """
+        return cls._lo_inst.config_cache
+
     @classproperty
     def tmp_dir(cls) -> Path:
         """
@@ -0,0 +1,369 @@
+"""
+Pool of office processes.
+
+.. versionadded:: 0.48.0
+"""
+
+from __future__ import annotations
+import contextlib
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Union
+
+from ooodev.conn import cache as mCache
+from ooodev.conn import connectors
+from ooodev.io.log.named_logger import NamedLogger
+from ooodev.loader.inst.lo_inst import LoInst
+from ooodev.loader.inst.options import Options as LoOptions
+
+ConnectorT = Union[connectors.ConnectPipe, connectors.ConnectSocket]
+
+_STOP = object()
+
+
+class _Task:
+    __slots__ = ("fn", "args", "kwargs", "future")
+
+    def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+
+
+class _PoolWorker(threading.Thread):
+    """Thread that owns a single office process and runs tasks on it."""
+
+    def __init__(self, pool: LoPool, index: int) -> None:
+        super().__init__(name=f"LoPoolWorker-{index}", daemon=True)
+        self._pool = pool
+        self._index = index
+        self._logger = NamedLogger(f"{self.__class__.__name__} {index}")
+        self._inst: LoInst | None = None
+        self._cache: mCache.Cache | None = None
+        self._busy_since: float | None = None
+        self._timed_out = False
+        self._lock = threading.Lock()
+        self.restarts = 0
+
+    # region office
+    def _start_office(self) -> LoInst:
+        self._cache = self._pool._cache_factory(self._index)
+        connector = self._pool._connector_factory(self._index)
+        inst = LoInst(opt=self._pool._opt)
+        inst.load_office(connector=connector, cache_obj=self._cache)
+        self._logger.debug("Office started")
+        return inst
+
+    def _stop_office(self) -> None:
+        inst = self._inst
+        self._inst = None
+        if inst is not None:
+            try:
+                if not inst.close_office():
+                    inst.kill_office()
+            except Exception:
+                with contextlib.suppress(Exception):
+                    inst.kill_office()
+        if self._cache is not None:
+            with contextlib.suppress(Exception):
+                self._cache.del_working_dir()
+            self._cache = None
+
+    def _restart_office(self) -> None:
+        self._logger.debug("Restarting office")
+        self._stop_office()
+        self.restarts += 1
+        self._inst = self._start_office()
+
+    def _is_alive(self) -> bool:
+        inst = self._inst
+        if inst is None:
+            return False
+        try:
+            # a round trip to office. A dead bridge raises.
+            return inst.bridge_connector.ctx.getServiceManager() is not None
+        except Exception:
+            return False
+
+    def _ensure_office(self) -> LoInst:
+        if self._inst is None:
+            self._inst = self._start_office()
+            return self._inst
+        self._mark_busy()
+        try:
+            alive = self._is_alive()
+        finally:
+            self._mark_idle()
+        if not alive:
+            self._restart_office()
+        return self._inst  # type: ignore
+
+    # endregion office
+
+    # region hang detection
+    def _mark_busy(self) -> None:
+        with self._lock:
+            self._busy_since = time.monotonic()
+            self._timed_out = False
+
+    def _mark_idle(self) -> None:
+        with self._lock:
+            self._busy_since = None
+
+    def check_hung(self, timeout: float) -> bool:
+        """Kills office if the current call has taken longer than ``timeout`` seconds. Called by pool monitor."""
+        with self._lock:
+            if self._busy_since is None or self._timed_out:
+                return False
+            if time.monotonic() - self._busy_since < timeout:
+                return False
+            self._timed_out = True
+            inst = self._inst
+        self._logger.warning(f"Office call exceeded {timeout} seconds. Killing office.")
+        if inst is not None:
+            with contextlib.suppress(Exception):
+                inst.kill_office()
+        return True
+
+    # endregion hang detection
+
+    def run(self) -> None:
+        pool = self._pool
+        try:
+            while True:
+                try:
+                    task = pool._queue.get(timeout=pool._health_check_interval)
+                except queue.Empty:
+                    # idle health check
+                    if self._inst is not None:
+                        with contextlib.suppress(Exception):
+                            self._ensure_office()
+                    continue
+                if task is _STOP:
+                    break
+                self._run_task(task)
+        finally:
+            self._stop_office()
+
+    def _run_task(self, task: _Task) -> None:
+        if not task.future.set_running_or_notify_cancel():
+            return
+        try:
+            inst = self._ensure_office()
+        except Exception as e:
+            self._logger.error(f"Unable to start office: {e}")
+            self._inst = None
+            task.future.set_exception(e)
+            return
+
+        self._mark_busy()
+        try:
+            result = task.fn(inst, *task.args, **task.kwargs)
+        except Exception as e:
+            timed_out = self._timed_out
+            self._mark_idle()
+            if timed_out:
+                task.future.set_exception(TimeoutError(f"Task exceeded {self._pool._task_timeout} seconds"))
+            else:
+                task.future.set_exception(e)
+            if timed_out or not self._is_alive():
+                # office crashed or hung, restart on next task.
+                with contextlib.suppress(Exception):
+                    self._restart_office()
+            return
+        self._mark_idle()
+        task.future.set_result(result)
+
+
+class LoPool:
+    """
+    Pool of headless office processes.
+
+    Each worker owns its own office process that is started with its own profile directory and its own pipe
+    or socket connection. Work is handed to the next free worker together with the :py:class:`~ooodev.loader.inst.LoInst`
+    instance of that worker.
+
+    Workers check the health of their office when idle and before each task.
+    An office that crashes is restarted. An office call that takes longer than ``task_timeout`` seconds is
+    treated as a hang; the office is killed, the task fails with ``TimeoutError`` and the office is restarted.
+
+    Example:
+        .. code-block:: python
+
+            from ooodev.loader.lo_pool import LoPool
+            from ooodev.write import WriteDoc
+
+            def convert(lo_inst, src, dst):
+                doc = WriteDoc.open_doc(fnm=src, lo_inst=lo_inst)
+                try:
+                    doc.save_doc(dst)
+                finally:
+                    doc.close()
+                return dst
+
+            with LoPool(size=4) as pool:
+                futures = [pool.submit(convert, src, dst) for src, dst in jobs]
+                results = [f.result() for f in futures]
+
+    Note:
+        Tasks run in worker threads. Tasks must use the ``lo_inst`` passed to them and must not use the static
+        :py:class:`~ooodev.loader.Lo` class which is bound to a single office.
+
+    Note:
+        On Windows killing a hung office may also kill other office processes.
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(
+        self,
+        size: int = 0,
+        *,
+        connector_factory: Callable[[int], ConnectorT] | None = None,
+        cache_factory: Callable[[int], mCache.Cache] | None = None,
+        opt: LoOptions | None = None,
+        max_queue: int = 0,
+        task_timeout: float = 0,
+        health_check_interval: float = 30.0,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            size (int, optional): Number of office processes. ``0`` or less uses the number of CPU cores. Default ``0``.
+            connector_factory (Callable[[int], ConnectPipe | ConnectSocket], optional): Called with the worker index
+                to get the connector for each worker. Each connector must be unique.
+                Defaults to a headless ``ConnectPipe`` with an auto generated pipe name.
+            cache_factory (Callable[[int], Cache], optional): Called with the worker index to get the profile cache
+                for each worker. Defaults to ``Cache()`` which creates a new working directory for each worker.
+            opt (Options, optional): Load options for each ``LoInst``.
+            max_queue (int, optional): Max number of tasks waiting in the queue. ``0`` or less is unbounded.
+                When the queue is full :py:meth:`submit` blocks. Default ``0``.
+            task_timeout (float, optional): Max number of seconds a task may run before the office is considered
+                hung. ``0`` or less turns hang detection off. Default ``0``.
+            health_check_interval (float, optional): Seconds between health checks of an idle worker. Default ``30``.
+        """
+        if size <= 0:
+            size = os.cpu_count() or 1
+        self._size = size
+        self._connector_factory = connector_factory or self._default_connector
+        self._cache_factory = cache_factory or self._default_cache
+        self._opt = LoOptions() if opt is None else opt
+        self._queue: queue.Queue = queue.Queue(maxsize=max(max_queue, 0))
+        self._task_timeout = max(task_timeout, 0)
+        self._health_check_interval = max(health_check_interval, 0.1)
+        self._logger = NamedLogger(self.__class__.__name__)
+        self._shutdown = False
+        self._shutdown_lock = threading.Lock()
+        self._workers: List[_PoolWorker] = []
+        self._monitor: threading.Thread | None = None
+        self._monitor_stop = threading.Event()
+        self._start()
+
+    @staticmethod
+    def _default_connector(index: int) -> ConnectorT:
+        return connectors.ConnectPipe(headless=True)
+
+    @staticmethod
+    def _default_cache(index: int) -> mCache.Cache:
+        return mCache.Cache()
+
+    def _start(self) -> None:
+        for i in range(self._size):
+            worker = _PoolWorker(self, i)
+            self._workers.append(worker)
+            worker.start()
+        if self._task_timeout > 0:
+            self._monitor = threading.Thread(target=self._monitor_run, name="LoPoolMonitor", daemon=True)
+            self._monitor.start()
+
+    def _monitor_run(self) -> None:
+        interval = min(1.0, self._task_timeout / 4)
+        while not self._monitor_stop.wait(interval):
+            for worker in self._workers:
+                worker.check_hung(self._task_timeout)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """
+        Submits a task to the pool.
+
+        Args:
+            fn (Callable[..., Any]): Callable that is called as ``fn(lo_inst, *args, **kwargs)``
+                where ``lo_inst`` is the ``LoInst`` of the worker that runs the task.
+            args (Any, optional): Positional args passed to ``fn``.
+            kwargs (Any, optional): Keyword args passed to ``fn``.
+
+        Raises:
+            RuntimeError: If the pool has been shut down.
+
+        Returns:
+            Future: Future that holds the result of ``fn``.
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit to a pool that has been shut down")
+        task = _Task(fn, args, kwargs)
+        self._queue.put(task)
+        return task.future
+
+    def map(self, fn: Callable[..., Any], *iterables: Any) -> List[Any]:
+        """
+        Runs ``fn`` for each set of items of ``iterables`` and waits for all results.
+
+        Args:
+            fn (Callable[..., Any]): Callable that is called as ``fn(lo_inst, *items)``.
+            iterables (Any): Iterables of positional args.
+
+        Returns:
+            List[Any]: Results in the order of ``iterables``.
+        """
+        futures = [self.submit(fn, *items) for items in zip(*iterables)]
+        return [f.result() for f in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the pool. Tasks already in the queue are run before the workers stop.
+
+        Each office process is closed and its profile working directory is removed.
+
+        Args:
+            wait (bool, optional): If ``True`` waits for the workers to stop. Default ``True``.
+        """
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        for _ in self._workers:
+            self._queue.put(_STOP)
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        self._monitor_stop.set()
+
+    def __enter__(self) -> LoPool:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown(wait=True)
+
+    @property
+    def size(self) -> int:
+        """Gets the number of workers."""
+        return self._size
+
+    @property
+    def restarts(self) -> int:
+        """Gets the total number of office restarts of all workers."""
+        return sum(w.restarts for w in self._workers)
+
+    @property
+    def pending(self) -> int:
+        """Gets the approximate number of tasks waiting in the queue."""
+        return self._queue.qsize()
+
+
+__all__ = ("LoPool",)
@@ -1,14 +1,127 @@
 from __future__ import annotations
-from typing import Any, cast, overload, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, cast, Dict, Iterable, List, overload, Tuple, TYPE_CHECKING
 import threading
 import contextlib
-from functools import lru_cache
+import weakref
 import uno
 from com.sun.star.script.provider import XScript
 from com.sun.star.uno import XInterface
 
+from ooodev.events.lo_named_event import LoNamedEvent
 from ooodev.loader import lo as mLo
 
+if TYPE_CHECKING:
+    try:
+        from typing import Literal  # Py >= 3.8
+    except ImportError:
+        from typing_extensions import Literal
+    from ooodev.loader.inst.lo_inst import LoInst
+
+
+class _ScriptCache:
+    """
+    Script providers and scripts of a single ``LoInst``.
+
+    Scripts are keyed by ``(document, url)``. Document keys are ``None`` for scripts of ``user``,
+    ``application`` and ``share`` locations. Entries of a document are dropped when the document is closed.
+    """
+
+    def __init__(self, lo_inst: LoInst, size: int) -> None:
+        self._lock = threading.Lock()
+        # weak, the cache is the value of a WeakKeyDictionary keyed by lo_inst.
+        self._lo_inst_ref = weakref.ref(lo_inst)
+        self._size = size
+        self._master_provider: Any = None
+        self._doc_providers: Dict[Any, Any] = {}
+        self._scripts: OrderedDict[Tuple[Any, str], XScript] = OrderedDict()
+        self._fn_on_doc_closed = self._on_doc_closed
+        self._fn_on_clear = self._on_clear
+        lo_inst.subscribe_event(LoNamedEvent.DOC_CLOSED, self._fn_on_doc_closed)
+        lo_inst.subscribe_event(LoNamedEvent.OFFICE_CLOSING, self._fn_on_clear)
+        lo_inst.subscribe_event(LoNamedEvent.BRIDGE_DISPOSED, self._fn_on_clear)
+
+    def _on_doc_closed(self, source: Any, event_args: Any) -> None:
+        closed = None
+        with contextlib.suppress(Exception):
+            closed = event_args.get("closeable", None)
+        with self._lock:
+            if closed is None:
+                # closed document is not known, drop the entries of all documents.
+                self._doc_providers.clear()
+                for key in [k for k in self._scripts if k[0] is not None]:
+                    del self._scripts[key]
+                return
+            for doc in [d for d in self._doc_providers if self._is_same_doc(d, closed)]:
+                del self._doc_providers[doc]
+            for key in [k for k in self._scripts if k[0] is not None and self._is_same_doc(k[0], closed)]:
+                del self._scripts[key]
+
+    @staticmethod
+    def _is_same_doc(doc: Any, other: Any) -> bool:
+        # UNO proxies of different interfaces of the same object compare equal.
+        try:
+            return doc is other or doc == other
+        except Exception:
+            return False
+
+    def _on_clear(self, source: Any, event_args: Any) -> None:
+        self.clear()
+
+    def _get_provider(self, doc: Any) -> Any:
+        if doc is None:
+            if self._master_provider is None:
+                lo_inst = self._lo_inst_ref()
+                if lo_inst is None:
+                    raise RuntimeError("Office instance of script cache no longer exists")
+                factory = cast(
+                    Any,
+                    lo_inst.create_instance_mcf(
+                        XInterface, "com.sun.star.script.provider.MasterScriptProviderFactory", raise_err=True
+                    ),
+                )
+                self._master_provider = factory.createScriptProvider("")
+            return self._master_provider
+        provider = self._doc_providers.get(doc, None)
+        if provider is None:
+            provider = doc.getScriptProvider()
+            self._doc_providers[doc] = provider
+        return provider
+
+    def get_script(self, script_url: str, doc: Any) -> XScript:
+        key = (doc, script_url)
+        try:
+            with self._lock:
+                script = self._scripts.get(key, None)
+                if script is not None:
+                    self._scripts.move_to_end(key)
+                    return script
+                script = self._get_provider(doc).getScript(script_url)
+                if self._size > 0:
+                    self._scripts[key] = script
+                    while len(self._scripts) > self._size:
+                        self._scripts.popitem(last=False)
+                return script
+        except TypeError:
+            # document proxy is not hashable, do not cache.
+            return doc.getScriptProvider().getScript(script_url)
+
+    def set_size(self, size: int) -> None:
+        with self._lock:
+            self._size = size
+            while self._scripts and len(self._scripts) > max(size, 0):
+                self._scripts.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._master_provider = None
+            self._doc_providers.clear()
+            self._scripts.clear()
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
 
 class MacroScript:
     """
@@ -18,10 +131,18 @@ class MacroScript:
         `See Scripting Framework <https://wiki.documentfoundation.org/Documentation/DevGuide/Scripting_Framework#Scripting_Framework_URI_Specification>`_
 
     .. versionadded:: 0.40.0
+
+    .. versionchanged:: 0.48.0
+        Scripts and script providers are cached per document and per ``LoInst``.
+        Entries of documents are dropped when a document is closed.
     """
 
+    _cache_size = 30
+    _caches: weakref.WeakKeyDictionary[LoInst, _ScriptCache] = weakref.WeakKeyDictionary()
+    _caches_lock = threading.Lock()
+
     @classmethod
-    def call_url(cls, url: str, *args: Any, in_thread: bool = False) -> Any:
+    def call_url(cls, url: str, *args: Any, in_thread: bool = False, doc: Any = None) -> Any:
         """
         Call macro by url
 
@@ -29,18 +150,78 @@ class MacroScript:
             args (tuple): Arguments passed to script when invoking.
             url (str): The URL of the script to be invoked.
             in_thread (bool, optional): If execute in thread. Defaults to ``False``.
+            doc (Any, optional): Document of ``location=document`` scripts. Defaults to the current document.
 
         Returns:
             Any: The return value of the script.
+
+        .. versionchanged:: 0.48.0
+            Added ``doc`` parameter.
         """
         result = None
         if in_thread:
-            t = threading.Thread(target=cls._call_url, args=(url, *args))
+            t = threading.Thread(target=cls._call_url, args=(url, *args), kwargs={"doc": doc})
             t.start()
         else:
-            result = cls._call_url(url, *args)
+            result = cls._call_url(url, *args, doc=doc)
         return result
 
+    @overload
+    @classmethod
+    def call_many(
+        cls, calls: Iterable[Tuple[str, Tuple[Any, ...]]], *, doc: Any = ..., in_thread: Literal[False] = ...
+    ) -> List[Any]: ...
+
+    @overload
+    @classmethod
+    def call_many(
+        cls, calls: Iterable[Tuple[str, Tuple[Any, ...]]], *, doc: Any = ..., in_thread: Literal[True]
+    ) -> Future: ...
+
+    @classmethod
+    def call_many(
+        cls, calls: Iterable[Tuple[str, Tuple[Any, ...]]], *, doc: Any = None, in_thread: bool = False
+    ) -> List[Any] | Future:
+        """
+        Calls many macros back to back.
+
+        Each distinct script url is resolved once before the first invocation.
+
+        Args:
+            calls (Iterable[Tuple[str, Tuple[Any, ...]]]): Sequence of ``(url, args)`` pairs.
+            doc (Any, optional): Document of ``location=document`` scripts. Defaults to the current document.
+            in_thread (bool, optional): If ``True`` the macros are run on a worker thread and a ``Future`` is
+                returned. Defaults to ``False``.
+
+        Returns:
+            List[Any] | Future: The return value of each script in the order of ``calls``.
+            When ``in_thread`` is ``True`` a ``Future`` whose result is the list of return values.
+
+        Example:
+            .. code-block:: python
+
+                url = MacroScript.get_url_script(name="RTrimStr", library="Tools", module="Strings")
+                results = MacroScript.call_many([(url, ("a ", " ")), (url, ("b ", " "))])
+
+        .. versionadded:: 0.48.0
+        """
+        items = [(url, tuple(args)) for url, args in calls]
+        if not in_thread:
+            return cls._call_many(items, doc)
+
+        future: Future = Future()
+
+        def run() -> None:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(cls._call_many(items, doc))
+            except Exception as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
     @overload
     @classmethod
     def call(
@@ -193,31 +374,73 @@ class MacroScript:
         return url
 
     @staticmethod
-    @lru_cache(maxsize=30)
-    def get_script(script_url: str) -> XScript:
+    def _is_embedded(script_url: str) -> bool:
+        embedded = False
+        with contextlib.suppress(ValueError):
+            idx = script_url.index("location=")
+            location = script_url[idx + 9 :]
+            embedded = location.lower().startswith("document")
+        return embedded
+
+    @classmethod
+    def _get_cache(cls, lo_inst: LoInst) -> _ScriptCache:
+        with cls._caches_lock:
+            cache = cls._caches.get(lo_inst, None)
+            if cache is None:
+                cache = _ScriptCache(lo_inst, cls._cache_size)
+                cls._caches[lo_inst] = cache
+            return cache
+
+    @staticmethod
+    def get_script(script_url: str, doc: Any = None) -> XScript:
         """
         Grab Basic script object before invocation.
 
         Args:
             script_url (str): The URL of the script to be invoked.
+            doc (Any, optional): Document of ``location=document`` scripts. Defaults to the current document.
 
         Returns:
             XScript: Basic script object.
+
+        .. versionchanged:: 0.48.0
+            Scripts are cached per document and per ``LoInst``. Added ``doc`` parameter.
         """
-        embedded = False
-        with contextlib.suppress(ValueError):
-            idx = script_url.index("location=")
-            location = script_url[idx + 9 :]
-            embedded = location.lower().startswith("document")
-        if embedded:
-            dk = cast(Any, mLo.Lo.desktop.component)
-            script_pro = dk.CurrentComponent.getScriptProvider()
+        lo_inst = mLo.Lo.current_lo
+        if MacroScript._is_embedded(script_url):
+            if doc is None:
+                doc = cast(Any, lo_inst.desktop.component).getCurrentComponent()
+            else:
+                doc = getattr(doc, "component", doc)
         else:
-            master_provider = cast(
-                Any, mLo.Lo.create_instance_mcf(XInterface, "com.sun.star.script.provider.MasterScriptProviderFactory")
-            )
-            script_pro = master_provider.createScriptProvider("")
-        return script_pro.getScript(script_url)
+            doc = None
+        return MacroScript._get_cache(lo_inst).get_script(script_url, doc)
+
+    @classmethod
+    def set_cache_size(cls, size: int) -> None:
+        """
+        Sets the max number of scripts cached for each ``LoInst``.
+
+        Args:
+            size (int): Max number of scripts. ``0`` or less turns script caching off. Default is ``30``.
+
+        .. versionadded:: 0.48.0
+        """
+        cls._cache_size = size
+        with cls._caches_lock:
+            for cache in cls._caches.values():
+                cache.set_size(size)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Clears cached scripts and script providers of all ``LoInst`` instances.
+
+        .. versionadded:: 0.48.0
+        """
+        with cls._caches_lock:
+            for cache in cls._caches.values():
+                cache.clear()
 
     @classmethod
     def _call(cls, **kwargs) -> Any:
@@ -226,6 +449,14 @@ class MacroScript:
         return cls._call_url(url, *args)
 
     @classmethod
-    def _call_url(cls, url: str, *args: Any) -> Any:
-        script = MacroScript.get_script(url)
+    def _call_url(cls, url: str, *args: Any, doc: Any = None) -> Any:
+        script = MacroScript.get_script(url, doc)
         return script.invoke(args, None, None)[0]  # type: ignore
+
+    @classmethod
+    def _call_many(cls, items: List[Tuple[str, Tuple[Any, ...]]], doc: Any) -> List[Any]:
+        scripts: Dict[str, XScript] = {}
+        for url, _ in items:
+            if url not in scripts:
+                scripts[url] = cls.get_script(url, doc)
+        return [scripts[url].invoke(args, None, None)[0] for url, args in items]  # type: ignore
@@ -13,11 +13,12 @@ class ConstructorSingleton(type):
 
     def __call__(cls, *args, **kwargs):
         # convert kwargs into a tuple of items
+        # class is part of the key, subclasses sharing the metaclass must not share instances.
         if not kwargs:
-            key = "default"
+            key = (cls, "default")
         else:
             t_kwargs = tuple(kwargs.items())
-            key = hash((t_kwargs))
+            key = (cls, hash((t_kwargs)))
         if key not in cls._instances:
             if args:
                 raise ValueError("ConstructorSingleton does not support positional arguments.")
@@ -7,7 +7,7 @@ import contextlib
 import itertools
 from enum import IntEnum, IntFlag, Enum
 import re
-from typing import Any, List, Tuple, cast, overload, Sequence, Optional, TYPE_CHECKING
+from typing import Any, Iterable, List, Tuple, cast, overload, Sequence, Optional, TYPE_CHECKING
 import uno
 
 # from ..mock import mock_g
@@ -10904,17 +10904,168 @@ class Calc:
             Any: The (string or numeric) value or the array of arrays returned by the call to the function
                 When the arguments contain arrays, the function is executed as an array function
                 Wrong arguments generate an error
+
+        .. versionchanged:: 0.48.0
+            Uses the ``FunctionAccess`` service cached by the current ``LoInst``.
         """
         args_len = len(args)
         arg = () if args_len == 0 else args
         try:
-            fa = mLo.Lo.create_instance_mcf(XFunctionAccess, "com.sun.star.sheet.FunctionAccess", raise_err=True)
+            fa = mLo.Lo.current_lo.function_access
             return fa.callFunction(func_name.upper(), arg)
         except Exception as e:
             mLo.Lo.print(f"Could not invoke function '{func_name.upper()}'")
             mLo.Lo.print(f"    {e}")
         return None
 
+    @staticmethod
+    def _is_scalar_arg(value: Any) -> bool:
+        return isinstance(value, (int, float, str))
+
+    @classmethod
+    def _call_fun_vector(
+        cls, fa: XFunctionAccess, name: str, rows: List[Tuple[Any, ...]], results: List[Any], start: int
+    ) -> bool:
+        """
+        Calls a function once for many rows by passing varying arguments as column arrays.
+
+        Returns ``False`` if the function does not return one value per row.
+        If the call fails the rows are split in half and each half is tried again
+        so that a single invalid row only costs a few extra calls.
+        """
+        count = len(rows)
+        columns = list(zip(*rows))
+        arg = []
+        for col in columns:
+            first = col[0]
+            if all(type(v) is type(first) and v == first for v in col):
+                arg.append(first)
+            else:
+                arg.append(tuple((v,) for v in col))
+        try:
+            result = fa.callFunction(name, tuple(arg))
+        except Exception as e:
+            if count == 1:
+                results[start] = e
+                return True
+            half = count // 2
+            return cls._call_fun_vector(fa, name, rows[:half], results, start) and cls._call_fun_vector(
+                fa, name, rows[half:], results, start + half
+            )
+        if all(not isinstance(a, tuple) for a in arg):
+            # all rows are the same
+            results[start : start + count] = [result] * count
+            return True
+        if not isinstance(result, tuple) or len(result) != count:
+            return False
+        values = []
+        for row in result:
+            if not isinstance(row, tuple) or len(row) != 1:
+                return False
+            values.append(row[0])
+        for i, value in enumerate(values):
+            if value is None:
+                # errors of single elements of an array result come back empty, call again to get the error.
+                try:
+                    values[i] = fa.callFunction(name, rows[i])
+                except Exception as e:
+                    values[i] = e
+        results[start : start + count] = values
+        return True
+
+    @classmethod
+    def call_fun_many(
+        cls,
+        func_name: str,
+        args: Iterable[Any],
+        *,
+        vectorize: bool = False,
+        chunk_size: int = 1000,
+        as_numpy: bool = False,
+        return_exceptions: bool = False,
+    ) -> Any:
+        """
+        Execute a Calc function for many sets of arguments.
+
+        The ``FunctionAccess`` service cached by the current ``LoInst`` is used for all calls.
+
+        When ``vectorize`` is ``True`` and all arguments are numbers or strings, each chunk of rows is sent to office
+        in a single call by passing the arguments that vary as column arrays. The function is then executed as an
+        array function and returns one value per row. Functions that do not return one value per row are called once
+        per row. A function that returns one value per row is assumed to work element wise, so ``vectorize`` must only
+        be used for such functions.
+
+        |lo_unsafe|
+
+        Args:
+            func_name (str): the English name of the function to execute such as ``NORM.DIST``.
+            args (Iterable[Any]): Arguments for each call. Each item is a tuple of arguments
+                or a single value for functions that take one argument.
+            vectorize (bool, optional): Pack arguments into arrays. Only set to ``True`` for functions that return
+                one value per element of an array argument, such as ``NORM.DIST`` or ``SQRT``. Array functions such as
+                ``SORT`` or ``TREND`` also return one value per row but the values depend on all rows, so the results
+                would be wrong. Defaults to ``False``.
+            chunk_size (int, optional): Max number of rows per call when vectorized. Defaults to ``1000``.
+            as_numpy (bool, optional): Return a NumPy array. The array has a ``float64`` dtype if all results are
+                numbers, failed rows are ``NaN``; Otherwise, the dtype is ``object``. Defaults to ``False``.
+            return_exceptions (bool, optional): If ``True`` the exception of a failed row is returned in place of
+                its result; Otherwise, ``None`` is returned for failed rows. Defaults to ``False``.
+
+        Raises:
+            ImportError: If ``as_numpy`` is ``True`` and NumPy is not installed.
+
+        Returns:
+            List[Any] | numpy.ndarray: One result per item of ``args``.
+
+        Example:
+            .. code-block:: python
+
+                values = [(x, 0, 1, 1) for x in (-1.0, 0.0, 1.0)]
+                results = Calc.call_fun_many("NORM.DIST", values, vectorize=True)
+                # [0.158655..., 0.5, 0.841344...]
+
+        .. versionadded:: 0.48.0
+        """
+        name = func_name.upper()
+        rows = [tuple(a) if isinstance(a, (list, tuple)) else (a,) for a in args]
+        results: List[Any] = [None] * len(rows)
+        fa = mLo.Lo.current_lo.function_access
+        chunk_size = max(int(chunk_size), 1)
+
+        start = 0
+        while start < len(rows):
+            chunk = rows[start : start + chunk_size]
+            done = False
+            if vectorize and len(chunk) > 1:
+                width = len(chunk[0])
+                if width and all(len(r) == width and all(cls._is_scalar_arg(v) for v in r) for r in chunk):
+                    done = cls._call_fun_vector(fa, name, chunk, results, start)
+                    # a function that does not work element wise will not work for the next chunk either.
+                    vectorize = done
+            if not done:
+                for i, row in enumerate(chunk, start):
+                    try:
+                        results[i] = fa.callFunction(name, row)
+                    except Exception as e:
+                        results[i] = e
+            start += len(chunk)
+
+        failed = [i for i, r in enumerate(results) if isinstance(r, Exception)]
+        if failed:
+            mLo.Lo.print(f"Function '{name}' failed for {len(failed)} of {len(results)} items")
+            if not return_exceptions:
+                for i in failed:
+                    results[i] = None
+
+        if not as_numpy:
+            return results
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+
+        if all(r is None or isinstance(r, (int, float)) for r in results):
+            return np.array([np.nan if r is None else r for r in results], dtype=np.float64)
+        return np.array(results, dtype=object)
+
     @staticmethod
     def get_function_names() -> List[str] | None:
         """
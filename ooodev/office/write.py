@@ -27,8 +27,10 @@ from com.sun.star.linguistic2 import XLinguServiceManager
 from com.sun.star.linguistic2 import XProofreader
 from com.sun.star.linguistic2 import XSearchableDictionaryList
 from com.sun.star.linguistic2 import XSpellChecker
+from com.sun.star.sheet import XCellRangeData
 from com.sun.star.style import XStyle
 from com.sun.star.table import BorderLine  # struct
+from com.sun.star.table import XCellRange
 from com.sun.star.text import HoriOrientation
 from com.sun.star.text import VertOrientation
 from com.sun.star.text import XBookmarksSupplier
@@ -82,7 +84,6 @@ from ooodev.utils.color import CommonColor, Color
 from ooodev.utils.data_type.size import Size
 from ooodev.utils.table_helper import TableHelper
 
-
 if TYPE_CHECKING:
     # from com.sun.star.beans import PropertyValue
     from com.sun.star.container import XEnumeration
@@ -3183,6 +3184,7 @@ class Write(mSel.Selection):
         tbl_fg_color: Color | None = CommonColor.BLACK,
         first_row_header: bool = True,
         styles: Sequence[StyleT] | None = None,
+        bulk: bool = False,
     ) -> XTextTable:
         """
         Adds a table.
@@ -3205,6 +3207,9 @@ class Write(mSel.Selection):
             first_row_header (bool, optional): If ``True`` First row is treated as header data. Default ``True``.
             styles (Sequence[StyleT], optional): One or more styles to apply to frame.
                 Only styles that support ``com.sun.star.text.TextTable`` service are applied.
+            bulk (bool, optional): If ``True`` all values are written with a single ``setDataArray()`` call and
+                header and body colors are set once per cell range instead of once per cell.
+                Recommended for large tables. Default ``False``.
 
         Raises:
             ValueError: If table_data is empty.
@@ -3236,6 +3241,9 @@ class Write(mSel.Selection):
         .. versionchanged:: 0.9.0
             Now returns added table instead of bool value.
             Added options ``first_row_header`` and ``styles``.
+
+        .. versionchanged:: 0.48.0
+            Added option ``bulk``.
         """
         # sourcery skip: remove-unnecessary-cast
 
@@ -3249,6 +3257,7 @@ class Write(mSel.Selection):
             "tbl_fg_color": tbl_fg_color,
             "first_row_header": first_row_header,
             "styles": styles,
+            "bulk": bulk,
         }
         _Events().trigger(WriteNamedEvent.TABLE_ADDING, cargs)
         if cargs.cancel:
@@ -3259,6 +3268,7 @@ class Write(mSel.Selection):
         tbl_bg_color = cast(Union[Color, None], cargs.event_data["tbl_bg_color"])
         tbl_fg_color = cast(Union[Color, None], cargs.event_data["tbl_fg_color"])
         first_row_header = cast(bool, cargs.event_data["first_row_header"])
+        bulk = cast(bool, cargs.event_data["bulk"])
 
         def make_cell_name(row: int, col: int) -> str:
             return TableHelper.make_cell_name(row=row + 1, col=col + 1)
@@ -3320,8 +3330,17 @@ class Write(mSel.Selection):
                 rows = table.getRows()
                 mProps.Props.set(rows.getByIndex(0), BackColor=header_bg_color)
 
+            if bulk:
+                cls._set_table_data_bulk(
+                    table=table,
+                    table_data=table_data,
+                    num_cols=num_cols,
+                    header_fg_color=header_fg_color,
+                    tbl_fg_color=tbl_fg_color,
+                    first_row_header=first_row_header,
+                )
             #  write table header
-            if first_row_header:
+            elif first_row_header:
                 row_data = table_data[0]
                 for x in range(num_cols):
                     set_cell_header(make_cell_name(0, x), row_data[x], table)
@@ -3349,6 +3368,41 @@ class Write(mSel.Selection):
         _Events().trigger(WriteNamedEvent.TABLE_ADDED, EventArgs.from_args(cargs))
         return table
 
+    @classmethod
+    def _set_table_data_bulk(
+        cls,
+        table: XTextTable,
+        table_data: Table,
+        num_cols: int,
+        header_fg_color: Color | None,
+        tbl_fg_color: Color | None,
+        first_row_header: bool,
+    ) -> None:
+        # values are written as text to match the cell by cell path of add_table().
+        num_rows = len(table_data)
+        data = tuple(tuple(str(row[x]) for x in range(num_cols)) for row in table_data)
+        mLo.Lo.qi(XCellRangeData, table, True).setDataArray(data)
+
+        cell_range = mLo.Lo.qi(XCellRange, table, True)
+        last_col = num_cols - 1
+        body_start = 0
+        if first_row_header:
+            body_start = 1
+            if header_fg_color is not None:
+                header_rng = cell_range.getCellRangeByPosition(0, 0, last_col, 0)
+                mProps.Props.set(header_rng, CharColor=header_fg_color)
+        if body_start >= num_rows:
+            return
+        props = {}
+        if not first_row_header:
+            # By default the first row has a style by the name of: Table Heading
+            props["ParaStyleName"] = "Table Contents"
+        if tbl_fg_color is not None:
+            props["CharColor"] = tbl_fg_color
+        if props:
+            body_rng = cell_range.getCellRangeByPosition(0, body_start, last_col, num_rows - 1)
+            mProps.Props.set(body_rng, **props)
+
     # region    add_image_link()
 
     @overload
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from abc import ABC
+from typing import Any, Tuple
 from enum import Enum
 from ooodev.utils.info import Info
 
@@ -39,16 +40,21 @@ class ThemeBase(ABC):
             raise ValueError("No theme name has been found,")
         self._theme_name = str(theme_name)
 
+    def _get_scheme_entry(self, prop_name: str) -> Tuple[Any, ...]:
+        # Color and IsVisible are read together with one call and cached by the configuration access cache.
+        return Info.get_config_many(
+            node_path=f"/org.openoffice.Office.UI/ColorScheme/ColorSchemes/{self._theme_name}/{prop_name}",
+            names=("Color", "IsVisible"),
+            default=None,
+        )
+
     def _get_color(self, prop_name: str) -> int:
         try:
             # val = Info.get_config(
             #     node_str="Color",
             #     node_path=f"org.openoffice.Office.UI/ColorScheme/ColorSchemes/org.openoffice.Office.UI:ColorScheme['{self._theme_name}']/{prop_name}",
             # )
-            val = Info.get_config(
-                node_str="Color",
-                node_path=f"/org.openoffice.Office.UI/ColorScheme/ColorSchemes/{self._theme_name}/{prop_name}",
-            )
+            val = self._get_scheme_entry(prop_name)[0]
             return -1 if val is None else int(val)
         except Exception:
             return -1
@@ -59,10 +65,7 @@ class ThemeBase(ABC):
             #     node_str="IsVisible",
             #     node_path=f"org.openoffice.Office.UI/ColorScheme/ColorSchemes/org.openoffice.Office.UI:ColorScheme['{self._theme_name}']/{prop_name}",
             # )
-            val = Info.get_config(
-                node_str="IsVisible",
-                node_path=f"/org.openoffice.Office.UI/ColorScheme/ColorSchemes/{self._theme_name}/{prop_name}",
-            )
+            val = self._get_scheme_entry(prop_name)[1]
             return False if val is None else bool(val)
         except Exception:
             return False
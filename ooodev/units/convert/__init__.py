@@ -11,6 +11,7 @@ from .unit_speed_kind import UnitSpeedKind as UnitSpeedKind
 from .unit_temp_kind import UnitTempKind as UnitTempKind
 from .unit_time_kind import UnitTimeKind as UnitTimeKind
 from .unit_volume_kind import UnitVolumeKind as UnitVolumeKind
+from .local_converter import LocalConverter as LocalConverter
 from .converter import Converter as Converter
 
 __all__ = [
@@ -27,5 +28,6 @@ __all__ = [
     "UnitTempKind",
     "UnitTimeKind",
     "UnitVolumeKind",
+    "LocalConverter",
     "Converter",
 ]
@@ -1,10 +1,12 @@
 from __future__ import annotations
-from typing import Any, TYPE_CHECKING
+from typing import Any, List, Sequence, Tuple, TYPE_CHECKING
+import math
+import random
 import uno
 from ooodev.adapter.sheet.function_access_comp import FunctionAccessComp
 from ooodev.loader import lo as mLo
 from ooodev.exceptions import ex as mEx
-
+from ooodev.units.convert.local_converter import LocalConverter
 
 if TYPE_CHECKING:
     from ooodev.loader.inst.lo_inst import LoInst
@@ -33,28 +35,51 @@ class Converter(FunctionAccessComp):
 
     Note that ``CONVERT`` is the same function as in Calc.
 
+    When ``local`` is ``True`` conversions are done in Python by :py:class:`~ooodev.units.convert.LocalConverter`
+    and only units that are not known locally are passed to ``CONVERT``.
+    Local results can differ from ``CONVERT`` by up to a relative ``1e-5`` for a few units such as ``eV``, ``cal``,
+    ``BTU``, ``stone`` and ``ton`` because office uses rounded constants for them.
+
     .. seealso::
         `Calc CONVERT function <https://help.libreoffice.org/latest/en-US/text/scalc/01/func_convert.html?&DbPAR=CALC&System=UNIX>`__
 
     .. versionadded:: 0.35.0
+
+    .. versionchanged:: 0.48.0
+        Added ``local`` and ``check_rate`` options, ``convert_many()`` and ``cross_check()``.
     """
 
-    def __init__(self, lo_inst: LoInst | None = None) -> None:
+    def __init__(
+        self,
+        lo_inst: LoInst | None = None,
+        *,
+        local: bool = False,
+        check_rate: float = 0.0,
+        rel_tol: float = 1e-5,
+    ) -> None:
         """
         Constructor
 
         Args:
             lo_inst (LoInst): Lo Instance. This instance is used to create ``component`` is it is not provided.
+            local (bool, optional): Convert in Python when units are known locally. Defaults to ``False``.
+            check_rate (float, optional): Fraction (``0.0`` to ``1.0``) of local conversions that are also done
+                with ``CONVERT`` and compared. Meant for testing. Defaults to ``0.0``.
+            rel_tol (float, optional): Relative tolerance used when comparing local and ``CONVERT`` results
+                by ``check_rate`` and :py:meth:`~.Converter.cross_check`. Defaults to ``1e-5``.
 
         Returns:
             None:
 
         Note:
-            ``component`` is automatically created from ``lo_inst`` if it is not provided.
+            ``component`` is the ``FunctionAccess`` service shared by ``lo_inst``.
         """
         if lo_inst is None:
             lo_inst = mLo.Lo.current_lo
-        FunctionAccessComp.__init__(self, lo_inst=lo_inst, component=None)
+        FunctionAccessComp.__init__(self, lo_inst=lo_inst, component=lo_inst.function_access)
+        self._local = LocalConverter() if local else None
+        self._check_rate = check_rate
+        self._rel_tol = rel_tol
 
     def convert_area(self, num: int | float, fm: UnitAreaKind, to: UnitAreaKind) -> float:
         """
@@ -318,6 +343,117 @@ class Converter(FunctionAccessComp):
         Returns:
             Any: The converted value.
         """
+        local = self._local
+        if local is not None and isinstance(val, (int, float)) and local.is_known(frm) and local.is_known(to):
+            result = local.convert(val, frm, to)
+            if self._check_rate > 0.0 and random.random() < self._check_rate:
+                expected = self._office_convert(val, frm, to)
+                if not self._is_close(result, expected):
+                    raise mEx.ConvertError(
+                        f"Local result {result} differs from CONVERT result {expected} for {val} {frm} to {to}"
+                    )
+            return result
+        return self._office_convert(val, frm, to)
+
+    def convert_many(self, values: Any, frm: str, to: str) -> Any:
+        """
+        Converts many values from one unit to another.
+
+        Args:
+            values (Any): Sequence of numbers or a NumPy array.
+            frm (str): The unit to convert from.
+            to (str): The unit to convert to.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            Any: NumPy array of float if ``values`` is a NumPy array; Otherwise, list of float.
+
+        .. versionadded:: 0.48.0
+        """
+        local = self._local
+        frm = str(frm)
+        to = str(to)
+        if local is not None and local.is_known(frm) and local.is_known(to):
+            return local.convert_many(values, frm, to)
+        results = [self._office_convert(v, frm, to) for v in values]
+        if type(values).__module__ == "numpy":
+            import numpy as np
+
+            return np.array(results, dtype=float)
+        return results
+
+    def cross_check(
+        self, units: Sequence[Sequence[Any]] | None = None, sample_size: int = 100, seed: Any = None
+    ) -> List[Tuple[float, str, str, float, float]]:
+        """
+        Compares a random sample of local conversions with the office ``CONVERT`` function.
+
+        Args:
+            units (Sequence[Sequence[str | Enum]], optional): Groups of units that convert to each other
+                such as ``[UnitLengthKind, UnitTempKind]``. Defaults to all ``Unit*Kind`` enums.
+            sample_size (int, optional): Number of conversions to compare. Defaults to ``100``.
+            seed (Any, optional): Random seed, for repeatable samples.
+
+        Returns:
+            List[Tuple[float, str, str, float, float]]: Mismatches as ``(value, from, to, local, office)``.
+            An empty list means all results agree within ``rel_tol``.
+
+        .. versionadded:: 0.48.0
+        """
+        if units is None:
+            from ooodev.units.convert import (
+                UnitAreaKind,
+                UnitEnergyKind,
+                UnitFluxDensityKind,
+                UnitForceKind,
+                UnitInfoKind,
+                UnitLengthKind,
+                UnitPowerKind,
+                UnitPressureKind,
+                UnitSpeedKind,
+                UnitTempKind,
+                UnitTimeKind,
+                UnitVolumeKind,
+                UnitWeightKind,
+            )
+
+            units = (
+                UnitAreaKind,
+                UnitEnergyKind,
+                UnitFluxDensityKind,
+                UnitForceKind,
+                UnitInfoKind,
+                UnitLengthKind,
+                UnitPowerKind,
+                UnitPressureKind,
+                UnitSpeedKind,
+                UnitTempKind,
+                UnitTimeKind,
+                UnitVolumeKind,
+                UnitWeightKind,
+            )
+        groups = [[str(u) for u in group] for group in units]
+        rnd = random.Random(seed)
+        local = self._local or LocalConverter()
+        mismatches: List[Tuple[float, str, str, float, float]] = []
+        for _ in range(sample_size):
+            group = rnd.choice(groups)
+            frm = rnd.choice(group)
+            to = rnd.choice(group)
+            val = round(rnd.uniform(-1000.0, 1000.0), 3)
+            result = local.convert(val, frm, to)
+            expected = self._office_convert(val, frm, to)
+            if not self._is_close(result, expected):
+                mismatches.append((val, frm, to, result, expected))
+        return mismatches
+
+    def _is_close(self, result: float, expected: float) -> bool:
+        # abs_tol covers results that should be zero such as 0 C to C
+        return math.isclose(result, expected, rel_tol=self._rel_tol, abs_tol=1e-12)
+
+    def _office_convert(self, val: Any, frm: str, to: str) -> Any:
         try:
             return self.call_function("CONVERT", val, frm, to)
         except Exception as e:
@@ -0,0 +1,702 @@
+"""Pure Python implementation of the Calc ``CONVERT`` function."""
+
+from __future__ import annotations
+import threading
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple, TYPE_CHECKING, Union
+
+from ooodev.exceptions import ex as mEx
+
+if TYPE_CHECKING:
+    from enum import Enum
+    from ooodev.units.convert.unit_area_kind import UnitAreaKind
+    from ooodev.units.convert.unit_length_kind import UnitLengthKind
+    from ooodev.units.convert.unit_energy_kind import UnitEnergyKind
+    from ooodev.units.convert.unit_flux_density_kind import UnitFluxDensityKind
+    from ooodev.units.convert.unit_force_kind import UnitForceKind
+    from ooodev.units.convert.unit_info_kind import UnitInfoKind
+    from ooodev.units.convert.unit_weight_kind import UnitWeightKind
+    from ooodev.units.convert.unit_power_kind import UnitPowerKind
+    from ooodev.units.convert.unit_pressure_kind import UnitPressureKind
+    from ooodev.units.convert.unit_speed_kind import UnitSpeedKind
+    from ooodev.units.convert.unit_temp_kind import UnitTempKind
+    from ooodev.units.convert.unit_time_kind import UnitTimeKind
+    from ooodev.units.convert.unit_volume_kind import UnitVolumeKind
+
+UnitT = Union[str, "Enum"]
+
+# region tables
+# The tables follow the LibreOffice analysis add-in (scaddins analysishelper.cxx).
+# Each unit is given as ``(category, units per base unit, offset, allows prefix)``.
+# Offsets are only used for temperature where the base unit is Kelvin.
+
+_AREA = "area"
+_ENERGY = "energy"
+_FLUX = "flux_density"
+_FORCE = "force"
+_INFO = "info"
+_LENGTH = "length"
+_MASS = "weight"
+_POWER = "power"
+_PRESSURE = "pressure"
+_SPEED = "speed"
+_TEMP = "temp"
+_TIME = "time"
+_VOLUME = "volume"
+
+_INCH = 0.0254
+_LY = 9.4607304725808e15
+_PARSEC = 3.08567758128155e16
+
+_UNITS: Dict[str, Tuple[str, float, float, bool]] = {
+    # mass, base gram
+    "g": (_MASS, 1.0, 0.0, True),
+    "sg": (_MASS, 6.8522050005347800e-05, 0.0, False),
+    "lbm": (_MASS, 2.2046226218487758e-03, 0.0, False),
+    "u": (_MASS, 6.0221417930000000e23, 0.0, True),
+    "ozm": (_MASS, 3.5273961949580412e-02, 0.0, False),
+    "stone": (_MASS, 1.5747304441777110e-04, 0.0, False),
+    "ton": (_MASS, 1.1023113109243879e-06, 0.0, False),
+    "grain": (_MASS, 1.5432358352941431e01, 0.0, False),
+    "pweight": (_MASS, 7.0547923899161798e-01, 0.0, False),
+    "cwt": (_MASS, 2.2046226218487758e-05, 0.0, False),
+    "uk_cwt": (_MASS, 1.9684130552221213e-05, 0.0, False),
+    "uk_ton": (_MASS, 9.8420652761106063e-07, 0.0, False),
+    # length, base meter
+    "m": (_LENGTH, 1.0, 0.0, True),
+    "mi": (_LENGTH, 1.0 / 1609.344, 0.0, False),
+    "Nmi": (_LENGTH, 1.0 / 1852.0, 0.0, False),
+    "in": (_LENGTH, 1.0 / _INCH, 0.0, False),
+    "ft": (_LENGTH, 1.0 / (_INCH * 12), 0.0, False),
+    "yd": (_LENGTH, 1.0 / (_INCH * 36), 0.0, False),
+    "ang": (_LENGTH, 1.0e10, 0.0, True),
+    "Pica": (_LENGTH, 72.0 / _INCH, 0.0, False),
+    "pica": (_LENGTH, 6.0 / _INCH, 0.0, False),
+    "ell": (_LENGTH, 1.0 / (_INCH * 45), 0.0, False),
+    "parsec": (_LENGTH, 1.0 / _PARSEC, 0.0, True),
+    "pc": (_LENGTH, 1.0 / _PARSEC, 0.0, True),
+    "ly": (_LENGTH, 1.0 / _LY, 0.0, True),
+    "survey_mi": (_LENGTH, 3937.0 / 6336000.0, 0.0, False),
+    # time, base second
+    "yr": (_TIME, 1.0 / (365.25 * 86400.0), 0.0, False),
+    "day": (_TIME, 1.0 / 86400.0, 0.0, False),
+    "hr": (_TIME, 1.0 / 3600.0, 0.0, False),
+    "mn": (_TIME, 1.0 / 60.0, 0.0, False),
+    "sec": (_TIME, 1.0, 0.0, True),
+    # pressure, base pascal
+    "Pa": (_PRESSURE, 1.0, 0.0, True),
+    "atm": (_PRESSURE, 1.0 / 101325.0, 0.0, True),
+    "mmHg": (_PRESSURE, 760.0 / 101325.0, 0.0, True),
+    "Torr": (_PRESSURE, 760.0 / 101325.0, 0.0, False),
+    "psi": (_PRESSURE, 1.4503773800721814e-04, 0.0, False),
+    # force, base newton
+    "N": (_FORCE, 1.0, 0.0, True),
+    "dyn": (_FORCE, 1.0e05, 0.0, True),
+    "lbf": (_FORCE, 1.0 / 4.4482216152605, 0.0, False),
+    "pond": (_FORCE, 1.0 / 9.80665e-03, 0.0, True),
+    # energy, base joule
+    "J": (_ENERGY, 1.0, 0.0, True),
+    "e": (_ENERGY, 1.0e07, 0.0, True),
+    "c": (_ENERGY, 1.0 / 4.184, 0.0, True),
+    "cal": (_ENERGY, 1.0 / 4.1868, 0.0, True),
+    "eV": (_ENERGY, 1.0 / 1.602176634e-19, 0.0, True),
+    "Wh": (_ENERGY, 1.0 / 3600.0, 0.0, True),
+    # office computes flb as foot-poundal, kept for compatibility with CONVERT.
+    "flb": (_ENERGY, 2.3730360404232171e01, 0.0, False),
+    "BTU": (_ENERGY, 1.0 / 1055.05585262, 0.0, False),
+    # power, base watt
+    "W": (_POWER, 1.0, 0.0, True),
+    "HP": (_POWER, 1.0 / 745.69987158227022, 0.0, False),
+    "PS": (_POWER, 1.0 / 735.49875, 0.0, False),
+    # magnetic flux density, base tesla
+    "T": (_FLUX, 1.0, 0.0, True),
+    "ga": (_FLUX, 1.0e04, 0.0, True),
+    # temperature, base kelvin. kelvin = value / factor - offset
+    "C": (_TEMP, 1.0, -273.15, False),
+    "F": (_TEMP, 1.8, -255.37222222222222, False),
+    "K": (_TEMP, 1.0, 0.0, True),
+    "Rank": (_TEMP, 1.8, 0.0, False),
+    "Reau": (_TEMP, 0.8, -273.15, False),
+    # volume, base cubic meter
+    "m3": (_VOLUME, 1.0, 0.0, True),
+    "l": (_VOLUME, 1.0e03, 0.0, True),
+    "tsp": (_VOLUME, 1.0 / 4.92892159375e-06, 0.0, False),
+    "tspm": (_VOLUME, 2.0e05, 0.0, False),
+    "tbs": (_VOLUME, 1.0 / 1.478676478125e-05, 0.0, False),
+    "oz": (_VOLUME, 1.0 / 2.95735295625e-05, 0.0, False),
+    "cup": (_VOLUME, 1.0 / 2.365882365e-04, 0.0, False),
+    "pt": (_VOLUME, 1.0 / 4.73176473e-04, 0.0, False),
+    "uk_pt": (_VOLUME, 1.0 / 5.6826125e-04, 0.0, False),
+    "qt": (_VOLUME, 1.0 / 9.46352946e-04, 0.0, False),
+    "uk_qt": (_VOLUME, 1.0 / 1.1365225e-03, 0.0, False),
+    "gal": (_VOLUME, 1.0 / 3.785411784e-03, 0.0, False),
+    "uk_gal": (_VOLUME, 1.0 / 4.54609e-03, 0.0, False),
+    "ang3": (_VOLUME, 1.0e30, 0.0, True),
+    "barrel": (_VOLUME, 1.0 / 0.158987294928, 0.0, False),
+    "bushel": (_VOLUME, 1.0 / 3.523907016688e-02, 0.0, False),
+    "ft3": (_VOLUME, 1.0 / (_INCH * 12) ** 3, 0.0, False),
+    "in3": (_VOLUME, 1.0 / _INCH**3, 0.0, False),
+    "yd3": (_VOLUME, 1.0 / (_INCH * 36) ** 3, 0.0, False),
+    "mi3": (_VOLUME, 1.0 / 1609.344**3, 0.0, False),
+    "Nmi3": (_VOLUME, 1.0 / 1852.0**3, 0.0, False),
+    "ly3": (_VOLUME, 1.0 / _LY**3, 0.0, False),
+    "Pica3": (_VOLUME, (72.0 / _INCH) ** 3, 0.0, False),
+    "pica3": (_VOLUME, (6.0 / _INCH) ** 3, 0.0, False),
+    "GRT": (_VOLUME, 1.0 / (100.0 * (_INCH * 12) ** 3), 0.0, False),
+    "MTON": (_VOLUME, 1.0 / (40.0 * (_INCH * 12) ** 3), 0.0, False),
+    "Glass": (_VOLUME, 5.0e03, 0.0, False),
+    "Humpen": (_VOLUME, 2.0e03, 0.0, False),
+    "Middy": (_VOLUME, 1.0 / 2.2e-04, 0.0, False),
+    "Schooner": (_VOLUME, 1.0 / 4.25e-04, 0.0, False),
+    "Sixpack": (_VOLUME, 5.0e02, 0.0, False),
+    # area, base square meter
+    "m2": (_AREA, 1.0, 0.0, True),
+    "ang2": (_AREA, 1.0e20, 0.0, True),
+    "ar": (_AREA, 1.0e-02, 0.0, True),
+    "ha": (_AREA, 1.0e-04, 0.0, False),
+    "uk_acre": (_AREA, 1.0 / 4046.8564224, 0.0, False),
+    "us_acre": (_AREA, 1.0 / 4046.8726098742522, 0.0, False),
+    "ft2": (_AREA, 1.0 / (_INCH * 12) ** 2, 0.0, False),
+    "in2": (_AREA, 1.0 / _INCH**2, 0.0, False),
+    "yd2": (_AREA, 1.0 / (_INCH * 36) ** 2, 0.0, False),
+    "mi2": (_AREA, 1.0 / 1609.344**2, 0.0, False),
+    "Nmi2": (_AREA, 1.0 / 1852.0**2, 0.0, False),
+    "ly2": (_AREA, 1.0 / _LY**2, 0.0, False),
+    "Pica2": (_AREA, (72.0 / _INCH) ** 2, 0.0, False),
+    "Morgen": (_AREA, 4.0e-04, 0.0, False),
+    # speed, base meter per second
+    "m/s": (_SPEED, 1.0, 0.0, True),
+    "m/h": (_SPEED, 3600.0, 0.0, True),
+    "mph": (_SPEED, 3600.0 / 1609.344, 0.0, False),
+    "kn": (_SPEED, 3600.0 / 1852.0, 0.0, False),
+    "admkn": (_SPEED, 3600.0 / 1853.184, 0.0, False),
+    # information, base bit
+    "bit": (_INFO, 1.0, 0.0, True),
+    "byte": (_INFO, 0.125, 0.0, True),
+}
+
+# decimal prefix -> power of ten
+_PREFIXES: Dict[str, int] = {
+    "Y": 24,
+    "Z": 21,
+    "E": 18,
+    "P": 15,
+    "T": 12,
+    "G": 9,
+    "M": 6,
+    "k": 3,
+    "h": 2,
+    "e": 1,
+    "da": 1,
+    "d": -1,
+    "c": -2,
+    "m": -3,
+    "u": -6,
+    "n": -9,
+    "p": -12,
+    "f": -15,
+    "a": -18,
+    "z": -21,
+    "y": -24,
+}
+
+# binary prefix -> power of two, information units only
+_BIN_PREFIXES: Dict[str, int] = {
+    "Yi": 80,
+    "Zi": 70,
+    "Ei": 60,
+    "Pi": 50,
+    "Ti": 40,
+    "Gi": 30,
+    "Mi": 20,
+    "ki": 10,
+}
+
+# endregion tables
+
+
+class UnitInfo(NamedTuple):
+    """
+    Resolved conversion unit.
+
+    A value in this unit is converted to the base unit of ``category`` as
+    ``value * 10 ** level * 2 ** bin_level / factor - offset``.
+
+    .. versionadded:: 0.48.0
+    """
+
+    name: str
+    """Unit name such as ``km``"""
+    category: str
+    """Unit category such as ``length``"""
+    factor: float
+    """Number of units in one base unit, without prefix"""
+    offset: float
+    """Offset in base units, temperature only"""
+    level: int
+    """Power of ten of the prefix, ``3`` for ``km`` and ``6`` for ``km2``"""
+    bin_level: int
+    """Power of two of a binary prefix, ``10`` for ``kibit``"""
+
+
+class LocalConverter:
+    """
+    Converts from one unit to another without a running office.
+
+    Results agree with the Calc ``CONVERT`` function within a relative ``1e-5``.
+    Constants are exact or CODATA values, office uses rounded constants for a few units such as ``eV``, ``cal``,
+    ``BTU``, ``stone`` and ``ton``.
+    Units are the same strings used by ``CONVERT`` and all ``Unit*Kind`` enums such as ``UnitLengthKind`` are accepted.
+
+    Lookups are cached and conversions between two units are reduced to ``value * scale + shift``.
+
+    Example:
+        .. code-block:: python
+
+            from ooodev.units.convert import LocalConverter, UnitLengthKind
+
+            conv = LocalConverter()
+            conv.convert_length(1, UnitLengthKind.INCH, UnitLengthKind.MM)  # 25.4
+            conv.convert_many([1, 2, 3], "km", "mi")
+
+    .. versionadded:: 0.48.0
+    """
+
+    _units: Dict[str, UnitInfo] = {}
+    _pairs: Dict[Tuple[str, str], Tuple[float, float]] = {}
+    _lock = threading.Lock()
+
+    # region lookups
+    @classmethod
+    def _resolve(cls, name: str) -> UnitInfo | None:
+        entry = _UNITS.get(name)
+        if entry is not None:
+            return UnitInfo(name, entry[0], entry[1], entry[2], 0, 0)
+        # binary prefix, information only
+        entry = _UNITS.get(name[2:])
+        if entry is not None and entry[0] == _INFO and name[:2] in _BIN_PREFIXES:
+            return UnitInfo(name, entry[0], entry[1], 0.0, 0, _BIN_PREFIXES[name[:2]])
+        for size in (1, 2):
+            exp = _PREFIXES.get(name[:size])
+            if exp is None:
+                continue
+            entry = _UNITS.get(name[size:])
+            if entry is None or not entry[3]:
+                continue
+            base = name[size:]
+            # prefix of a square or cubic unit is raised to the same power, km2 is (1000 m)^2
+            power = int(base[-1]) if base[-1] in "23" else 1
+            return UnitInfo(name, entry[0], entry[1], 0.0, exp * power, 0)
+        return None
+
+    @classmethod
+    def get_unit(cls, unit: UnitT) -> UnitInfo:
+        """
+        Gets information for a unit.
+
+        Args:
+            unit (str, Enum): Unit such as ``km`` or ``UnitLengthKind.METER_KILO``.
+
+        Raises:
+            ConvertError: If unit is not known.
+
+        Returns:
+            UnitInfo: Unit info.
+        """
+        name = str(unit)
+        info = cls._units.get(name)
+        if info is None:
+            info = cls._resolve(name)
+            if info is None:
+                raise mEx.ConvertError(f"Unknown unit: {name}")
+            with cls._lock:
+                cls._units[name] = info
+        return info
+
+    @classmethod
+    def is_known(cls, unit: UnitT) -> bool:
+        """
+        Gets if a unit can be converted.
+
+        Args:
+            unit (str, Enum): Unit.
+
+        Returns:
+            bool: ``True`` if unit is known; Otherwise, ``False``.
+        """
+        try:
+            cls.get_unit(unit)
+            return True
+        except mEx.ConvertError:
+            return False
+
+    @classmethod
+    def get_factor(cls, frm: UnitT, to: UnitT) -> Tuple[float, float]:
+        """
+        Gets scale and shift that convert a value from one unit to another as ``value * scale + shift``.
+
+        ``shift`` is ``0.0`` for all categories except temperature.
+
+        Args:
+            frm (str, Enum): The unit to convert from.
+            to (str, Enum): The unit to convert to.
+
+        Raises:
+            ConvertError: If a unit is not known or units are of different categories.
+
+        Returns:
+            Tuple[float, float]: scale and shift.
+        """
+        key = (str(frm), str(to))
+        pair = cls._pairs.get(key)
+        if pair is not None:
+            return pair
+        u_frm = cls.get_unit(key[0])
+        u_to = cls.get_unit(key[1])
+        if u_frm.category != u_to.category:
+            raise mEx.ConvertError(
+                f"Cannot convert {u_frm.category} unit '{u_frm.name}' to {u_to.category} unit '{u_to.name}'"
+            )
+        # to base: v / f1 - o1, from base: (b + o2) * f2
+        scale = u_to.factor / u_frm.factor
+        # prefixes are applied as exact powers, 1 kar is 100000.0 m2 and not 99999.99999999999
+        level = u_frm.level - u_to.level
+        if level > 0:
+            scale *= 10.0**level
+        elif level < 0:
+            scale /= 10.0**-level
+        bin_level = u_frm.bin_level - u_to.bin_level
+        if bin_level:
+            scale *= 2.0**bin_level
+        shift = (u_to.offset - u_frm.offset) * u_to.factor
+        pair = (scale, shift)
+        with cls._lock:
+            cls._pairs[key] = pair
+        return pair
+
+    @classmethod
+    def get_category(cls, unit: UnitT) -> str:
+        """
+        Gets the category of a unit such as ``length`` or ``temp``.
+
+        Args:
+            unit (str, Enum): Unit.
+
+        Raises:
+            ConvertError: If unit is not known.
+
+        Returns:
+            str: Category name.
+        """
+        return cls.get_unit(unit).category
+
+    @classmethod
+    def _convert_offset(cls, val: Any, frm: UnitT, to: UnitT) -> Any:
+        # two steps through the base unit as done by CONVERT, 32 F is 0.0 C and not 7.1e-15 C
+        u_frm = cls.get_unit(frm)
+        u_to = cls.get_unit(to)
+        if u_frm.level:
+            val = val * 10.0**u_frm.level
+        val = val / u_frm.factor - u_frm.offset
+        val = (val + u_to.offset) * u_to.factor
+        if u_to.level:
+            val = val / 10.0**u_to.level
+        return val
+
+    # endregion lookups
+
+    # region convert
+    def convert(self, val: int | float, frm: UnitT, to: UnitT) -> float:
+        """
+        Converts a value from one unit to another.
+
+        Args:
+            val (int, float): The value to be converted.
+            frm (str, Enum): The unit to convert from.
+            to (str, Enum): The unit to convert to.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        scale, shift = self.get_factor(frm, to)
+        try:
+            if shift:
+                return self._convert_offset(float(val), frm, to)
+            return float(val) * scale
+        except (TypeError, ValueError) as e:
+            raise mEx.ConvertError(f"Unable to convert {val!r} from {frm} to {to}") from e
+
+    def convert_many(self, values: Any, frm: UnitT, to: UnitT) -> Any:
+        """
+        Converts many values from one unit to another.
+
+        The unit lookup is done once for all values.
+
+        Args:
+            values (Any): Sequence of numbers or a NumPy array.
+            frm (str, Enum): The unit to convert from.
+            to (str, Enum): The unit to convert to.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            Any: NumPy array of float if ``values`` is a NumPy array; Otherwise, list of float.
+        """
+        scale, shift = self.get_factor(frm, to)
+        if type(values).__module__ == "numpy":
+            import numpy as np
+
+            arr = np.asarray(values, dtype=float)
+            if shift:
+                return self._convert_offset(arr, frm, to)
+            return arr * scale
+        try:
+            if shift:
+                return [self._convert_offset(float(v), frm, to) for v in values]
+            return [float(v) * scale for v in values]
+        except (TypeError, ValueError) as e:
+            raise mEx.ConvertError(f"Unable to convert values from {frm} to {to}") from e
+
+    def get_matrix(self, units: Sequence[UnitT]) -> List[List[float]]:
+        """
+        Gets a precomputed conversion matrix.
+
+        ``matrix[i][j]`` is the factor that converts a value in ``units[i]`` to ``units[j]``.
+        For a NumPy array of values in ``units[i]`` with shape ``(n,)`` then ``np.outer(values, matrix[i])``
+        converts all values to all units at once.
+
+        Args:
+            units (Sequence[str | Enum]): Units of the same category.
+
+        Raises:
+            ConvertError: If units are of different categories or a unit is a temperature with an offset.
+
+        Returns:
+            List[List[float]]: Conversion matrix.
+        """
+        matrix: List[List[float]] = []
+        for frm in units:
+            row: List[float] = []
+            for to in units:
+                scale, shift = self.get_factor(frm, to)
+                if shift:
+                    raise mEx.ConvertError(f"Conversion from {frm} to {to} is not a linear factor")
+                row.append(scale)
+            matrix.append(row)
+        return matrix
+
+    def convert_area(self, num: int | float, fm: UnitAreaKind, to: UnitAreaKind) -> float:
+        """
+        Converts area from one unit to another.
+
+        Args:
+            fm (UnitAreaKind): Enum values, from unit.
+            to (UnitAreaKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_length(self, num: int | float, fm: UnitLengthKind, to: UnitLengthKind) -> float:
+        """
+        Converts length from one unit to another.
+
+        Args:
+            fm (UnitLengthKind): Enum values, from unit.
+            to (UnitLengthKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_energy(self, num: int | float, fm: UnitEnergyKind, to: UnitEnergyKind) -> float:
+        """
+        Converts energy from one unit to another.
+
+        Args:
+            fm (UnitEnergyKind): Enum values, from unit.
+            to (UnitEnergyKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_flux_density(self, num: int | float, fm: UnitFluxDensityKind, to: UnitFluxDensityKind) -> float:
+        """
+        Converts flux density from one unit to another.
+
+        Args:
+            fm (UnitFluxDensityKind): Enum values, from unit.
+            to (UnitFluxDensityKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_force(self, num: int | float, fm: UnitForceKind, to: UnitForceKind) -> float:
+        """
+        Converts force from one unit to another.
+
+        Args:
+            fm (UnitForceKind): Enum values, from unit.
+            to (UnitForceKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_info(self, num: int | float, fm: UnitInfoKind, to: UnitInfoKind) -> float:
+        """
+        Converts information from one unit to another.
+
+        Args:
+            fm (UnitInfoKind): Enum values, from unit.
+            to (UnitInfoKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_weight(self, num: int | float, fm: UnitWeightKind, to: UnitWeightKind) -> float:
+        """
+        Converts weight from one unit to another.
+
+        Args:
+            fm (UnitWeightKind): Enum values, from unit.
+            to (UnitWeightKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_power(self, num: int | float, fm: UnitPowerKind, to: UnitPowerKind) -> float:
+        """
+        Converts power from one unit to another.
+
+        Args:
+            fm (UnitPowerKind): Enum values, from unit.
+            to (UnitPowerKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_pressure(self, num: int | float, fm: UnitPressureKind, to: UnitPressureKind) -> float:
+        """
+        Converts pressure from one unit to another.
+
+        Args:
+            fm (UnitPressureKind): Enum values, from unit.
+            to (UnitPressureKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_speed(self, num: int | float, fm: UnitSpeedKind, to: UnitSpeedKind) -> float:
+        """
+        Converts speed from one unit to another.
+
+        Args:
+            fm (UnitSpeedKind): Enum values, from unit.
+            to (UnitSpeedKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_temp(self, num: int | float, fm: UnitTempKind, to: UnitTempKind) -> float:
+        """
+        Converts temperature from one unit to another.
+
+        Args:
+            fm (UnitTempKind): Enum values, from unit.
+            to (UnitTempKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_time(self, num: int | float, fm: UnitTimeKind, to: UnitTimeKind) -> float:
+        """
+        Converts time from one unit to another.
+
+        Args:
+            fm (UnitTimeKind): Enum values, from unit.
+            to (UnitTimeKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    def convert_volume(self, num: int | float, fm: UnitVolumeKind, to: UnitVolumeKind) -> float:
+        """
+        Converts volume from one unit to another.
+
+        Args:
+            fm (UnitVolumeKind): Enum values, from unit.
+            to (UnitVolumeKind): Enum value, to unit.
+
+        Raises:
+            ConvertError: If the conversion fails.
+
+        Returns:
+            float: The converted value.
+        """
+        return self.convert(num, fm, to)
+
+    # endregion convert
+
+
+__all__ = ("LocalConverter", "UnitInfo")
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import contextlib
+from collections import OrderedDict
 from typing import Any, cast, Dict, List, Type, Tuple, Set, TYPE_CHECKING
 import importlib
+import threading
 import types
 
 import uno
@@ -26,8 +28,34 @@ if TYPE_CHECKING:
     from ooodev.utils.type_var import EventCallback
     from ooodev.loader.inst.lo_inst import LoInst
 
+# region process wide caches
+# generated classes keyed by (name, base class, bases, class properties).
+# Bounded because some callers pass a new base class on each call and would never hit.
+_CLASS_CACHE: OrderedDict[Tuple[Any, ...], Type[Any]] = OrderedDict()
+_CLASS_CACHE_MAX_SIZE = 1024
+_CACHE_LOCK = threading.Lock()
+_CACHE_STATS = {"hits": 0, "misses": 0}
+# endregion process wide caches
+
 
 class DefaultBuilder(LoInstPropsPartial, EventsPartial):
+    """
+    Builds classes dynamically from partial classes that match the interfaces and services of a UNO component.
+
+    Classes built by :py:meth:`build_class` are cached for the process. Components with the same bases and the same
+    class properties share a single class.
+
+    Note:
+        Interfaces and services are always probed on the component itself.
+        Components with the same implementation name, such as configuration nodes, can support different interfaces.
+
+    .. versionchanged:: 0.48.0
+        Added class cache.
+    """
+
+    cache_enabled: bool = True
+    """Class level switch for the process wide class cache. Default ``True``."""
+
     def __init__(self, component: Any, lo_inst: LoInst | None = None):
         # ComponentBase.__init__(self, component)
         EventsPartial.__init__(self)
@@ -51,6 +79,7 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
         self._partial_excludes = {"_listener", "_events"}
         self._service_info = mLo.Lo.qi(XServiceInfo, self._component)
         self._type_names = None
+        self._services: Dict[str, bool] = {}
         if self._service_info is None:
             self._implementation_name = ""
         else:
@@ -84,6 +113,16 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
             self._type_names = result
         return self._type_names
 
+    def _has_service(self, name: str) -> bool:
+        """Gets if the component supports a service. Results are kept for this builder only."""
+        if self._service_info is None:
+            return False
+        result = self._services.get(name, None)
+        if result is None:
+            result = bool(self._service_info.supportsService(name))
+            self._services[name] = result
+        return result
+
     def auto_interface(self) -> None:
         """
         Automatically add interfaces to the builder based on the component types.
@@ -147,7 +186,7 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
             return False
         result = False
         for srv in name:
-            result = self._service_info.supportsService(srv)
+            result = self._has_service(srv)
             if result:
                 break
         return result
@@ -157,7 +196,7 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
             return False
         result = True
         for srv in name:
-            result = self._service_info.supportsService(srv)
+            result = self._has_service(srv)
             if not result:
                 break
         return result
@@ -175,12 +214,12 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
         if count == 0:
             return False
         if count == 1:
-            return self._service_info.supportsService(name[0])
-        result = self._service_info.supportsService(name[0])
+            return self._has_service(name[0])
+        result = self._has_service(name[0])
         if not result:
             return False
         for srv in name[1:]:
-            if self._service_info.supportsService(srv):
+            if self._has_service(srv):
                 return False
         return True
 
@@ -391,14 +430,17 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
         for mod, arg in self._bases_event_interfaces.items():
             self._init_event_class(instance, mod, arg)
 
+    def _get_bases(self, base_class: Type[Any]) -> List[Type[Any]]:
+        return (
+            [base_class]
+            + list(self._bases_partial.keys())
+            + list(self._bases_interfaces.keys())
+            + list([getattr(mod, arg.class_name) for mod, arg in self._bases_event_interfaces.items()])
+        )
+
     def _generate_class(self, base_class: Type[Any], name: str, **kwargs) -> Type[Any]:
         try:
-            bases = (
-                [base_class]
-                + list(self._bases_partial.keys())
-                + list(self._bases_interfaces.keys())
-                + list([getattr(mod, arg.class_name) for mod, arg in self._bases_event_interfaces.items()])
-            )
+            bases = self._get_bases(base_class)
             if len(bases) == 1 and not kwargs:
                 return base_class
             else:
@@ -407,6 +449,98 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
             self._logger.error(f"Error generating class: {name}", exc_info=True)
             raise
 
+    # region Class Cache
+    def _get_class_cache_key(
+        self, name: str, base_class: Type[Any], class_props: Dict[str, Any]
+    ) -> Tuple[Any, ...] | None:
+        """Gets the class cache key or ``None`` if the class cannot be cached."""
+        if not DefaultBuilder.cache_enabled:
+            return None
+        key = (name, base_class, tuple(self._get_bases(base_class)[1:]), tuple(class_props.items()))
+        try:
+            hash(key)
+        except TypeError:
+            # a class property value is not hashable.
+            return None
+        return key
+
+    def _get_cached_class(self, name: str, base_class: Type[Any]) -> Type[Any]:
+        """
+        Gets a class from the class cache or generates, caches and returns a new class.
+
+        Class properties are resolved first so that the ``class_property_init`` event is raised for every build
+        and the resolved values are part of the cache key.
+        """
+        class_props = self._get_class_props()
+        key = self._get_class_cache_key(name, base_class, class_props)
+        if key is not None:
+            with _CACHE_LOCK:
+                clz = _CLASS_CACHE.get(key, None)
+                if clz is not None:
+                    _CLASS_CACHE.move_to_end(key)
+                    _CACHE_STATS["hits"] += 1
+                    return clz
+        clz = self._new_class_type(name, base_class, True)
+        self._set_class_props(clz, class_props)
+        if key is not None and clz is not base_class:
+            with _CACHE_LOCK:
+                _CACHE_STATS["misses"] += 1
+                _CLASS_CACHE[key] = clz
+                while len(_CLASS_CACHE) > _CLASS_CACHE_MAX_SIZE:
+                    _CLASS_CACHE.popitem(last=False)
+        return clz
+
+    @staticmethod
+    def get_cache_info() -> Dict[str, int]:
+        """
+        Gets statistics of the process wide class cache.
+
+        Returns:
+            Dict[str, int]: Dictionary with keys ``hits``, ``misses``, ``size`` and ``max_size``.
+
+        .. versionadded:: 0.48.0
+        """
+        with _CACHE_LOCK:
+            result = dict(_CACHE_STATS)
+            result["size"] = len(_CLASS_CACHE)
+            result["max_size"] = _CLASS_CACHE_MAX_SIZE
+        return result
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Clears the process wide class cache and resets the statistics.
+
+        .. versionadded:: 0.48.0
+        """
+        with _CACHE_LOCK:
+            _CLASS_CACHE.clear()
+            for key in _CACHE_STATS:
+                _CACHE_STATS[key] = 0
+
+    @staticmethod
+    def set_cache_max_size(max_size: int) -> None:
+        """
+        Sets the max number of classes in the process wide class cache. Default is ``1024``.
+
+        Args:
+            max_size (int): Max number of classes.
+
+        Raises:
+            ValueError: If ``max_size`` is less than ``1``.
+
+        .. versionadded:: 0.48.0
+        """
+        global _CLASS_CACHE_MAX_SIZE
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        with _CACHE_LOCK:
+            _CLASS_CACHE_MAX_SIZE = max_size
+            while len(_CLASS_CACHE) > _CLASS_CACHE_MAX_SIZE:
+                _CLASS_CACHE.popitem(last=False)
+
+    # endregion Class Cache
+
     def _convert_to_ooodev(self, name: str) -> str:
         if not name:
             raise ValueError("Name cannot be empty.")
@@ -854,6 +988,9 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
             - LO_INST = 4
         """
         self._process_imports()
+        return self._new_class_type(name, base_class, set_mod_name)
+
+    def _new_class_type(self, name: str, base_class: Type[Any], set_mod_name: bool) -> Type[Any]:
         if "." in name:
             mod, class_name = name.rsplit(".", 1)
         else:
@@ -886,9 +1023,12 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
             - COMPONENT_INTERFACE = 2
             - CALLBACK = 3
             - LO_INST = 4
+
+        .. versionchanged:: 0.48.0
+            The generated class is taken from the process wide class cache when the bases and class properties match.
         """
-        clz = self.get_class_type(name=name, base_class=base_class)
-        self.init_class_properties(clz)
+        self._process_imports()
+        clz = self._get_cached_class(name, base_class)
         inst = self._create_class(clz, InitKind(init_kind))
         self.init_classes(inst)
         return inst
@@ -953,10 +1093,9 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
         """
         return self._class_props.get(name, default)
 
-    def init_class_properties(self, clz: Type[Any]) -> None:
-        """Initialize the class properties."""
-        if not self._class_props:
-            return
+    def _get_class_props(self) -> Dict[str, Any]:
+        """Gets the class properties after the ``class_property_init`` event has been raised for each."""
+        result: Dict[str, Any] = {}
         for name, value in self._class_props.items():
             eargs = EventArgs(self)
             eargs.event_data = {"name": name, "value": value}
@@ -964,7 +1103,19 @@ class DefaultBuilder(LoInstPropsPartial, EventsPartial):
             if eargs.event_data:
                 name = eargs.event_data.get("name", name)
                 value = eargs.event_data.get("value", value)
-            setattr(clz, name, property(lambda self: value))
+            result[name] = value
+        return result
+
+    def _set_class_props(self, clz: Type[Any], class_props: Dict[str, Any]) -> None:
+        for name, value in class_props.items():
+            # bind value as a default, a closure would return the last value for every property.
+            setattr(clz, name, property(lambda self, value=value: value))
+
+    def init_class_properties(self, clz: Type[Any]) -> None:
+        """Initialize the class properties."""
+        if not self._class_props:
+            return
+        self._set_class_props(clz, self._get_class_props())
 
     # endregion Class Properties
 
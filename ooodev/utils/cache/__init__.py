@@ -1,5 +1,6 @@
+from .cache_stats import CacheStats as CacheStats
 from .lru_cache import LRUCache as LRUCache
 from .tlru_cache import TLRUCache as TLRUCache
 from .time_cache import TimeCache as TimeCache
 
-__all__ = ["LRUCache", "TLRUCache", "TimeCache"]
+__all__ = ["CacheStats", "LRUCache", "TLRUCache", "TimeCache"]
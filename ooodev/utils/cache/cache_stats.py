@@ -0,0 +1,30 @@
+"""Statistics of in memory caches."""
+
+from __future__ import annotations
+from typing import NamedTuple
+
+
+class CacheStats(NamedTuple):
+    """
+    In memory cache statistics.
+
+    .. versionadded:: 0.48.0
+    """
+
+    hits: int
+    """Number of lookups that were found in cache."""
+    misses: int
+    """Number of lookups that were not found in cache."""
+    evictions: int
+    """Number of items removed to stay within capacity or size limits."""
+    expired: int = 0
+    """Number of items removed because their time expired."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Gets the hit rate. Value is between ``0.0`` and ``1.0``."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+__all__ = ("CacheStats",)
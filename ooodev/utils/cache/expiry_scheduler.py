@@ -0,0 +1,158 @@
+"""Process wide scheduler for cache expiry."""
+
+from __future__ import annotations
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Protocol, Tuple
+
+from ooodev.io.log.named_logger import NamedLogger
+
+
+class ExpiryTarget(Protocol):
+    """Object that can be registered with :py:class:`ExpiryScheduler`."""
+
+    def on_expiry_due(self) -> float:
+        """
+        Called on the scheduler thread when the registered deadline is reached.
+
+        Returns:
+            float: Next ``time.monotonic()`` deadline or ``0`` to stay unregistered.
+        """
+        ...
+
+
+class ExpiryScheduler:
+    """
+    Process wide expiry scheduler.
+
+    Holds a heap of deadlines driven by a single daemon thread that uses ``time.monotonic()``.
+    Each target has at most one pending deadline. Registering replaces the previous deadline.
+    Targets are held weakly, a target that is garbage collected is dropped.
+
+    Callbacks run on the scheduler thread one after another, a callback should not block.
+
+    Use :py:meth:`get_instance` to get the shared scheduler.
+
+    .. versionadded:: 0.48.0
+    """
+
+    _instance: ExpiryScheduler | None = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        # reentrant, dropping the last reference to a target while holding the lock calls _forget()
+        self._cond = threading.Condition(threading.RLock())
+        self._heap: List[Tuple[float, int, weakref.ref]] = []
+        # id of target -> sequence of its current heap entry. Older entries are skipped when popped.
+        self._current: Dict[int, int] = {}
+        self._seq = itertools.count()
+        self._thread: threading.Thread | None = None
+        self._logger = NamedLogger(self.__class__.__name__)
+
+    @classmethod
+    def get_instance(cls) -> ExpiryScheduler:
+        """Gets the shared scheduler."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def schedule(self, target: ExpiryTarget, deadline: float) -> None:
+        """
+        Registers a target. Replaces any deadline the target already has.
+
+        Args:
+            target (ExpiryTarget): Object with a ``on_expiry_due()`` method.
+            deadline (float): ``time.monotonic()`` time to call the target.
+        """
+        tid = id(target)
+        with self._cond:
+            seq = next(self._seq)
+            self._current[tid] = seq
+            ref = weakref.ref(target, lambda _, tid=tid, seq=seq: self._forget(tid, seq))
+            heapq.heappush(self._heap, (deadline, seq, ref))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ooodev_expiry_scheduler", daemon=True)
+                self._thread.start()
+            elif self._heap[0][1] == seq:
+                # new earliest deadline
+                self._cond.notify()
+
+    def cancel(self, target: ExpiryTarget) -> bool:
+        """
+        Unregisters a target.
+
+        Args:
+            target (ExpiryTarget): Target.
+
+        Returns:
+            bool: ``True`` if the target had a pending deadline.
+        """
+        with self._cond:
+            # heap entry stays and is skipped when popped.
+            return self._current.pop(id(target), None) is not None
+
+    def is_scheduled(self, target: ExpiryTarget) -> bool:
+        """Gets if a target has a pending deadline."""
+        with self._cond:
+            return id(target) in self._current
+
+    def _forget(self, tid: int, seq: int) -> None:
+        with self._cond:
+            if self._current.get(tid) == seq:
+                del self._current[tid]
+
+    def _pop_due(self) -> List[Any]:
+        # waits for the earliest deadline and returns the targets that are due.
+        with self._cond:
+            while True:
+                heap = self._heap
+                while heap:
+                    _, seq, ref = heap[0]
+                    target = ref()
+                    if target is not None and self._current.get(id(target)) == seq:
+                        break
+                    # cancelled, replaced or collected
+                    heapq.heappop(heap)
+                target = None
+                if not heap:
+                    self._cond.wait()
+                    continue
+                delay = heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                due = []
+                now = time.monotonic()
+                while heap and heap[0][0] <= now:
+                    _, seq, ref = heapq.heappop(heap)
+                    target = ref()
+                    if target is not None and self._current.get(id(target)) == seq:
+                        del self._current[id(target)]
+                        due.append(target)
+                if due:
+                    return due
+
+    def _run(self) -> None:
+        while True:
+            for target in self._pop_due():
+                try:
+                    deadline = target.on_expiry_due()
+                except Exception as e:
+                    self._logger.warning(f"Expiry callback failed: {e}")
+                    continue
+                if deadline and not self.is_scheduled(target):
+                    self.schedule(target, deadline)
+            # drop references before waiting again
+            target = None
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._current)
+
+
+__all__ = ("ExpiryScheduler",)
@@ -1,5 +1,6 @@
 from .cache_base import CacheBase as CacheBase
+from .cache_base import FileCacheStats as FileCacheStats
 from .pickle_cache import PickleCache as PickleCache
 from .text_cache import TextCache as TextCache
 
-__all__ = ["CacheBase", "PickleCache", "TextCache"]
+__all__ = ["CacheBase", "FileCacheStats", "PickleCache", "TextCache"]
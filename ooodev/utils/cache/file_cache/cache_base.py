@@ -1,30 +1,99 @@
 # coding: utf-8
+from __future__ import annotations
+import contextlib
+import hashlib
 import os
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Dict, List, NamedTuple, Tuple, Union
 import uno
 from abc import abstractmethod
 
 from ooodev.adapter.util.the_path_settings_comp import ThePathSettingsComp
 from ooodev.io.log.named_logger import NamedLogger
 from ooodev.meta.constructor_singleton import ConstructorSingleton
+from ooodev.utils.cache.file_cache.file_lock import FileLock
+
+_BLOB_DIR = ".blobs"
+# empty file per key, its modified time is the time the key was written and its access time the last read.
+# keys with the same content share one inode, so the times of the cache file itself are shared.
+_META_DIR = ".meta"
+_LOCK_FILE = ".lock"
+_TMP_PREFIX = ".tmp_"
+
+
+class FileCacheStats(NamedTuple):
+    """
+    File cache statistics. Statistics are per process.
+
+    .. versionadded:: 0.48.0
+    """
+
+    hits: int
+    """Number of reads that were found in cache."""
+    misses: int
+    """Number of reads that were not found in cache or were expired."""
+    puts: int
+    """Number of writes."""
+    dedup: int
+    """Number of writes that reused content already in cache."""
+    evictions: int
+    """Number of files removed because they expired or the cache was over its limits."""
+
+    @property
+    def hit_rate(self) -> float:
+        """Gets the hit rate. Value is between ``0.0`` and ``1.0``."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
 
 
 class CacheBase(metaclass=ConstructorSingleton):
     """
     Caches files and retrieves cached files.
     Cached file are in a subfolder of system tmp dir.
+
+    Files are written to a temporary file and then renamed so readers never see a partial file.
+    Writes, removals and sweeps hold an advisory lock on the cache folder so many processes can share a cache.
+
+    When ``tmp_dir`` is set the cache folder is managed by the cache:
+
+    - Files with the same content are stored once and hard linked.
+      Write and access times are kept per file in a sidecar folder.
+    - When ``max_bytes`` or ``max_entries`` is set the least recently used files are removed when the cache
+      grows past its limits.
+    - Expired files are removed by :py:meth:`~.CacheBase.sweep`.
+
+    .. versionchanged:: 0.48.0
+        Added atomic writes, file locking, size limits, deduplication and statistics.
     """
 
-    def __init__(self, tmp_dir: str = "", lifetime: float = -1) -> None:
+    def __init__(
+        self,
+        tmp_dir: str = "",
+        lifetime: float = -1,
+        max_bytes: int = 0,
+        max_entries: int = 0,
+        sweep_interval: float = 0.0,
+    ) -> None:
         """
         Constructor
 
         Args:
             tmp_dir (str, optional): Dir name to create in tmp folder. Defaults to 'ooo_uno_tmpl'.
             lifetime (float): Time in seconds that cache is good for.
+            max_bytes (int, optional): Max total size of cached files. ``0`` for no limit. Defaults to ``0``.
+            max_entries (int, optional): Max number of cached files. ``0`` for no limit. Defaults to ``0``.
+            sweep_interval (float, optional): Seconds between background sweeps.
+                ``0`` for no background sweeps. Defaults to ``0``.
+
+        Note:
+            Limits, deduplication and sweeps only apply when ``tmp_dir`` is set.
+
+        .. versionchanged:: 0.48.0
+            Added ``max_bytes``, ``max_entries`` and ``sweep_interval`` arguments.
         """
-        uno.fileUrlToSystemPath
         self._ps = ThePathSettingsComp.from_lo()
         t_path = Path(uno.fileUrlToSystemPath(self._ps.temp[0]))
         self._tmp_dir = tmp_dir
@@ -36,6 +105,18 @@ class CacheBase(metaclass=ConstructorSingleton):
 
         self._lifetime = lifetime
         self._logger = NamedLogger(self.__class__.__name__)
+        self._managed = bool(tmp_dir)
+        self._max_bytes = max(int(max_bytes), 0)
+        self._max_entries = max(int(max_entries), 0)
+        self._file_lock = FileLock(self._cache_path / _LOCK_FILE)
+        self._stats_lock = threading.Lock()
+        # size of the cache as of the last sweep plus writes since. -1 is unknown.
+        self._known_bytes = -1
+        self._known_entries = -1
+        self._sweep_stop: threading.Event | None = None
+        self.reset_stats()
+        if sweep_interval > 0:
+            self.start_sweeper(sweep_interval)
 
     @abstractmethod
     def get(self, filename: Union[str, Path]):
@@ -70,11 +151,322 @@ class CacheBase(metaclass=ConstructorSingleton):
         """
         try:
             f = Path(self.path, filename)
-            if os.path.exists(f):
-                os.remove(f)
+            with self._file_lock:
+                if os.path.exists(f):
+                    st = f.stat()
+                    os.remove(f)
+                    if self._known_entries > 0:
+                        self._known_entries -= 1
+                    if self._known_bytes >= 0 and st.st_nlink <= 2:
+                        # no other file shares the content.
+                        self._known_bytes = max(self._known_bytes - st.st_size, 0)
+                if self._managed:
+                    with contextlib.suppress(OSError):
+                        os.remove(self._get_marker(f))
         except Exception as e:
             self.logger.warning(f"Not able to delete file: {filename}, error: {e}")
 
+    # region read write
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def _get_marker(self, f: Path) -> Path:
+        return self._cache_path / _META_DIR / f.relative_to(self._cache_path)
+
+    def _get_times(self, f: Path, f_stat: os.stat_result) -> Tuple[float, float]:
+        # (last access, written) times of a cache file.
+        if self._managed:
+            with contextlib.suppress(OSError, ValueError):
+                m_stat = self._get_marker(f).stat()
+                return m_stat.st_atime, m_stat.st_mtime
+        return f_stat.st_atime, f_stat.st_mtime
+
+    def _touch_marker(self, f: Path) -> None:
+        try:
+            marker = self._get_marker(f)
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+            os.utime(marker)
+        except (OSError, ValueError) as e:
+            self.logger.debug(f"Not able to update times of cache file: {f.name}, error: {e}")
+
+    def _get_bytes(self, filename: Union[str, Path]) -> Union[bytes, None]:
+        """
+        Reads file contents from cache if it exist and is not expired.
+
+        Updates statistics and the last access time used for least recently used eviction.
+
+        .. versionadded:: 0.48.0
+        """
+        f = Path(self.path, filename)
+        try:
+            f_stat = f.stat()
+        except OSError:
+            self._count("_misses")
+            return None
+        if self.can_expire:
+            if f_stat.st_size == 0:
+                # should not be zero byte file.
+                self.remove(f)
+                self._count("_misses")
+                return None
+            _, written = self._get_times(f, f_stat)
+            age = time.time() - written
+            if age >= self.seconds:
+                self._count("_misses")
+                return None
+        try:
+            with open(f, "rb") as file:
+                content = file.read()
+        except OSError:
+            self._count("_misses")
+            return None
+        if self.is_limited:
+            # keep modified time, it is used for the lifetime.
+            _, written = self._get_times(f, f_stat)
+            with contextlib.suppress(OSError, ValueError):
+                os.utime(self._get_marker(f), (time.time(), written))
+        self._count("_hits")
+        return content
+
+    def _write_atomic(self, f: Path, data: bytes) -> None:
+        fd, tmp = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=f.parent)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(tmp, f)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+            raise
+
+    def _link_blob(self, f: Path, data: bytes) -> bool:
+        # Stores content once in the blob folder and hard links the cache file to it.
+        blob_dir = self._cache_path / _BLOB_DIR
+        blob = blob_dir / hashlib.sha256(data).hexdigest()
+        try:
+            if blob.exists():
+                if f.exists() and os.path.samefile(f, blob):
+                    self._count("_dedup")
+                    return True
+                self._count("_dedup")
+            else:
+                blob_dir.mkdir(exist_ok=True)
+                self._write_atomic(blob, data)
+            tmp = f.parent / f"{_TMP_PREFIX}{os.getpid()}_{threading.get_ident()}_{f.name}"
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+            os.link(blob, tmp)
+            os.replace(tmp, f)
+            return True
+        except OSError as e:
+            # file system without hard links.
+            self.logger.debug(f"Not able to link cache file: {f.name}, error: {e}")
+            return False
+
+    def _put_bytes(self, filename: Union[str, Path], data: bytes) -> None:
+        """
+        Writes file contents into cache.
+
+        The file is written atomically while holding the cache lock.
+        Least recently used files are removed if the cache is over its limits.
+
+        .. versionadded:: 0.48.0
+        """
+        f = Path(self.path, filename)
+        with self._file_lock:
+            try:
+                old_st: os.stat_result | None = f.stat()
+            except OSError:
+                old_st = None
+            if not (self._managed and self._link_blob(f, data)):
+                self._write_atomic(f, data)
+            if self._managed:
+                self._touch_marker(f)
+            self._count("_puts")
+            if self._known_bytes >= 0:
+                self._update_known(old_st, f.stat())
+            if self.is_limited and self._is_over_limit(self._known_bytes, self._known_entries):
+                self.sweep()
+
+    def _update_known(self, old_st: os.stat_result | None, new_st: os.stat_result) -> None:
+        # Bytes are counted once per content. A content is linked from the blob folder and from each cache file
+        # that uses it, a link count of at most two means no other cache file shares it.
+        if old_st is None:
+            self._known_entries += 1
+        elif (old_st.st_dev, old_st.st_ino) == (new_st.st_dev, new_st.st_ino):
+            return
+        elif old_st.st_nlink <= 2:
+            self._known_bytes = max(self._known_bytes - old_st.st_size, 0)
+        if new_st.st_nlink <= 2:
+            self._known_bytes += new_st.st_size
+
+    def _is_over_limit(self, total_bytes: int, entries: int) -> bool:
+        if total_bytes < 0 or entries < 0:
+            return True
+        if self._max_bytes > 0 and total_bytes > self._max_bytes:
+            return True
+        return self._max_entries > 0 and entries > self._max_entries
+
+    def _scan(self) -> List[Tuple[float, float, str, Tuple[int, int], int]]:
+        # (atime, mtime, path, inode key, size) of each cache file.
+        result = []
+        with os.scandir(self._cache_path) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                atime, mtime = self._get_times(Path(entry.path), st)
+                result.append((atime, mtime, entry.path, (st.st_dev, st.st_ino), st.st_size))
+        return result
+
+    def _remove_orphans(self) -> None:
+        # called with the lock held, any temporary file left is from a writer that did not finish.
+        with os.scandir(self._cache_path) as it:
+            for entry in it:
+                if entry.name.startswith(_TMP_PREFIX):
+                    with contextlib.suppress(OSError):
+                        os.remove(entry.path)
+        meta_dir = self._cache_path / _META_DIR
+        if meta_dir.exists():
+            with os.scandir(meta_dir) as it:
+                for entry in it:
+                    if not os.path.exists(self._cache_path / entry.name):
+                        with contextlib.suppress(OSError):
+                            os.remove(entry.path)
+        blob_dir = self._cache_path / _BLOB_DIR
+        if not blob_dir.exists():
+            return
+        with os.scandir(blob_dir) as it:
+            for entry in it:
+                with contextlib.suppress(OSError):
+                    if entry.name.startswith(_TMP_PREFIX) or entry.stat().st_nlink <= 1:
+                        os.remove(entry.path)
+
+    # endregion read write
+
+    # region eviction
+    def sweep(self) -> int:
+        """
+        Removes expired files and least recently used files until the cache is within its limits.
+
+        Does nothing if the cache was created without ``tmp_dir``.
+
+        Returns:
+            int: Number of files removed.
+
+        .. versionadded:: 0.48.0
+        """
+        if not self._managed:
+            return 0
+        removed = 0
+        with self._file_lock:
+            now = time.time()
+            files = []
+            refs: Dict[Tuple[int, int], int] = {}
+            sizes: Dict[Tuple[int, int], int] = {}
+            for atime, mtime, path, key, size in self._scan():
+                if self.can_expire and now - mtime >= self.seconds:
+                    with contextlib.suppress(OSError):
+                        os.remove(path)
+                        removed += 1
+                    continue
+                files.append((atime, path, key))
+                refs[key] = refs.get(key, 0) + 1
+                sizes[key] = size
+            total = sum(sizes.values())
+            count = len(files)
+            files.sort()
+            for _, path, key in files:
+                if not self._is_over_limit(total, count):
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                removed += 1
+                count -= 1
+                refs[key] -= 1
+                if refs[key] == 0:
+                    total -= sizes[key]
+            self._remove_orphans()
+            self._known_bytes = total
+            self._known_entries = count
+        if removed:
+            self._count("_evictions", removed)
+        return removed
+
+    def clear(self) -> None:
+        """
+        Removes all cached files.
+
+        Does nothing if the cache was created without ``tmp_dir``.
+
+        .. versionadded:: 0.48.0
+        """
+        if not self._managed:
+            return
+        with self._file_lock:
+            for _, _, path, _, _ in self._scan():
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+            self._remove_orphans()
+            self._known_bytes = 0
+            self._known_entries = 0
+
+    def start_sweeper(self, interval: float) -> None:
+        """
+        Starts a background thread that calls :py:meth:`~.CacheBase.sweep` every ``interval`` seconds.
+
+        Args:
+            interval (float): Seconds between sweeps.
+
+        .. versionadded:: 0.48.0
+        """
+        self.stop_sweeper()
+        stop = threading.Event()
+        self._sweep_stop = stop
+
+        def run() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.sweep()
+                except Exception as e:
+                    self.logger.warning(f"Cache sweep failed: {e}")
+
+        threading.Thread(target=run, name=f"{self.__class__.__name__}_sweeper", daemon=True).start()
+
+    def stop_sweeper(self) -> None:
+        """
+        Stops the background sweep thread if running.
+
+        .. versionadded:: 0.48.0
+        """
+        if self._sweep_stop is not None:
+            self._sweep_stop.set()
+            self._sweep_stop = None
+
+    def reset_stats(self) -> None:
+        """
+        Resets statistics.
+
+        .. versionadded:: 0.48.0
+        """
+        with self._stats_lock:
+            self._hits = 0
+            self._misses = 0
+            self._puts = 0
+            self._dedup = 0
+            self._evictions = 0
+
+    # endregion eviction
+
     # region Dunder Methods
     def __contains__(self, key: Any) -> bool:
         return self.get(key) is not None
@@ -107,6 +499,56 @@ class CacheBase(metaclass=ConstructorSingleton):
         """Gets/Sets cache expiration"""
         return self._lifetime > 0
 
+    @property
+    def max_bytes(self) -> int:
+        """
+        Gets/Sets max total size of cached files. ``0`` for no limit.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._max_bytes = max(int(value), 0)
+
+    @property
+    def max_entries(self) -> int:
+        """
+        Gets/Sets max number of cached files. ``0`` for no limit.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int) -> None:
+        self._max_entries = max(int(value), 0)
+
+    @property
+    def is_limited(self) -> bool:
+        """
+        Gets if the cache has a size or entry limit.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._managed and (self._max_bytes > 0 or self._max_entries > 0)
+
+    @property
+    def stats(self) -> FileCacheStats:
+        """
+        Gets cache statistics of this process.
+
+        .. versionadded:: 0.48.0
+        """
+        return FileCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            puts=self._puts,
+            dedup=self._dedup,
+            evictions=self._evictions,
+        )
+
     @property
     def path(self) -> Path:
         """Gets cache path"""
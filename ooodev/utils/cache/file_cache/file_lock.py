@@ -0,0 +1,109 @@
+"""Advisory inter process file lock."""
+
+from __future__ import annotations
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+    import msvcrt
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file.
+
+    Uses ``flock()`` on POSIX and ``msvcrt.locking()`` on Windows.
+    The lock is reentrant within a process and also serializes threads.
+
+    Example:
+        .. code-block:: python
+
+            lock = FileLock(Path(cache_dir, ".lock"))
+            with lock:
+                ...
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Constructor
+
+        Args:
+            path (str, Path): Lock file. Created if it does not exist.
+        """
+        self._path = Path(path)
+        self._thread_lock = threading.RLock()
+        self._fd = -1
+        self._count = 0
+
+    def _lock_fd(self, fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            return
+        while True:
+            try:
+                # LK_LOCK only retries for about 10 seconds.
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)  # type: ignore
+                return
+            except OSError:
+                time.sleep(0.05)
+
+    def _unlock_fd(self, fd: int) -> None:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)  # type: ignore
+
+    def acquire(self) -> None:
+        """Acquires the lock. Blocks until the lock is available."""
+        self._thread_lock.acquire()
+        if self._count == 0:
+            try:
+                fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o666)
+                try:
+                    self._lock_fd(fd)
+                except Exception:
+                    os.close(fd)
+                    raise
+            except Exception:
+                self._thread_lock.release()
+                raise
+            self._fd = fd
+        self._count += 1
+
+    def release(self) -> None:
+        """Releases the lock."""
+        if self._count <= 0:
+            raise RuntimeError("FileLock is not acquired.")
+        self._count -= 1
+        if self._count == 0:
+            fd = self._fd
+            self._fd = -1
+            try:
+                self._unlock_fd(fd)
+            finally:
+                os.close(fd)
+        self._thread_lock.release()
+
+    def __enter__(self) -> FileLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+    @property
+    def path(self) -> Path:
+        """Gets lock file path"""
+        return self._path
+
+
+__all__ = ("FileLock",)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 from typing import Any
 import pickle
-import time
 from pathlib import Path
 from typing import Union
 from ooodev.utils.cache.file_cache.cache_base import CacheBase
@@ -23,31 +22,12 @@ class PickleCache(CacheBase):
         Returns:
             Union[object, None]: File contents if retrieved; Otherwise, ``None``
         """
-        f = Path(self.path, filename)
-        if not f.exists():
+        data = self._get_bytes(filename)
+        if data is None:
             return None
-        if self.can_expire:
-            f_stat = f.stat()
-            if f_stat.st_size == 0:
-                # should not be zero byte file.
-                try:
-                    self.remove(f)
-                except Exception as e:
-                    self.logger.warning(f"Not able to delete 0 byte file: {filename} error: {e}")
-                return None
-            ti_m = f_stat.st_mtime
-            age = time.time() - ti_m
-            if age >= self.seconds:
-                return None
-
         try:
-            # Open the file in binary mode
-            with open(f, "rb") as file:
-                # Call load method to deserialize
-                content = pickle.load(file)
-            return content
-        except IOError:
-            return None
+            # Call loads method to deserialize
+            return pickle.loads(data)
         except Exception as e:
             self.logger.error(e, exc_info=True)
             raise e
@@ -60,6 +40,4 @@ class PickleCache(CacheBase):
             filename (Union[str, Path]): filename to write.
             content (Any): Contents to write into file.
         """
-        f = Path(self.path, filename)
-        with open(f, "wb") as file:
-            pickle.dump(content, file)
+        self._put_bytes(filename, pickle.dumps(content))
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import time
 from pathlib import Path
 from typing import Union
 from ooodev.utils.cache.file_cache.cache_base import CacheBase
@@ -23,32 +22,12 @@ class TextCache(CacheBase):
         """
         if self.seconds <= 0:
             return None
-        f = Path(self.path, filename)
-        if not f.exists():
+        data = self._get_bytes(filename)
+        if data is None:
             return None
-
-        if self.can_expire:
-            f_stat = f.stat()
-            if f_stat.st_size == 0:
-                # should not be zero byte file.
-                try:
-                    self.remove(f)
-                except Exception as e:
-                    self.logger.warning(f"Not able to delete 0 byte file: {filename}, error: {e}")
-                return None
-            ti_m = f_stat.st_mtime
-            age = time.time() - ti_m
-            if age >= self.seconds:
-                return None
-
         try:
-            # Check if we have this file locally
-
-            with open(f) as fin:
-                content = fin.read()
-            # If we have it, let's send it
-            return content
-        except IOError:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
             return None
 
     def put(self, filename: Union[str, Path], content: str):
@@ -59,7 +38,4 @@ class TextCache(CacheBase):
             filename (Union[str, Path]): filename to write.
             content (str): Contents to write into file.
         """
-        f = Path(self.path, filename)
-        # print('Saving a copy of {} in the cache'.format(filename))
-        with open(f, "w") as cached_file:
-            cached_file.write(content)
+        self._put_bytes(filename, content.encode("utf-8"))
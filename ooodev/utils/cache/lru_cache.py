@@ -1,49 +1,125 @@
 from __future__ import annotations
 from collections import OrderedDict
-from typing import Any
+import sys
+import threading
+from typing import Any, Callable, Dict
+
+from ooodev.utils.cache.cache_stats import CacheStats
+
+_MISSING = object()
 
 
 class LRUCache:
     """
     Least Recently Used (LRU) Cache
+
+    All methods are thread safe.
+
+    .. versionchanged:: 0.48.0
+        Cache is now thread safe, can optionally store ``None`` values, can be bound by size in bytes and has
+        statistics.
     """
 
     # region Initialization
-    def __init__(self, capacity: int):
+    def __init__(
+        self,
+        capacity: int,
+        *,
+        allow_none: bool = False,
+        max_bytes: int = 0,
+        sizeof: Callable[[Any], int] | None = None,
+        on_evict: Callable[[Any, Any], None] | None = None,
+    ):
         """
         Least Recently Used (LRU) Cache
 
         Args:
             capacity (int): Cache capacity.
+            allow_none (bool, optional): Allow ``None`` values to be stored. Defaults to ``False``.
+                Use ``get(key, default)`` to tell a stored ``None`` from a missing key.
+            max_bytes (int, optional): Max total size of values in bytes. ``0`` for no limit. Defaults to ``0``.
+            sizeof (Callable[[Any], int], optional): Gets the size of a value in bytes.
+                Defaults to ``sys.getsizeof``. Only used when ``max_bytes`` is set.
+            on_evict (Callable[[Any, Any], None], optional): Called with key and value of each item removed to stay
+                within capacity or size limits. It is called while the cache lock is held.
+
+        .. versionchanged:: 0.48.0
+            Added ``allow_none``, ``max_bytes``, ``sizeof`` and ``on_evict`` arguments.
         """
         self._cache = OrderedDict()
         self._capacity = max(capacity, 0)
+        self._lock = threading.Lock()
+        self._allow_none = allow_none
+        self._max_bytes = max(max_bytes, 0)
+        self._sizeof = sys.getsizeof if sizeof is None else sizeof
+        self._on_evict = on_evict
+        self._sizes: Dict[Any, int] = {}
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
 
     # endregion Initialization
 
+    # region internal
+    def _discard(self, key: Any) -> None:
+        # lock must be held
+        del self._cache[key]
+        if self._max_bytes:
+            self._size_bytes -= self._sizes.pop(key, 0)
+
+    def _evict(self) -> None:
+        # lock must be held
+        cache = self._cache
+        while cache and (len(cache) > self._capacity or (self._max_bytes and self._size_bytes > self._max_bytes)):
+            key, value = cache.popitem(last=False)
+            if self._max_bytes:
+                self._size_bytes -= self._sizes.pop(key, 0)
+            self._evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key, value)
+
+    # endregion internal
+
     # region Dictionary Methods
 
     def clear(self) -> None:
         """
         Clear cache.
         """
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._sizes.clear()
+            self._size_bytes = 0
 
-    def get(self, key: Any) -> Any:
+    def get(self, key: Any, default: Any = None) -> Any:
         """
         Get value by key.
 
         Args:
             key (Any): Any Hashable object.
+            default (Any, optional): Value returned if the key is not found. Defaults to ``None``.
 
         Returns:
-            Any: Value or ``None`` if not found.
+            Any: Value or ``default`` if not found.
 
         Note:
             The ``get`` method is an alias for the ``__getitem__`` method.
             So you can use ``cache_inst.get(key)`` or ``cache_inst[key]`` interchangeably.
+
+        .. versionchanged:: 0.48.0
+            Added ``default`` argument.
         """
-        return self[key]
+        if key is None:
+            raise TypeError("Key must not be None.")
+        with self._lock:
+            value = self._cache.get(key, _MISSING)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return value
 
     def put(self, key: Any, value: Any) -> None:
         """
@@ -72,28 +148,37 @@ class LRUCache:
         """
         del self[key]
 
+    def reset_stats(self) -> None:
+        """
+        Resets statistics.
+
+        .. versionadded:: 0.48.0
+        """
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
     # endregion Dictionary Methods
 
     # region Dunder Methods
 
     def __getitem__(self, key: Any) -> Any:
-        if key is None:
-            raise TypeError("Key must not be None.")
-        if self._capacity <= 0:
-            return None
-        if key not in self._cache:
-            return None
-        self._cache.move_to_end(key)
-        return self._cache[key]
+        return self.get(key)
 
     def __setitem__(self, key: Any, value: Any) -> None:
-        if key is None or value is None:
+        if key is None or (value is None and not self._allow_none):
             raise TypeError("Key and value must not be None.")
         if self._capacity <= 0:
             return
-        self._cache[key] = value
-        if len(self._cache) > self._capacity:
-            self._cache.popitem(last=False)
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            if self._max_bytes:
+                size = self._sizeof(value)
+                self._size_bytes += size - self._sizes.get(key, 0)
+                self._sizes[key] = size
+            self._evict()
 
     def __contains__(self, key: Any) -> bool:
         return False if key is None else key in self._cache
@@ -101,8 +186,9 @@ class LRUCache:
     def __delitem__(self, key: Any) -> None:
         if key is None:
             raise TypeError("Key must not be None.")
-        if key in self._cache:
-            del self._cache[key]
+        with self._lock:
+            if key in self._cache:
+                self._discard(key)
 
     def __repr__(self) -> str:
         return f"LRUCache({self._capacity})"
@@ -137,12 +223,52 @@ class LRUCache:
         Args:
             value (int): Cache capacity.
         """
-        self._capacity = value
-        self._capacity = max(self._capacity, 0)
+        self._capacity = max(value, 0)
         if self._capacity == 0:
             self.clear()
             return
-        while len(self._cache) > self._capacity:
-            self._cache.popitem(last=False)
+        with self._lock:
+            self._evict()
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        Gets/Sets max total size of values in bytes. ``0`` for no limit.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            value = max(value, 0)
+            if value and not self._max_bytes:
+                # sizes are only tracked while there is a limit.
+                self._sizes = {key: self._sizeof(val) for key, val in self._cache.items()}
+                self._size_bytes = sum(self._sizes.values())
+            elif not value:
+                self._sizes.clear()
+                self._size_bytes = 0
+            self._max_bytes = value
+            self._evict()
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Gets the total size of values in bytes. Always ``0`` when ``max_bytes`` is not set.
+
+        .. versionadded:: 0.48.0
+        """
+        return self._size_bytes
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Gets cache statistics.
+
+        .. versionadded:: 0.48.0
+        """
+        return CacheStats(hits=self._hits, misses=self._misses, evictions=self._evictions)
 
     # endregion Properties
@@ -1,11 +1,14 @@
 from __future__ import annotations
+import heapq
+import itertools
 import threading
-from typing import Any
-from datetime import datetime, timedelta, timezone
+import time
+from typing import Any, List, Tuple
 from ooodev.events.args.cancel_event_args import CancelEventArgs
 from ooodev.events.args.event_args import EventArgs
 from ooodev.utils.helper.dot_dict import DotDict
 from ooodev.events.partial.events_partial import EventsPartial
+from ooodev.utils.cache.expiry_scheduler import ExpiryScheduler
 
 
 class TimeCache(EventsPartial):
@@ -20,6 +23,10 @@ class TimeCache(EventsPartial):
     When an item expires, the event ``cache_items_expired`` is triggered.
     This event is called on a separate thread. for this reason it is important to make sure that the event handler is thread safe.
 
+    Cleanup of all instances is driven by a single process wide :py:class:`~ooodev.utils.cache.expiry_scheduler.ExpiryScheduler`
+    thread. Expired items are found using a heap of deadlines and are reported in one ``cache_items_expired`` event per cleanup.
+    An instance is only registered with the scheduler while it holds items.
+
     Example:
 
         .. code-block:: python
@@ -49,26 +56,92 @@ class TimeCache(EventsPartial):
             seconds (float): Cache expiration time in seconds.
             cleanup_interval (float, optional): Cache cleanup interval in seconds.
                 If set to ``0`` then the cleanup is disabled. Defaults to ``60.0``.
+
+        .. versionchanged:: 0.48.0
+            Cleanup uses the shared expiry scheduler instead of a timer thread per instance.
         """
         EventsPartial.__init__(self)
-        self._lock = threading.Lock()
-        self._delta = timedelta(seconds=max(seconds, 0))
-        self._seconds = self._delta.total_seconds()
+        self._lock = threading.RLock()
+        self._seconds = float(max(seconds, 0))
         self._timeout = max(cleanup_interval, 0)
-        self._expiration_time = datetime.now(timezone.utc) + self._delta
+        # key -> [value, last access time, sequence]
         self._cache = {}
-        self._timer = None
-        self._fn_clear_expired = self.clear_expired
-        self._fn_trigger_event = self.trigger_event
+        # (deadline, sequence, key). An entry is stale when the sequence of the key has changed.
+        self._heap: List[Tuple[float, int, Any]] = []
+        self._seq = itertools.count()
+        self._scheduler = ExpiryScheduler.get_instance()
+        self._timer_active = False
+        self._scheduled = False
         self.start_timer()
 
+    # region internal
+    def _schedule(self, now: float) -> None:
+        # lock must be held
+        if self._timer_active and self._heap and not self._scheduled:
+            self._scheduled = True
+            self._scheduler.schedule(self, max(self._heap[0][0], now + self._timeout))
+
+    def _expire(self, now: float) -> List[Any]:
+        # lock must be held. Pops due deadlines, items accessed since are pushed back with their new deadline.
+        heap = self._heap
+        cache = self._cache
+        seconds = self._seconds
+        keys = []
+        while heap and heap[0][0] <= now:
+            _, seq, key = heapq.heappop(heap)
+            item = cache.get(key, None)
+            if item is None or item[2] != seq:
+                continue
+            deadline = item[1] + seconds
+            if deadline <= now:
+                del cache[key]
+                keys.append(key)
+            else:
+                heapq.heappush(heap, (deadline, seq, key))
+        return keys
+
+    def _compact(self) -> None:
+        # lock must be held. Drops stale heap entries left by removed keys.
+        if len(self._heap) > 2 * len(self._cache) + 64:
+            seconds = self._seconds
+            self._heap = [(ts + seconds, seq, key) for key, (_, ts, seq) in self._cache.items()]
+            heapq.heapify(self._heap)
+
+    def _trigger_expired(self, keys: List[Any]) -> None:
+        eargs = EventArgs(self)
+        eargs.event_data = DotDict(keys=keys)
+        self.trigger_event("cache_items_expired", eargs)
+
+    def on_expiry_due(self) -> float:
+        """
+        Called by the expiry scheduler. Not intended to be called directly.
+
+        Returns:
+            float: Next cleanup deadline or ``0`` if there is nothing to clean up.
+
+        .. versionadded:: 0.48.0
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._scheduled = False
+            keys = self._expire(now)
+        if keys:
+            self._trigger_expired(keys)
+        with self._lock:
+            if self._timer_active and self._heap and not self._scheduled:
+                self._scheduled = True
+                return max(self._heap[0][0], now + self._timeout)
+        return 0.0
+
+    # endregion internal
+
     def clear(self) -> None:
         """
         Clear cache.
         """
-        self.stop_timer()
-        self._cache.clear()
-        self.stop_timer()
+        with self._lock:
+            self._cache.clear()
+            self._heap.clear()
 
     def get(self, key: Any) -> Any:
         """
@@ -124,13 +197,18 @@ class TimeCache(EventsPartial):
 
         Note:
             Triggers the event ``time_cache_timer_started``.
+            The event data ``timer`` and ``scheduler`` are the shared
+            :py:class:`~ooodev.utils.cache.expiry_scheduler.ExpiryScheduler`.
+
+        .. versionchanged:: 0.48.0
+            Registers with the shared expiry scheduler.
         """
-        if self.seconds > 0 and self._timeout > 0 and self._timer is None:
-            self._timer = threading.Timer(self._timeout, self._fn_clear_expired)
-            self._timer.daemon = True  # important for the timer to stop when the main thread exits
-            self._timer.start()
+        if self.seconds > 0 and self._timeout > 0 and not self._timer_active:
+            with self._lock:
+                self._timer_active = True
+                self._schedule(time.monotonic())
             eargs = EventArgs(self)
-            eargs.event_data = DotDict(timer=self._timer)
+            eargs.event_data = DotDict(timer=self._scheduler, scheduler=self._scheduler)
             self.trigger_event("time_cache_timer_started", eargs)
             return True
         return False
@@ -147,9 +225,11 @@ class TimeCache(EventsPartial):
         Note:
             Triggers the event ``time_cache_timer_stopped``.
         """
-        if self._timer is not None:
-            self._timer.cancel()
-            self._timer = None
+        if self._timer_active:
+            with self._lock:
+                self._timer_active = False
+                self._scheduled = False
+                self._scheduler.cancel(self)
             eargs = EventArgs(self)
             self.trigger_event("time_cache_timer_stopped", eargs)
             return True
@@ -160,47 +240,31 @@ class TimeCache(EventsPartial):
         Clear expired items from the cache.
 
         Note:
-            Triggers the event ``cache_items_expired``, on a new thread.
+            Triggers the event ``cache_items_expired``.
 
             The event args ``event_data`` is a ``DotDict`` instance that contains the ``keys`` as a list of the items that were removed.
         """
-
-        self.stop_timer()
+        now = time.monotonic()
         with self._lock:
-            if not self._cache:
-                self.start_timer()
-                return
-
-            seconds = self.seconds
-            del_keys = [
-                key
-                for key, (_, timestamp) in self._cache.items()
-                if (datetime.now(timezone.utc) - timestamp).total_seconds() >= seconds
-            ]
-            for key in del_keys:
-                del self._cache[key]
-        if del_keys:
-            eargs = EventArgs(self)
-            eargs.event_data = DotDict(keys=del_keys)
-
-            thread = threading.Thread(target=self._fn_trigger_event, args=("cache_items_expired", eargs), daemon=True)
-            thread.start()
-            thread.join()  # wait for the thread to finish before starting timer again.
-        self.start_timer()
+            keys = self._expire(now)
+        if keys:
+            self._trigger_expired(keys)
 
     # region Dunder Methods
     def __getitem__(self, key: Any) -> Any:
         if key is None:
             raise TypeError("Key must not be None.")
-        if key in self._cache:
-            value, timestamp = self._cache[key]
-            now_dt = datetime.now(timezone.utc)
-            if (now_dt - timestamp).total_seconds() < self.seconds:
-                # update timestamp
-                self._cache[key] = (value, now_dt)
-                return value
-            else:
-                del self._cache[key]  # remove expired item
+        with self._lock:
+            item = self._cache.get(key, None)
+            if item is None:
+                return None
+            now = time.monotonic()
+            if now - item[1] < self._seconds:
+                # update timestamp, the heap entry is moved when its old deadline is reached.
+                item[1] = now
+                return item[0]
+            del self._cache[key]  # remove expired item
+            self._compact()
         return None
 
     def __setitem__(self, key: Any, value: Any) -> None:
@@ -246,7 +310,17 @@ class TimeCache(EventsPartial):
             if cargs.cancel:
                 return
             eargs = EventArgs.from_args(cargs)
-        self._cache[key] = (value, datetime.now(timezone.utc))
+        with self._lock:
+            now = time.monotonic()
+            item = self._cache.get(key, None)
+            if item is None:
+                seq = next(self._seq)
+                self._cache[key] = [value, now, seq]
+                heapq.heappush(self._heap, (now + self._seconds, seq, key))
+                self._schedule(now)
+            else:
+                item[0] = value
+                item[1] = now
 
         if is_new:
             self.trigger_event("cache_item_added", eargs)
@@ -283,7 +357,9 @@ class TimeCache(EventsPartial):
             self.trigger_event("cache_item_removing", cargs)
             if cargs.cancel:
                 return
-            del self._cache[key]
+            with self._lock:
+                self._cache.pop(key, None)
+                self._compact()
             eargs = EventArgs.from_args(cargs)
             self.trigger_event("cache_item_removed", eargs)
 
@@ -296,10 +372,6 @@ class TimeCache(EventsPartial):
     def __len__(self) -> int:
         return len(self._cache)
 
-    def __del__(self):
-        # not reliable but better than nothing
-        self.stop_timer()
-
     # endregion Dunder Methods
 
     # region Properties
@@ -312,9 +384,15 @@ class TimeCache(EventsPartial):
 
     @seconds.setter
     def seconds(self, value: float) -> None:
-        self._delta = timedelta(seconds=value)
-        self._seconds = self._delta.total_seconds()
-        self._expiration_time = datetime.now(timezone.utc) + self._delta
+        with self._lock:
+            self._seconds = float(value)
+            # deadlines depend on seconds
+            self._heap = [(ts + self._seconds, seq, key) for key, (_, ts, seq) in self._cache.items()]
+            heapq.heapify(self._heap)
+            if self._scheduled:
+                self._scheduled = False
+                self._scheduler.cancel(self)
+            self._schedule(time.monotonic())
         self.clear_expired()
 
     @property
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable
 import threading
+from ooodev.utils.cache.cache_stats import CacheStats
 from ooodev.utils.cache.lru_cache import LRUCache
 from ooodev.utils.cache.time_cache import TimeCache
 from ooodev.events.args.event_args import EventArgs
@@ -11,19 +12,48 @@ class TLRUCache:
     Time and Least Recently Used (LRU) Cache.
 
     When time expires, the item is removed from the cache automatically.
+
+    All methods are thread safe.
+
+    .. versionchanged:: 0.48.0
+        Cache is now thread safe, can optionally store ``None`` values, can be bound by size in bytes and has
+        statistics.
     """
 
-    def __init__(self, capacity: int, seconds: float):
+    def __init__(
+        self,
+        capacity: int,
+        seconds: float,
+        *,
+        allow_none: bool = False,
+        max_bytes: int = 0,
+        sizeof: Callable[[Any], int] | None = None,
+    ):
         """
         Time and Least Recently Used (LRU) Cache.
 
         Args:
             capacity (int): Cache capacity.
             seconds (float): Time in seconds before item expires.
+            allow_none (bool, optional): Allow ``None`` values to be stored. Defaults to ``False``.
+                Use ``get(key, default)`` to tell a stored ``None`` from a missing key.
+            max_bytes (int, optional): Max total size of values in bytes. ``0`` for no limit. Defaults to ``0``.
+            sizeof (Callable[[Any], int], optional): Gets the size of a value in bytes.
+                Defaults to ``sys.getsizeof``. Only used when ``max_bytes`` is set.
+
+        .. versionchanged:: 0.48.0
+            Added ``allow_none``, ``max_bytes`` and ``sizeof`` arguments.
         """
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()
         self._fn_on_ttl_expired = self._on_ttl_expired
-        self._lru_cache = LRUCache(capacity)
+        self._allow_none = allow_none
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        # values are kept in the LRU cache, the time cache only tracks the time of each key.
+        self._lru_cache = LRUCache(
+            capacity, allow_none=True, max_bytes=max_bytes, sizeof=sizeof, on_evict=self._on_lru_evict
+        )
         self._seconds = seconds
 
         self._ttl_cache = TimeCache(seconds, self._get_ttl_seconds())
@@ -41,29 +71,57 @@ class TLRUCache:
             for key in keys:
                 if key in self._lru_cache:
                     del self._lru_cache[key]
+                    self._expired += 1
+
+    def _on_lru_evict(self, key: Any, value: Any) -> None:
+        # called by the LRU cache, with the lock held, when it drops a key to stay within its limits.
+        self._ttl_cache.remove(key)
 
     def clear(self):
         """
         Clear cache.
         """
-        self._lru_cache.clear()
-        self._ttl_cache.clear()
+        with self._lock:
+            self._lru_cache.clear()
+            self._ttl_cache.clear()
 
-    def get(self, key: Any):
+    def get(self, key: Any, default: Any = None):
         """
         Get value by key.
 
         Args:
             key (Any): Any Hashable object.
+            default (Any, optional): Value returned if the key is not found or has expired. Defaults to ``None``.
 
         Returns:
-            Any: Value or ``None`` if not found.
+            Any: Value or ``default`` if not found.
 
         Note:
             The ``get`` method is an alias for the ``__getitem__`` method.
             So you can use ``cache_inst.get(key)`` or ``cache_inst[key]`` interchangeably.
+
+        .. versionchanged:: 0.48.0
+            Added ``default`` argument.
         """
-        return self[key]
+        if key is None:
+            raise TypeError("Key cannot be None.")
+        with self._lock:
+            # moves the key to the most recently used position when found.
+            value = self._lru_cache.get(key, self._dummy)
+            if value is self._dummy:
+                if key in self._ttl_cache:
+                    # Key must be valid in both caches
+                    del self._ttl_cache[key]
+                self._misses += 1
+                return default
+            if self._ttl_cache[key] is None:
+                # expired
+                del self._lru_cache[key]
+                self._expired += 1
+                self._misses += 1
+                return default
+            self._hits += 1
+            return value
 
     def put(self, key: Any, value: Any) -> None:
         """
@@ -99,39 +157,44 @@ class TLRUCache:
         # this will trigger event to clear from LRU cache if needed.
         self._ttl_cache.clear_expired()
 
+    def reset_stats(self) -> None:
+        """
+        Resets statistics.
+
+        .. versionadded:: 0.48.0
+        """
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._expired = 0
+            self._lru_cache.reset_stats()
+
     # region Dunder Methods
     def __getitem__(self, key: Any) -> Any:
-        if key is None:
-            raise TypeError("Key cannot be None.")
-        if key not in self._lru_cache:
-            if key in self._ttl_cache:
-                # Key must be valid in both caches
-                del self._ttl_cache[key]
-            return None
-        if key not in self._ttl_cache:
-            del self._lru_cache[key]
-            return None
-        value = self._ttl_cache[key]
-        # update LRU to keep it fresh
-        self._lru_cache[key] = self._dummy
-        return value
+        return self.get(key)
 
     def __setitem__(self, key: Any, value: Any) -> None:
-        if key is None or value is None:
+        if key is None or (value is None and not self._allow_none):
             raise TypeError("Key and value cannot be None.")
-        self._lru_cache[key] = self._dummy
-        self._ttl_cache[key] = value
+        with self._lock:
+            self._lru_cache[key] = value
+            if key in self._lru_cache:
+                self._ttl_cache[key] = self._dummy
 
     def __contains__(self, key: Any) -> bool:
-        return False if key is None else self[key] is not None
+        if key is None:
+            return False
+        with self._lock:
+            return key in self._lru_cache and self._ttl_cache[key] is not None
 
     def __delitem__(self, key: Any) -> None:
         if key is None:
             raise TypeError("Key must not be None.")
-        if key in self._ttl_cache:
-            del self._ttl_cache[key]
-        if key in self._lru_cache:
-            del self._lru_cache[key]
+        with self._lock:
+            if key in self._ttl_cache:
+                del self._ttl_cache[key]
+            if key in self._lru_cache:
+                del self._lru_cache[key]
 
     def __repr__(self) -> str:
         return f"TLRUCache({self._lru_cache.capacity}, {self._ttl_cache.seconds})"
@@ -143,3 +206,17 @@ class TLRUCache:
         return len(self._lru_cache)
 
     # endregion Dunder Methods
+
+    # region Properties
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Gets cache statistics.
+
+        .. versionadded:: 0.48.0
+        """
+        return CacheStats(
+            hits=self._hits, misses=self._misses, evictions=self._lru_cache.stats.evictions, expired=self._expired
+        )
+
+    # endregion Properties
@@ -1,4 +1,5 @@
 from .lo_context import LoContext as LoContext
 from .dispatch_context import DispatchContext as DispatchContext
+from .sheet_index_context import SheetIndexContext as SheetIndexContext
 
-__all__ = ["LoContext", "DispatchContext"]
+__all__ = ["LoContext", "DispatchContext", "SheetIndexContext"]
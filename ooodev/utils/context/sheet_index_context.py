@@ -0,0 +1,64 @@
+from __future__ import annotations
+from contextvars import ContextVar, Token
+from typing import Any, Optional
+
+_SHEET_INDEX: ContextVar[Optional[int]] = ContextVar("ooodev_sheet_index", default=None)
+
+
+class SheetIndexContext:
+    """
+    SheetIndexContext is a context manager that sets the current sheet index for cell and range objects.
+
+    While active, a :py:class:`~ooodev.utils.data_type.cell_obj.CellObj` or
+    :py:class:`~ooodev.utils.data_type.range_obj.RangeObj` that is created with a sheet index of ``-1``
+    uses the context sheet index instead of asking office for the active sheet.
+
+    The context is scoped with ``contextvars`` so it is safe to use with threads and ``asyncio``.
+
+    Example:
+        .. code-block:: python
+
+            from ooodev.utils.context import SheetIndexContext
+
+            with SheetIndexContext(sheet):
+                rng = RangeObj.from_range("A1:Z5000")
+                for cell in rng:
+                    ...
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(self, sheet: Any) -> None:
+        """
+        Constructor for SheetIndexContext
+
+        Args:
+            sheet (int, CalcSheet): Zero-based sheet index or an object that has a ``sheet_index`` property such as ``CalcSheet``.
+        """
+        if isinstance(sheet, int):
+            self._idx = sheet
+        else:
+            self._idx = int(sheet.sheet_index)
+        self._token: Token | None = None
+
+    def __enter__(self) -> int:
+        self._token = _SHEET_INDEX.set(self._idx)
+        return self._idx
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._token is not None:
+            _SHEET_INDEX.reset(self._token)
+            self._token = None
+        return None
+
+
+def get_context_sheet_index() -> int | None:
+    """
+    Gets the sheet index of the current :py:class:`SheetIndexContext`.
+
+    Returns:
+        int | None: Sheet index if a context is active; Otherwise, ``None``.
+
+    .. versionadded:: 0.48.0
+    """
+    return _SHEET_INDEX.get()
@@ -1,13 +1,14 @@
 from __future__ import annotations
 import contextlib
-from typing import cast, overload, TYPE_CHECKING
-from dataclasses import dataclass, field
+from typing import Any, cast, overload, TYPE_CHECKING
+from dataclasses import FrozenInstanceError
 from weakref import ref
 import uno
 from ooo.dyn.table.cell_address import CellAddress
 
 from ooodev.loader import lo as mLo
 from ooodev.utils import table_helper as mTb
+from ooodev.utils.context.sheet_index_context import get_context_sheet_index
 from ooodev.utils.validation import check
 from ooodev.loader.inst.doc_type import DocType
 
@@ -15,56 +16,81 @@ if TYPE_CHECKING:
     from ooodev.calc.calc_doc import CalcDoc
 
 
-@dataclass(frozen=True)
+def _get_active_sheet_index() -> int:
+    # returns -1 if there is no active spreadsheet.
+    with contextlib.suppress(Exception):
+        # pylint: disable=no-member
+        if mLo.Lo.is_loaded and mLo.Lo.current_doc.DOC_TYPE == DocType.CALC:
+            doc = cast("CalcDoc", mLo.Lo.current_doc)
+            sheet = doc.get_active_sheet()
+            return sheet.get_sheet_index()
+    return -1
+
+
 class CellObj:
     """
     Cell Parts
 
+    Instances are immutable.
+
     .. seealso::
         - :ref:`ooodev.utils.data_type.cell_obj.CellObj`
 
     .. versionchanged:: 0.32.0
         If index is set to ``-2`` then no attempt is made to get index from spreadsheet.
 
+    .. versionchanged:: 0.48.0
+        Sheet index of ``-1`` is no longer resolved on construction.
+        It is taken from the active :py:class:`~ooodev.utils.context.SheetIndexContext` if there is one;
+        Otherwise, it is resolved from the active spreadsheet the first time ``sheet_idx`` is read.
+        Instances use ``__slots__``.
+        Hash no longer includes the sheet index.
+
     .. versionadded:: 0.8.2
     """
 
+    __slots__ = {
+        "col": "Column such as ``A``",
+        "row": "One based row such as ``125``",
+        "range_obj": "Range Object that instance is part of",
+        "_sheet_idx": None,
+        "_sheet_resolved": None,
+        "_col_info": None,
+        "_row_info": None,
+        "_cell_right": None,
+        "_cell_left": None,
+        "_cell_down": None,
+        "_cell_up": None,
+        "__weakref__": None,
+    }
+
     # region init
 
-    col: str
-    """Column such as ``A``"""
-    row: int
-    """One based row such as ``125``"""
-    sheet_idx: int = -1
-    """
-    Sheet index that this cell value belongs to.
-    If value is ``-1`` then the active spreadsheet, if available, is used to get the sheet index.
-    If the value is ``-2`` then no sheet index is applied.
-    """
-    range_obj: mRngObj.RangeObj | None = field(repr=False, hash=False, default=None)
-    """Range Object that instance is part of"""
+    def __init__(self, col: str, row: int, sheet_idx: int = -1, range_obj: mRngObj.RangeObj | None = None) -> None:
+        """
+        Constructor
 
-    def __post_init__(self):
-        object.__setattr__(self, "col", self.col.upper())
+        Args:
+            col (str): Column such as ``A``.
+            row (int): One based row such as ``125``.
+            sheet_idx (int, optional): Sheet index that this cell value belongs to. Default ``-1``.
+            range_obj (RangeObj, optional): Range Object that instance is part of. Default ``None``.
+        """
+        object.__setattr__(self, "col", col.upper())
+        object.__setattr__(self, "row", row)
+        object.__setattr__(self, "range_obj", range_obj)
         try:
             # convert col to index for the purpose of validation
             _ = mTb.TableHelper.col_name_to_int(name=self.col)
         except ValueError as e:
             raise AssertionError from e
         check(self.row >= 1, f"{self}", f"Expected a row of 1 or greater. Got: {self.row}")
-        if self.sheet_idx == -1:
-            # do not use the commented out code below!!! It will cause recursion error.
-            # if self.range_obj:
-            #     if self.range_obj.sheet_idx >= 0:
-            #         object.__setattr__(self, "sheet_idx", self.range_obj.sheet_idx)
-            # else:
-            with contextlib.suppress(Exception):
-                # pylint: disable=no-member
-                if mLo.Lo.is_loaded and mLo.Lo.current_doc.DOC_TYPE == DocType.CALC:
-                    doc = cast("CalcDoc", mLo.Lo.current_doc)
-                    sheet = doc.get_active_sheet()
-                    idx = sheet.get_sheet_index()
-                    object.__setattr__(self, "sheet_idx", idx)
+        if sheet_idx == -1:
+            # do not look at range_obj here. It will cause recursion error.
+            ctx_idx = get_context_sheet_index()
+            if ctx_idx is not None:
+                sheet_idx = ctx_idx
+        object.__setattr__(self, "sheet_idx", sheet_idx)
 
     # endregion init
 
@@ -85,18 +111,11 @@ class CellObj:
         .. versionadded:: 0.32.0
         """
         if idx is None:
-            try:
-                # pylint: disable=no-member
-                if mLo.Lo.is_loaded and mLo.Lo.current_doc.DOC_TYPE == DocType.CALC:
-                    doc = cast("CalcDoc", mLo.Lo.current_doc)
-                    sheet = doc.get_active_sheet()
-                    idx = sheet.get_sheet_index()
-                    object.__setattr__(self, "sheet_idx", idx)
-            except Exception:
-                object.__setattr__(self, "sheet_idx", -1)
+            object.__setattr__(self, "sheet_idx", _get_active_sheet_index())
+            object.__setattr__(self, "_sheet_resolved", True)
             return self
 
-        if idx != self.sheet_idx:
+        if idx != self._sheet_idx:
             object.__setattr__(self, "sheet_idx", idx)
         return self
 
@@ -219,6 +238,26 @@ class CellObj:
 
     # region dunder methods
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __getstate__(self) -> tuple:
+        # cached weak references are not part of the state.
+        return (self.col, self.row, self._sheet_idx, self.range_obj)
+
+    def __setstate__(self, state: tuple) -> None:
+        col, row, sheet_idx, range_obj = state
+        object.__setattr__(self, "col", col)
+        object.__setattr__(self, "row", row)
+        object.__setattr__(self, "range_obj", range_obj)
+        object.__setattr__(self, "sheet_idx", sheet_idx)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(col={self.col!r}, row={self.row!r}, sheet_idx={self.sheet_idx!r})"
+
     def __copy__(self) -> CellObj:
         if self.range_obj is None:
             return CellObj(col=self.col, row=self.row, sheet_idx=self.sheet_idx, range_obj=None)
@@ -230,7 +269,11 @@ class CellObj:
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, CellObj):
-            return self.sheet_idx == other.sheet_idx and self.col == other.col and self.row == other.row
+            if self.col != other.col or self.row != other.row:
+                return False
+            # pylint: disable=protected-access
+            # an unresolved sheet index is only looked up when the stored values differ.
+            return self._sheet_idx == other._sheet_idx or self.sheet_idx == other.sheet_idx
         return str(self) == other.upper() if isinstance(other, str) else False
 
     def __lt__(self, other: object) -> bool:
@@ -397,12 +440,43 @@ class CellObj:
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash((self.sheet_idx, self.row, self.col))
+        # sheet index is left out, it may not be resolved yet and the hash must not change.
+        return hash((self.row, self.col))
 
     # endregion dunder methods
 
     # region properties
 
+    def _get_sheet_idx(self) -> int:
+        # pylint: disable=no-member
+        idx = self._sheet_idx
+        if idx == -1 and not self._sheet_resolved:
+            rng = self.range_obj
+            if rng is not None and rng.sheet_idx >= -1:
+                # range looks up its sheet index once for all of its cells.
+                idx = rng.sheet_idx
+            else:
+                idx = _get_active_sheet_index()
+            object.__setattr__(self, "_sheet_idx", idx)
+            object.__setattr__(self, "_sheet_resolved", True)
+        return idx
+
+    def _set_sheet_idx(self, value: int) -> None:
+        object.__setattr__(self, "_sheet_idx", value)
+        object.__setattr__(self, "_sheet_resolved", False)
+
+    sheet_idx = property(
+        _get_sheet_idx,
+        _set_sheet_idx,
+        doc="""
+        Sheet index that this cell value belongs to.
+        If value is ``-1`` then the active spreadsheet, if available, is used to get the sheet index.
+        If the value is ``-2`` then no sheet index is applied.
+
+        A value of ``-1`` is resolved the first time it is read.
+        """,
+    )
+
     @property
     def col_obj(self) -> mCol.ColObj:
         """Gets Column object"""
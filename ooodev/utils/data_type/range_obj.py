@@ -12,10 +12,10 @@ from ooodev.loader import lo as mLo
 from ooodev.events.gbl_named_event import GblNamedEvent
 from ooodev.exceptions import ex as mEx
 from ooodev.utils import table_helper as mTb
+from ooodev.utils.context.sheet_index_context import get_context_sheet_index
 from ooodev.utils.decorator import enforce
 from ooodev.loader.inst.doc_type import DocType
 
-
 if TYPE_CHECKING:
     from com.sun.star.table import CellAddress
     from ooo.dyn.table.cell_range_address import CellRangeAddress
@@ -38,6 +38,12 @@ class RangeObj:
     .. versionchanged:: 0.32.0
         Added support for ``__contains__`` and ``__iter__`` methods. If sheet_idx is set to -2 then no attempt is made to get the sheet index or name from spreadsheet.
 
+    .. versionchanged:: 0.48.0
+        Sheet index of ``-1`` is taken from the active :py:class:`~ooodev.utils.context.SheetIndexContext` if there is one;
+        Otherwise, it is resolved from the active spreadsheet the first time ``sheet_idx`` is read.
+        Cells created by the range use the sheet index of the range.
+        Hash no longer includes the sheet index.
+
     .. versionadded:: 0.8.2
     """
 
@@ -81,23 +87,21 @@ class RangeObj:
             object.__setattr__(self, "col_start", col_start)
             object.__setattr__(self, "col_end", col_end)
 
-        start = mCellObj.CellObj(col=self.col_start, row=self.row_start, range_obj=self)
-        end = mCellObj.CellObj(col=self.col_end, row=self.row_end, range_obj=self)
+        # pylint: disable=no-member
+        if self._sheet_idx == -1:
+            ctx_idx = get_context_sheet_index()
+            if ctx_idx is not None:
+                object.__setattr__(self, "sheet_idx", ctx_idx)
+        if self._sheet_idx < -1:
+            object.__setattr__(self, "_sheet_name", "")
+
+        # cells get an unresolved sheet index from the range when they need it.
+        cell_sheet_idx = self._sheet_idx if self._sheet_idx >= 0 else -1
+        start = mCellObj.CellObj(col=self.col_start, row=self.row_start, sheet_idx=cell_sheet_idx, range_obj=self)
+        end = mCellObj.CellObj(col=self.col_end, row=self.row_end, sheet_idx=cell_sheet_idx, range_obj=self)
 
         object.__setattr__(self, "start", start)
         object.__setattr__(self, "end", end)
-        if self.sheet_idx == -1:
-            with contextlib.suppress(Exception):
-                # pylint: disable=no-member
-                if mLo.Lo.is_loaded and mLo.Lo.current_doc.DOC_TYPE == DocType.CALC:
-                    doc = cast("CalcDoc", mLo.Lo.current_doc)
-                    sheet = doc.get_active_sheet()
-                    idx = sheet.get_sheet_index()
-                    name = sheet.name
-                    object.__setattr__(self, "sheet_idx", idx)
-                    object.__setattr__(self, "_sheet_name", name)
-        if self.sheet_idx < -1:
-            object.__setattr__(self, "_sheet_name", "")
 
     # endregion init
 
@@ -111,14 +115,19 @@ class RangeObj:
         return self.cell_count
 
     def __copy__(self) -> RangeObj:
+        # pylint: disable=no-member
         return RangeObj(
             col_start=self.col_start,
             col_end=self.col_end,
             row_start=self.row_start,
             row_end=self.row_end,
-            sheet_idx=self.sheet_idx,
+            sheet_idx=self._sheet_idx,
         )
 
+    def __hash__(self) -> int:
+        # sheet index is left out, it may not be resolved yet and the hash must not change.
+        return hash((self.col_start, self.col_end, self.row_start, self.row_end))
+
     # region methods
 
     def copy(self) -> RangeObj:
@@ -164,6 +173,7 @@ class RangeObj:
                 object.__setattr__(self, "sheet_idx", -1)
                 if hasattr(self, "_sheet_name"):
                     object.__delattr__(self, "_sheet_name")
+            object.__setattr__(self, "_sheet_resolved", True)
             return self
 
         if idx != self.sheet_idx:
@@ -614,6 +624,7 @@ class RangeObj:
         return mCellObj.CellObj(
             col=parts.col,
             row=parts.row,
+            sheet_idx=self.sheet_idx if self.sheet_idx >= 0 else -1,
             range_obj=self,
         )
 
@@ -867,6 +878,24 @@ class RangeObj:
 
     # region properties
 
+    def _get_sheet_idx(self) -> int:
+        # pylint: disable=no-member
+        idx = self._sheet_idx
+        if idx == -1 and not self._sheet_resolved:
+            object.__setattr__(self, "_sheet_resolved", True)
+            with contextlib.suppress(Exception):
+                if mLo.Lo.is_loaded and mLo.Lo.current_doc.DOC_TYPE == DocType.CALC:
+                    doc = cast("CalcDoc", mLo.Lo.current_doc)
+                    sheet = doc.get_active_sheet()
+                    idx = sheet.get_sheet_index()
+                    object.__setattr__(self, "_sheet_idx", idx)
+                    object.__setattr__(self, "_sheet_name", sheet.name)
+        return idx
+
+    def _set_sheet_idx(self, value: int) -> None:
+        object.__setattr__(self, "_sheet_idx", value)
+        object.__setattr__(self, "_sheet_resolved", False)
+
     @property
     def sheet_name(self) -> str:
         """Gets sheet name"""
@@ -981,6 +1010,19 @@ class RangeObj:
     # endregion properties
 
 
+# a property in the class body would become the default value of the dataclass field.
+RangeObj.sheet_idx = property(  # type: ignore[assignment]
+    RangeObj._get_sheet_idx,  # pylint: disable=protected-access
+    RangeObj._set_sheet_idx,  # pylint: disable=protected-access
+    doc="""
+    Sheet index that this cell value belongs to.
+    If value is ``-1`` then the active spreadsheet, if available, is used to get the sheet index.
+    If the value is ``-2`` then no sheet index is applied and sheet name will always return and empty string.
+
+    A value of ``-1`` is resolved the first time it is read.
+    """,
+)
+
 from ooodev.utils.data_type import row_obj as mRowObj
 from ooodev.utils.data_type import col_obj as mColObj
 from ooodev.utils.data_type import cell_obj as mCellObj
@@ -0,0 +1,209 @@
+"""
+Helpers for exporting many images with a single filter setup.
+
+.. versionadded:: 0.48.0
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Tuple, TYPE_CHECKING
+import uno
+from com.sun.star.io import XSequenceOutputStream
+
+from ooodev.utils import file_io as mFile
+from ooodev.utils import props as mProps
+
+if TYPE_CHECKING:
+    from com.sun.star.beans import PropertyValue
+    from ooodev.loader.inst.lo_inst import LoInst
+    from ooodev.utils.type_var import PathOrStr
+
+_MEDIA_TYPES = {"png": "image/png", "jpg": "image/jpeg"}
+
+
+class BatchExportResult(NamedTuple):
+    """
+    Result of exporting a single item of a batch.
+
+    .. versionadded:: 0.48.0
+    """
+
+    index: int
+    """Index of the item in the batch. For pages exported by a pool this is the page index."""
+    source: Any
+    """Item that was exported such as a page, a shape, a cell range or a page index."""
+    url: str
+    """URL of the image file. Empty when exported into memory."""
+    data: bytes | None
+    """Image data when exported into memory; Otherwise, ``None``."""
+    seconds: float
+    """Number of seconds spent exporting the item."""
+
+
+class ImageExportHelper:
+    """
+    Builds and reuses the filter setup for exporting many images.
+
+    The filter data is built once for each distinct pixel size and the media descriptor is built once for the batch.
+    Only the target, ``URL`` or ``OutputStream``, changes between items.
+
+    .. versionadded:: 0.48.0
+    """
+
+    def __init__(
+        self,
+        filter_name: str,
+        image_type: str,
+        lo_inst: LoInst,
+        *,
+        translucent: bool = False,
+        compression: int = 6,
+        quality: int = 75,
+        color_mode: bool = True,
+        selection_only: bool = False,
+    ) -> None:
+        """
+        Constructor
+
+        Args:
+            filter_name (str): Export filter name such as ``draw_png_Export``.
+            image_type (str): Image type. ``png`` or ``jpg``.
+            lo_inst (LoInst): Lo Instance.
+            translucent (bool, optional): ``png`` only. Transparent background. Defaults to ``False``.
+            compression (int, optional): ``png`` only. Compression ``1`` to ``9``. Defaults to ``6``.
+            quality (int, optional): ``jpg`` only. Quality ``1`` to ``100``. Defaults to ``75``.
+            color_mode (bool, optional): ``jpg`` only. ``True`` for color, ``False`` for grayscale.
+                Defaults to ``True``.
+            selection_only (bool, optional): Adds ``SelectionOnly`` to the media descriptor. Defaults to ``False``.
+
+        Raises:
+            ValueError: If ``image_type`` is not ``png`` or ``jpg``.
+        """
+        image_type = image_type.lower().lstrip(".")
+        if image_type == "jpeg":
+            image_type = "jpg"
+        if image_type not in _MEDIA_TYPES:
+            raise ValueError(f"Unsupported image type: {image_type}. Expected png or jpg.")
+        self._filter_name = filter_name
+        self._image_type = image_type
+        self._lo_inst = lo_inst
+        self._translucent = translucent
+        self._compression = compression
+        self._quality = quality
+        self._color_mode = color_mode
+        self._selection_only = selection_only
+        self._filter_data: Dict[Tuple[int, int], Any] = {}
+
+    def get_filter_data(self, pixel_width: int, pixel_height: int) -> Any:
+        """
+        Gets filter data for an image size. Filter data is cached for each size.
+
+        Args:
+            pixel_width (int): Image width in pixels.
+            pixel_height (int): Image height in pixels.
+
+        Returns:
+            Any: ``uno.Any`` of ``[]com.sun.star.beans.PropertyValue``.
+        """
+        key = (pixel_width, pixel_height)
+        result = self._filter_data.get(key, None)
+        if result is not None:
+            return result
+        make_prop = mProps.Props.make_prop_value
+        if self._image_type == "png":
+            filter_data = [
+                make_prop(name="Interlaced", value=0),
+                make_prop(name="Translucent", value=int(self._translucent)),
+            ]
+            if 0 < self._compression < 10:
+                filter_data.append(make_prop(name="Compression", value=self._compression))
+        else:
+            filter_data = [make_prop(name="ColorMode", value=int(not self._color_mode))]
+            if 0 < self._quality < 101:
+                filter_data.append(make_prop(name="Quality", value=self._quality))
+        if pixel_width > 0 and pixel_height > 0:
+            filter_data.append(make_prop(name="PixelWidth", value=pixel_width))
+            filter_data.append(make_prop(name="PixelHeight", value=pixel_height))
+            filter_data.append(make_prop(name="LogicalHeight", value=pixel_height))
+            filter_data.append(make_prop(name="LogicalWidth", value=pixel_width))
+        result = uno.Any("[]com.sun.star.beans.PropertyValue", tuple(filter_data))  # type: ignore
+        self._filter_data[key] = result
+        return result
+
+    def get_args(self, filter_data: Any, target: str | Any) -> Tuple[PropertyValue, ...]:
+        """
+        Gets the media descriptor for a single item.
+
+        Args:
+            filter_data (Any): Filter data from :py:meth:`get_filter_data`.
+            target (str | XOutputStream): URL of image file or output stream.
+
+        Returns:
+            Tuple[PropertyValue, ...]: Media descriptor.
+        """
+        kwargs: Dict[str, Any] = {
+            "FilterName": self._filter_name,
+            "MediaType": self.media_type,
+            "FilterData": filter_data,
+            "Overwrite": True,
+        }
+        if isinstance(target, str):
+            kwargs["URL"] = target
+        else:
+            kwargs["OutputStream"] = target
+        if self._selection_only:
+            kwargs["SelectionOnly"] = True
+        return mProps.Props.make_props(**kwargs)
+
+    def create_output_stream(self) -> XSequenceOutputStream:
+        """
+        Creates an in-memory output stream.
+
+        Returns:
+            XSequenceOutputStream: Output stream.
+        """
+        return self._lo_inst.create_instance_mcf(
+            XSequenceOutputStream, "com.sun.star.io.SequenceOutputStream", raise_err=True
+        )
+
+    @staticmethod
+    def get_stream_bytes(stream: XSequenceOutputStream) -> bytes:
+        """
+        Gets the bytes written to an in-memory output stream.
+
+        Args:
+            stream (XSequenceOutputStream): Output stream.
+
+        Returns:
+            bytes: Written bytes.
+        """
+        data = stream.getWrittenBytes()
+        return bytes(data.value) if isinstance(data, uno.ByteSequence) else bytes(data)  # type: ignore
+
+    def get_url(self, out_dir: PathOrStr, name_template: str, index: int) -> str:
+        """
+        Gets the URL of an image file.
+
+        Args:
+            out_dir (PathOrStr): Output directory.
+            name_template (str): File name template. ``{index}`` and ``{ext}`` are replaced.
+            index (int): Index of item.
+
+        Returns:
+            str: URL.
+        """
+        fnm = Path(out_dir, name_template.format(index=index, ext=self._image_type))
+        return mFile.FileIO.fnm_to_url(fnm=fnm)
+
+    @property
+    def image_type(self) -> str:
+        """Gets image type. ``png`` or ``jpg``."""
+        return self._image_type
+
+    @property
+    def media_type(self) -> str:
+        """Gets media type such as ``image/png``."""
+        return _MEDIA_TYPES[self._image_type]
+
+
+__all__ = ("BatchExportResult", "ImageExportHelper")
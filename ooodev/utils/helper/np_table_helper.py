@@ -0,0 +1,213 @@
+"""
+NumPy helpers for reading and writing blocks of cells.
+
+NumPy is an optional dependency. It is only imported when one of the methods of this module is called.
+
+.. versionadded:: 0.48.0
+"""
+
+from __future__ import annotations
+import sys
+from typing import Any, TYPE_CHECKING
+import uno
+from com.sun.star.chart import XChartDataArray
+from com.sun.star.sheet import XCellRangeData
+from com.sun.star.sheet import XCellRangeFormula
+
+from ooodev.loader import lo as mLo
+
+if TYPE_CHECKING:
+    from com.sun.star.table import XCellRange
+    import numpy as np
+
+# Calc uses DBL_MIN to mark cells that are not a number in XChartDataArray.getData()
+_CALC_NAN = sys.float_info.min
+
+
+class NpTableHelper:
+    """
+    NumPy table helper.
+
+    .. versionadded:: 0.48.0
+    """
+
+    @staticmethod
+    def import_np() -> Any:
+        """
+        Imports NumPy.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+
+        Returns:
+            Any: numpy module.
+        """
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ImportError("NumPy is required for this method. Install it with: pip install numpy") from e
+        return numpy
+
+    # region get_array()
+    @classmethod
+    def get_array(
+        cls, cell_range: XCellRange, dtype: Any = None, mask_empty: bool = False, formula: bool = False
+    ) -> np.ndarray:
+        """
+        Gets the values of a cell range as a 2-Dimensional NumPy array in a single call to office.
+
+        Args:
+            cell_range (XCellRange): Cell Range.
+            dtype (Any, optional): NumPy dtype of the result.
+                If a floating point dtype is passed then values are read with ``XChartDataArray.getData()``
+                which transfers pure doubles. Non-numeric cells are returned as ``NaN``.
+                If omitted then dtype is inferred. The result is ``float64`` when all non-empty cells are numeric;
+                Otherwise, the result is ``object``.
+            mask_empty (bool, optional): If ``True`` a ``numpy.ma.MaskedArray`` is returned with empty cells masked;
+                Otherwise, empty cells are ``NaN``. Default ``False``.
+            formula (bool, optional): If ``True`` cell formulas are returned instead of values.
+                Result dtype is ``object`` unless ``dtype`` is passed. Default ``False``.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            MissingInterfaceError: If ``cell_range`` does not support the interface needed to read the data.
+
+        Returns:
+            numpy.ndarray: 2-Dimensional array.
+        """
+        np = cls.import_np()
+        if formula:
+            cr_formula = mLo.Lo.qi(XCellRangeFormula, cell_range, True)
+            data = cr_formula.getFormulaArray()
+            arr = np.array(data, dtype=object)
+            arr = arr.reshape(len(data), len(data[0]) if data else 0)
+            empty = arr == ""
+            return cls._finish_get(np, arr, empty, dtype, mask_empty)
+
+        if dtype is not None and np.issubdtype(np.dtype(dtype), np.floating):
+            chart_data = mLo.Lo.qi(XChartDataArray, cell_range, True)
+            data = chart_data.getData()
+            arr = np.array(data, dtype=np.float64)
+            arr = arr.reshape(len(data), len(data[0]) if data else 0)
+            nan_mask = arr == _CALC_NAN
+            arr[nan_mask] = np.nan
+            if mask_empty:
+                return np.ma.MaskedArray(arr.astype(dtype, copy=False), mask=nan_mask)
+            return arr.astype(dtype, copy=False)
+
+        cr_data = mLo.Lo.qi(XCellRangeData, cell_range, True)
+        data = cr_data.getDataArray()
+        arr = np.array(data, dtype=object)
+        arr = arr.reshape(len(data), len(data[0]) if data else 0)
+        # getDataArray() returns float for numbers and str for text. Empty cells are empty strings.
+        empty = arr == ""
+        if dtype is None:
+            is_num = np.frompyfunc(type, 1, 1)(arr) == float
+            if np.all(is_num | empty):
+                arr[empty] = np.nan
+                arr = arr.astype(np.float64)
+                if mask_empty:
+                    return np.ma.MaskedArray(arr, mask=empty)
+                return arr
+        return cls._finish_get(np, arr, empty, dtype, mask_empty)
+
+    @staticmethod
+    def _finish_get(np: Any, arr: Any, empty: Any, dtype: Any, mask_empty: bool) -> Any:
+        if mask_empty:
+            if dtype is not None:
+                arr = arr.astype(dtype)
+            return np.ma.MaskedArray(arr, mask=empty)
+        if dtype is None or np.dtype(dtype) == np.dtype(object):
+            arr[empty] = np.nan
+            return arr
+        if np.issubdtype(np.dtype(dtype), np.floating):
+            arr[empty] = np.nan
+        return arr.astype(dtype)
+
+    # endregion get_array()
+
+    # region set_array()
+    @classmethod
+    def set_array(cls, cell_range: XCellRange, values: Any, formula: bool = False) -> None:
+        """
+        Sets the values of a cell range from a 2-Dimensional NumPy array in a single call to office.
+
+        Args:
+            cell_range (XCellRange): Cell Range. Must be the same size as ``values``.
+            values (numpy.ndarray): 2-Dimensional array. Masked arrays are supported.
+            formula (bool, optional): If ``True`` values are written as formulas. Default ``False``.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If ``values`` is not 2-Dimensional.
+            MissingInterfaceError: If ``cell_range`` does not support the interface needed to write the data.
+
+        Returns:
+            None:
+
+        Note:
+            ``NaN``, ``None`` and masked values result in empty cells.
+
+            Numeric arrays without empty values are written with ``XChartDataArray.setData()`` which transfers
+            pure doubles. All other arrays are written with ``XCellRangeData.setDataArray()``.
+        """
+        np = cls.import_np()
+        arr = values if isinstance(values, np.ndarray) else np.asarray(values)
+        if arr.ndim != 2:
+            raise ValueError(f"Expected a 2-Dimensional array. Got {arr.ndim} dimensions.")
+        mask = np.ma.getmaskarray(arr) if isinstance(arr, np.ma.MaskedArray) else None
+        data = np.ma.getdata(arr)
+
+        if formula:
+            obj = data.astype(str).astype(object)
+            if mask is not None:
+                obj[mask] = ""
+            cr_formula = mLo.Lo.qi(XCellRangeFormula, cell_range, True)
+            cr_formula.setFormulaArray(cls._to_uno_table(obj))
+            return
+
+        if data.dtype.kind in "biuf":
+            floats = data.astype(np.float64, copy=False)
+            empty = np.isnan(floats)
+            if mask is not None:
+                empty = empty | mask
+            if not empty.any():
+                chart_data = mLo.Lo.qi(XChartDataArray, cell_range, True)
+                chart_data.setData(cls._to_uno_table(floats))
+                return
+            obj = floats.astype(object)
+            obj[empty] = ""
+        else:
+            obj = data.astype(object)
+            empty = np.frompyfunc(cls._is_empty, 1, 1)(obj).astype(bool)
+            if mask is not None:
+                empty = empty | mask
+            obj[empty] = ""
+            # NumPy scalars such as numpy.int64 are not understood by the bridge.
+            obj = np.frompyfunc(cls._to_py, 1, 1)(obj)
+
+        cr_data = mLo.Lo.qi(XCellRangeData, cell_range, True)
+        cr_data.setDataArray(cls._to_uno_table(obj))
+
+    @staticmethod
+    def _to_uno_table(arr: Any) -> tuple:
+        return tuple(tuple(row) for row in arr.tolist())
+
+    @staticmethod
+    def _is_empty(value: Any) -> bool:
+        if value is None:
+            return True
+        return isinstance(value, float) and value != value
+
+    @staticmethod
+    def _to_py(value: Any) -> Any:
+        if isinstance(value, (str, float)):
+            return value
+        item = getattr(value, "item", None)
+        if item is not None:
+            value = item()
+        if isinstance(value, (bool, int)):
+            return float(value)
+        return value
+
+    # endregion set_array()
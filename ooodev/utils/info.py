@@ -8,7 +8,7 @@ import datetime
 from enum import Enum, IntFlag
 from pathlib import Path
 import mimetypes
-from typing import TYPE_CHECKING, Any, Tuple, List, cast, overload, Optional, Set
+from typing import TYPE_CHECKING, Any, Iterable, Tuple, List, cast, overload, Optional, Set
 from typing import Type, TypeVar, Union
 
 import uno
@@ -41,6 +41,7 @@ from ooodev.utils.decorator.deprecated import deprecated
 from ooodev.loader.inst.service import Service as LoService
 from ooodev.utils import date_time_util as mDate
 from ooodev.utils import file_io as mFileIO
+from ooodev.utils import gen_util
 from ooodev.loader import lo as mLo
 from ooodev.utils import props as mProps
 from ooodev.units import unit_convert as mConvert
@@ -423,6 +424,10 @@ class Info(metaclass=StaticProperty):
                     mInfo.Info.get_config(node_str="Other", node_path="/org.openoffice.Office.Writer/Layout/"),
                 )
                 ts_val = props.getPropertyValue("TabStop") # int val
+
+        .. versionchanged:: 0.48.0
+            Values are read through the configuration access cache of the current ``LoInst``.
+            See :py:attr:`Lo.config_cache <ooodev.loader.lo.Lo.config_cache>`.
         """
         # props = Lo.qi(XPropertySet, Info.get_config(node_str='Data', node_path="/org.openoffice.UserProfile/"))
         # Props.show_obj_props("User Data", props)
@@ -439,8 +444,7 @@ class Info(metaclass=StaticProperty):
     @classmethod
     def _get_config1(cls, node_str: str, node_path: str):
         """LO UN-Safe Method"""
-        props = cls.get_config_props(node_path)
-        return mProps.Props.get(props, node_str)
+        return mLo.Lo.current_lo.config_cache.get_value(node_path, node_str)
 
     @classmethod
     def _get_config2(cls, node_str: str) -> Any:
@@ -450,6 +454,41 @@ class Info(metaclass=StaticProperty):
                 return cls._get_config1(node_str=node_str, node_path=node_path)
         raise mEx.ConfigError(f"{node_str} not found in common node paths")
 
+    @classmethod
+    def get_config_many(
+        cls, node_path: str, names: Iterable[str], default: Any = gen_util.NULL_OBJ
+    ) -> Tuple[Any, ...]:
+        """
+        Gets many configuration values of a node.
+
+        |lo_unsafe|
+
+        The node is opened once and values that are not already cached are read with a single call.
+
+        Args:
+            node_path (str): node path such as ``/org.openoffice.Office.Common/Misc``.
+            names (Iterable[str]): names of values.
+            default (Any, optional): value returned for names the node does not have.
+                If omitted then an error is raised for names the node does not have.
+
+        Raises:
+            ConfigError: if unable to get config
+
+        Returns:
+            Tuple[Any, ...]: values in the order of ``names``.
+
+        Example:
+            .. code-block:: python
+
+                name, version = Info.get_config_many("/org.openoffice.Setup/Product", ("ooName", "ooSetupVersion"))
+
+        .. versionadded:: 0.48.0
+        """
+        try:
+            return mLo.Lo.current_lo.config_cache.get_values(node_path, names, default)
+        except Exception as e:
+            raise mEx.ConfigError(f"Unable to get configuration with path: '{node_path}'") from e
+
     @staticmethod
     def get_config_props(node_path: str) -> XPropertySet:
         """
@@ -465,18 +504,11 @@ class Info(metaclass=StaticProperty):
 
         Returns:
             XPropertySet: Property set
+
+        .. versionchanged:: 0.48.0
+            The property set is a read only node view shared through the configuration access cache.
         """
-        try:
-            con_prov = mLo.Lo.create_instance_mcf(
-                XMultiServiceFactory,
-                "com.sun.star.configuration.ConfigurationProvider",
-                raise_err=True,
-            )
-            p = mProps.Props.make_props(nodepath=node_path)
-            ca = con_prov.createInstanceWithArguments("com.sun.star.configuration.ConfigurationAccess", p)
-            return mLo.Lo.qi(XPropertySet, ca, True)
-        except Exception as e:
-            raise mEx.PropertyError(node_path, f"Unable to access config properties for\n\n  '{node_path}'") from e
+        return mLo.Lo.current_lo.config_cache.get_node(node_path)
 
     @staticmethod
     def get_paths(setting: str | InfoPathsKind) -> str:
@@ -15,6 +15,8 @@ from com.sun.star.beans import UnknownPropertyException
 from com.sun.star.beans import XFastPropertySet
 from com.sun.star.beans import XPropertySet
 from com.sun.star.beans import XPropertyState
+from com.sun.star.beans import XMultiPropertySet
+from com.sun.star.beans import XTolerantMultiPropertySet
 from com.sun.star.container import XIndexAccess
 from com.sun.star.container import XNameAccess
 from com.sun.star.document import XTypeDetection
@@ -42,7 +44,6 @@ from ooodev.utils.helper.dot_dict import DotDict
 
 if TYPE_CHECKING:
     from com.sun.star.beans import XPropertySetInfo
-    from com.sun.star.beans import XMultiPropertySet
 
     # import module and not module content to avoid circular import issue.
     # https://stackoverflow.com/questions/22187279/python-circular-importing
@@ -610,7 +611,7 @@ class Props:
     # region    set_properties()
     @overload
     @classmethod
-    def set_properties(cls, obj: object, names: Sequence[str], vals: Sequence[object]) -> None:
+    def set_properties(cls, obj: object, names: Sequence[str], vals: Sequence[object], *, batch: bool = ...) -> None:
         """
         Set Properties
 
@@ -627,7 +628,9 @@ class Props:
 
     @overload
     @classmethod
-    def set_properties(cls, prop_set: XPropertySet, names: Sequence[str], vals: Sequence[object]) -> None:
+    def set_properties(
+        cls, prop_set: XPropertySet, names: Sequence[str], vals: Sequence[object], *, batch: bool = ...
+    ) -> None:
         """
         Set Properties
 
@@ -643,7 +646,7 @@ class Props:
 
     @overload
     @classmethod
-    def set_properties(cls, obj: object, from_obj: object) -> None:
+    def set_properties(cls, obj: object, from_obj: object, *, batch: bool = ...) -> None:
         """
         Set properties
 
@@ -662,7 +665,7 @@ class Props:
 
     @overload
     @classmethod
-    def set_properties(cls, prop_set: XPropertySet, from_props: XPropertySet) -> None:
+    def set_properties(cls, prop_set: XPropertySet, from_props: XPropertySet, *, batch: bool = ...) -> None:
         """
         Set properties
 
@@ -689,6 +692,7 @@ class Props:
             from_obj (object): Other object that implements XPropertySet interface
             names (Sequence[str]): Property Names
             vals (Sequence[object]): Property Values
+            batch (bool, optional): If ``True`` properties are set using a single ``XMultiPropertySet`` call when possible. Default ``False``.
 
         Raises:
             MissingInterfaceError: if obj does not implement XPropertySet interface
@@ -709,8 +713,14 @@ class Props:
 
             If ``MultiError`` occurs only the properties that raised an error is part of the error object.
             The remaining properties will still be set.
+
+            When ``batch`` is ``True`` properties are set in the same manner as :py:meth:`~.props.Props.set_batch`.
+
+        .. versionchanged:: 0.48.0
+            Added ``batch`` keyword argument.
         """
         ordered_keys = (1, 2, 3)
+        batch = bool(kwargs.pop("batch", False))
         kargs_len = len(kwargs)
         count = len(args) + kargs_len
 
@@ -758,7 +768,10 @@ class Props:
         if count == 3:
             # set_properties(cls, prop_set: XPropertySet, names: Sequence[str], vals: Sequence[object]) -> None
             # set_properties(cls, obj: object, names: Sequence[str], vals: Sequence[object]) -> None
-            cls._set_properties_by_vals(prop_set=prop_set, names=kargs[2], vals=kargs[3])
+            if batch:
+                cls._set_properties_batch(prop_set=prop_set, names=kargs[2], vals=kargs[3])
+            else:
+                cls._set_properties_by_vals(prop_set=prop_set, names=kargs[2], vals=kargs[3])
             return
 
         elif count == 2:
@@ -768,7 +781,27 @@ class Props:
             else:
                 # set_properties(cls, obj: object, from_obj: object) -> None
                 from_props = mLo.Lo.qi(XPropertySet, kargs[1], True)
-            cls._set_properties_from_props(prop_set=prop_set, from_props=from_props)
+            if batch:
+                nms = cls.get_prop_names(from_props)
+                vals = [cls.get_property(from_props, itm) for itm in nms]
+                cls._set_properties_batch(prop_set=prop_set, names=nms, vals=vals)
+            else:
+                cls._set_properties_from_props(prop_set=prop_set, from_props=from_props)
+
+    @classmethod
+    def _set_properties_batch(cls, prop_set: XPropertySet, names: Sequence[str], vals: Sequence[object]) -> None:
+        errs = []
+        batch: Dict[str, Tuple[str, KeyValCancelArgs]] = {}
+        for i, name in enumerate(names):
+            cargs = KeyValCancelArgs(Props.set_properties.__qualname__, name, vals[i])
+            cargs.event_data = prop_set
+            _Events().trigger(PropsNamedEvent.PROP_SETTING, cargs)
+            if cargs.cancel or cargs.key == "":
+                continue
+            batch[cargs.key] = (name, cargs)
+        cls._set_batch(obj=prop_set, ps=prop_set, batch=batch, errs=errs)
+        if errs:
+            raise mEx.MultiError(errs)
 
     @classmethod
     def _set_properties_by_vals(cls, prop_set: XPropertySet, names: Sequence[str], vals: Sequence[object]) -> None:
@@ -930,53 +963,172 @@ class Props:
             ps = mLo.Lo.qi(XPropertySet, obj, True)
         errs = []
         for key, value in kwargs.items():
-            has_error = False
             cargs = KeyValCancelArgs(Props.set.__qualname__, key, value)
             cargs.event_data = obj
             _Events().trigger(PropsNamedEvent.PROP_SETTING, cargs)
             if cargs.cancel:
                 continue
-            try:
-                if cargs.default:
-                    cls.set_default(obj, cargs.key)
-                elif cargs.key == "":
-                    continue
-                else:
-                    ps.setPropertyValue(cargs.key, cargs.value)
-            except (AttributeError, UnknownPropertyException) as e:
-                # handle a LibreOffice bug
-                try:
-                    if not cls._set_by_attribute(obj, cargs.key, cargs.value):
-                        raise e
-                except Exception as ex:
-                    has_error = True
-                    if type(ex).__name__ == "com.sun.star.beans.UnknownPropertyException":
-                        errs.append(mEx.PropertyNotFoundError(key, ex))
-                    else:
-                        errs.append(
-                            mEx.UnKnownError(
-                                f'Something went wrong. Could not find setPropertyValue attribute on property set. Tried setting "{key}" manually but failed'
-                            )
-                        )
+            cls._set_key_val(obj=obj, ps=ps, key=key, cargs=cargs, errs=errs)
+        if errs:
+            raise mEx.MultiError(errs)
 
-            except PropertyVetoException as e:
-                has_error = True
-                errs.append(mEx.PropertySetError(f'Could not set readonly-property "{key}"', e))
-            except Exception as e:
-                has_error = True
-                errs.append(Exception(f'Could not set property "{key}"', e))
-            if has_error:
-                error_args = KeyValCancelArgs.from_args(cargs)
-                error_args.cancel = False
-                error_args.handled = False
-                _Events().trigger(PropsNamedEvent.PROP_SET_ERROR, error_args)
-                if (error_args.handled or error_args.cancel) and errs:
-                    _ = errs.pop()
+    @classmethod
+    def set_batch(cls, obj: Any, **kwargs) -> None:
+        """
+        Set one or more properties using as few calls to LibreOffice as possible.
+
+        Works the same as :py:meth:`~.props.Props.set` except that all properties that are not canceled
+        are written in a single ``XMultiPropertySet.setPropertyValues()`` call.
+        When ``obj`` supports ``XTolerantMultiPropertySet`` only the properties that fail to be set
+        are set again one at a time. When ``obj`` only supports ``XMultiPropertySet`` and the batch call fails
+        then all properties of the batch are set again one at a time.
+        When ``obj`` does not support ``XMultiPropertySet`` then properties are set one at a time.
+
+        |lo_safe|
+
+        Args:
+            obj (Any): object to set properties for. Must support ``XPropertySet``
+            **kwargs: Variable length Key value pairs used to set properties.
+
+        Raises:
+            MissingInterfaceError: if obj does not implement ``XPropertySet`` interface
+            MultiError: If unable to set a property
+
+        Returns:
+            None:
+
+        :events:
+            .. cssclass:: lo_event
+
+                - :py:attr:`~.events.props_named_event.PropsNamedEvent.PROP_SETTING` :eventref:`src-docs-props-event-setting`
+                - :py:attr:`~.events.props_named_event.PropsNamedEvent.PROP_SET` :eventref:`src-docs-props-event-set`
+                - :py:attr:`~.events.props_named_event.PropsNamedEvent.PROP_SET_ERROR` :eventref:`src-docs-props-event-set-error`
+
+        Note:
+            Events are still raised for each property.
+            ``PROP_SETTING`` is raised for all properties before any property is set.
+
+            Properties are set in alphabetical order as required by ``XMultiPropertySet``.
+            Use :py:meth:`~.props.Props.set` when the order in which properties are set matters.
+
+        .. versionadded:: 0.48.0
+        """
+        if not kwargs:
+            return
+        if mInfo.Info.is_type_interface(obj, "com.sun.star.beans.XPropertySet"):
+            ps = cast(XPropertySet, obj)
+        else:
+            ps = mLo.Lo.qi(XPropertySet, obj, True)
+        errs = []
+        batch: Dict[str, Tuple[str, KeyValCancelArgs]] = {}
+        for key, value in kwargs.items():
+            cargs = KeyValCancelArgs(Props.set_batch.__qualname__, key, value)
+            cargs.event_data = obj
+            _Events().trigger(PropsNamedEvent.PROP_SETTING, cargs)
+            if cargs.cancel:
+                continue
+            if cargs.default:
+                cls._set_key_val(obj=obj, ps=ps, key=key, cargs=cargs, errs=errs)
+            elif cargs.key == "":
+                continue
             else:
-                _Events().trigger(PropsNamedEvent.PROP_SET, KeyValArgs.from_args(cargs))  # type: ignore
+                batch[cargs.key] = (key, cargs)
+        cls._set_batch(obj=obj, ps=ps, batch=batch, errs=errs)
         if errs:
             raise mEx.MultiError(errs)
 
+    @classmethod
+    def _set_batch(
+        cls, obj: Any, ps: XPropertySet, batch: Dict[str, Tuple[str, KeyValCancelArgs]], errs: list
+    ) -> None:
+        """
+        Sets a batch of properties.
+
+        Args:
+            obj (Any): Object to set properties for.
+            ps (XPropertySet): Property set of ``obj``.
+            batch (Dict[str, Tuple[str, KeyValCancelArgs]]): Property name mapped to original key and event args.
+            errs (list): Errors are appended to this list.
+        """
+        if not batch:
+            return
+        # XMultiPropertySet requires the names to be sorted.
+        names = tuple(sorted(batch.keys()))
+        failed_names: Sequence[str] = names
+        if len(names) > 1:
+            try:
+                tps = mLo.Lo.qi(XTolerantMultiPropertySet, obj)
+                if tps is not None:
+                    failed = tps.setPropertyValuesTolerant(names, tuple(batch[name][1].value for name in names))
+                    failed_names = tuple(f.Name for f in failed)
+                else:
+                    mps = mLo.Lo.qi(XMultiPropertySet, obj)
+                    if mps is not None:
+                        mps.setPropertyValues(names, tuple(batch[name][1].value for name in names))
+                        failed_names = ()
+            except Exception:
+                # some implementations are missing methods, fall back to setting each property.
+                failed_names = names
+        failed_set = set(failed_names)
+        for name in names:
+            key, cargs = batch[name]
+            if name in failed_set:
+                cls._set_key_val(obj=obj, ps=ps, key=key, cargs=cargs, errs=errs)
+            else:
+                _Events().trigger(PropsNamedEvent.PROP_SET, KeyValArgs.from_args(cargs))  # type: ignore
+
+    @classmethod
+    def _set_key_val(cls, obj: Any, ps: XPropertySet, key: str, cargs: KeyValCancelArgs, errs: list) -> None:
+        """
+        Sets a single property from event args and raises set or error events.
+
+        Args:
+            obj (Any): Object to set property for.
+            ps (XPropertySet): Property set of ``obj``.
+            key (str): Original property key, used in error messages.
+            cargs (KeyValCancelArgs): Event args that were passed to ``PROP_SETTING``.
+            errs (list): Errors are appended to this list.
+        """
+        has_error = False
+        try:
+            if cargs.default:
+                cls.set_default(obj, cargs.key)
+            elif cargs.key == "":
+                return
+            else:
+                ps.setPropertyValue(cargs.key, cargs.value)
+        except (AttributeError, UnknownPropertyException) as e:
+            # handle a LibreOffice bug
+            try:
+                if not cls._set_by_attribute(obj, cargs.key, cargs.value):
+                    raise e
+            except Exception as ex:
+                has_error = True
+                if type(ex).__name__ == "com.sun.star.beans.UnknownPropertyException":
+                    errs.append(mEx.PropertyNotFoundError(key, ex))
+                else:
+                    errs.append(
+                        mEx.UnKnownError(
+                            f'Something went wrong. Could not find setPropertyValue attribute on property set. Tried setting "{key}" manually but failed'
+                        )
+                    )
+
+        except PropertyVetoException as e:
+            has_error = True
+            errs.append(mEx.PropertySetError(f'Could not set readonly-property "{key}"', e))
+        except Exception as e:
+            has_error = True
+            errs.append(Exception(f'Could not set property "{key}"', e))
+        if has_error:
+            error_args = KeyValCancelArgs.from_args(cargs)
+            error_args.cancel = False
+            error_args.handled = False
+            _Events().trigger(PropsNamedEvent.PROP_SET_ERROR, error_args)
+            if (error_args.handled or error_args.cancel) and errs:
+                _ = errs.pop()
+        else:
+            _Events().trigger(PropsNamedEvent.PROP_SET, KeyValArgs.from_args(cargs))  # type: ignore
+
     @classmethod
     def set_default(cls, obj: object, *prop_names: str) -> None:
         """
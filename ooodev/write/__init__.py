@@ -1,42 +1,89 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 import uno
-from ooo.dyn.linguistic2.dictionary_type import DictionaryType as DictionaryType
-from ooo.dyn.style.numbering_type import NumberingTypeEnum as NumberingTypeEnum
-from ooo.dyn.style.paragraph_adjust import ParagraphAdjust as ParagraphAdjust
-from ooo.dyn.text.control_character import ControlCharacterEnum as ControlCharacterEnum
-from ooo.dyn.text.page_number_type import PageNumberType as PageNumberType
-from ooo.dyn.text.text_content_anchor_type import TextContentAnchorType as TextContentAnchorType
-from ooo.dyn.view.paper_format import PaperFormat as PaperFormat
 
-from ooodev.events.write_named_event import WriteNamedEvent as WriteNamedEvent
-from ooodev.format.writer.style.family_names_kind import FamilyNamesKind as FamilyNamesKind
-from ooodev.format.writer.style.char.kind.style_char_kind import StyleCharKind as StyleCharKind
-from ooodev.format.writer.style.frame.style_frame_kind import StyleFrameKind as StyleFrameKind
-from ooodev.format.writer.style.lst.style_list_kind import StyleListKind as StyleListKind
-from ooodev.format.writer.style.page.kind.writer_style_page_kind import WriterStylePageKind as WriterStylePageKind
-from ooodev.format.writer.style.para.kind.style_para_kind import StyleParaKind as StyleParaKind
-from ooodev.office.write import Write as Write
-from ooodev.utils.kind.zoom_kind import ZoomKind as ZoomKind
-from ooodev.write.write_doc import WriteDoc as WriteDoc
-from ooodev.write.write_draw_page import WriteDrawPage as WriteDrawPage
-from ooodev.write.write_draw_pages import WriteDrawPages as WriteDrawPages
-from ooodev.write.write_form import WriteForm as WriteForm
-from ooodev.write.write_forms import WriteForms as WriteForms
-from ooodev.write.write_paragraph import WriteParagraph as WriteParagraph
-from ooodev.write.write_paragraph_cursor import WriteParagraphCursor as WriteParagraphCursor
-from ooodev.write.write_paragraphs import WriteParagraphs as WriteParagraphs
-from ooodev.write.write_sentence_cursor import WriteSentenceCursor as WriteSentenceCursor
-from ooodev.write.write_text import WriteText as WriteText
-from ooodev.write.write_text_content import WriteTextContent as WriteTextContent
-from ooodev.write.write_text_cursor import WriteTextCursor as WriteTextCursor
-from ooodev.write.write_text_frame import WriteTextFrame as WriteTextFrame
-from ooodev.write.write_text_frames import WriteTextFrames as WriteTextFrames
-from ooodev.write.write_text_portion import WriteTextPortion as WriteTextPortion
-from ooodev.write.write_text_portions import WriteTextPortions as WriteTextPortions
-from ooodev.write.write_text_range import WriteTextRange as WriteTextRange
-from ooodev.write.write_text_ranges import WriteTextRanges as WriteTextRanges
-from ooodev.write.write_text_view_cursor import WriteTextViewCursor as WriteTextViewCursor
-from ooodev.write.write_word_cursor import WriteWordCursor as WriteWordCursor
+from ooodev.lazy.lazy_exports import lazy_exports
 
+if TYPE_CHECKING:
+    from ooo.dyn.linguistic2.dictionary_type import DictionaryType as DictionaryType
+    from ooo.dyn.style.numbering_type import NumberingTypeEnum as NumberingTypeEnum
+    from ooo.dyn.style.paragraph_adjust import ParagraphAdjust as ParagraphAdjust
+    from ooo.dyn.text.control_character import ControlCharacterEnum as ControlCharacterEnum
+    from ooo.dyn.text.page_number_type import PageNumberType as PageNumberType
+    from ooo.dyn.text.text_content_anchor_type import TextContentAnchorType as TextContentAnchorType
+    from ooo.dyn.view.paper_format import PaperFormat as PaperFormat
+
+    from ooodev.events.write_named_event import WriteNamedEvent as WriteNamedEvent
+    from ooodev.format.writer.style.family_names_kind import FamilyNamesKind as FamilyNamesKind
+    from ooodev.format.writer.style.char.kind.style_char_kind import StyleCharKind as StyleCharKind
+    from ooodev.format.writer.style.frame.style_frame_kind import StyleFrameKind as StyleFrameKind
+    from ooodev.format.writer.style.lst.style_list_kind import StyleListKind as StyleListKind
+    from ooodev.format.writer.style.page.kind.writer_style_page_kind import WriterStylePageKind as WriterStylePageKind
+    from ooodev.format.writer.style.para.kind.style_para_kind import StyleParaKind as StyleParaKind
+    from ooodev.office.write import Write as Write
+    from ooodev.utils.kind.zoom_kind import ZoomKind as ZoomKind
+    from ooodev.write.write_doc import WriteDoc as WriteDoc
+    from ooodev.write.write_draw_page import WriteDrawPage as WriteDrawPage
+    from ooodev.write.write_draw_pages import WriteDrawPages as WriteDrawPages
+    from ooodev.write.write_form import WriteForm as WriteForm
+    from ooodev.write.write_forms import WriteForms as WriteForms
+    from ooodev.write.write_paragraph import WriteParagraph as WriteParagraph
+    from ooodev.write.write_paragraph_cursor import WriteParagraphCursor as WriteParagraphCursor
+    from ooodev.write.write_paragraphs import WriteParagraphs as WriteParagraphs
+    from ooodev.write.write_sentence_cursor import WriteSentenceCursor as WriteSentenceCursor
+    from ooodev.write.write_text import WriteText as WriteText
+    from ooodev.write.write_text_content import WriteTextContent as WriteTextContent
+    from ooodev.write.write_text_cursor import WriteTextCursor as WriteTextCursor
+    from ooodev.write.write_text_frame import WriteTextFrame as WriteTextFrame
+    from ooodev.write.write_text_frames import WriteTextFrames as WriteTextFrames
+    from ooodev.write.write_text_portion import WriteTextPortion as WriteTextPortion
+    from ooodev.write.write_text_portions import WriteTextPortions as WriteTextPortions
+    from ooodev.write.write_text_range import WriteTextRange as WriteTextRange
+    from ooodev.write.write_text_ranges import WriteTextRanges as WriteTextRanges
+    from ooodev.write.write_text_view_cursor import WriteTextViewCursor as WriteTextViewCursor
+    from ooodev.write.write_word_cursor import WriteWordCursor as WriteWordCursor
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DictionaryType": "ooo.dyn.linguistic2.dictionary_type",
+        "NumberingTypeEnum": "ooo.dyn.style.numbering_type",
+        "ParagraphAdjust": "ooo.dyn.style.paragraph_adjust",
+        "ControlCharacterEnum": "ooo.dyn.text.control_character",
+        "PageNumberType": "ooo.dyn.text.page_number_type",
+        "TextContentAnchorType": "ooo.dyn.text.text_content_anchor_type",
+        "PaperFormat": "ooo.dyn.view.paper_format",
+        "WriteNamedEvent": "ooodev.events.write_named_event",
+        "FamilyNamesKind": "ooodev.format.writer.style.family_names_kind",
+        "StyleCharKind": "ooodev.format.writer.style.char.kind.style_char_kind",
+        "StyleFrameKind": "ooodev.format.writer.style.frame.style_frame_kind",
+        "StyleListKind": "ooodev.format.writer.style.lst.style_list_kind",
+        "WriterStylePageKind": "ooodev.format.writer.style.page.kind.writer_style_page_kind",
+        "StyleParaKind": "ooodev.format.writer.style.para.kind.style_para_kind",
+        "Write": "ooodev.office.write",
+        "ZoomKind": "ooodev.utils.kind.zoom_kind",
+        "WriteDoc": "ooodev.write.write_doc",
+        "WriteDrawPage": "ooodev.write.write_draw_page",
+        "WriteDrawPages": "ooodev.write.write_draw_pages",
+        "WriteForm": "ooodev.write.write_form",
+        "WriteForms": "ooodev.write.write_forms",
+        "WriteParagraph": "ooodev.write.write_paragraph",
+        "WriteParagraphCursor": "ooodev.write.write_paragraph_cursor",
+        "WriteParagraphs": "ooodev.write.write_paragraphs",
+        "WriteSentenceCursor": "ooodev.write.write_sentence_cursor",
+        "WriteText": "ooodev.write.write_text",
+        "WriteTextContent": "ooodev.write.write_text_content",
+        "WriteTextCursor": "ooodev.write.write_text_cursor",
+        "WriteTextFrame": "ooodev.write.write_text_frame",
+        "WriteTextFrames": "ooodev.write.write_text_frames",
+        "WriteTextPortion": "ooodev.write.write_text_portion",
+        "WriteTextPortions": "ooodev.write.write_text_portions",
+        "WriteTextRange": "ooodev.write.write_text_range",
+        "WriteTextRanges": "ooodev.write.write_text_ranges",
+        "WriteTextViewCursor": "ooodev.write.write_text_view_cursor",
+        "WriteWordCursor": "ooodev.write.write_word_cursor",
+    },
+)
 
 __all__ = [
     "WriteDoc",
@@ -387,6 +387,7 @@ class TextCursorPartial(Generic[_T]):
         tbl_fg_color: Color | None = None,
         first_row_header: bool = True,
         styles: Sequence[StyleT] | None = None,
+        bulk: bool = False,
     ) -> WriteTable[_T]:
         """
         Adds a table.
@@ -407,6 +408,9 @@ class TextCursorPartial(Generic[_T]):
             first_row_header (bool, optional): If ``True`` First row is treated as header data. Default ``True``.
             styles (Sequence[StyleT], optional): One or more styles to apply to frame.
                 Only styles that support ``com.sun.star.text.TextTable`` service are applied.
+            bulk (bool, optional): If ``True`` all values are written with a single ``setDataArray()`` call and
+                header and body colors are set once per cell range instead of once per cell.
+                Recommended for large tables. Default ``False``.
 
         Raises:
             ValueError: If table_data is empty
@@ -431,9 +435,13 @@ class TextCursorPartial(Generic[_T]):
             - :py:class:`~.utils.color.CommonColor`
             - :py:meth:`~.utils.table_helper.TableHelper.table_2d_to_dict`
             - :py:meth:`~.utils.table_helper.TableHelper.table_dict_to_table`
+            - :py:meth:`WriteTable.append_data() <ooodev.write.table.write_table.WriteTable.append_data>`
 
         Hint:
             Styles that can be applied are found in :doc:`ooodev.format.writer.direct.table </src/format/ooodev.format.writer.direct.table>` subpackages.
+
+        .. versionchanged:: 0.48.0
+            Added option ``bulk``.
         """
         # pylint: disable=import-outside-toplevel
         from ooodev.write.table.write_table import WriteTable
@@ -448,6 +456,7 @@ class TextCursorPartial(Generic[_T]):
                 tbl_fg_color=tbl_fg_color,
                 first_row_header=first_row_header,
                 styles=styles,
+                bulk=bulk,
             )
         tbl = WriteTable(self.__owner, result)
         if name:
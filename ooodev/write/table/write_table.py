@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Any, cast, overload, Sequence, TYPE_CHECKING, Tuple, TypeVar, Generic, Generator
+from itertools import islice
+from typing import Any, cast, overload, Iterable, Sequence, TYPE_CHECKING, Tuple, TypeVar, Generic, Generator
 import uno
 from com.sun.star.lang import IndexOutOfBoundsException
 from ooo.dyn.table.cell_content_type import CellContentType
@@ -646,6 +647,63 @@ class WriteTable(
         data_rng = self.get_cell_range(data_rng_addr)
         data_rng.set_data_array(data)
 
+    def append_data(self, data: Iterable[Sequence[Any]], batch_size: int = 500) -> int:
+        """
+        Appends rows of data to the end of the table in batches.
+
+        For each batch the rows are inserted with one call and the values are written with a single
+        ``setDataArray()`` call.
+
+        Args:
+            data (Iterable[Sequence[Any]]): Rows of data. Can be any iterable such as a generator.
+                Each element must be a ``float`` or a ``str``. Rows shorter than the number of table columns are
+                padded with empty strings.
+            batch_size (int, optional): Number of rows appended per batch. Defaults to ``500``.
+
+        Raises:
+            ValueError: If ``batch_size`` is less than ``1``.
+            ValueError: If a row has more values than the table has columns.
+
+        Returns:
+            int: Number of rows appended.
+
+        Note:
+            Rows appended to a table take on the formatting of the last row of the table.
+
+        Example:
+            .. code-block:: python
+
+                >>> tbl = cursor.add_table(table_data=[["Name", "Value"]], bulk=True)
+                >>> tbl.append_data(((f"Item {i}", float(i)) for i in range(2000)))
+                2000
+
+        .. versionadded:: 0.48.0
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be greater than 0")
+        num_cols = len(self.columns)
+        rows = self.rows
+        row_count = len(rows)
+        total = 0
+        it = iter(data)
+        while True:
+            batch = list(islice(it, batch_size))
+            if not batch:
+                break
+            block = []
+            for row in batch:
+                row_len = len(row)
+                if row_len > num_cols:
+                    raise ValueError(f"Row has {row_len} values. Table only has {num_cols} columns.")
+                block.append(tuple(row) + ("",) * (num_cols - row_len))
+            count = len(block)
+            rows.insert_by_index(row_count, count)
+            rng = self.get_cell_range_by_position(0, row_count, num_cols - 1, row_count + count - 1)
+            rng.set_data_array(block)
+            row_count += count
+            total += count
+        return total
+
     def get_cell_value(self, cell: XCell, formula_value: bool = False) -> float | str | None:
         """
         Get the cell value.
@@ -0,0 +1,142 @@
+from __future__ import annotations
+from typing import Any, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.adapter.awt.grid.virtual_grid_data_model import VirtualGridDataModel
+
+
+class _Listener:
+    def __init__(self) -> None:
+        self.events: List[Any] = []
+
+    def rowsInserted(self, event: Any) -> None:
+        self.events.append(("rowsInserted", event.FirstRow, event.LastRow))
+
+    def rowsRemoved(self, event: Any) -> None:
+        self.events.append(("rowsRemoved", event.FirstRow, event.LastRow))
+
+    def dataChanged(self, event: Any) -> None:
+        self.events.append(("dataChanged", event.FirstRow, event.LastRow))
+
+    def rowHeadingChanged(self, event: Any) -> None:
+        self.events.append(("rowHeadingChanged", event.FirstRow, event.LastRow))
+
+    def disposing(self, event: Any) -> None:
+        self.events.append(("disposing",))
+
+
+def test_sequence_source(loader) -> None:
+    rows = [[i, f"Item {i}", i * 1.5] for i in range(1000)]
+    model = VirtualGridDataModel(rows, headings=lambda i: str(i + 1))
+    assert model.RowCount == 1000
+    assert model.ColumnCount == 3
+    assert model.getRowData(10) == (10, "Item 10", 15.0)
+    assert model.getCellData(1, 999) == "Item 999"
+    assert model.getRowHeading(4) == "5"
+    assert model.is_virtual
+
+
+def test_fetch_source(loader) -> None:
+    calls = []
+
+    def fetch(start: int, count: int):
+        calls.append((start, count))
+        return [{"id": i, "name": f"n{i}"} for i in range(start, start + count)]
+
+    model = VirtualGridDataModel(
+        fetch, row_count=250, row_converter=lambda r: (r["id"], r["name"]), page_size=100, cache_size=2
+    )
+    assert model.RowCount == 250
+    assert model.getRowData(0) == (0, "n0")
+    assert model.getRowData(99) == (99, "n99")
+    assert calls == [(0, 100)]
+    assert model.getCellData(1, 249) == "n249"
+    assert calls[-1] == (200, 50)
+    assert model.cache_stats.hits > 0
+
+
+def test_iterator_source(loader) -> None:
+    listener = _Listener()
+    model = VirtualGridDataModel(((i, i * 2) for i in range(25)), page_size=10)
+    model.addGridDataListener(listener)
+    assert model.RowCount == 10
+    # reading the last row read so far reads the next page.
+    assert model.getRowData(9) == (9, 18)
+    assert model.RowCount == 20
+    assert listener.events == [("rowsInserted", 10, 19)]
+    model.getRowData(19)
+    assert model.RowCount == 25
+
+
+def test_updates(loader) -> None:
+    rows = tuple((i, f"v{i}") for i in range(50))
+    listener = _Listener()
+    model = VirtualGridDataModel(rows)
+    model.addGridDataListener(listener)
+
+    model.updateCellData(1, 3, "changed")
+    assert model.getCellData(1, 3) == "changed"
+    assert rows[3] == (3, "v3")
+    model.updateRowHeading(3, "H")
+    assert model.getRowHeading(3) == "H"
+    model.updateCellToolTip(0, 5, "tip")
+    assert model.getCellToolTip(0, 5) == "tip"
+    assert model.is_virtual
+
+    model.insertRow(0, "new", (-1, "first"))
+    assert not model.is_virtual
+    assert model.RowCount == 51
+    assert model.getRowData(0) == (-1, "first")
+    assert model.getCellData(1, 4) == "changed"
+    assert model.getRowHeading(4) == "H"
+    assert model.getCellToolTip(0, 6) == "tip"
+
+    model.removeRow(0)
+    assert model.getRowData(0) == (0, "v0")
+    assert model.getCellToolTip(0, 5) == "tip"
+
+    model.addRows(("a", "b"), ((50, "v50"), (51, "v51")))
+    assert model.RowCount == 52
+    assert model.getRowHeading(51) == "b"
+
+    model.removeAllRows()
+    assert model.RowCount == 0
+    assert [e[0] for e in listener.events] == [
+        "dataChanged",
+        "rowHeadingChanged",
+        "rowsInserted",
+        "rowsRemoved",
+        "rowsInserted",
+        "rowsRemoved",
+    ]
+
+
+def test_clone_and_refresh(loader) -> None:
+    rows = [(i,) for i in range(20)]
+    model = VirtualGridDataModel(rows)
+    model.updateCellData(0, 0, 100)
+    clone = model.createClone()
+    assert clone.RowCount == 20
+    assert clone.getCellData(0, 0) == 100
+
+    # clone keeps its own row headings.
+    other = VirtualGridDataModel([(0,), (1,)], headings=["h0", "h1"])
+    other.addRows(("h2",), ((2,),))
+    clone = other.createClone()
+    other.removeRow(0)
+    assert clone.RowCount == 3
+    assert clone.getRowHeading(0) == "h0"
+
+    listener = _Listener()
+    model.addGridDataListener(listener)
+    rows.append((20,))
+    model.refresh()
+    assert model.getCellData(0, 0) == 0
+    assert ("rowsInserted", 20, 20) in listener.events
+
+    model.dispose()
+    assert ("disposing",) in listener.events
+    assert model.RowCount == 0
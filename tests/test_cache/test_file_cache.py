@@ -0,0 +1,91 @@
+import os
+import time
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_pickle_cache_limits(loader) -> None:
+    from ooodev.utils.cache.file_cache import PickleCache
+
+    cache = PickleCache(tmp_dir="ooodev_test/pickle_cache_limits", lifetime=60, max_entries=3)
+    cache.clear()
+    cache.reset_stats()
+    try:
+        for name in ("a", "b", "c"):
+            cache[name] = {"name": name}
+            time.sleep(0.02)
+        # a is now the most recently used
+        assert cache["a"] == {"name": "a"}
+        time.sleep(0.02)
+        cache["d"] = {"name": "d"}
+        assert cache["b"] is None
+        assert cache["a"] == {"name": "a"}
+        files = [f for f in os.listdir(cache.path) if not f.startswith(".")]
+        assert sorted(files) == ["a", "c", "d"]
+
+        stats = cache.stats
+        assert stats.puts == 4
+        assert stats.evictions == 1
+        assert stats.hits == 2
+        assert stats.misses == 1
+    finally:
+        cache.clear()
+
+
+def test_text_cache_dedup(loader) -> None:
+    from ooodev.utils.cache.file_cache import TextCache
+
+    cache = TextCache(tmp_dir="ooodev_test/text_cache_dedup", lifetime=60)
+    cache.clear()
+    cache.reset_stats()
+    try:
+        cache["one.txt"] = "Hello World"
+        cache["two.txt"] = "Hello World"
+        cache["two.txt"] = "Hello World"
+        assert cache["one.txt"] == "Hello World"
+        assert cache.stats.dedup == 2
+        assert os.path.samefile(cache.path / "one.txt", cache.path / "two.txt")
+
+        cache["two.txt"] = "Goodbye"
+        assert cache["one.txt"] == "Hello World"
+        assert cache["two.txt"] == "Goodbye"
+        # only the content still in use is kept.
+        cache.remove("one.txt")
+        cache.sweep()
+        assert len(os.listdir(cache.path / ".blobs")) == 1
+    finally:
+        cache.clear()
+
+
+def test_text_cache_shared_times(loader) -> None:
+    from ooodev.utils.cache.file_cache import TextCache
+
+    cache = TextCache(tmp_dir="ooodev_test/text_cache_shared_times", lifetime=60, max_bytes=1024)
+    cache.clear()
+    try:
+        cache["one.txt"] = "Hello World"
+        one_meta = cache.path / ".meta" / "one.txt"
+        os.utime(one_meta, (1000.0, time.time() - 30))
+        one_times = one_meta.stat()
+        cache["two.txt"] = "Hello World"
+        cache["two.txt"] = "Hello World"
+        assert cache["two.txt"] == "Hello World"
+        # writing and reading a key with the same content does not touch the times of the other key.
+        assert one_meta.stat().st_mtime == one_times.st_mtime
+        assert one_meta.stat().st_atime == one_times.st_atime
+        assert cache._known_bytes == len("Hello World")
+        assert cache._known_entries == 2
+
+        cache["two.txt"] = "Goodbye"
+        assert cache._known_bytes == len("Hello World") + len("Goodbye")
+        cache["one.txt"] = "Goodbye"
+        assert cache._known_bytes == len("Goodbye")
+        cache.remove("one.txt")
+        assert cache._known_bytes == len("Goodbye")
+        cache.remove("two.txt")
+        assert cache._known_bytes == 0
+        assert cache._known_entries == 0
+    finally:
+        cache.clear()
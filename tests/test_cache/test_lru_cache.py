@@ -101,3 +101,56 @@ def test_lru_cache_error_cases(capacity, action, key, value, expected_exception)
             cache.get(key)
         elif action == "remove":
             cache.remove(key)
+
+
+def test_lru_cache_none_and_stats():
+    cache = LRUCache(2, allow_none=True)
+    missing = object()
+    cache.put("a", None)
+    assert cache.get("a", missing) is None
+    assert cache.get("b", missing) is missing
+    cache.put("b", 1)
+    cache.put("c", 2)
+    assert "a" not in cache
+
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == 1
+    assert stats.hit_rate == 0.5
+    cache.reset_stats()
+    assert cache.stats.hits == 0
+
+
+def test_lru_cache_max_bytes():
+    evicted = []
+    cache = LRUCache(10, max_bytes=10, sizeof=len, on_evict=lambda k, v: evicted.append(k))
+    cache["a"] = "12345"
+    cache["b"] = "12345"
+    assert cache.size_bytes == 10
+    cache.get("a")
+    cache["c"] = "1"
+    assert evicted == ["b"]
+    assert cache.size_bytes == 6
+    cache["a"] = "1"
+    assert cache.size_bytes == 2
+    del cache["a"]
+    assert cache.size_bytes == 1
+
+
+def test_lru_cache_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = LRUCache(50)
+
+    def work(n: int) -> None:
+        for i in range(500):
+            key = (n + i) % 100
+            if cache.get(key) is None:
+                cache.put(key, i)
+
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        list(ex.map(work, range(8)))
+    assert len(cache) == 50
+    stats = cache.stats
+    assert stats.hits + stats.misses == 8 * 500
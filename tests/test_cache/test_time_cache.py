@@ -187,3 +187,25 @@ def test_thread():
     assert "key1" in cache
     time.sleep(3)
     assert "key1" not in cache._cache
+
+
+def test_shared_scheduler():
+    import threading
+
+    expired = []
+
+    def on_items_expired(source, event):
+        expired.append(sorted(event.event_data.keys))
+
+    before = threading.active_count()
+    caches = [TimeCache(1, 0.5) for _ in range(20)]
+    for cache in caches:
+        cache.put("key1", "value1")
+        cache.put("key2", "value2")
+    caches[0].subscribe_event("cache_items_expired", on_items_expired)
+    # at most one scheduler thread is added for all caches.
+    assert threading.active_count() <= before + 1
+    time.sleep(2)
+    assert all(len(cache._cache) == 0 for cache in caches)
+    # expired keys of a cache are reported in one batch.
+    assert expired == [["key1", "key2"]]
@@ -157,3 +157,21 @@ def test_clear_expired():
     cache.clear_expired()
     assert "key1" not in cache._lru_cache._cache
     assert "key1" not in cache._ttl_cache._cache
+
+
+def test_none_and_stats():
+    cache = TLRUCache(2, 10, allow_none=True)
+    missing = object()
+    cache.put("key1", None)
+    assert cache.get("key1", missing) is None
+    assert cache.get("key2", missing) is missing
+    cache.put("key2", "value2")
+    cache.put("key3", "value3")
+    # key1 evicted from both caches
+    assert "key1" not in cache._lru_cache._cache
+    assert "key1" not in cache._ttl_cache._cache
+
+    stats = cache.stats
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.evictions == 1
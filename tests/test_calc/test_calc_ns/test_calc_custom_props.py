@@ -466,6 +466,86 @@ def test_sheet_custom_cell(loader, tmp_path) -> None:
             doc.close()
 
 
+def test_sheet_custom_cell_index(loader) -> None:
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader)
+        sheet = doc.sheets[0]
+        cprops = sheet.custom_cell_properties
+
+        for i in range(1, 5):
+            cell = sheet[f"B{i}"]
+            cell.set_custom_property("cell_num", i)
+
+        index = cprops._get_shape_index()
+        assert len(index) == 4
+        assert (0, 1) in index
+        assert (3, 1) in index
+
+        # inserting a row moves the shapes with the cells.
+        sheet.insert_row(0)
+        assert cprops._shape_index is None
+        index = cprops._get_shape_index()
+        assert (0, 1) not in index
+        assert (4, 1) in index
+        assert sheet["B5"].get_custom_property("cell_num") == 4
+        assert sheet["B1"].has_custom_property("cell_num") is False
+
+        sheet.delete_column(0)
+        assert cprops._shape_index is None
+        assert sheet["A2"].get_custom_property("cell_num") == 1
+
+        sheet["A3"].remove_custom_properties()
+        assert (2, 0) not in cprops._get_shape_index()
+        assert len(cprops.get_cell_properties()) == 3
+
+    finally:
+        if doc:
+            doc.close()
+
+
+def test_range_custom_props_bulk(loader) -> None:
+    from ooodev.utils.data_type.cell_obj import CellObj
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader)
+        sheet = doc.sheets[0]
+        # existing custom property should be updated by bulk set.
+        sheet["B2"].set_custom_property("cell_num", 0)
+
+        rng = sheet.get_range(range_name="A1:C10")
+        values = {}
+        for i in range(1, 11):
+            dd = DotDict()
+            dd.cell_name = f"B{i}"
+            dd.cell_num = i
+            values[f"B{i}"] = dd
+        rng.set_custom_properties_bulk(values)
+
+        assert sheet["B2"].get_custom_property("cell_num") == 2
+        assert sheet["B10"].get_custom_property("cell_name") == "B10"
+
+        result = rng.get_custom_properties_bulk()
+        assert len(result) == 10
+        b5 = result[CellObj.from_cell("Sheet1.B5")]
+        assert b5.cell_name == "B5"
+        assert b5.cell_num == 5
+
+        result = sheet.get_range(range_name="A1:C3").get_custom_properties_bulk()
+        assert len(result) == 3
+
+        with pytest.raises(IndexError):
+            rng.set_custom_properties_bulk({"D1": DotDict(test=1)})
+
+        with pytest.raises(AttributeError):
+            rng.set_custom_properties_bulk({"A1": DotDict(Name="test")})
+
+    finally:
+        if doc:
+            doc.close()
+
+
 def test_doc_custom_props(loader, tmp_path) -> None:
     # get_sheet is overload method.
     # testing each overload.
@@ -89,3 +89,29 @@ def test_export_range_png(loader, tmp_path) -> None:
 
     finally:
         doc.close_doc()
+
+
+def test_export_ranges_batch(loader, tmp_path) -> None:
+    from ooodev.calc.export.range_batch_export import RangeBatchExport
+
+    doc = CalcDoc(Calc.create_doc(loader))
+    try:
+        vals = (
+            ("", "JAN", "FEB", "MAR"),
+            ("Smith", 42, 58.9, -66.5),
+            ("Jones", 21, 40.9, -57.5),
+        )
+        sheet = doc.sheets[0]
+        sheet.set_array(values=vals, name="A1")
+        ranges = [sheet.get_range(range_name="A1:D3"), sheet.get_range(range_name="B2:C3")]
+        exporter = RangeBatchExport(doc, image_type="jpg")
+        results = exporter.export_ranges(ranges, out_dir=tmp_path)
+        assert len(results) == 2
+        assert Path(tmp_path, "range_0000.jpg").exists()
+        assert Path(tmp_path, "range_0001.jpg").exists()
+
+        results = exporter.export_ranges(ranges[:1])
+        assert results[0].data is not None
+        assert results[0].data[:2] == b"\xff\xd8"
+    finally:
+        doc.close_doc()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.calc import CalcDoc
+
+np = pytest.importorskip("numpy")
+
+
+def test_range_get_array_np(loader) -> None:
+    doc = CalcDoc.create_doc(loader)
+    try:
+        sheet = doc.sheets[0]
+        sheet.set_array(values=((1, 2, 3), (4, "", 6)), name="A1")
+        rng = sheet.get_range(range_name="A1:C2")
+
+        arr = rng.get_array_np()
+        assert arr.dtype == np.float64
+        assert arr.shape == (2, 3)
+        assert arr[0, 0] == 1.0
+        assert np.isnan(arr[1, 1])
+
+        masked = rng.get_array_np(mask_empty=True)
+        assert masked.mask[1, 1]
+        assert not masked.mask[0, 0]
+
+        arr = sheet.get_array_np(range_name="A1:C2", dtype=float)
+        assert arr[1, 2] == 6.0
+        assert np.isnan(arr[1, 1])
+
+        sheet.set_array(values=(("a", 1),), name="A4")
+        arr = sheet.get_array_np(range_name="A4:B4")
+        assert arr.dtype == object
+        assert arr[0, 0] == "a"
+        assert arr[0, 1] == 1.0
+    finally:
+        doc.close()
+
+
+def test_range_set_array_np(loader) -> None:
+    doc = CalcDoc.create_doc(loader)
+    try:
+        sheet = doc.sheets[0]
+        rng = sheet.get_range(range_name="A1:C2")
+        rng.set_array_np(np.array([[1.0, 2.0, 3.0], [4.0, np.nan, 6.0]]))
+        assert sheet.get_array(range_name="A1:C2") == ((1.0, 2.0, 3.0), (4.0, "", 6.0))
+
+        values = np.array([["x", 1], [None, 2.5]], dtype=object)
+        sheet.set_array_np(values=values, cell_obj=sheet["E1"].cell_obj)
+        assert sheet.get_array(range_name="E1:F2") == (("x", 1.0), ("", 2.5))
+
+        with pytest.raises(ValueError):
+            rng.set_array_np(np.zeros((3, 3)))
+    finally:
+        doc.close()
@@ -74,3 +74,60 @@ def test_cell_cursor_find_used(loader):
     finally:
         if doc is not None:
             doc.close()
+
+
+def test_sheet_iter_rows(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        vals = _tbl_data()
+        sheet.set_array(values=vals, name="A1")
+
+        rows = list(sheet.iter_rows(chunk_rows=4))
+        assert len(rows) == len(vals)
+        assert rows[0] == vals[0]
+        assert rows[-1] == ("Alice", "Apples", 9.0)
+
+        rows = list(sheet.iter_rows(chunk_rows=3, columns=["C", "A"]))
+        assert len(rows) == len(vals)
+        assert rows[1] == (3.0, "Alice")
+
+        rows = list(sheet.iter_rows(columns=[1]))
+        assert rows[2] == ("Oranges",)
+
+        with pytest.raises(ValueError):
+            next(sheet.iter_rows(chunk_rows=0))
+    finally:
+        if doc is not None:
+            doc.close()
+
+
+def test_sheet_write_table(loader):
+    doc = None
+    try:
+        doc = CalcDoc.create_doc(loader=loader)
+        sheet = doc.sheets[0]
+        vals = _tbl_data()
+
+        def gen_rows():
+            yield from vals
+
+        rng = sheet.write_table(gen_rows(), "B2", chunk_rows=4, disable_auto_calc=True)
+        assert rng is not None
+        assert str(rng) == "B2:D22"
+        assert sheet.get_array(range_name="B2:D22") == tuple(
+            tuple(float(v) if isinstance(v, int) else v for v in row) for row in vals
+        )
+        assert doc.component.isAutomaticCalculationEnabled()
+        assert not doc.component.hasControllersLocked()
+
+        # rows shorter than the widest row in a block are padded.
+        rng = sheet.write_table([(1, 2), (3,)], "F1")
+        assert str(rng) == "F1:G2"
+        assert sheet.get_array(range_name="F1:G2") == ((1.0, 2.0), (3.0, ""))
+
+        assert sheet.write_table([], "A1") is None
+    finally:
+        if doc is not None:
+            doc.close()
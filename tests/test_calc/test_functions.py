@@ -305,3 +305,41 @@ def _test_funcs(loader) -> None:
     result = Calc.call_fun("TRANSPOSE", arr)
 
     assert result is not None
+
+
+def test_call_fun_many(loader) -> None:
+    from ooodev.calc import CalcDoc
+
+    doc = CalcDoc.create_doc(loader)
+    try:
+        fa = Lo.current_lo.function_access
+        # service is created once per instance
+        assert Lo.current_lo.function_access is fa
+
+        values = [-1.0, 0.0, 1.0, 2.5]
+        expected = [Calc.call_fun("NORM.DIST", x, 0, 1, 1) for x in values]
+        result = doc.call_fun_many("NORM.DIST", [(x, 0, 1, 1) for x in values], vectorize=True)
+        assert result == pytest.approx(expected)
+
+        # single argument items and a per item error.
+        result = Calc.call_fun_many("SQRT", [4, "abc", 9], vectorize=True, return_exceptions=True)
+        assert result[0] == 2.0
+        assert isinstance(result[1], Exception)
+        assert result[2] == 3.0
+        assert Calc.call_fun_many("SQRT", [4, "abc", 9]) == [2.0, None, 3.0]
+
+        result = Calc.call_fun_many("CONVERT", [(1, "m", "mm"), (2, "m", "mm")], chunk_size=1)
+        assert result == [1000.0, 2000.0]
+
+        # SUM does not work element wise, each row is called on its own.
+        result = Calc.call_fun_many("SUM", [(1, 2), (3, 4), (5, 6)], vectorize=True)
+        assert result == [3.0, 7.0, 11.0]
+
+        # array functions return one value per row from an array argument but are not element wise.
+        # by default each row is called on its own.
+        values = [3.0, 1.0, 2.0]
+        expected = [Calc.call_fun("TREND", x) for x in values]
+        assert Calc.call_fun_many("TREND", values) == expected
+        assert doc.call_fun_many("TREND", values) == expected
+    finally:
+        doc.close()
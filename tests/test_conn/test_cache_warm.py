@@ -0,0 +1,69 @@
+from __future__ import annotations
+import os
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.conn.cache import Cache
+
+
+def test_warm_profile(soffice_path, tmp_path) -> None:
+    warm_path = tmp_path / "warm"
+    cache = Cache(warm_profile=True, warm_profile_path=warm_path, working_dir=tmp_path / "work")
+    (tmp_path / "work").mkdir()
+    try:
+        profile = cache.get_warm_profile(soffice_path)
+        assert profile.is_dir()
+        assert "warm_prepare" in cache.timings
+        stamps = list(warm_path.glob("*/ooodev_stamp.json"))
+        assert len(stamps) == 1
+
+        # second instance reuses the warm profile.
+        cache2 = Cache(warm_profile=True, warm_profile_path=warm_path, working_dir=tmp_path / "work2")
+        (tmp_path / "work2").mkdir()
+        cache2.copy_cache_to_profile(soffice=soffice_path)
+        assert "warm_prepare" not in cache2.timings
+        assert "profile_copy" in cache2.timings
+        assert cache2.user_profile.is_dir()
+        assert any(cache2.user_profile.iterdir())
+
+        # an instance profile is never written back to the warm profile.
+        cache2.cache_profile()
+        cache3 = Cache(warm_profile=True, warm_profile_path=warm_path)
+        assert cache3.get_warm_profile(soffice_path) == profile
+        assert "warm_prepare" not in cache3.timings
+    finally:
+        cache.del_working_dir()
+
+
+def test_warm_profile_clone_files(tmp_path, monkeypatch) -> None:
+    warm_path = tmp_path / "warm"
+    profile = warm_path / "key" / "profile"
+    (profile / "user" / "basic" / "Standard").mkdir(parents=True)
+    (profile / "user" / "extensions").mkdir(parents=True)
+    (profile / "user" / "gallery").mkdir(parents=True)
+    xba = profile / "user" / "basic" / "Standard" / "Module1.xba"
+    xba.write_text("REM one", encoding="utf-8")
+    png = profile / "user" / "gallery" / "image.png"
+    png.write_bytes(b"png")
+    ext_png = profile / "user" / "extensions" / "icon.png"
+    ext_png.write_bytes(b"png")
+
+    cache = Cache(warm_profile=True, warm_profile_path=warm_path)
+    monkeypatch.setattr(Cache, "_reflink", staticmethod(lambda src, dst: False))
+    dst = tmp_path / "dst"
+    dst.mkdir()
+    for src in (xba, png, ext_png):
+        cache._clone_file(str(src), str(dst / src.name))
+    # only read only files outside of extensions are linked.
+    assert (dst / "image.png").stat().st_ino == png.stat().st_ino
+    assert (dst / "Module1.xba").stat().st_ino != xba.stat().st_ino
+    assert (dst / "icon.png").stat().st_ino != ext_png.stat().st_ino
+
+    # a rewrite that keeps the size still changes the profile hash.
+    hash1 = cache._get_profile_hash(profile)
+    xba.write_text("REM two", encoding="utf-8")
+    st = xba.stat()
+    os.utime(xba, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache._get_profile_hash(profile) != hash1
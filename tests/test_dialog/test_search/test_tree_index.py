@@ -0,0 +1,146 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.dialog.search.tree_search import (
+    RuleDataCompare,
+    RuleDataInsensitive,
+    RuleDataRegex,
+    RuleTextInsensitive,
+    RuleTextRegex,
+    SearchTree,
+    TreeIndex,
+)
+from ooodev.dialog.search.tree_search.tree_index import DATA_VALUE_KEY
+
+
+def _get_tree_data() -> dict:
+    # same structure as CtlTree.convert_to_tree()
+    return {
+        "Root": {
+            DATA_VALUE_KEY: "root",
+            "A1": {
+                DATA_VALUE_KEY: 1,
+                "B1": {"C1": {DATA_VALUE_KEY: "Data1"}, "C2": {}},
+                "B2": {"C3": {DATA_VALUE_KEY: "Razor"}},
+            },
+            "A2": {"B3": {"C4": {}, "c1": {DATA_VALUE_KEY: "data1"}}},
+        }
+    }
+
+
+def test_add_tree_data(loader) -> None:
+    index = TreeIndex()
+    top = index.add_tree_data(_get_tree_data())
+    assert len(top) == 1
+    root = index.root
+    assert root is top[0]
+    assert root.display_value == "Root"
+    assert root.data_value == "root"
+    assert len(index) == 11
+    assert [n.display_value for n in root.children] == ["A1", "A2"]
+
+    node = index.find_path(("Root", "A1", "B2", "C3"))
+    assert node is not None
+    assert node.data_value == "Razor"
+    assert node.path == ("Root", "A1", "B2", "C3")
+    assert node.index_path == (0, 1, 0)
+    assert index.from_index_path((0, 1, 0)) is node
+    assert index.from_index_path((0, 5)) is None
+    assert index.find_path(("Root", "A9")) is None
+
+    assert [n.display_value for n in index.walk()] == [
+        "Root",
+        "A1",
+        "B1",
+        "C1",
+        "C2",
+        "B2",
+        "C3",
+        "A2",
+        "B3",
+        "C4",
+        "c1",
+    ]
+
+
+def test_find_text_data(loader) -> None:
+    index = TreeIndex()
+    index.add_tree_data(_get_tree_data())
+    assert [n.path for n in index.find_text("C1")] == [("Root", "A1", "B1", "C1")]
+    assert [n.path for n in index.find_text("C1", case_sensitive=False)] == [
+        ("Root", "A1", "B1", "C1"),
+        ("Root", "A2", "B3", "c1"),
+    ]
+    assert [n.display_value for n in index.find_data("Data1")] == ["C1"]
+    assert [n.display_value for n in index.find_data("DATA1", case_sensitive=False)] == ["C1", "c1"]
+    assert [n.display_value for n in index.find_data(1)] == ["A1"]
+    assert index.find_data(["unhashable"]) == []
+
+    a2 = index.find_path(("Root", "A2"))
+    assert a2 is not None
+    child = index.add_child(a2, "B4", "new")
+    assert index.find_path(("Root", "A2", "B4")) is child
+    assert index.find_data("new") == [child]
+    assert len(index) == 12
+
+    # new root replaces the index
+    index.set_root("Other")
+    assert len(index) == 1
+    assert index.find_text("C1") == []
+
+
+def test_search_tree_on_index(loader) -> None:
+    index = TreeIndex()
+    index.add_tree_data(_get_tree_data())
+    root = index.root
+
+    search = SearchTree(match_value="c1")
+    search.register_rule(RuleTextInsensitive())
+    assert search.find_node(root) is index.find_path(("Root", "A1", "B1", "C1"))
+    # search from a sub node
+    a2 = index.find_path(("Root", "A2"))
+    assert search.find_node(a2) is index.find_path(("Root", "A2", "B3", "c1"))
+
+    search = SearchTree(match_value="razor")
+    search.register_rule(RuleDataInsensitive())
+    assert search.find_node(root) is index.find_path(("Root", "A1", "B2", "C3"))
+
+    search = SearchTree(match_value=1)
+    search.register_rule(RuleDataCompare("="))
+    assert search.find_node(root) is index.find_path(("Root", "A1"))
+
+    search = SearchTree(match_value=r"^B\d$")
+    search.register_rule(RuleTextRegex())
+    assert search.find_node(a2) is index.find_path(("Root", "A2", "B3"))
+
+    search = SearchTree(match_value="")
+    search.register_rule(RuleDataRegex(r"^[Dd]ata\d"))
+    assert search.find_node(a2) is index.find_path(("Root", "A2", "B3", "c1"))
+    assert search.find_node(index.find_path(("Root", "A1", "B2"))) is None
+
+
+def test_find_uno_node(loader) -> None:
+    class Node:
+        pass
+
+    index = TreeIndex()
+    uno_root = Node()
+    root = index.set_root("Root", node=uno_root)
+    uno_nodes = [Node() for _ in range(3)]
+    children = [index.add_child(root, f"A{i}", node=n) for i, n in enumerate(uno_nodes)]
+    assert index.find_node(uno_root) is root
+    assert [index.find_node(n) for n in uno_nodes] == children
+    assert [c.position for c in children] == [0, 1, 2]
+    assert children[2].index_path == (2,)
+    # another object is not found, even if it stands for the same UNO node.
+    assert index.find_node(Node()) is None
+
+    other = Node()
+    index.set_node(children[0], other)
+    assert index.find_node(other) is children[0]
+    assert index.find_node(uno_nodes[0]) is None
+    index.clear()
+    assert index.find_node(other) is None
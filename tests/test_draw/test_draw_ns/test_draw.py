@@ -281,3 +281,42 @@ def test_cursor(loader) -> None:
     assert cursor.get_string().startswith("Hello World")
 
     doc.close_doc()
+
+
+def test_shape_index(loader) -> None:
+    doc = DrawDoc.create_doc(loader)
+    try:
+        slide = doc.get_slide(idx=0)
+        r1 = slide.draw_rectangle(x=10, y=10, width=20, height=20)
+        r1.name = "Box1"
+        e1 = slide.draw_ellipse(x=20, y=20, width=20, height=20)
+        e1.name = "Circle1"
+
+        idx = slide.enable_shape_index()
+        assert slide.shape_index is idx
+        assert idx.auto_update
+        assert len(idx) == 2
+        assert slide.find_shape_by_name("box1").name == "Box1"
+        assert slide.find_top_shape().name == "Circle1"
+        assert slide.find_biggest_zorder() == 1
+        assert [s.name for s in slide.get_ordered_shapes()] == ["Box1", "Circle1"]
+        ellipses = idx.find_by_type("com.sun.star.drawing.EllipseShape")
+        assert len(ellipses) == 1
+
+        # 25mm, 25mm is inside both shapes. 1/100th mm units.
+        assert [s.name for s in slide.find_shapes_at(2500, 2500)] == ["Circle1", "Box1"]
+        assert len(idx.find_at(1500, 1500)) == 1
+        assert len(idx.find_in_rect(0, 0, 3500, 3500, inside=True)) == 1
+
+        # adding a shape modifies the document and the index is rebuilt on next lookup.
+        r2 = slide.draw_rectangle(x=100, y=100, width=10, height=10)
+        r2.name = "Box2"
+        assert idx.is_dirty
+        assert slide.find_shape_by_name("Box2").name == "Box2"
+        assert len(idx) == 3
+
+        slide.disable_shape_index()
+        assert slide.shape_index is None
+        assert slide.find_shape_by_name("Box2").name == "Box2"
+    finally:
+        doc.close()
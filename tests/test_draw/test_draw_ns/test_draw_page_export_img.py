@@ -270,3 +270,27 @@ def test_new_context_slide_save_png(loader, tmp_path_fn) -> None:
         assert img_path.exists()
     finally:
         doc.close_doc()
+
+
+def test_slides_batch_export(loader, tmp_path_fn) -> None:
+    from ooodev.draw.export.page_batch_export import PageBatchExport
+
+    doc = ImpressDoc(Draw.create_impress_doc(loader))
+    try:
+        doc.add_slide()
+        doc.add_slide()
+        exporter = PageBatchExport(doc, image_type="png", resolution=48)
+        results = exporter.export_pages(out_dir=tmp_path_fn)
+        assert len(results) == 3
+        for i, result in enumerate(results):
+            assert result.index == i
+            assert result.seconds >= 0.0
+            assert Path(tmp_path_fn, f"page_{i:04d}.png").exists()
+
+        results = exporter.export_pages(pages=[doc.slides[1]])
+        assert len(results) == 1
+        assert results[0].url == ""
+        assert results[0].data is not None
+        assert results[0].data[:8] == b"\x89PNG\r\n\x1a\n"
+    finally:
+        doc.close_doc()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_cmd_catalog(loader, tmp_path_fn) -> None:
+    from ooodev.loader import Lo
+    from ooodev.gui.commands import CmdCatalog
+    from ooodev.gui.commands import CmdInfo
+    from ooodev.utils.kind.module_names_kind import ModuleNamesKind
+
+    calc = str(ModuleNamesKind.SPREADSHEET_DOCUMENT)
+    version, locale = CmdCatalog.get_version_locale()
+    rows = CmdCatalog.read_modules(Lo.current_lo, (calc,))
+    catalog = CmdCatalog(version=version, locale=locale, rows=rows)
+    path = catalog.save(tmp_path_fn)
+    assert path.exists()
+
+    loaded = CmdCatalog.from_lo(cache_dir=tmp_path_fn)
+    assert loaded is not None
+    assert loaded.module_names == (calc,)
+    assert len(loaded) == len(catalog)
+    copy = loaded.get_cmd_data(calc, ".uno:Copy")
+    assert copy == catalog.get_cmd_data(calc, ".uno:Copy")
+    assert loaded.find_command(".uno:Copy") == [(calc, copy)]
+    assert (calc, copy) in loaded.find_label(copy.label.replace("~", "").upper())
+    assert CmdCatalog.load("0.0.0", locale, tmp_path_fn) is None
+
+    inst = CmdInfo()
+    try:
+        inst.set_catalog(loaded)
+        assert inst.get_cmd_data(calc, ".uno:Copy") == copy
+        assert calc in inst.find_command(".uno:Copy")
+    finally:
+        inst.set_catalog(None)
@@ -17,3 +17,32 @@ def test_config(loader) -> None:
 
     op = Info.get_office_dir()
     assert op is not None
+
+
+def test_config_many(loader) -> None:
+    from ooodev.exceptions import ex as mEx
+    from ooodev.loader import Lo
+    from ooodev.utils.info import Info
+
+    cache = Lo.config_cache
+    cache.clear()
+    cache.reset_stats()
+    name, version = Info.get_config_many(Info.NODE_PRODUCT, ("ooName", "ooSetupVersion"))
+    assert name == Info.get_config("ooName")
+    assert version
+    stats = cache.stats
+    assert stats.value_misses == 2
+    assert stats.value_hits == 1
+
+    # node and values are now cached.
+    assert Info.get_config_many(Info.NODE_PRODUCT, ("ooSetupVersion", "ooName")) == (version, name)
+    assert cache.stats.node_misses == 1
+
+    missing = Info.get_config_many(Info.NODE_PRODUCT, ("ooName", "NoSuchName"), default=None)
+    assert missing == (name, None)
+    with pytest.raises(mEx.ConfigError):
+        Info.get_config_many(Info.NODE_PRODUCT, ("NoSuchName",))
+
+    cache.invalidate(Info.NODE_PRODUCT)
+    assert Info.get_config_many(Info.NODE_PRODUCT, ("ooName",)) == (name,)
+    assert cache.stats.invalidations == 1
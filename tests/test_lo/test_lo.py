@@ -86,3 +86,54 @@ def test_lo_version(loader) -> None:
     assert isinstance(Lo.version, tuple)
     assert len(Lo.version) == 3
     assert Lo.version >= (0, 45, 0)
+
+
+def test_qi_cache(loader) -> None:
+    from com.sun.star.beans import XPropertySet
+    from com.sun.star.text import XTextDocument
+    from ooodev.loader.lo import Lo
+    from ooodev.office.calc import Calc
+
+    doc = Calc.create_doc()
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        cell = Calc.get_cell(sheet=sheet, cell_name="A1")
+        Lo.qi_cache.reset_stats()
+        assert Lo.is_uno_interfaces(cell, "com.sun.star.beans.XPropertySet")
+        # a miss is counted once.
+        assert Lo.qi_cache.stats.supported_misses == 1
+        assert Lo.qi(XPropertySet, cell) is cell
+        for _ in range(3):
+            assert Lo.qi(XPropertySet, cell) is not None
+            assert Lo.qi(XTextDocument, cell) is None
+            assert Lo.is_uno_interfaces(cell, "com.sun.star.beans.XPropertySet")
+            assert Lo.is_uno_interfaces(cell, "com.sun.star.text.XTextDocument") is False
+        stats = Lo.qi_cache.stats
+        assert stats.type_hits > 0
+        assert stats.supported_hits > 0
+        assert stats.supported_hit_rate > 0.5
+    finally:
+        Lo.close_doc(doc)
+    # closing a document clears the cache.
+    assert len(Lo.qi_cache) == 0
+
+
+def test_qi_cache_keys(loader) -> None:
+    import gc
+    from ooodev.loader.inst.qi_cache import QiCache
+
+    class Obj:
+        pass
+
+    cache = QiCache(10)
+    obj = Obj()
+    cache.set_supported(obj, "com.sun.star.beans.XPropertySet", True)
+    assert cache.get_supported(obj, "com.sun.star.beans.XPropertySet") is True
+    assert cache.get_supported(Obj(), "com.sun.star.beans.XPropertySet") is None
+    assert cache.stats.supported_misses == 1
+
+    # objects are held weakly and dropped once collected.
+    del obj
+    gc.collect()
+    assert cache.get_supported(Obj(), "com.sun.star.beans.XPropertySet") is None
+    assert len(cache) == 0
@@ -0,0 +1,42 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.conn import connectors
+from ooodev.loader.lo_pool import LoPool
+
+
+def test_lo_pool(soffice_path, tmp_path) -> None:
+    from ooodev.calc import CalcDoc
+
+    def connector_factory(idx: int) -> connectors.ConnectPipe:
+        return connectors.ConnectPipe(headless=True, soffice=soffice_path)
+
+    def write_read(lo_inst, val: int) -> float:
+        doc = CalcDoc.create_doc(lo_inst=lo_inst)
+        try:
+            sheet = doc.sheets[0]
+            sheet["A1"].value = val
+            return sheet["A1"].value
+        finally:
+            doc.close()
+
+    def fail(lo_inst) -> None:
+        raise ValueError("expected")
+
+    with LoPool(size=2, connector_factory=connector_factory, max_queue=4) as pool:
+        assert pool.size == 2
+        results = pool.map(write_read, range(6))
+        assert results == [float(i) for i in range(6)]
+
+        future = pool.submit(fail)
+        with pytest.raises(ValueError):
+            future.result()
+        # worker is still usable after a failed task
+        assert pool.submit(write_read, 10).result() == 10.0
+        assert pool.restarts == 0
+
+    with pytest.raises(RuntimeError):
+        pool.submit(write_read, 1)
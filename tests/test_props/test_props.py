@@ -86,3 +86,47 @@ def test_prop_get_with_default(loader) -> None:
         assert p is None
     finally:
         Lo.close(closeable=doc, deliver_ownership=False)
+
+
+def test_prop_set_batch(loader) -> None:
+    from ooodev.loader.lo import Lo
+    from ooodev.utils.props import Props
+    from ooodev.office.calc import Calc
+    from ooodev.events.lo_events import event_ctx
+    from ooodev.events.props_named_event import PropsNamedEvent
+    from ooodev.events.args.key_val_cancel_args import KeyValCancelArgs
+    from ooodev.exceptions import ex as mEx
+
+    assert loader is not None
+    doc = Calc.create_doc(loader)
+    assert doc is not None
+    set_keys = []
+
+    def on_set(source, args: KeyValCancelArgs) -> None:
+        set_keys.append(args.key)
+
+    def on_setting(source, args: KeyValCancelArgs) -> None:
+        if args.key == "CellBackColor":
+            args.cancel = True
+
+    try:
+        sheet = Calc.get_sheet(doc=doc, index=0)
+        cell = Calc.get_cell(sheet=sheet, cell_name="A1")
+        with event_ctx((PropsNamedEvent.PROP_SET, on_set), (PropsNamedEvent.PROP_SETTING, on_setting)):
+            Props.set_batch(cell, CharHeight=16.0, CharWeight=150.0, CellBackColor=0xFF0000)
+        assert sorted(set_keys) == ["CharHeight", "CharWeight"]
+        assert Props.get(cell, "CharHeight") == 16.0
+        assert Props.get(cell, "CharWeight") == 150.0
+        assert Props.get(cell, "CellBackColor") != 0xFF0000
+
+        # only the failed property is reported.
+        with pytest.raises(mEx.MultiError) as e:
+            Props.set_batch(cell, CharHeight=12.0, NonExistingProp=1)
+        assert len(e.value.errors) == 1
+        assert Props.get(cell, "CharHeight") == 12.0
+
+        Props.set_properties(cell, ("CharHeight", "CharWeight"), (10.0, 100.0), batch=True)
+        assert Props.get(cell, "CharHeight") == 10.0
+        assert Props.get(cell, "CharWeight") == 100.0
+    finally:
+        Lo.close(closeable=doc, deliver_ownership=False)
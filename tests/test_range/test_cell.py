@@ -489,3 +489,71 @@ def test_cell_copy(loader) -> None:
     finally:
         if doc is not None:
             doc.close()
+
+
+def test_cell_sheet_index_lazy(loader) -> None:
+    import pickle
+    from dataclasses import FrozenInstanceError
+    from ooodev.utils.data_type.cell_obj import CellObj
+    from ooodev.utils.data_type.range_obj import RangeObj
+    from ooodev.utils.context import SheetIndexContext
+
+    from ooodev.calc import CalcDoc
+
+    doc = None
+    try:
+        doc = CalcDoc.create_doc()
+        sheet = doc.sheets[0]
+        _ = doc.insert_sheet("Other")
+
+        cell = CellObj(col="B", row=3)
+        assert not hasattr(cell, "__dict__")
+        assert cell._sheet_idx == -1
+        # resolved on first access
+        assert cell.sheet_idx == 0
+        assert cell._sheet_idx == 0
+
+        with pytest.raises(FrozenInstanceError):
+            cell.row = 5  # type: ignore
+
+        with SheetIndexContext(1) as idx:
+            assert idx == 1
+            cell = CellObj(col="C", row=4)
+            assert cell._sheet_idx == 1
+            rng = RangeObj(col_start="A", col_end="C", row_start=1, row_end=3)
+            assert rng.sheet_idx == 1
+            assert rng.cell_start._sheet_idx == 1
+        assert CellObj(col="C", row=4)._sheet_idx == -1
+
+        # comparing and hashing do not resolve the sheet index.
+        cell = CellObj(col="B", row=3)
+        cell_hash = hash(cell)
+        assert cell == CellObj(col="B", row=3)
+        assert cell._sheet_idx == -1
+        assert cell == CellObj(col="B", row=3, sheet_idx=0)
+        assert hash(cell) == cell_hash
+
+        rng = RangeObj(col_start="A", col_end="C", row_start=1, row_end=3)
+        assert rng._sheet_idx == -1
+        rng_hash = hash(rng)
+        # cells of the range take the sheet index of the range.
+        assert rng.start.sheet_idx == 0
+        assert rng._sheet_idx == 0
+        assert hash(rng) == rng_hash
+
+        with SheetIndexContext(sheet):
+            rng = RangeObj(col_start="A", col_end="C", row_start=1, row_end=3)
+        assert rng.sheet_idx == 0
+        cells = list(rng)
+        assert len(cells) == 9
+        assert all(c._sheet_idx == 0 for c in cells)
+        assert rng["B2"]._sheet_idx == 0
+
+        cell = CellObj(col="D", row=7, sheet_idx=1)
+        cell2 = pickle.loads(pickle.dumps(cell))
+        assert cell2 == cell
+        assert repr(cell2) == "CellObj(col='D', row=7, sheet_idx=1)"
+
+    finally:
+        if doc is not None:
+            doc.close()
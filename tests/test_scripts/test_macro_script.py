@@ -37,3 +37,70 @@ def test_call(loader) -> None:
         assert result == "hello again"
     finally:
         doc.close_doc()
+
+
+def test_call_many(loader) -> None:
+    from ooodev.calc import CalcDoc
+    from ooodev.macro.script.macro_script import MacroScript
+
+    doc = CalcDoc.create_doc(loader)
+    try:
+        url = MacroScript.get_url_script(name="RTrimStr", library="Tools", language="Basic", module="Strings")
+        assert MacroScript.get_script(url) is MacroScript.get_script(url)
+
+        calls = [(url, ("hello ", " ")), (url, ("hello again ", " "))]
+        results = MacroScript.call_many(calls)
+        assert results == ["hello", "hello again"]
+
+        future = MacroScript.call_many(calls, in_thread=True)
+        assert future.result(timeout=30) == ["hello", "hello again"]
+
+        MacroScript.clear_cache()
+        assert MacroScript.call_many(calls[:1]) == ["hello"]
+    finally:
+        doc.close_doc()
+
+
+def test_script_cache_doc_closed(loader) -> None:
+    import gc
+    import weakref
+    from ooodev.events.args.event_args import EventArgs
+    from ooodev.macro.script.macro_script import _ScriptCache
+
+    class FakeLoInst:
+        def __init__(self) -> None:
+            self.handlers = {}
+
+        def subscribe_event(self, name, cb) -> None:
+            self.handlers[name] = cb
+
+    class FakeProvider:
+        def getScript(self, url: str) -> object:
+            return object()
+
+    class FakeDoc:
+        def getScriptProvider(self) -> FakeProvider:
+            return FakeProvider()
+
+    lo_inst = FakeLoInst()
+    cache = _ScriptCache(lo_inst, 10)  # type: ignore
+    doc1 = FakeDoc()
+    doc2 = FakeDoc()
+    script1 = cache.get_script("url", doc1)
+    script2 = cache.get_script("url", doc2)
+    assert cache.get_script("url", doc1) is script1
+    assert len(cache) == 2
+
+    # only the entries of the closed document are dropped.
+    args = EventArgs("test")
+    args.set("closeable", doc1)
+    cache._on_doc_closed(None, args)
+    assert len(cache) == 1
+    assert cache.get_script("url", doc2) is script2
+    assert cache.get_script("url", doc1) is not script1
+
+    # cache does not keep the office instance alive.
+    ref = weakref.ref(lo_inst)
+    del lo_inst
+    gc.collect()
+    assert ref() is None
@@ -271,3 +271,19 @@ def test_convert_all_volume_units(loader, the_converter: Converter):
         result = the_converter.convert(1, frm="oz", to=val)
         # Assert
         assert result is not None
+
+
+def test_convert_local_cross_check(loader):
+    # office tables use rounded constants for a few units such as stone and ton.
+    converter = Converter(local=True)
+    mismatches = converter.cross_check(sample_size=300, seed=42)
+    assert mismatches == []
+
+    checked = Converter(local=True, check_rate=1.0)
+    assert checked.convert_temp(100, UnitTempKind.C, UnitTempKind.F) == pytest.approx(212.0)
+    assert checked.convert_many([1, 2], "km", "m") == [1000.0, 2000.0]
+
+    # office CONVERT is used by default.
+    office = Converter()
+    assert office.convert(1, "stone", "g") == office.call_function("CONVERT", 1, "stone", "g")
+    assert office.convert_many([1, 2], "km", "m") == [1000.0, 2000.0]
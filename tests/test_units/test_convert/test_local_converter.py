@@ -0,0 +1,101 @@
+from __future__ import annotations
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from ooodev.exceptions import ex
+from ooodev.units.convert import LocalConverter
+from ooodev.units.convert import UnitAreaKind
+from ooodev.units.convert import UnitEnergyKind
+from ooodev.units.convert import UnitFluxDensityKind
+from ooodev.units.convert import UnitForceKind
+from ooodev.units.convert import UnitInfoKind
+from ooodev.units.convert import UnitLengthKind
+from ooodev.units.convert import UnitPowerKind
+from ooodev.units.convert import UnitPressureKind
+from ooodev.units.convert import UnitSpeedKind
+from ooodev.units.convert import UnitTempKind
+from ooodev.units.convert import UnitTimeKind
+from ooodev.units.convert import UnitVolumeKind
+from ooodev.units.convert import UnitWeightKind
+
+
+@pytest.mark.parametrize(
+    "num, fm, to, expected",
+    [
+        (1, UnitLengthKind.IN, UnitLengthKind.MM, 25.4),
+        (1, UnitLengthKind.METER_KILO, UnitLengthKind.METER, 1000.0),
+        (45, UnitAreaKind.ARE_KILO, UnitAreaKind.ARE, 45000.0),
+        (1, "km2", "m2", 1_000_000.0),
+        (100, UnitTempKind.C, UnitTempKind.F, 212.0),
+        (32, UnitTempKind.F, UnitTempKind.C, 0.0),
+        (0, "C", "K", 273.15),
+        (80, "Reau", "C", 100.0),
+        (1, UnitInfoKind.BYTE_KIBI, UnitInfoKind.BIT, 8192.0),
+        (1, UnitInfoKind.BIT_MEBI, UnitInfoKind.BIT_KIBI, 1024.0),
+        (1, "kbyte", "bit", 8000.0),
+        (1, UnitEnergyKind.WATT_HOUR_KILO, UnitEnergyKind.JOULE_KILO, 3600.0),
+        (1, UnitVolumeKind.METER, UnitVolumeKind.LITER, 1000.0),
+        (1, "hr", "sec", 3600.0),
+        (1, "m/s", "km/h", 3.6),
+    ],
+)
+def test_convert(num, fm, to, expected) -> None:
+    conv = LocalConverter()
+    assert conv.convert(num, fm, to) == pytest.approx(expected, rel=1e-12, abs=1e-12)
+
+
+def test_all_enum_units_known() -> None:
+    conv = LocalConverter()
+    for kind in (
+        UnitAreaKind,
+        UnitEnergyKind,
+        UnitFluxDensityKind,
+        UnitForceKind,
+        UnitInfoKind,
+        UnitLengthKind,
+        UnitPowerKind,
+        UnitPressureKind,
+        UnitSpeedKind,
+        UnitTempKind,
+        UnitTimeKind,
+        UnitVolumeKind,
+        UnitWeightKind,
+    ):
+        categories = {conv.get_category(unit) for unit in kind}
+        assert len(categories) == 1, kind.__name__
+
+
+def test_convert_errors() -> None:
+    conv = LocalConverter()
+    assert conv.is_known("km")
+    assert not conv.is_known("no_such_unit")
+    with pytest.raises(ex.ConvertError):
+        conv.convert(1, "no_such_unit", "m")
+    with pytest.raises(ex.ConvertError):
+        conv.convert(1, "m", "sec")
+    with pytest.raises(ex.ConvertError):
+        conv.convert("abc", "m", "km")
+
+
+def test_convert_many() -> None:
+    conv = LocalConverter()
+    assert conv.convert_many([1, 2, 3], "km", "m") == [1000.0, 2000.0, 3000.0]
+    assert conv.convert_many((0, 100), "C", "F") == pytest.approx([32.0, 212.0])
+
+    np = pytest.importorskip("numpy")
+    arr = conv.convert_many(np.array([0.0, 100.0]), UnitTempKind.C, UnitTempKind.F)
+    assert isinstance(arr, np.ndarray)
+    assert arr.tolist() == pytest.approx([32.0, 212.0])
+
+
+def test_get_matrix() -> None:
+    conv = LocalConverter()
+    matrix = conv.get_matrix(["m", "km", "in"])
+    assert matrix[0][1] == pytest.approx(0.001)
+    assert matrix[1][0] == pytest.approx(1000.0)
+    assert matrix[2][0] == pytest.approx(0.0254)
+    assert [matrix[i][i] for i in range(3)] == [1.0, 1.0, 1.0]
+    with pytest.raises(ex.ConvertError):
+        conv.get_matrix(["C", "F"])
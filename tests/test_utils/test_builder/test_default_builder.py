@@ -0,0 +1,92 @@
+from __future__ import annotations
+from typing import Any
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+def test_class_cache(loader) -> None:
+    from ooodev.adapter.component_base import ComponentBase
+    from ooodev.calc import CalcDoc
+    from ooodev.utils.builder.default_builder import DefaultBuilder
+    from ooodev.utils.builder.check_kind import CheckKind
+
+    def build(component):
+        builder = DefaultBuilder(component)
+        builder.add_import(
+            "ooodev.adapter.container.index_access_partial.IndexAccessPartial",
+            uno_name="com.sun.star.container.XIndexAccess",
+            optional=True,
+            check_kind=CheckKind.INTERFACE,
+        )
+        builder.add_import(
+            "ooodev.adapter.container.name_access_partial.NameAccessPartial",
+            uno_name="com.sun.star.sheet.Spreadsheets",
+            optional=True,
+            check_kind=CheckKind.SERVICE,
+        )
+        builder.add_class_property("prop_a", "a")
+        builder.add_class_property("prop_b", "b")
+        return builder.build_class(name="tests.CachedSheets", base_class=ComponentBase)
+
+    doc = CalcDoc.create_doc(loader=loader)
+    try:
+        DefaultBuilder.clear_cache()
+        sheets = doc.component.getSheets()
+        inst1 = build(sheets)
+        info = DefaultBuilder.get_cache_info()
+        assert info["hits"] == 0
+        assert info["misses"] == 1
+
+        inst2 = build(doc.component.getSheets())
+        assert type(inst1) is type(inst2)
+        assert inst2.component is not None
+        assert inst2.prop_a == "a"
+        assert inst2.prop_b == "b"
+        assert inst2.get_count() == sheets.getCount()
+        assert inst2.has_by_name(sheets.getElementNames()[0])
+        info = DefaultBuilder.get_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+        DefaultBuilder.cache_enabled = False
+        try:
+            inst3 = build(sheets)
+            assert type(inst3) is not type(inst1)
+        finally:
+            DefaultBuilder.cache_enabled = True
+        assert DefaultBuilder.get_cache_info()["size"] == 1
+        DefaultBuilder.clear_cache()
+        assert DefaultBuilder.get_cache_info()["size"] == 0
+    finally:
+        doc.close()
+
+
+def test_builder_probes_each_component(loader) -> None:
+    # configuration nodes share one implementation name but not their interfaces.
+    from com.sun.star.beans import XPropertySet
+    from com.sun.star.lang import XMultiServiceFactory
+    from ooodev.adapter.beans.property_change_implement import PropertyChangeImplement
+    from ooodev.adapter.configuration.configuration_access_comp import ConfigurationAccessComp
+    from ooodev.loader import Lo
+    from ooodev.utils.props import Props
+
+    provider = Lo.create_instance_mcf(
+        XMultiServiceFactory, "com.sun.star.configuration.ConfigurationProvider", raise_err=True
+    )
+
+    def get_node(path: str) -> Any:
+        args = Props.make_props(nodepath=path)
+        return provider.createInstanceWithArguments("com.sun.star.configuration.ConfigurationAccess", args)
+
+    group = get_node("/org.openoffice.Setup/Product")
+    colors = get_node("/org.openoffice.Office.UI/ColorScheme/ColorSchemes")
+    assert group.getImplementationName() == colors.getImplementationName()
+    assert Lo.qi(XPropertySet, group) is not None
+    assert Lo.qi(XPropertySet, colors) is None
+
+    for nodes in ((group, colors), (colors, group)):
+        for node in nodes:
+            comp = ConfigurationAccessComp(node)
+            assert isinstance(comp, PropertyChangeImplement) == (node is group)
@@ -245,3 +245,34 @@ def test_range_sub_range(loader, copy_fix_writer):
 
     finally:
         doc.close()
+
+
+def test_make_table_bulk(loader, bond_movies_table: list):
+    from ooodev.utils.color import CommonColor
+
+    doc = WriteDoc.create_doc(loader)
+    try:
+        cursor = doc.get_cursor()
+        tbl = cursor.add_table(
+            table_data=bond_movies_table,
+            header_fg_color=CommonColor.WHITE,
+            tbl_fg_color=CommonColor.BLACK,
+            bulk=True,
+        )
+        assert len(tbl.rows) == len(bond_movies_table)
+        assert len(tbl.columns) == len(bond_movies_table[0])
+        assert tbl["A1"].value == str(bond_movies_table[0][0])
+        assert tbl["B2"].value == str(bond_movies_table[1][1])
+
+        num_rows = len(tbl.rows)
+        rows = [("Title",) + ("",) * (len(tbl.columns) - 1) for _ in range(25)]
+        rows.append(("Last",))
+        count = tbl.append_data(iter(rows), batch_size=10)
+        assert count == 26
+        assert len(tbl.rows) == num_rows + 26
+        assert tbl[(0, num_rows)].value == "Title"
+        last = tbl[(0, num_rows + 25)]
+        assert last.value == "Last"
+        assert tbl[(1, num_rows + 25)].value in (None, "")
+    finally:
+        doc.close()